@@ -0,0 +1,38 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.6.10;
+pragma experimental ABIEncoderV2;
+
+/// @title Multicall contract.
+/// @notice Aggregates the results of many read-only calls into a single call,
+/// so that they are all evaluated against the same block.
+contract Multicall {
+    struct Call {
+        address target;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    /// @notice Executes every call and returns their results.
+    /// @dev A failing call does not revert the aggregate, its result is flagged
+    /// instead and `returnData` holds the revert data.
+    /// @param _calls       Calls to execute
+    /// @return blockNumber_ Block the calls were evaluated against
+    /// @return results_     Result of each call, in order
+    function aggregate(Call[] calldata _calls)
+        external
+        returns (uint256 blockNumber_, Result[] memory results_)
+    {
+        blockNumber_ = block.number;
+        results_ = new Result[](_calls.length);
+        for (uint256 i = 0; i < _calls.length; i++) {
+            (bool success, bytes memory returnData) = _calls[i].target.call(
+                _calls[i].callData
+            );
+            results_[i] = Result(success, returnData);
+        }
+    }
+}
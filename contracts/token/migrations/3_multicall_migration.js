@@ -0,0 +1,5 @@
+const Multicall = artifacts.require("Multicall");
+
+module.exports = function (deployer) {
+  deployer.deploy(Multicall);
+};
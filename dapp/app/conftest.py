@@ -1,7 +1,36 @@
+from typing import NamedTuple
+
 import pytest
+from django.conf import settings
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from web3 import EthereumTesterProvider, Web3
+from web3.contract import Contract
+from web3.middleware import construct_sign_and_send_raw_middleware
+
+from app.account.models import User
+
+# Sources of the contracts, compiled as truffle-config.js does.
+CONTRACTS_DIR = settings.ROOT_DIR.parent / "contracts" / "token" / "contracts"
+# The same sources with their imports inlined, which need no node_modules.
+FLATTENED_DIR = settings.ROOT_DIR.parent / "contracts" / "token" / "flattened"
+SOLC_VERSION = "0.6.10"
+
+# ERC-1820 registry without any implementer, so that tokens move without hooks.
+ERC1820_REGISTRY = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.6.10;
 
-from app.users.models import User
-from app.users.tests.factories import UserFactory
+contract ERC1820Registry {
+    function getInterfaceImplementer(address, bytes32)
+        external
+        pure
+        returns (address)
+    {
+        return address(0);
+    }
+}
+"""
 
 
 @pytest.fixture(autouse=True)
@@ -11,4 +40,96 @@ def media_storage(settings, tmpdir):
 
 @pytest.fixture
 def user() -> User:
-    return UserFactory()
+    return User.objects.create_user("user@example.com", "password")
+
+
+@pytest.fixture
+def w3() -> Web3:
+    """Client of a fresh in-memory chain, sending from its first account."""
+    web3 = Web3(EthereumTesterProvider())
+    web3.eth.defaultAccount = web3.eth.accounts[0]
+    return web3
+
+
+@pytest.fixture
+def signer(w3) -> LocalAccount:
+    """Funded account signing locally, which ``w3`` can also transact from."""
+    account = Account.create()
+    w3.middleware_onion.add(construct_sign_and_send_raw_middleware(account))
+    w3.eth.waitForTransactionReceipt(
+        w3.eth.sendTransaction({"to": account.address, "value": 10 ** 18})
+    )
+    return account
+
+
+@pytest.fixture(scope="session")
+def solidity():
+    """Return a function compiling a contract to its ABI and bytecode.
+
+    The contract is ``name`` of ``source``, or of the file of ``CONTRACTS_DIR``
+    named after it.
+    """
+    import solcx
+
+    installed = {str(version) for version in solcx.get_installed_solc_versions()}
+    if SOLC_VERSION not in installed:
+        solcx.install_solc(SOLC_VERSION)
+    # source -> its compiled contracts
+    compiled = {}
+
+    def compile_contract(name: str, source: str = None) -> dict:
+        if source is None:
+            source = (CONTRACTS_DIR / f"{name}.sol").read_text()
+        if source not in compiled:
+            compiled[source] = solcx.compile_source(
+                source, output_values=["abi", "bin"], solc_version=SOLC_VERSION
+            )
+        return compiled[source][f"<stdin>:{name}"]
+
+    return compile_contract
+
+
+@pytest.fixture
+def deploy(w3, solidity):
+    """Return a function deploying a contract compiled by ``solidity``."""
+
+    def deploy_contract(name: str, source: str = None, *args):
+        interface = solidity(name, source)
+        factory = w3.eth.contract(abi=interface["abi"], bytecode=interface["bin"])
+        tx_hash = factory.constructor(*args).transact()
+        receipt = w3.eth.waitForTransactionReceipt(tx_hash)
+        return w3.eth.contract(address=receipt.contractAddress, abi=interface["abi"])
+
+    return deploy_contract
+
+
+@pytest.fixture
+def transact(w3):
+    """Return a function sending a contract transaction and returning its receipt."""
+
+    def send(function, sender: str = None):
+        tx_hash = function.transact({"from": sender or w3.eth.defaultAccount})
+        return w3.eth.waitForTransactionReceipt(tx_hash)
+
+    return send
+
+
+class Deployment(NamedTuple):
+    token: Contract
+    account: Contract
+    implementation: Contract
+
+
+@pytest.fixture
+def contracts(w3, deploy) -> Deployment:
+    """Deploy the contracts as the truffle migrations do.
+
+    The first account of ``w3`` owns ``Implementation`` and is an active root
+    account.
+    """
+    registry = deploy("ERC1820Registry", ERC1820_REGISTRY)
+    source = (FLATTENED_DIR / "ImplementationFlattened.sol").read_text()
+    token = deploy("Token", source, 1, registry.address)
+    account = deploy("Account", source, 5, 5)
+    implementation = deploy("implementation", source, account.address, token.address)
+    return Deployment(token, account, implementation)
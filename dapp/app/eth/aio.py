@@ -0,0 +1,264 @@
+"""Non-blocking JSON-RPC transport for the asyncio wrappers.
+
+``config.asgi`` runs under uvicorn workers, where a synchronous
+``Web3.HTTPProvider`` request blocks the whole event loop.  The generated
+``Async*`` wrappers encode and decode calls exactly like their synchronous
+counterparts but send requests through an :class:`AsyncHTTPProvider`, backed by
+one ``aiohttp`` session per worker.  Its connection pool, timeout, retries and
+metrics follow the synchronous :class:`~app.eth.session.RPCSession`.
+"""
+import asyncio
+import itertools
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import aiohttp
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from hexbytes import HexBytes
+from web3 import Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.exceptions import TransactionNotFound
+from web3.providers.base import BaseProvider
+from web3.types import BlockIdentifier, RPCEndpoint, RPCResponse, TxReceipt
+from zero_ex.contract_wrappers.bases import ContractMethod
+from zero_ex.contract_wrappers.tx_params import TxParams
+
+from app.eth.batch import decode_response, format_block, format_call, normalize_inputs
+from app.eth.session import RPCMetrics, backoff_delay, register_metrics
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_providers: Dict[str, "AsyncHTTPProvider"] = {}
+
+
+class AsyncHTTPProvider:
+    """JSON-RPC over HTTP provider whose requests are coroutines.
+
+    ``aiohttp`` sessions and semaphores belong to the event loop they are
+    created in, so the provider creates one of each per running loop, on
+    first use, and keeps them alive for the life of the loop.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        request_kwargs: Optional[dict] = None,
+        pool_size: int = 10,
+        timeout: float = 10,
+        retries: int = 3,
+    ):
+        """
+        :param endpoint_uri: URI of the node
+        :param request_kwargs: extra keyword arguments of every ``post``
+        :param pool_size: maximum number of concurrent connections
+        :param timeout: per-request timeout, in seconds
+        :param retries: how many times a request failing with a transport
+            error is retried
+        """
+        self.endpoint_uri = endpoint_uri
+        self.request_kwargs = request_kwargs or {}
+        self.request_counter = itertools.count()
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.metrics = RPCMetrics()
+        # Event loop -> its session and its semaphore of connections.
+        self._loops: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __str__(self):
+        return f"Async RPC connection {self.endpoint_uri}"
+
+    def create_session(self) -> aiohttp.ClientSession:
+        """Return a new session used for every request of this provider."""
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size, keepalive_timeout=60, ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    def _loop_state(self) -> Tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        """Return the session and semaphore of the running event loop."""
+        loop = asyncio.get_event_loop()
+        state = self._loops.get(loop)
+        if state is None or state[0].closed:
+            state = self._loops[loop] = (
+                self.create_session(),
+                asyncio.Semaphore(self.pool_size),
+            )
+        return state
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The session shared by the requests of the running event loop."""
+        return self._loop_state()[0]
+
+    async def _post_once(self, payload: Any) -> Any:
+        session, slots = self._loop_state()
+        if slots.locked():
+            self.metrics.record_pool_wait()
+        async with slots:
+            with self.metrics.track():
+                async with session.post(
+                    self.endpoint_uri, json=payload, **self.request_kwargs
+                ) as response:
+                    response.raise_for_status()
+                    return await response.json(content_type=None)
+
+    async def post(self, payload: Any) -> Any:
+        """Post ``payload`` to the node and return the decoded JSON answer."""
+        attempt = 0
+        while True:
+            try:
+                return await self._post_once(payload)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                if attempt >= self.retries:
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning(
+                    "RPC transport error on %s (%s), retrying in %.2fs",
+                    self.endpoint_uri,
+                    exc,
+                    delay,
+                )
+                self.metrics.record_retry()
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a single JSON-RPC request."""
+        logger.debug(
+            "Making request HTTP. URI: %s, Method: %s", self.endpoint_uri, method
+        )
+        return await self.post(
+            {
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params,
+                "id": next(self.request_counter),
+            }
+        )
+
+    async def close(self):
+        """Close the session of the running event loop."""
+        state = self._loops.pop(asyncio.get_event_loop(), None)
+        if state is not None:
+            await state[0].close()
+
+
+def get_async_provider(
+    provider: Union[str, Web3, BaseProvider, AsyncHTTPProvider]
+) -> AsyncHTTPProvider:
+    """Return the shared :class:`AsyncHTTPProvider` for the node behind ``provider``."""
+    if isinstance(provider, AsyncHTTPProvider):
+        return provider
+    if isinstance(provider, Web3):
+        provider = provider.provider
+    endpoint_uri = str(getattr(provider, "endpoint_uri", provider))
+
+    async_provider = _providers.get(endpoint_uri)
+    if async_provider is None:
+        with _lock:
+            async_provider = _providers.get(endpoint_uri)
+            if async_provider is None:
+                async_provider = AsyncHTTPProvider(
+                    endpoint_uri,
+                    pool_size=settings.WEB3_POOL_SIZE,
+                    timeout=settings.WEB3_REQUEST_TIMEOUT,
+                    retries=settings.WEB3_REQUEST_RETRIES,
+                )
+                _providers[endpoint_uri] = async_provider
+                register_metrics(f"{endpoint_uri} (async)", async_provider.metrics)
+    return async_provider
+
+
+async def get_transaction_receipt(
+    provider: AsyncHTTPProvider, tx_hash: Union[HexBytes, bytes, str]
+) -> TxReceipt:
+    """Return the formatted receipt of ``tx_hash``, like ``getTransactionReceipt``."""
+    tx_hash = HexBytes(tx_hash).hex()
+    response = await provider.make_request(
+        RPCEndpoint("eth_getTransactionReceipt"), [tx_hash]
+    )
+    if "error" in response:
+        raise ValueError(response["error"])
+    if response["result"] is None:
+        raise TransactionNotFound(f"Transaction with hash: {tx_hash} not found.")
+    return receipt_formatter(response["result"])
+
+
+class AsyncContractMethod:
+    """Asyncio interfaces to a method of a generated wrapper.
+
+    Inputs are validated, encoded and decoded by the synchronous ``method``;
+    only the requests to the node go through ``provider``.
+    """
+
+    def __init__(self, provider: AsyncHTTPProvider, method: ContractMethod):
+        """
+        :param provider: non-blocking provider used for every request
+        :param method: synchronous method, e.g. ``token.balance_of``
+        """
+        self._provider = provider
+        self._method = method
+
+    def _transaction(self, args: Sequence, tx_params: Optional[TxParams]):
+        """Return the function called with ``args`` and its transaction.
+
+        Validators may query the database, so this is run off the event loop
+        by :meth:`_prepare`.
+        """
+        function = self._method._underlying_method(
+            *normalize_inputs(self._method, args, tx_params)
+        )
+        transaction = {
+            "to": function.address,
+            "data": function._encode_transaction_data(),
+        }
+        if tx_params is not None:
+            transaction.update(tx_params.as_dict())
+        return function, format_call(transaction)
+
+    async def _prepare(self, args: Sequence, tx_params: Optional[TxParams]):
+        if not args:
+            # Nothing to validate.
+            return self._transaction(args, tx_params)
+        return await sync_to_async(self._transaction, thread_sensitive=True)(
+            args, tx_params
+        )
+
+    async def call(
+        self,
+        *args,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Execute underlying contract method via eth_call.
+
+        :param tx_params: transaction parameters
+        :param block_identifier: block at which the call is evaluated
+        """
+        local_function = getattr(self._method, "local_function", None)
+        if local_function is not None:
+            return local_function(*normalize_inputs(self._method, args))
+        function, transaction = await self._prepare(args, tx_params)
+        response = await self._provider.make_request(
+            RPCEndpoint("eth_call"), [transaction, format_block(block_identifier)]
+        )
+        returned = decode_response(self._method._web3_eth.web3, function.abi, response)
+        convert_output = getattr(self._method, "convert_output", None)
+        return returned if convert_output is None else convert_output(returned)
+
+    async def estimate_gas(self, *args, tx_params: Optional[TxParams] = None) -> int:
+        """Estimate gas consumption of method call."""
+        _function, transaction = await self._prepare(args, tx_params)
+        response = await self._provider.make_request(
+            RPCEndpoint("eth_estimateGas"), [transaction]
+        )
+        if "error" in response:
+            raise ValueError(response["error"])
+        return int(response["result"], 16)
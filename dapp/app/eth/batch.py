@@ -0,0 +1,288 @@
+"""JSON-RPC batching of contract view calls.
+
+Every ``*Method.call()`` of a generated wrapper is one HTTP round trip.  A
+:class:`Batch` queues calls instead and sends them to the node as a single
+JSON-RPC batch array when it is executed::
+
+    with token.batch() as batch:
+        balance = batch.balance_of(owner, token_id)
+        granularity = batch.add(token.granularity)
+
+    balance.result()
+
+Results are decoded against the ABI of the queued method and converted by
+its ``convert_output``, so they are those ``call`` would return.  Errors,
+transport errors included, are reported on the item they belong to.
+"""
+import logging
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from eth_abi.exceptions import DecodingError
+from eth_utils import to_bytes
+from hexbytes import HexBytes
+from web3 import HTTPProvider, Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.encoding import FriendlyJsonSerde
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import make_post_request
+from web3.eth import Eth
+from web3.exceptions import BadFunctionCallOutput
+from web3.types import BlockIdentifier, RPCEndpoint, RPCResponse
+from zero_ex.contract_wrappers.bases import ContractMethod
+from zero_ex.contract_wrappers.tx_params import TxParams
+
+from app.eth.preflight import sent_from
+
+logger = logging.getLogger(__name__)
+
+_PENDING = object()
+
+
+class BatchHTTPProvider(HTTPProvider):
+    """HTTP provider able to send several requests in one JSON-RPC batch."""
+
+    def post(self, request_data: bytes) -> bytes:
+        """Post encoded ``request_data`` to the node and return the raw answer."""
+        return make_post_request(
+            self.endpoint_uri, request_data, **self.get_request_kwargs()
+        )
+
+    def make_batch_request(
+        self, calls: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        """Send ``calls`` as one batch and return their responses in order.
+
+        :param calls: ``(method, params)`` pairs
+        """
+        request_ids = []
+        payload = []
+        for method, params in calls:
+            request_id = next(self.request_counter)
+            request_ids.append(request_id)
+            payload.append(
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+            )
+        logger.debug(
+            "Making batch request HTTP. URI: %s, Size: %s",
+            self.endpoint_uri,
+            len(payload),
+        )
+        raw_response = self.post(
+            to_bytes(text=FriendlyJsonSerde().json_encode(payload))
+        )
+        responses = self.decode_rpc_response(raw_response)
+        if not isinstance(responses, list):
+            # Nodes without batch support answer with a single error object.
+            raise ValueError(responses.get("error", responses))
+
+        by_id = {response.get("id"): response for response in responses}
+        missing = {"code": -32603, "message": "No response in batch"}
+        return [by_id.get(request_id, {"error": missing}) for request_id in request_ids]
+
+
+class BatchItem:
+    """Result of a call queued in a :class:`Batch`."""
+
+    def __init__(self, fn_abi: dict, params: list, convert: Optional[Callable] = None):
+        """
+        :param fn_abi: ABI of the function called
+        :param params: parameters of its ``eth_call``
+        :param convert: turns the decoded output into the value of the item
+        """
+        self.fn_abi = fn_abi
+        self.params = params
+        self.convert = convert
+        self._value: Any = _PENDING
+        self._error: Optional[Exception] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the batch holding this item has been executed."""
+        return self._value is not _PENDING or self._error is not None
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """Error raised by this call, if any."""
+        return self._error
+
+    def result(self) -> Any:
+        """Return the decoded return value, or raise the error of this call."""
+        if self._error is not None:
+            raise self._error
+        if self._value is _PENDING:
+            raise RuntimeError("The batch holding this call has not been executed")
+        return self._value
+
+    def set_response(self, web3: Web3, response: RPCResponse):
+        """Decode the JSON-RPC ``response`` of this call."""
+        try:
+            value = decode_response(web3, self.fn_abi, response)
+            self._value = value if self.convert is None else self.convert(value)
+        except (TypeError, ValueError, BadFunctionCallOutput) as exc:
+            self._error = exc
+
+    def set_value(self, value: Any):
+        """Record ``value`` as the return value of this call."""
+        self._value = value
+
+    def set_error(self, error: Exception):
+        """Record ``error`` as the outcome of this call."""
+        self._error = error
+
+
+class Batch:
+    """Queue of contract view calls sent to the node in one round trip.
+
+    Calls from different wrappers can share a batch as long as they talk to
+    the same node.  Used as a context manager, the batch is executed when the
+    block exits without an exception.
+    """
+
+    def __init__(self, web3_or_eth: Union[Web3, Eth], wrapper: Any = None):
+        """
+        :param web3_or_eth: client, or its ``eth`` module, used to send calls
+        :param wrapper: generated wrapper whose methods are reachable as
+            attributes of the batch
+        """
+        self._web3 = getattr(web3_or_eth, "web3", web3_or_eth)
+        self._wrapper = wrapper
+        self._items: List[BatchItem] = []
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getattr__(self, name: str) -> Callable[..., BatchItem]:
+        wrapper = self.__dict__.get("_wrapper")
+        method = getattr(wrapper, name, None)
+        if not isinstance(method, ContractMethod):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.add(method, *args, **kwargs)
+
+    def add(
+        self,
+        method: ContractMethod,
+        *args,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> BatchItem:
+        """Queue ``method.call(*args)`` and return the item holding its result.
+
+        :param method: method of a generated wrapper, e.g. ``token.balance_of``
+        :param tx_params: transaction parameters
+        :param block_identifier: block at which the call is evaluated
+        """
+        local_function = getattr(method, "local_function", None)
+        if local_function is not None:
+            # Pure functions evaluated in-process are resolved right away.
+            item = BatchItem(None, [])
+            try:
+                item.set_value(local_function(*normalize_inputs(method, args)))
+            except ValueError as exc:
+                item.set_error(exc)
+            return item
+        function = method._underlying_method(
+            *normalize_inputs(method, args, tx_params)
+        )
+        transaction = {
+            "to": function.address,
+            "data": function._encode_transaction_data(),
+        }
+        if tx_params is not None:
+            transaction.update(tx_params.as_dict())
+        item = BatchItem(
+            function.abi,
+            [format_call(transaction), format_block(block_identifier)],
+            getattr(method, "convert_output", None),
+        )
+        self._items.append(item)
+        return item
+
+    def execute(self) -> List[BatchItem]:
+        """Send every queued call and resolve its item."""
+        items, self._items = self._items, []
+        if not items:
+            return items
+
+        provider = self._web3.provider
+        calls = [(RPCEndpoint("eth_call"), item.params) for item in items]
+        if hasattr(provider, "make_batch_request"):
+            try:
+                responses = provider.make_batch_request(calls)
+            except Exception as exc:  # pylint: disable=broad-except
+                # Raised again by the result() of every item.
+                for item in items:
+                    item.set_error(exc)
+                return items
+            for item, response in zip(items, responses):
+                item.set_response(self._web3, response)
+        else:
+            # Providers without batch support (IPC, eth-tester) go one by one,
+            # through the middlewares eth-tester needs to read JSON-RPC params.
+            for item, call in zip(items, calls):
+                try:
+                    response = self._web3.manager._make_request(*call)
+                    item.set_response(self._web3, response)
+                except Exception as exc:  # pylint: disable=broad-except
+                    item.set_error(exc)
+        return items
+
+
+def normalize_inputs(
+    method: ContractMethod, args: Sequence, tx_params: Optional[TxParams] = None
+) -> tuple:
+    """Validate ``args`` the way ``method.call`` would and return them as a tuple.
+
+    :param tx_params: transaction parameters, whose sender the validation uses
+    """
+    if not args:
+        return ()
+    with sent_from(tx_params):
+        normalized = method.validate_and_normalize_inputs(*args)
+    # Generated validators return a bare value for single-input methods.
+    return (normalized,) if len(args) == 1 else tuple(normalized)
+
+
+def decode_response(web3: Web3, fn_abi: dict, response: RPCResponse) -> Any:
+    """Return the value of the ``eth_call`` of ``fn_abi`` answered by ``response``.
+
+    Values are normalized like ``ContractFunction.call`` does: a single output
+    is returned bare, several outputs as a tuple.
+    """
+    if "error" in response:
+        raise ValueError(response["error"])
+    output_types = get_abi_output_types(fn_abi)
+    try:
+        output = web3.codec.decode_abi(output_types, HexBytes(response["result"]))
+    except DecodingError as exc:
+        raise BadFunctionCallOutput(
+            f"Could not decode the output of {fn_abi['name']}: {exc}"
+        )
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output)
+    if not normalized:
+        return None
+    if len(normalized) == 1:
+        return normalized[0]
+    return tuple(normalized)
+
+
+def format_call(transaction: dict) -> dict:
+    """Return ``transaction`` formatted as an ``eth_call`` parameter."""
+    return {
+        key: hex(value) if isinstance(value, int) else value
+        for key, value in transaction.items()
+        if value is not None
+    }
+
+
+def format_block(block_identifier: BlockIdentifier) -> Union[str, BlockIdentifier]:
+    """Return ``block_identifier`` formatted as a JSON-RPC block parameter."""
+    if isinstance(block_identifier, int):
+        return hex(block_identifier)
+    return block_identifier
@@ -0,0 +1,275 @@
+"""Block-aware cache of contract view calls.
+
+Reads come in two flavours:
+
+* immutable reads (``name``, ``owner``, ``granularity``, the EIP-712 type
+  hashes...) are cached indefinitely, keyed by (chain id, address, method,
+  arguments);
+* state reads (``balance_of``, ``is_active``, ``is_operator_for``...) are
+  evaluated at the current head and keyed by (chain id, address, method,
+  arguments, block number).  The in-process entries of a block are dropped as soon as a
+  new head is seen.
+
+Every entry lives in a per-worker LRU backed by the Django cache named by
+``settings.WEB3_CACHE_ALIAS`` (Redis in production), which workers share,
+whichever chain their node is on.
+When that cache is unreachable, reads go to the node.  Values are returned
+as ``call`` returns them::
+
+    token = get_contract(Token, address).cached()
+    token.granularity.call()  # cached forever
+    token.balance_of.call(owner, token_id)  # cached until the next block
+"""
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from web3 import Web3
+from zero_ex.contract_wrappers.bases import ContractMethod
+from zero_ex.contract_wrappers.tx_params import TxParams
+
+from app.eth import eip712
+from app.eth.batch import normalize_inputs
+
+logger = logging.getLogger(__name__)
+
+# ABI names of the view functions whose result never changes.
+IMMUTABLE_CALLS = frozenset(
+    {
+        "name",
+        "owner",
+        "granularity",
+        "DOMAIN_SEPARATOR",
+        "SWAP_TYPEHASH",
+        "EIP712_DOMAIN_TYPEHASH",
+    }
+)
+
+_MISSING = object()
+
+_lock = threading.Lock()
+_caches: Dict[Hashable, "ReadCache"] = {}
+
+
+class LRUCache:
+    """Thread-safe mapping keeping the ``maxsize`` most recently used entries."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value of ``key`` and mark it as recently used."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any):
+        """Store ``value`` under ``key``, evicting the least recently used entry."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+
+class HeadTracker:
+    """Current block number of a node, polled at most every ``interval`` seconds."""
+
+    def __init__(self, web3: Web3, interval: float = 1.0):
+        self.web3 = web3
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._block_number: Optional[int] = None
+        self._checked_at = 0.0
+
+    def block_number(self) -> int:
+        """Return the number of the head block."""
+        if self._stale():
+            with self._lock:
+                if self._stale():
+                    self._block_number = self.web3.eth.blockNumber
+                    self._checked_at = time.monotonic()
+        return self._block_number
+
+    def _stale(self) -> bool:
+        return (
+            self._block_number is None
+            or time.monotonic() - self._checked_at >= self.interval
+        )
+
+
+class ReadCache:
+    """Two-level cache of the view calls sent to a node."""
+
+    def __init__(
+        self,
+        web3: Web3,
+        shared: Optional[BaseCache] = None,
+        maxsize: int = 4096,
+        head_interval: float = 1.0,
+        state_timeout: int = 60,
+        immutable: Iterable[str] = IMMUTABLE_CALLS,
+    ):
+        """
+        :param web3: client used to send the calls
+        :param shared: cache shared between workers, if any
+        :param maxsize: size of each in-process LRU
+        :param head_interval: how often the head block is polled, in seconds
+        :param state_timeout: lifetime of the shared state entries, in seconds
+        :param immutable: ABI names of the functions cached indefinitely
+        """
+        self.web3 = web3
+        self.shared = shared
+        self.head = HeadTracker(web3, head_interval)
+        self.state_timeout = state_timeout
+        self.immutable: FrozenSet[str] = frozenset(immutable)
+        self._immutable = LRUCache(maxsize)
+        self._state = LRUCache(maxsize)
+        self._state_block: Optional[int] = None
+
+    def call(
+        self, method: ContractMethod, *args, tx_params: Optional[TxParams] = None
+    ) -> Any:
+        """Return ``method.call(*args)``, from the cache when possible."""
+        local_function = getattr(method, "local_function", None)
+        if local_function is not None:
+            return local_function(*normalize_inputs(method, args))
+        returned = self._read(method, args, tx_params)
+        # Entries hold the decoded outputs, converted like call() does.
+        convert_output = getattr(method, "convert_output", None)
+        return returned if convert_output is None else convert_output(returned)
+
+    def _read(
+        self, method: ContractMethod, args: tuple, tx_params: Optional[TxParams]
+    ) -> Any:
+        function = method._underlying_method(
+            *normalize_inputs(method, args, tx_params)
+        )
+        transaction = tx_params.as_dict() if tx_params is not None else {}
+        key = "eth:call:%s:%s:%s:%s" % (
+            eip712.chain_id(self.web3),
+            function.address,
+            function.fn_name,
+            _digest((function.args, function.kwargs, sorted(transaction.items()))),
+        )
+
+        if function.fn_name in self.immutable:
+            return self._lookup(self._immutable, key, None, function, transaction)
+
+        block_number = self.head.block_number()
+        if block_number != self._state_block:
+            # A new head invalidates every state read of the previous ones.
+            self._state.clear()
+            self._state_block = block_number
+        return self._lookup(
+            self._state,
+            f"{key}:{block_number}",
+            self.state_timeout,
+            function,
+            transaction,
+            block_number,
+        )
+
+    def _lookup(self, local, key, timeout, function, transaction, block="latest"):
+        """Return the value of ``key``, calling ``function`` on a miss."""
+        value = local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if self.shared is not None:
+            try:
+                value = self.shared.get(key, _MISSING)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Could not read %s from the shared cache", key)
+        if value is _MISSING:
+            value = function.call(transaction, block_identifier=block)
+            if self.shared is not None:
+                try:
+                    self.shared.set(key, value, timeout)
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning("Could not write %s to the shared cache", key)
+        local.set(key, value)
+        return value
+
+    def clear(self):
+        """Drop the in-process entries."""
+        self._immutable.clear()
+        self._state.clear()
+
+
+class CachedMethod:
+    """Method of a generated wrapper reading through a :class:`ReadCache`."""
+
+    def __init__(self, method: ContractMethod, cache: ReadCache):
+        self._method = method
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._method, name)
+
+    def call(self, *args, tx_params: Optional[TxParams] = None) -> Any:
+        """Execute underlying contract method via eth_call, or read it from cache.
+
+        :param tx_params: transaction parameters
+        """
+        return self._cache.call(self._method, *args, tx_params=tx_params)
+
+
+class CachedContract:
+    """View of a generated wrapper whose methods read through a :class:`ReadCache`.
+
+    Everything else (transactions, events, batches) is the wrapper's own.
+    """
+
+    def __init__(self, wrapper: Any, cache: ReadCache):
+        self._wrapper = wrapper
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._wrapper, name)
+        if isinstance(attribute, ContractMethod):
+            return CachedMethod(attribute, self._cache)
+        return attribute
+
+
+def get_read_cache(web3: Web3) -> ReadCache:
+    """Return the shared :class:`ReadCache` of the node behind ``web3``."""
+    key = getattr(web3.provider, "endpoint_uri", None) or web3.provider
+    cache = _caches.get(key)
+    if cache is None:
+        with _lock:
+            cache = _caches.get(key)
+            if cache is None:
+                alias = settings.WEB3_CACHE_ALIAS
+                cache = ReadCache(
+                    web3,
+                    shared=caches[alias] if alias else None,
+                    maxsize=settings.WEB3_CACHE_SIZE,
+                    head_interval=settings.WEB3_HEAD_POLL_INTERVAL,
+                    state_timeout=settings.WEB3_CACHE_STATE_TIMEOUT,
+                )
+                _caches[key] = cache
+    return cache
+
+
+def _digest(value: Any) -> str:
+    """Return a short stable digest of ``value``."""
+    return hashlib.sha1(repr(value).encode()).hexdigest()
@@ -0,0 +1,61 @@
+"""Generated wrappers of the deployed contracts.
+
+Every module of this package is generated by ``abi-gen`` from the compiled
+contracts, using the templates of ``abi-templates``::
+
+    abi-gen --abis '../contracts/token/build/contracts/*.json' \
+        --template abi-templates/contract.handlebars \
+        --partials 'abi-templates/partials/*.handlebars' \
+        --output app/eth/contracts --language Python
+
+Generated modules are large and import most of ``web3`` along the way, so
+none of them is imported until one of its wrappers is first looked up::
+
+    from app.eth.contracts import Token  # imports app.eth.contracts.token only
+"""
+from importlib import import_module
+from typing import Any, Callable, Dict
+
+# Wrapper class name -> generated module defining it.
+_WRAPPERS: Dict[str, str] = {
+    "Account": "account",
+    "AsyncAccount": "account",
+    "Implementation": "implementation",
+    "AsyncImplementation": "implementation",
+    "Token": "token",
+    "AsyncToken": "token",
+}
+
+# Validator class name -> module defining it.  The generated modules import
+# ``<Contract>Validator`` from this package and fall back to a no-op validator.
+_VALIDATORS: Dict[str, str] = {
+    "ImplementationValidator": "app.eth.preflight",
+}
+
+__all__ = sorted(_WRAPPERS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _WRAPPERS.get(name)
+    if module_name is not None:
+        module = import_module(f"{__name__}.{module_name}")
+    elif name in _VALIDATORS:
+        module = import_module(_VALIDATORS[name])
+    else:
+        # Also lets the generated modules fall back to their no-op validators.
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def event_decoders() -> Dict[bytes, Callable]:
+    """Return the log decoder of every event of every contract, by topic 0."""
+    decoders: Dict[bytes, Callable] = {}
+    for module_name in sorted(set(_WRAPPERS.values())):
+        decoders.update(import_module(f"{__name__}.{module_name}").EVENT_DECODERS)
+    return decoders
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_WRAPPERS) | set(_VALIDATORS))
@@ -3,6 +3,8 @@
 # pylint: disable=too-many-arguments
 
 import json
+from functools import partial
+from types import MappingProxyType
 from typing import (  # noqa
     Any,
     List,
@@ -11,17 +13,40 @@ from typing import (  # noqa
     Union,
 )
 
-from eth_utils import to_checksum_address
+from eth_abi.codec import ABICodec
+from eth_account.signers.local import LocalAccount
+from eth_utils import (
+    event_abi_to_log_topic,
+    function_abi_to_4byte_selector,
+    to_checksum_address,
+)
 from mypy_extensions import TypedDict
 from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
+from web3.types import BlockIdentifier
+from web3._utils.abi import build_default_registry
+from web3._utils.events import get_event_data
 
 from zero_ex.contract_wrappers.bases import ContractMethod, Validator
 from zero_ex.contract_wrappers.tx_params import TxParams
 
+from app.eth.aio import (
+    AsyncContractMethod,
+    AsyncHTTPProvider,
+    get_async_provider,
+    get_transaction_receipt,
+)
+from app.eth.batch import Batch
+from app.eth.cache import CachedContract, get_read_cache
+from app.eth.methods import LazyMethod, local_method_class
+from app.eth.multicall import Aggregate
+from app.eth.pipeline import TransactionPipeline
+from app.eth.preflight import sent_from
+from app.eth.receipts import get_receipt_tracker
+
 
 # Try to import a custom validator class definition; if there isn't one,
 # declare one that we can instantiate for the default argument to the
@@ -107,7 +132,8 @@ class InitializeMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (implementation) = self.validate_and_normalize_inputs(implementation)
+        with sent_from(tx_params):
+            (implementation) = self.validate_and_normalize_inputs(implementation)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(implementation).call(tx_params.as_dict())
 
@@ -118,7 +144,8 @@ class InitializeMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (implementation) = self.validate_and_normalize_inputs(implementation)
+        with sent_from(tx_params):
+            (implementation) = self.validate_and_normalize_inputs(implementation)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(implementation).transact(tx_params.as_dict())
 
@@ -126,7 +153,8 @@ class InitializeMethod(ContractMethod):
         self, implementation: str, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (implementation) = self.validate_and_normalize_inputs(implementation)
+        with sent_from(tx_params):
+            (implementation) = self.validate_and_normalize_inputs(implementation)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(implementation).buildTransaction(
             tx_params.as_dict()
@@ -136,7 +164,8 @@ class InitializeMethod(ContractMethod):
         self, implementation: str, tx_params: Optional[TxParams] = None
     ) -> int:
         """Estimate gas consumption of method call."""
-        (implementation) = self.validate_and_normalize_inputs(implementation)
+        with sent_from(tx_params):
+            (implementation) = self.validate_and_normalize_inputs(implementation)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(implementation).estimateGas(tx_params.as_dict())
 
@@ -178,7 +207,8 @@ class AddAccountMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (acc, p_acc, name) = self.validate_and_normalize_inputs(acc, p_acc, name)
+        with sent_from(tx_params):
+            (acc, p_acc, name) = self.validate_and_normalize_inputs(acc, p_acc, name)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(acc, p_acc, name).call(tx_params.as_dict())
 
@@ -189,7 +219,8 @@ class AddAccountMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (acc, p_acc, name) = self.validate_and_normalize_inputs(acc, p_acc, name)
+        with sent_from(tx_params):
+            (acc, p_acc, name) = self.validate_and_normalize_inputs(acc, p_acc, name)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc, p_acc, name).transact(tx_params.as_dict())
 
@@ -197,7 +228,8 @@ class AddAccountMethod(ContractMethod):
         self, acc: str, p_acc: str, name: str, tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (acc, p_acc, name) = self.validate_and_normalize_inputs(acc, p_acc, name)
+        with sent_from(tx_params):
+            (acc, p_acc, name) = self.validate_and_normalize_inputs(acc, p_acc, name)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc, p_acc, name).buildTransaction(
             tx_params.as_dict()
@@ -207,7 +239,8 @@ class AddAccountMethod(ContractMethod):
         self, acc: str, p_acc: str, name: str, tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (acc, p_acc, name) = self.validate_and_normalize_inputs(acc, p_acc, name)
+        with sent_from(tx_params):
+            (acc, p_acc, name) = self.validate_and_normalize_inputs(acc, p_acc, name)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc, p_acc, name).estimateGas(
             tx_params.as_dict()
@@ -251,7 +284,8 @@ class UpdateAccountStatusMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (acc, action) = self.validate_and_normalize_inputs(acc, action)
+        with sent_from(tx_params):
+            (acc, action) = self.validate_and_normalize_inputs(acc, action)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(acc, action).call(tx_params.as_dict())
 
@@ -262,7 +296,8 @@ class UpdateAccountStatusMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (acc, action) = self.validate_and_normalize_inputs(acc, action)
+        with sent_from(tx_params):
+            (acc, action) = self.validate_and_normalize_inputs(acc, action)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc, action).transact(tx_params.as_dict())
 
@@ -270,7 +305,8 @@ class UpdateAccountStatusMethod(ContractMethod):
         self, acc: str, action: int, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (acc, action) = self.validate_and_normalize_inputs(acc, action)
+        with sent_from(tx_params):
+            (acc, action) = self.validate_and_normalize_inputs(acc, action)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc, action).buildTransaction(
             tx_params.as_dict()
@@ -280,7 +316,8 @@ class UpdateAccountStatusMethod(ContractMethod):
         self, acc: str, action: int, tx_params: Optional[TxParams] = None
     ) -> int:
         """Estimate gas consumption of method call."""
-        (acc, action) = self.validate_and_normalize_inputs(acc, action)
+        with sent_from(tx_params):
+            (acc, action) = self.validate_and_normalize_inputs(acc, action)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc, action).estimateGas(tx_params.as_dict())
 
@@ -323,7 +360,8 @@ class AuthorizeOperatorMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
+        with sent_from(tx_params):
+            (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(sender, operator).call(tx_params.as_dict())
 
@@ -334,7 +372,8 @@ class AuthorizeOperatorMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
+        with sent_from(tx_params):
+            (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, operator).transact(tx_params.as_dict())
 
@@ -342,7 +381,8 @@ class AuthorizeOperatorMethod(ContractMethod):
         self, sender: str, operator: str, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
+        with sent_from(tx_params):
+            (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, operator).buildTransaction(
             tx_params.as_dict()
@@ -352,7 +392,8 @@ class AuthorizeOperatorMethod(ContractMethod):
         self, sender: str, operator: str, tx_params: Optional[TxParams] = None
     ) -> int:
         """Estimate gas consumption of method call."""
-        (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
+        with sent_from(tx_params):
+            (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, operator).estimateGas(
             tx_params.as_dict()
@@ -397,7 +438,8 @@ class RevokeOperatorMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
+        with sent_from(tx_params):
+            (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(sender, operator).call(tx_params.as_dict())
 
@@ -408,7 +450,8 @@ class RevokeOperatorMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
+        with sent_from(tx_params):
+            (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, operator).transact(tx_params.as_dict())
 
@@ -416,7 +459,8 @@ class RevokeOperatorMethod(ContractMethod):
         self, sender: str, operator: str, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
+        with sent_from(tx_params):
+            (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, operator).buildTransaction(
             tx_params.as_dict()
@@ -426,7 +470,8 @@ class RevokeOperatorMethod(ContractMethod):
         self, sender: str, operator: str, tx_params: Optional[TxParams] = None
     ) -> int:
         """Estimate gas consumption of method call."""
-        (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
+        with sent_from(tx_params):
+            (sender, operator) = self.validate_and_normalize_inputs(sender, operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, operator).estimateGas(
             tx_params.as_dict()
@@ -455,15 +500,8 @@ class GetAccountMethod(ContractMethod):
         acc = self.validate_and_checksum_address(acc)
         return acc
 
-    def call(self, acc: str, tx_params: Optional[TxParams] = None) -> AccountAcc:
-        """Execute underlying contract method via eth_call.
-
-        :param tx_params: transaction parameters
-
-        """
-        (acc) = self.validate_and_normalize_inputs(acc)
-        tx_params = super().normalize_tx_params(tx_params)
-        returned = self._underlying_method(acc).call(tx_params.as_dict())
+    def convert_output(self, returned: Any) -> AccountAcc:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
         return AccountAcc(
             acc=returned[0],
             pAcc=returned[1],
@@ -474,9 +512,22 @@ class GetAccountMethod(ContractMethod):
             status=returned[6],
         )
 
+    def call(self, acc: str, tx_params: Optional[TxParams] = None) -> AccountAcc:
+        """Execute underlying contract method via eth_call.
+
+        :param tx_params: transaction parameters
+
+        """
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
+        tx_params = super().normalize_tx_params(tx_params)
+        returned = self._underlying_method(acc).call(tx_params.as_dict())
+        return self.convert_output(returned)
+
     def estimate_gas(self, acc: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).estimateGas(tx_params.as_dict())
 
@@ -503,20 +554,26 @@ class GetParentAccountMethod(ContractMethod):
         acc = self.validate_and_checksum_address(acc)
         return acc
 
+    def convert_output(self, returned: Any) -> str:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return str(returned)
+
     def call(self, acc: str, tx_params: Optional[TxParams] = None) -> str:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(acc).call(tx_params.as_dict())
-        return str(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, acc: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).estimateGas(tx_params.as_dict())
 
@@ -549,6 +606,10 @@ class IsOperatorForMethod(ContractMethod):
         acc = self.validate_and_checksum_address(acc)
         return (operator, acc)
 
+    def convert_output(self, returned: Any) -> bool:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return bool(returned)
+
     def call(
         self, operator: str, acc: str, tx_params: Optional[TxParams] = None
     ) -> bool:
@@ -557,16 +618,18 @@ class IsOperatorForMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        (operator, acc) = self.validate_and_normalize_inputs(operator, acc)
+        with sent_from(tx_params):
+            (operator, acc) = self.validate_and_normalize_inputs(operator, acc)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(operator, acc).call(tx_params.as_dict())
-        return bool(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(
         self, operator: str, acc: str, tx_params: Optional[TxParams] = None
     ) -> int:
         """Estimate gas consumption of method call."""
-        (operator, acc) = self.validate_and_normalize_inputs(operator, acc)
+        with sent_from(tx_params):
+            (operator, acc) = self.validate_and_normalize_inputs(operator, acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(operator, acc).estimateGas(tx_params.as_dict())
 
@@ -593,20 +656,26 @@ class IsActiveMethod(ContractMethod):
         acc = self.validate_and_checksum_address(acc)
         return acc
 
+    def convert_output(self, returned: Any) -> bool:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return bool(returned)
+
     def call(self, acc: str, tx_params: Optional[TxParams] = None) -> bool:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(acc).call(tx_params.as_dict())
-        return bool(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, acc: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).estimateGas(tx_params.as_dict())
 
@@ -615,48 +684,54 @@ class IsActiveMethod(ContractMethod):
 class Account:
     """Wrapper class for Account Solidity contract."""
 
-    initialize: InitializeMethod
-    """Constructor-initialized instance of
+    initialize = LazyMethod(InitializeMethod, "initialize", validated=True)
+    """Lazily-initialized instance of
     :class:`InitializeMethod`.
     """
 
-    add_account: AddAccountMethod
-    """Constructor-initialized instance of
+    add_account = LazyMethod(AddAccountMethod, "addAccount", validated=True)
+    """Lazily-initialized instance of
     :class:`AddAccountMethod`.
     """
 
-    update_account_status: UpdateAccountStatusMethod
-    """Constructor-initialized instance of
+    update_account_status = LazyMethod(
+        UpdateAccountStatusMethod, "updateAccountStatus", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`UpdateAccountStatusMethod`.
     """
 
-    authorize_operator: AuthorizeOperatorMethod
-    """Constructor-initialized instance of
+    authorize_operator = LazyMethod(
+        AuthorizeOperatorMethod, "authorizeOperator", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`AuthorizeOperatorMethod`.
     """
 
-    revoke_operator: RevokeOperatorMethod
-    """Constructor-initialized instance of
+    revoke_operator = LazyMethod(RevokeOperatorMethod, "revokeOperator", validated=True)
+    """Lazily-initialized instance of
     :class:`RevokeOperatorMethod`.
     """
 
-    get_account: GetAccountMethod
-    """Constructor-initialized instance of
+    get_account = LazyMethod(GetAccountMethod, "getAccount", validated=True)
+    """Lazily-initialized instance of
     :class:`GetAccountMethod`.
     """
 
-    get_parent_account: GetParentAccountMethod
-    """Constructor-initialized instance of
+    get_parent_account = LazyMethod(
+        GetParentAccountMethod, "getParentAccount", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`GetParentAccountMethod`.
     """
 
-    is_operator_for: IsOperatorForMethod
-    """Constructor-initialized instance of
+    is_operator_for = LazyMethod(IsOperatorForMethod, "isOperatorFor", validated=True)
+    """Lazily-initialized instance of
     :class:`IsOperatorForMethod`.
     """
 
-    is_active: IsActiveMethod
-    """Constructor-initialized instance of
+    is_active = LazyMethod(IsActiveMethod, "isActive", validated=True)
+    """Lazily-initialized instance of
     :class:`IsActiveMethod`.
     """
 
@@ -710,47 +785,78 @@ class Account:
 
         self._web3_eth = web3.eth
 
-        functions = self._web3_eth.contract(
-            address=to_checksum_address(contract_address), abi=Account.abi()
-        ).functions
+        self._web3_or_provider = web3_or_provider
+        self._validator = validator
+        self._address = to_checksum_address(contract_address)
 
-        self.initialize = InitializeMethod(
-            web3_or_provider, contract_address, functions.initialize, validator
-        )
+    def _build_method(
+        self, method_class: Any, function_name: str, validated: bool = False
+    ) -> Any:
+        """Return the `method_class`:code: instance calling `function_name`:code:.
 
-        self.add_account = AddAccountMethod(
-            web3_or_provider, contract_address, functions.addAccount, validator
+        Only the ABI entry of `function_name`:code: is resolved, so a method
+        costs nothing until it is first used.  Pure functions with an
+        in-process implementation are evaluated locally, see
+        `app.eth.methods.local_method_class`:code:.
+        """
+        function = ContractFunction.factory(
+            function_name,
+            web3=self._web3_eth.web3,
+            contract_abi=_WEB3_ABI,
+            address=self._address,
+            function_identifier=function_name,
         )
-
-        self.update_account_status = UpdateAccountStatusMethod(
-            web3_or_provider,
-            contract_address,
-            functions.updateAccountStatus,
-            validator,
+        method_class = local_method_class(
+            method_class, FUNCTION_ABIS[FUNCTION_SELECTORS[function_name]]
         )
+        if validated:
+            return method_class(
+                self._web3_or_provider, self.contract_address, function, self._validator
+            )
+        return method_class(self._web3_or_provider, self.contract_address, function)
 
-        self.authorize_operator = AuthorizeOperatorMethod(
-            web3_or_provider, contract_address, functions.authorizeOperator, validator,
-        )
+    def batch(self) -> Batch:
+        """Return a batch queueing view calls into a single JSON-RPC request.
 
-        self.revoke_operator = RevokeOperatorMethod(
-            web3_or_provider, contract_address, functions.revokeOperator, validator,
-        )
+        Methods of this wrapper are reachable as attributes of the batch, e.g.
+        `batch.balance_of(owner, token_id)`:code:, and calls to other
+        wrappers on the same node can be queued with `Batch.add`:code:.
+        """
+        return Batch(self._web3_eth, self)
 
-        self.get_account = GetAccountMethod(
-            web3_or_provider, contract_address, functions.getAccount, validator
-        )
+    def aggregate(self, block_identifier: BlockIdentifier = "latest") -> Aggregate:
+        """Return an aggregate packing view calls into one Multicall eth_call.
 
-        self.get_parent_account = GetParentAccountMethod(
-            web3_or_provider, contract_address, functions.getParentAccount, validator,
-        )
+        Every queued call is read at the same block; without a configured
+        aggregator the calls are sent as a plain batch instead.
 
-        self.is_operator_for = IsOperatorForMethod(
-            web3_or_provider, contract_address, functions.isOperatorFor, validator,
-        )
+        :param block_identifier: block at which the calls are evaluated
+        """
+        return Aggregate(self._web3_eth, self, block_identifier=block_identifier)
+
+    def cached(self) -> CachedContract:
+        """Return a view of this wrapper whose view calls are cached.
+
+        Immutable reads are cached indefinitely and state reads until the next
+        block, in-process and in the shared Django cache.
+        """
+        return CachedContract(self, get_read_cache(self._web3_eth.web3))
+
+    def pipeline(
+        self, account: LocalAccount, max_workers: int = 8
+    ) -> TransactionPipeline:
+        """Return a pipeline sending transactions signed by `account`:code:.
 
-        self.is_active = IsActiveMethod(
-            web3_or_provider, contract_address, functions.isActive, validator
+        Methods of this wrapper are reachable as attributes of the pipeline,
+        e.g. `pipeline.send(to, ids, amounts, data)`:code:, which returns the
+        future of the transaction hash; nonces come from the shared nonce
+        manager of the node.
+
+        :param account: local account signing the transactions
+        :param max_workers: how many transactions are in flight at once
+        """
+        return TransactionPipeline(
+            self._web3_eth.web3, account, wrapper=self, max_workers=max_workers
         )
 
     def get_account_created_event(
@@ -760,14 +866,8 @@ class Account:
 
         :param tx_hash: hash of transaction emitting AccountCreated event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address), abi=Account.abi(),
-            )
-            .events.AccountCreated()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["AccountCreated"])
 
     def get_account_status_updated_event(
         self, tx_hash: Union[HexBytes, bytes]
@@ -776,14 +876,8 @@ class Account:
 
         :param tx_hash: hash of transaction emitting AccountStatusUpdated event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address), abi=Account.abi(),
-            )
-            .events.AccountStatusUpdated()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["AccountStatusUpdated"])
 
     def get_authorized_operator_event(
         self, tx_hash: Union[HexBytes, bytes]
@@ -792,14 +886,8 @@ class Account:
 
         :param tx_hash: hash of transaction emitting AuthorizedOperator event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address), abi=Account.abi(),
-            )
-            .events.AuthorizedOperator()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["AuthorizedOperator"])
 
     def get_revoked_operator_event(
         self, tx_hash: Union[HexBytes, bytes]
@@ -808,21 +896,179 @@ class Account:
 
         :param tx_hash: hash of transaction emitting RevokedOperator event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address), abi=Account.abi(),
-            )
-            .events.RevokedOperator()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["RevokedOperator"])
 
     @staticmethod
     def abi():
         """Return the ABI to the underlying contract."""
-        return json.loads(
-            '[{"inputs":[{"internalType":"uint256","name":"_breadth","type":"uint256"},{"internalType":"uint256","name":"_depth","type":"uint256"}],"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"_acc","type":"address"},{"indexed":false,"internalType":"address","name":"_pAcc","type":"address"},{"indexed":false,"internalType":"address","name":"_uAcc","type":"address"},{"indexed":false,"internalType":"string","name":"_name","type":"string"},{"indexed":false,"internalType":"uint256","name":"level","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"_status","type":"uint256"}],"name":"AccountCreated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"_acc","type":"address"},{"indexed":false,"internalType":"uint256","name":"_status","type":"uint256"}],"name":"AccountStatusUpdated","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"holder","type":"address"}],"name":"AuthorizedOperator","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"holder","type":"address"}],"name":"RevokedOperator","type":"event"},{"inputs":[{"internalType":"address","name":"_implementation","type":"address"}],"name":"initialize","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"},{"internalType":"address","name":"_pAcc","type":"address"},{"internalType":"string","name":"_name","type":"string"}],"name":"addAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"},{"internalType":"uint256","name":"_action","type":"uint256"}],"name":"updateAccountStatus","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address","name":"_operator","type":"address"}],"name":"authorizeOperator","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address","name":"_operator","type":"address"}],"name":"revokeOperator","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"getAccount","outputs":[{"components":[{"internalType":"address","name":"acc","type":"address"},{"internalType":"address","name":"pAcc","type":"address"},{"internalType":"address","name":"uAcc","type":"address"},{"internalType":"string","name":"name","type":"string"},{"internalType":"uint256","name":"level","type":"uint256"},{"internalType":"address[]","name":"subAccs","type":"address[]"},{"internalType":"uint256","name":"status","type":"uint256"}],"internalType":"struct Account.Acc","name":"","type":"tuple"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"getParentAccount","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_operator","type":"address"},{"internalType":"address","name":"_acc","type":"address"}],"name":"isOperatorFor","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"isActive","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"view","type":"function","constant":true}]'  # noqa: E501 (line-too-long)
-        )
+        return ABI
+
+
+# pylint: disable=too-many-public-methods,too-many-instance-attributes
+class AsyncAccount:
+    """Asyncio wrapper class for Account Solidity contract.
+
+    Every method is an :class:`AsyncContractMethod` mirroring the method of
+    the same name on :class:`Account`.
+    """
+
+    initialize = LazyMethod(AsyncContractMethod, "initialize")
+    """Asyncio flavour of :class:`InitializeMethod`."""
+
+    add_account = LazyMethod(AsyncContractMethod, "add_account")
+    """Asyncio flavour of :class:`AddAccountMethod`."""
+
+    update_account_status = LazyMethod(AsyncContractMethod, "update_account_status")
+    """Asyncio flavour of :class:`UpdateAccountStatusMethod`."""
+
+    authorize_operator = LazyMethod(AsyncContractMethod, "authorize_operator")
+    """Asyncio flavour of :class:`AuthorizeOperatorMethod`."""
+
+    revoke_operator = LazyMethod(AsyncContractMethod, "revoke_operator")
+    """Asyncio flavour of :class:`RevokeOperatorMethod`."""
+
+    get_account = LazyMethod(AsyncContractMethod, "get_account")
+    """Asyncio flavour of :class:`GetAccountMethod`."""
+
+    get_parent_account = LazyMethod(AsyncContractMethod, "get_parent_account")
+    """Asyncio flavour of :class:`GetParentAccountMethod`."""
+
+    is_operator_for = LazyMethod(AsyncContractMethod, "is_operator_for")
+    """Asyncio flavour of :class:`IsOperatorForMethod`."""
+
+    is_active = LazyMethod(AsyncContractMethod, "is_active")
+    """Asyncio flavour of :class:`IsActiveMethod`."""
+
+    def __init__(
+        self,
+        web3_or_provider: Union[Web3, BaseProvider],
+        contract_address: str,
+        validator: AccountValidator = None,
+        async_provider: AsyncHTTPProvider = None,
+    ):
+        """Get an instance of asyncio wrapper for smart contract.
+
+        :param web3_or_provider: Either an instance of `web3.Web3`:code: or
+            `web3.providers.base.BaseProvider`:code:, used to encode calls
+        :param contract_address: where the contract has been deployed
+        :param validator: for validation of method inputs.
+        :param async_provider: sends every request; defaults to the shared
+            provider for the node behind `web3_or_provider`:code:
+        """
+        self._wrapper = Account(web3_or_provider, contract_address, validator)
+        self.contract_address = contract_address
+        self._provider = get_async_provider(async_provider or web3_or_provider)
+
+    def _build_method(self, method_class: Any, name: str) -> Any:
+        """Return the `method_class`:code: instance mirroring `name`:code:."""
+        return method_class(self._provider, getattr(self._wrapper, name))
+
+    async def get_account_created_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for AccountCreated event.
+
+        :param tx_hash: hash of transaction emitting AccountCreated event
+        """
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["AccountCreated"])
+
+    async def get_account_status_updated_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for AccountStatusUpdated event.
+
+        :param tx_hash: hash of transaction emitting AccountStatusUpdated event
+        """
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["AccountStatusUpdated"])
+
+    async def get_authorized_operator_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for AuthorizedOperator event.
+
+        :param tx_hash: hash of transaction emitting AuthorizedOperator event
+        """
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["AuthorizedOperator"])
+
+    async def get_revoked_operator_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for RevokedOperator event.
+
+        :param tx_hash: hash of transaction emitting RevokedOperator event
+        """
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["RevokedOperator"])
+
+
+def _freeze(value):
+    """Recursively turn parsed JSON into read-only containers."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _decode_receipt_logs(tx_receipt, topic: bytes) -> Tuple[AttributeDict]:
+    """Decode the logs of `tx_receipt`:code: emitted for the event `topic`:code:."""
+    decode = EVENT_DECODERS[topic]
+    return tuple(
+        decode(log)
+        for log in tx_receipt["logs"]
+        if log["topics"] and log["topics"][0] == topic
+    )
+
+
+# Parsed once at import time.  web3 gets its own plain copy because it expects
+# mutable dicts, everybody else gets the read-only ABI.
+_WEB3_ABI = json.loads(
+    '[{"inputs":[{"internalType":"uint256","name":"_breadth","type":"uint256"},{"internalType":"uint256","name":"_depth","type":"uint256"}],"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"_acc","type":"address"},{"indexed":false,"internalType":"address","name":"_pAcc","type":"address"},{"indexed":false,"internalType":"address","name":"_uAcc","type":"address"},{"indexed":false,"internalType":"string","name":"_name","type":"string"},{"indexed":false,"internalType":"uint256","name":"level","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"_status","type":"uint256"}],"name":"AccountCreated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"_acc","type":"address"},{"indexed":false,"internalType":"uint256","name":"_status","type":"uint256"}],"name":"AccountStatusUpdated","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"holder","type":"address"}],"name":"AuthorizedOperator","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"holder","type":"address"}],"name":"RevokedOperator","type":"event"},{"inputs":[{"internalType":"address","name":"_implementation","type":"address"}],"name":"initialize","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"},{"internalType":"address","name":"_pAcc","type":"address"},{"internalType":"string","name":"_name","type":"string"}],"name":"addAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"},{"internalType":"uint256","name":"_action","type":"uint256"}],"name":"updateAccountStatus","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address","name":"_operator","type":"address"}],"name":"authorizeOperator","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address","name":"_operator","type":"address"}],"name":"revokeOperator","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"getAccount","outputs":[{"components":[{"internalType":"address","name":"acc","type":"address"},{"internalType":"address","name":"pAcc","type":"address"},{"internalType":"address","name":"uAcc","type":"address"},{"internalType":"string","name":"name","type":"string"},{"internalType":"uint256","name":"level","type":"uint256"},{"internalType":"address[]","name":"subAccs","type":"address[]"},{"internalType":"uint256","name":"status","type":"uint256"}],"internalType":"struct Account.Acc","name":"","type":"tuple"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"getParentAccount","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_operator","type":"address"},{"internalType":"address","name":"_acc","type":"address"}],"name":"isOperatorFor","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"isActive","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"view","type":"function","constant":true}]'  # noqa: E501 (line-too-long)
+)
+_CODEC = ABICodec(build_default_registry())
+
+ABI = _freeze(_WEB3_ABI)
+"""Immutable ABI of the underlying contract."""
+
+FUNCTION_SELECTORS = MappingProxyType(
+    {
+        entry["name"]: function_abi_to_4byte_selector(entry)
+        for entry in _WEB3_ABI
+        if entry["type"] == "function"
+    }
+)
+"""4-byte selector of every function, keyed by function name."""
+
+FUNCTION_ABIS = MappingProxyType(
+    {
+        FUNCTION_SELECTORS[entry["name"]]: entry
+        for entry in ABI
+        if entry["type"] == "function"
+    }
+)
+"""ABI entry of every function, keyed by its 4-byte selector."""
+
+EVENT_TOPICS = MappingProxyType(
+    {
+        entry["name"]: event_abi_to_log_topic(entry)
+        for entry in _WEB3_ABI
+        if entry["type"] == "event"
+    }
+)
+"""Topic 0 of every event, keyed by event name."""
+
+EVENT_DECODERS = MappingProxyType(
+    {
+        EVENT_TOPICS[entry["name"]]: partial(get_event_data, _CODEC, entry)
+        for entry in _WEB3_ABI
+        if entry["type"] == "event"
+    }
+)
+"""Log decoder of every event, keyed by its topic 0."""
 
 
 # pylint: disable=too-many-lines
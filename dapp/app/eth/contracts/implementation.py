@@ -3,6 +3,8 @@
 # pylint: disable=too-many-arguments
 
 import json
+from functools import partial
+from types import MappingProxyType
 from typing import (  # noqa
     Any,
     List,
@@ -11,17 +13,40 @@ from typing import (  # noqa
     Union,
 )
 
-from eth_utils import to_checksum_address
+from eth_abi.codec import ABICodec
+from eth_account.signers.local import LocalAccount
+from eth_utils import (
+    event_abi_to_log_topic,
+    function_abi_to_4byte_selector,
+    to_checksum_address,
+)
 from mypy_extensions import TypedDict
 from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
+from web3.types import BlockIdentifier
+from web3._utils.abi import build_default_registry
+from web3._utils.events import get_event_data
 
 from zero_ex.contract_wrappers.bases import ContractMethod, Validator
 from zero_ex.contract_wrappers.tx_params import TxParams
 
+from app.eth.aio import (
+    AsyncContractMethod,
+    AsyncHTTPProvider,
+    get_async_provider,
+    get_transaction_receipt,
+)
+from app.eth.batch import Batch
+from app.eth.cache import CachedContract, get_read_cache
+from app.eth.methods import LazyMethod, local_method_class
+from app.eth.multicall import Aggregate
+from app.eth.pipeline import TransactionPipeline
+from app.eth.preflight import sent_from
+from app.eth.receipts import get_receipt_tracker
+
 
 # Try to import a custom validator class definition; if there isn't one,
 # declare one that we can instantiate for the default argument to the
@@ -86,6 +111,10 @@ class DomainSeparatorMethod(ContractMethod):
         super().__init__(web3_or_provider, contract_address)
         self._underlying_method = contract_function
 
+    def convert_output(self, returned: Any) -> Union[bytes, str]:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return Union[bytes, str](returned)
+
     def call(self, tx_params: Optional[TxParams] = None) -> Union[bytes, str]:
         """Execute underlying contract method via eth_call.
 
@@ -94,7 +123,7 @@ class DomainSeparatorMethod(ContractMethod):
         """
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method().call(tx_params.as_dict())
-        return Union[bytes, str](returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
@@ -115,6 +144,10 @@ class Eip712DomainTypehashMethod(ContractMethod):
         super().__init__(web3_or_provider, contract_address)
         self._underlying_method = contract_function
 
+    def convert_output(self, returned: Any) -> Union[bytes, str]:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return Union[bytes, str](returned)
+
     def call(self, tx_params: Optional[TxParams] = None) -> Union[bytes, str]:
         """Execute underlying contract method via eth_call.
 
@@ -123,7 +156,7 @@ class Eip712DomainTypehashMethod(ContractMethod):
         """
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method().call(tx_params.as_dict())
-        return Union[bytes, str](returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
@@ -144,6 +177,10 @@ class SwapTypehashMethod(ContractMethod):
         super().__init__(web3_or_provider, contract_address)
         self._underlying_method = contract_function
 
+    def convert_output(self, returned: Any) -> Union[bytes, str]:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return Union[bytes, str](returned)
+
     def call(self, tx_params: Optional[TxParams] = None) -> Union[bytes, str]:
         """Execute underlying contract method via eth_call.
 
@@ -152,7 +189,7 @@ class SwapTypehashMethod(ContractMethod):
         """
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method().call(tx_params.as_dict())
-        return Union[bytes, str](returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
@@ -173,6 +210,10 @@ class NameMethod(ContractMethod):
         super().__init__(web3_or_provider, contract_address)
         self._underlying_method = contract_function
 
+    def convert_output(self, returned: Any) -> str:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return str(returned)
+
     def call(self, tx_params: Optional[TxParams] = None) -> str:
         """Execute underlying contract method via eth_call.
 
@@ -181,7 +222,7 @@ class NameMethod(ContractMethod):
         """
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method().call(tx_params.as_dict())
-        return str(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
@@ -202,6 +243,10 @@ class OwnerMethod(ContractMethod):
         super().__init__(web3_or_provider, contract_address)
         self._underlying_method = contract_function
 
+    def convert_output(self, returned: Any) -> str:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return str(returned)
+
     def call(self, tx_params: Optional[TxParams] = None) -> str:
         """Execute underlying contract method via eth_call.
 
@@ -210,7 +255,7 @@ class OwnerMethod(ContractMethod):
         """
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method().call(tx_params.as_dict())
-        return str(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
@@ -285,20 +330,26 @@ class SignerNoncesMethod(ContractMethod):
         index_0 = self.validate_and_checksum_address(index_0)
         return index_0
 
+    def convert_output(self, returned: Any) -> int:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return int(returned)
+
     def call(self, index_0: str, tx_params: Optional[TxParams] = None) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (index_0) = self.validate_and_normalize_inputs(index_0)
+        with sent_from(tx_params):
+            (index_0) = self.validate_and_normalize_inputs(index_0)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(index_0).call(tx_params.as_dict())
-        return int(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, index_0: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (index_0) = self.validate_and_normalize_inputs(index_0)
+        with sent_from(tx_params):
+            (index_0) = self.validate_and_normalize_inputs(index_0)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(index_0).estimateGas(tx_params.as_dict())
 
@@ -333,7 +384,8 @@ class TransferOwnershipMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (new_owner) = self.validate_and_normalize_inputs(new_owner)
+        with sent_from(tx_params):
+            (new_owner) = self.validate_and_normalize_inputs(new_owner)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(new_owner).call(tx_params.as_dict())
 
@@ -344,7 +396,8 @@ class TransferOwnershipMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (new_owner) = self.validate_and_normalize_inputs(new_owner)
+        with sent_from(tx_params):
+            (new_owner) = self.validate_and_normalize_inputs(new_owner)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(new_owner).transact(tx_params.as_dict())
 
@@ -352,13 +405,15 @@ class TransferOwnershipMethod(ContractMethod):
         self, new_owner: str, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (new_owner) = self.validate_and_normalize_inputs(new_owner)
+        with sent_from(tx_params):
+            (new_owner) = self.validate_and_normalize_inputs(new_owner)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(new_owner).buildTransaction(tx_params.as_dict())
 
     def estimate_gas(self, new_owner: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (new_owner) = self.validate_and_normalize_inputs(new_owner)
+        with sent_from(tx_params):
+            (new_owner) = self.validate_and_normalize_inputs(new_owner)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(new_owner).estimateGas(tx_params.as_dict())
 
@@ -390,7 +445,8 @@ class RegisterMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (name) = self.validate_and_normalize_inputs(name)
+        with sent_from(tx_params):
+            (name) = self.validate_and_normalize_inputs(name)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(name).call(tx_params.as_dict())
 
@@ -401,7 +457,8 @@ class RegisterMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (name) = self.validate_and_normalize_inputs(name)
+        with sent_from(tx_params):
+            (name) = self.validate_and_normalize_inputs(name)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(name).transact(tx_params.as_dict())
 
@@ -409,13 +466,15 @@ class RegisterMethod(ContractMethod):
         self, name: str, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (name) = self.validate_and_normalize_inputs(name)
+        with sent_from(tx_params):
+            (name) = self.validate_and_normalize_inputs(name)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(name).buildTransaction(tx_params.as_dict())
 
     def estimate_gas(self, name: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (name) = self.validate_and_normalize_inputs(name)
+        with sent_from(tx_params):
+            (name) = self.validate_and_normalize_inputs(name)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(name).estimateGas(tx_params.as_dict())
 
@@ -451,7 +510,8 @@ class AddSubAccountMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (acc, name) = self.validate_and_normalize_inputs(acc, name)
+        with sent_from(tx_params):
+            (acc, name) = self.validate_and_normalize_inputs(acc, name)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(acc, name).call(tx_params.as_dict())
 
@@ -462,7 +522,8 @@ class AddSubAccountMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (acc, name) = self.validate_and_normalize_inputs(acc, name)
+        with sent_from(tx_params):
+            (acc, name) = self.validate_and_normalize_inputs(acc, name)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc, name).transact(tx_params.as_dict())
 
@@ -470,7 +531,8 @@ class AddSubAccountMethod(ContractMethod):
         self, acc: str, name: str, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (acc, name) = self.validate_and_normalize_inputs(acc, name)
+        with sent_from(tx_params):
+            (acc, name) = self.validate_and_normalize_inputs(acc, name)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc, name).buildTransaction(tx_params.as_dict())
 
@@ -478,7 +540,8 @@ class AddSubAccountMethod(ContractMethod):
         self, acc: str, name: str, tx_params: Optional[TxParams] = None
     ) -> int:
         """Estimate gas consumption of method call."""
-        (acc, name) = self.validate_and_normalize_inputs(acc, name)
+        with sent_from(tx_params):
+            (acc, name) = self.validate_and_normalize_inputs(acc, name)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc, name).estimateGas(tx_params.as_dict())
 
@@ -511,7 +574,8 @@ class SuspendAccountMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(acc).call(tx_params.as_dict())
 
@@ -522,19 +586,22 @@ class SuspendAccountMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).transact(tx_params.as_dict())
 
     def build_transaction(self, acc: str, tx_params: Optional[TxParams] = None) -> dict:
         """Construct calldata to be used as input to the method."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).buildTransaction(tx_params.as_dict())
 
     def estimate_gas(self, acc: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).estimateGas(tx_params.as_dict())
 
@@ -567,7 +634,8 @@ class ReactivateAccountMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(acc).call(tx_params.as_dict())
 
@@ -578,19 +646,22 @@ class ReactivateAccountMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).transact(tx_params.as_dict())
 
     def build_transaction(self, acc: str, tx_params: Optional[TxParams] = None) -> dict:
         """Construct calldata to be used as input to the method."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).buildTransaction(tx_params.as_dict())
 
     def estimate_gas(self, acc: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).estimateGas(tx_params.as_dict())
 
@@ -623,7 +694,8 @@ class BlacklistAccountMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(acc).call(tx_params.as_dict())
 
@@ -634,19 +706,22 @@ class BlacklistAccountMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).transact(tx_params.as_dict())
 
     def build_transaction(self, acc: str, tx_params: Optional[TxParams] = None) -> dict:
         """Construct calldata to be used as input to the method."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).buildTransaction(tx_params.as_dict())
 
     def estimate_gas(self, acc: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).estimateGas(tx_params.as_dict())
 
@@ -679,7 +754,8 @@ class RecoverAccountMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(acc).call(tx_params.as_dict())
 
@@ -690,19 +766,22 @@ class RecoverAccountMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).transact(tx_params.as_dict())
 
     def build_transaction(self, acc: str, tx_params: Optional[TxParams] = None) -> dict:
         """Construct calldata to be used as input to the method."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).buildTransaction(tx_params.as_dict())
 
     def estimate_gas(self, acc: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (acc) = self.validate_and_normalize_inputs(acc)
+        with sent_from(tx_params):
+            (acc) = self.validate_and_normalize_inputs(acc)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(acc).estimateGas(tx_params.as_dict())
 
@@ -737,7 +816,8 @@ class AuthorizeOperatorMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (operator) = self.validate_and_normalize_inputs(operator)
+        with sent_from(tx_params):
+            (operator) = self.validate_and_normalize_inputs(operator)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(operator).call(tx_params.as_dict())
 
@@ -748,7 +828,8 @@ class AuthorizeOperatorMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (operator) = self.validate_and_normalize_inputs(operator)
+        with sent_from(tx_params):
+            (operator) = self.validate_and_normalize_inputs(operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(operator).transact(tx_params.as_dict())
 
@@ -756,13 +837,15 @@ class AuthorizeOperatorMethod(ContractMethod):
         self, operator: str, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (operator) = self.validate_and_normalize_inputs(operator)
+        with sent_from(tx_params):
+            (operator) = self.validate_and_normalize_inputs(operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(operator).buildTransaction(tx_params.as_dict())
 
     def estimate_gas(self, operator: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (operator) = self.validate_and_normalize_inputs(operator)
+        with sent_from(tx_params):
+            (operator) = self.validate_and_normalize_inputs(operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(operator).estimateGas(tx_params.as_dict())
 
@@ -797,7 +880,8 @@ class RevokeOperatorMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (operator) = self.validate_and_normalize_inputs(operator)
+        with sent_from(tx_params):
+            (operator) = self.validate_and_normalize_inputs(operator)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(operator).call(tx_params.as_dict())
 
@@ -808,7 +892,8 @@ class RevokeOperatorMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (operator) = self.validate_and_normalize_inputs(operator)
+        with sent_from(tx_params):
+            (operator) = self.validate_and_normalize_inputs(operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(operator).transact(tx_params.as_dict())
 
@@ -816,13 +901,15 @@ class RevokeOperatorMethod(ContractMethod):
         self, operator: str, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (operator) = self.validate_and_normalize_inputs(operator)
+        with sent_from(tx_params):
+            (operator) = self.validate_and_normalize_inputs(operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(operator).buildTransaction(tx_params.as_dict())
 
     def estimate_gas(self, operator: str, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (operator) = self.validate_and_normalize_inputs(operator)
+        with sent_from(tx_params):
+            (operator) = self.validate_and_normalize_inputs(operator)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(operator).estimateGas(tx_params.as_dict())
 
@@ -868,7 +955,8 @@ class CreateMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (uri, is_nf, data) = self.validate_and_normalize_inputs(uri, is_nf, data)
+        with sent_from(tx_params):
+            (uri, is_nf, data) = self.validate_and_normalize_inputs(uri, is_nf, data)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(uri, is_nf, data).call(tx_params.as_dict())
 
@@ -883,7 +971,8 @@ class CreateMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (uri, is_nf, data) = self.validate_and_normalize_inputs(uri, is_nf, data)
+        with sent_from(tx_params):
+            (uri, is_nf, data) = self.validate_and_normalize_inputs(uri, is_nf, data)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(uri, is_nf, data).transact(tx_params.as_dict())
 
@@ -895,7 +984,8 @@ class CreateMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (uri, is_nf, data) = self.validate_and_normalize_inputs(uri, is_nf, data)
+        with sent_from(tx_params):
+            (uri, is_nf, data) = self.validate_and_normalize_inputs(uri, is_nf, data)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(uri, is_nf, data).buildTransaction(
             tx_params.as_dict()
@@ -909,7 +999,8 @@ class CreateMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (uri, is_nf, data) = self.validate_and_normalize_inputs(uri, is_nf, data)
+        with sent_from(tx_params):
+            (uri, is_nf, data) = self.validate_and_normalize_inputs(uri, is_nf, data)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(uri, is_nf, data).estimateGas(
             tx_params.as_dict()
@@ -965,9 +1056,10 @@ class MintFungibleMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (to, _id, amounts, data) = self.validate_and_normalize_inputs(
-            to, _id, amounts, data
-        )
+        with sent_from(tx_params):
+            (to, _id, amounts, data) = self.validate_and_normalize_inputs(
+                to, _id, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(to, _id, amounts, data).call(tx_params.as_dict())
 
@@ -983,9 +1075,10 @@ class MintFungibleMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (to, _id, amounts, data) = self.validate_and_normalize_inputs(
-            to, _id, amounts, data
-        )
+        with sent_from(tx_params):
+            (to, _id, amounts, data) = self.validate_and_normalize_inputs(
+                to, _id, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(to, _id, amounts, data).transact(
             tx_params.as_dict()
@@ -1000,9 +1093,10 @@ class MintFungibleMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (to, _id, amounts, data) = self.validate_and_normalize_inputs(
-            to, _id, amounts, data
-        )
+        with sent_from(tx_params):
+            (to, _id, amounts, data) = self.validate_and_normalize_inputs(
+                to, _id, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(to, _id, amounts, data).buildTransaction(
             tx_params.as_dict()
@@ -1017,9 +1111,10 @@ class MintFungibleMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (to, _id, amounts, data) = self.validate_and_normalize_inputs(
-            to, _id, amounts, data
-        )
+        with sent_from(tx_params):
+            (to, _id, amounts, data) = self.validate_and_normalize_inputs(
+                to, _id, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(to, _id, amounts, data).estimateGas(
             tx_params.as_dict()
@@ -1069,7 +1164,8 @@ class MintNonFungibleMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (to, _type, data) = self.validate_and_normalize_inputs(to, _type, data)
+        with sent_from(tx_params):
+            (to, _type, data) = self.validate_and_normalize_inputs(to, _type, data)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(to, _type, data).call(tx_params.as_dict())
 
@@ -1084,7 +1180,8 @@ class MintNonFungibleMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (to, _type, data) = self.validate_and_normalize_inputs(to, _type, data)
+        with sent_from(tx_params):
+            (to, _type, data) = self.validate_and_normalize_inputs(to, _type, data)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(to, _type, data).transact(tx_params.as_dict())
 
@@ -1096,7 +1193,8 @@ class MintNonFungibleMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (to, _type, data) = self.validate_and_normalize_inputs(to, _type, data)
+        with sent_from(tx_params):
+            (to, _type, data) = self.validate_and_normalize_inputs(to, _type, data)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(to, _type, data).buildTransaction(
             tx_params.as_dict()
@@ -1110,7 +1208,8 @@ class MintNonFungibleMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (to, _type, data) = self.validate_and_normalize_inputs(to, _type, data)
+        with sent_from(tx_params):
+            (to, _type, data) = self.validate_and_normalize_inputs(to, _type, data)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(to, _type, data).estimateGas(tx_params.as_dict())
 
@@ -1161,9 +1260,10 @@ class SendMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (to, ids, amounts, data) = self.validate_and_normalize_inputs(
-            to, ids, amounts, data
-        )
+        with sent_from(tx_params):
+            (to, ids, amounts, data) = self.validate_and_normalize_inputs(
+                to, ids, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(to, ids, amounts, data).call(tx_params.as_dict())
 
@@ -1179,9 +1279,10 @@ class SendMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (to, ids, amounts, data) = self.validate_and_normalize_inputs(
-            to, ids, amounts, data
-        )
+        with sent_from(tx_params):
+            (to, ids, amounts, data) = self.validate_and_normalize_inputs(
+                to, ids, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(to, ids, amounts, data).transact(
             tx_params.as_dict()
@@ -1196,9 +1297,10 @@ class SendMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (to, ids, amounts, data) = self.validate_and_normalize_inputs(
-            to, ids, amounts, data
-        )
+        with sent_from(tx_params):
+            (to, ids, amounts, data) = self.validate_and_normalize_inputs(
+                to, ids, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(to, ids, amounts, data).buildTransaction(
             tx_params.as_dict()
@@ -1213,9 +1315,10 @@ class SendMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (to, ids, amounts, data) = self.validate_and_normalize_inputs(
-            to, ids, amounts, data
-        )
+        with sent_from(tx_params):
+            (to, ids, amounts, data) = self.validate_and_normalize_inputs(
+                to, ids, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(to, ids, amounts, data).estimateGas(
             tx_params.as_dict()
@@ -1287,16 +1390,17 @@ class OperatorSendMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (
-            _from,
-            to,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            _from, to, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                _from,
+                to,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                _from, to, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(_from, to, ids, amounts, data, operator_data).call(
             tx_params.as_dict()
@@ -1316,16 +1420,17 @@ class OperatorSendMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (
-            _from,
-            to,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            _from, to, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                _from,
+                to,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                _from, to, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             _from, to, ids, amounts, data, operator_data
@@ -1342,16 +1447,17 @@ class OperatorSendMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (
-            _from,
-            to,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            _from, to, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                _from,
+                to,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                _from, to, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             _from, to, ids, amounts, data, operator_data
@@ -1368,16 +1474,17 @@ class OperatorSendMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (
-            _from,
-            to,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            _from, to, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                _from,
+                to,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                _from, to, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             _from, to, ids, amounts, data, operator_data
@@ -1425,7 +1532,10 @@ class BurnMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (ids, amounts, data) = self.validate_and_normalize_inputs(ids, amounts, data)
+        with sent_from(tx_params):
+            (ids, amounts, data) = self.validate_and_normalize_inputs(
+                ids, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(ids, amounts, data).call(tx_params.as_dict())
 
@@ -1440,7 +1550,10 @@ class BurnMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (ids, amounts, data) = self.validate_and_normalize_inputs(ids, amounts, data)
+        with sent_from(tx_params):
+            (ids, amounts, data) = self.validate_and_normalize_inputs(
+                ids, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(ids, amounts, data).transact(tx_params.as_dict())
 
@@ -1452,7 +1565,10 @@ class BurnMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (ids, amounts, data) = self.validate_and_normalize_inputs(ids, amounts, data)
+        with sent_from(tx_params):
+            (ids, amounts, data) = self.validate_and_normalize_inputs(
+                ids, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(ids, amounts, data).buildTransaction(
             tx_params.as_dict()
@@ -1466,7 +1582,10 @@ class BurnMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (ids, amounts, data) = self.validate_and_normalize_inputs(ids, amounts, data)
+        with sent_from(tx_params):
+            (ids, amounts, data) = self.validate_and_normalize_inputs(
+                ids, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(ids, amounts, data).estimateGas(
             tx_params.as_dict()
@@ -1532,13 +1651,16 @@ class OperatorBurnMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (
-            _from,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(_from, ids, amounts, data, operator_data)
+        with sent_from(tx_params):
+            (
+                _from,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                _from, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(_from, ids, amounts, data, operator_data).call(
             tx_params.as_dict()
@@ -1557,13 +1679,16 @@ class OperatorBurnMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (
-            _from,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(_from, ids, amounts, data, operator_data)
+        with sent_from(tx_params):
+            (
+                _from,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                _from, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             _from, ids, amounts, data, operator_data
@@ -1579,13 +1704,16 @@ class OperatorBurnMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (
-            _from,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(_from, ids, amounts, data, operator_data)
+        with sent_from(tx_params):
+            (
+                _from,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                _from, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             _from, ids, amounts, data, operator_data
@@ -1601,13 +1729,16 @@ class OperatorBurnMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (
-            _from,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(_from, ids, amounts, data, operator_data)
+        with sent_from(tx_params):
+            (
+                _from,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                _from, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             _from, ids, amounts, data, operator_data
@@ -1682,9 +1813,10 @@ class SwapMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (swap, nonce, expiry, v, r, s, data,) = self.validate_and_normalize_inputs(
-            swap, nonce, expiry, v, r, s, data
-        )
+        with sent_from(tx_params):
+            (swap, nonce, expiry, v, r, s, data,) = self.validate_and_normalize_inputs(
+                swap, nonce, expiry, v, r, s, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(swap, nonce, expiry, v, r, s, data).call(
             tx_params.as_dict()
@@ -1705,9 +1837,10 @@ class SwapMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (swap, nonce, expiry, v, r, s, data,) = self.validate_and_normalize_inputs(
-            swap, nonce, expiry, v, r, s, data
-        )
+        with sent_from(tx_params):
+            (swap, nonce, expiry, v, r, s, data,) = self.validate_and_normalize_inputs(
+                swap, nonce, expiry, v, r, s, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(swap, nonce, expiry, v, r, s, data).transact(
             tx_params.as_dict()
@@ -1725,9 +1858,10 @@ class SwapMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (swap, nonce, expiry, v, r, s, data,) = self.validate_and_normalize_inputs(
-            swap, nonce, expiry, v, r, s, data
-        )
+        with sent_from(tx_params):
+            (swap, nonce, expiry, v, r, s, data,) = self.validate_and_normalize_inputs(
+                swap, nonce, expiry, v, r, s, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             swap, nonce, expiry, v, r, s, data
@@ -1745,9 +1879,10 @@ class SwapMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (swap, nonce, expiry, v, r, s, data,) = self.validate_and_normalize_inputs(
-            swap, nonce, expiry, v, r, s, data
-        )
+        with sent_from(tx_params):
+            (swap, nonce, expiry, v, r, s, data,) = self.validate_and_normalize_inputs(
+                swap, nonce, expiry, v, r, s, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(swap, nonce, expiry, v, r, s, data).estimateGas(
             tx_params.as_dict()
@@ -1762,123 +1897,135 @@ class Implementation:
     which can be accomplished via `str.encode("utf_8")`:code:.
     """
 
-    domain_separator: DomainSeparatorMethod
-    """Constructor-initialized instance of
+    domain_separator = LazyMethod(DomainSeparatorMethod, "DOMAIN_SEPARATOR")
+    """Lazily-initialized instance of
     :class:`DomainSeparatorMethod`.
     """
 
-    eip712_domain_typehash: Eip712DomainTypehashMethod
-    """Constructor-initialized instance of
+    eip712_domain_typehash = LazyMethod(
+        Eip712DomainTypehashMethod, "EIP712_DOMAIN_TYPEHASH"
+    )
+    """Lazily-initialized instance of
     :class:`Eip712DomainTypehashMethod`.
     """
 
-    swap_typehash: SwapTypehashMethod
-    """Constructor-initialized instance of
+    swap_typehash = LazyMethod(SwapTypehashMethod, "SWAP_TYPEHASH")
+    """Lazily-initialized instance of
     :class:`SwapTypehashMethod`.
     """
 
-    name: NameMethod
-    """Constructor-initialized instance of
+    name = LazyMethod(NameMethod, "name")
+    """Lazily-initialized instance of
     :class:`NameMethod`.
     """
 
-    owner: OwnerMethod
-    """Constructor-initialized instance of
+    owner = LazyMethod(OwnerMethod, "owner")
+    """Lazily-initialized instance of
     :class:`OwnerMethod`.
     """
 
-    renounce_ownership: RenounceOwnershipMethod
-    """Constructor-initialized instance of
+    renounce_ownership = LazyMethod(RenounceOwnershipMethod, "renounceOwnership")
+    """Lazily-initialized instance of
     :class:`RenounceOwnershipMethod`.
     """
 
-    signer_nonces: SignerNoncesMethod
-    """Constructor-initialized instance of
+    signer_nonces = LazyMethod(SignerNoncesMethod, "signerNonces", validated=True)
+    """Lazily-initialized instance of
     :class:`SignerNoncesMethod`.
     """
 
-    transfer_ownership: TransferOwnershipMethod
-    """Constructor-initialized instance of
+    transfer_ownership = LazyMethod(
+        TransferOwnershipMethod, "transferOwnership", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`TransferOwnershipMethod`.
     """
 
-    register: RegisterMethod
-    """Constructor-initialized instance of
+    register = LazyMethod(RegisterMethod, "register", validated=True)
+    """Lazily-initialized instance of
     :class:`RegisterMethod`.
     """
 
-    add_sub_account: AddSubAccountMethod
-    """Constructor-initialized instance of
+    add_sub_account = LazyMethod(AddSubAccountMethod, "addSubAccount", validated=True)
+    """Lazily-initialized instance of
     :class:`AddSubAccountMethod`.
     """
 
-    suspend_account: SuspendAccountMethod
-    """Constructor-initialized instance of
+    suspend_account = LazyMethod(SuspendAccountMethod, "suspendAccount", validated=True)
+    """Lazily-initialized instance of
     :class:`SuspendAccountMethod`.
     """
 
-    reactivate_account: ReactivateAccountMethod
-    """Constructor-initialized instance of
+    reactivate_account = LazyMethod(
+        ReactivateAccountMethod, "reactivateAccount", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`ReactivateAccountMethod`.
     """
 
-    blacklist_account: BlacklistAccountMethod
-    """Constructor-initialized instance of
+    blacklist_account = LazyMethod(
+        BlacklistAccountMethod, "blacklistAccount", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`BlacklistAccountMethod`.
     """
 
-    recover_account: RecoverAccountMethod
-    """Constructor-initialized instance of
+    recover_account = LazyMethod(RecoverAccountMethod, "recoverAccount", validated=True)
+    """Lazily-initialized instance of
     :class:`RecoverAccountMethod`.
     """
 
-    authorize_operator: AuthorizeOperatorMethod
-    """Constructor-initialized instance of
+    authorize_operator = LazyMethod(
+        AuthorizeOperatorMethod, "authorizeOperator", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`AuthorizeOperatorMethod`.
     """
 
-    revoke_operator: RevokeOperatorMethod
-    """Constructor-initialized instance of
+    revoke_operator = LazyMethod(RevokeOperatorMethod, "revokeOperator", validated=True)
+    """Lazily-initialized instance of
     :class:`RevokeOperatorMethod`.
     """
 
-    create: CreateMethod
-    """Constructor-initialized instance of
+    create = LazyMethod(CreateMethod, "create", validated=True)
+    """Lazily-initialized instance of
     :class:`CreateMethod`.
     """
 
-    mint_fungible: MintFungibleMethod
-    """Constructor-initialized instance of
+    mint_fungible = LazyMethod(MintFungibleMethod, "mintFungible", validated=True)
+    """Lazily-initialized instance of
     :class:`MintFungibleMethod`.
     """
 
-    mint_non_fungible: MintNonFungibleMethod
-    """Constructor-initialized instance of
+    mint_non_fungible = LazyMethod(
+        MintNonFungibleMethod, "mintNonFungible", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`MintNonFungibleMethod`.
     """
 
-    send: SendMethod
-    """Constructor-initialized instance of
+    send = LazyMethod(SendMethod, "send", validated=True)
+    """Lazily-initialized instance of
     :class:`SendMethod`.
     """
 
-    operator_send: OperatorSendMethod
-    """Constructor-initialized instance of
+    operator_send = LazyMethod(OperatorSendMethod, "operatorSend", validated=True)
+    """Lazily-initialized instance of
     :class:`OperatorSendMethod`.
     """
 
-    burn: BurnMethod
-    """Constructor-initialized instance of
+    burn = LazyMethod(BurnMethod, "burn", validated=True)
+    """Lazily-initialized instance of
     :class:`BurnMethod`.
     """
 
-    operator_burn: OperatorBurnMethod
-    """Constructor-initialized instance of
+    operator_burn = LazyMethod(OperatorBurnMethod, "operatorBurn", validated=True)
+    """Lazily-initialized instance of
     :class:`OperatorBurnMethod`.
     """
 
-    swap: SwapMethod
-    """Constructor-initialized instance of
+    swap = LazyMethod(SwapMethod, "swap", validated=True)
+    """Lazily-initialized instance of
     :class:`SwapMethod`.
     """
 
@@ -1932,125 +2079,275 @@ class Implementation:
 
         self._web3_eth = web3.eth
 
-        functions = self._web3_eth.contract(
-            address=to_checksum_address(contract_address), abi=Implementation.abi(),
-        ).functions
+        self._web3_or_provider = web3_or_provider
+        self._validator = validator
+        self._address = to_checksum_address(contract_address)
 
-        self.domain_separator = DomainSeparatorMethod(
-            web3_or_provider, contract_address, functions.DOMAIN_SEPARATOR
-        )
+    def _build_method(
+        self, method_class: Any, function_name: str, validated: bool = False
+    ) -> Any:
+        """Return the `method_class`:code: instance calling `function_name`:code:.
 
-        self.eip712_domain_typehash = Eip712DomainTypehashMethod(
-            web3_or_provider, contract_address, functions.EIP712_DOMAIN_TYPEHASH,
-        )
+        Only the ABI entry of `function_name`:code: is resolved, so a method
+        costs nothing until it is first used.  Pure functions with an
+        in-process implementation are evaluated locally, see
+        `app.eth.methods.local_method_class`:code:.
+        """
+        function = ContractFunction.factory(
+            function_name,
+            web3=self._web3_eth.web3,
+            contract_abi=_WEB3_ABI,
+            address=self._address,
+            function_identifier=function_name,
+        )
+        method_class = local_method_class(
+            method_class, FUNCTION_ABIS[FUNCTION_SELECTORS[function_name]]
+        )
+        if validated:
+            return method_class(
+                self._web3_or_provider, self.contract_address, function, self._validator
+            )
+        return method_class(self._web3_or_provider, self.contract_address, function)
 
-        self.swap_typehash = SwapTypehashMethod(
-            web3_or_provider, contract_address, functions.SWAP_TYPEHASH
-        )
+    def batch(self) -> Batch:
+        """Return a batch queueing view calls into a single JSON-RPC request.
 
-        self.name = NameMethod(web3_or_provider, contract_address, functions.name)
+        Methods of this wrapper are reachable as attributes of the batch, e.g.
+        `batch.balance_of(owner, token_id)`:code:, and calls to other
+        wrappers on the same node can be queued with `Batch.add`:code:.
+        """
+        return Batch(self._web3_eth, self)
 
-        self.owner = OwnerMethod(web3_or_provider, contract_address, functions.owner)
+    def aggregate(self, block_identifier: BlockIdentifier = "latest") -> Aggregate:
+        """Return an aggregate packing view calls into one Multicall eth_call.
 
-        self.renounce_ownership = RenounceOwnershipMethod(
-            web3_or_provider, contract_address, functions.renounceOwnership
-        )
+        Every queued call is read at the same block; without a configured
+        aggregator the calls are sent as a plain batch instead.
 
-        self.signer_nonces = SignerNoncesMethod(
-            web3_or_provider, contract_address, functions.signerNonces, validator,
-        )
+        :param block_identifier: block at which the calls are evaluated
+        """
+        return Aggregate(self._web3_eth, self, block_identifier=block_identifier)
 
-        self.transfer_ownership = TransferOwnershipMethod(
-            web3_or_provider, contract_address, functions.transferOwnership, validator,
-        )
+    def cached(self) -> CachedContract:
+        """Return a view of this wrapper whose view calls are cached.
 
-        self.register = RegisterMethod(
-            web3_or_provider, contract_address, functions.register, validator
-        )
+        Immutable reads are cached indefinitely and state reads until the next
+        block, in-process and in the shared Django cache.
+        """
+        return CachedContract(self, get_read_cache(self._web3_eth.web3))
 
-        self.add_sub_account = AddSubAccountMethod(
-            web3_or_provider, contract_address, functions.addSubAccount, validator,
-        )
+    def pipeline(
+        self, account: LocalAccount, max_workers: int = 8
+    ) -> TransactionPipeline:
+        """Return a pipeline sending transactions signed by `account`:code:.
 
-        self.suspend_account = SuspendAccountMethod(
-            web3_or_provider, contract_address, functions.suspendAccount, validator,
-        )
+        Methods of this wrapper are reachable as attributes of the pipeline,
+        e.g. `pipeline.send(to, ids, amounts, data)`:code:, which returns the
+        future of the transaction hash; nonces come from the shared nonce
+        manager of the node.
 
-        self.reactivate_account = ReactivateAccountMethod(
-            web3_or_provider, contract_address, functions.reactivateAccount, validator,
+        :param account: local account signing the transactions
+        :param max_workers: how many transactions are in flight at once
+        """
+        return TransactionPipeline(
+            self._web3_eth.web3, account, wrapper=self, max_workers=max_workers
         )
 
-        self.blacklist_account = BlacklistAccountMethod(
-            web3_or_provider, contract_address, functions.blacklistAccount, validator,
-        )
+    def get_ownership_transferred_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for OwnershipTransferred event.
 
-        self.recover_account = RecoverAccountMethod(
-            web3_or_provider, contract_address, functions.recoverAccount, validator,
-        )
+        :param tx_hash: hash of transaction emitting OwnershipTransferred event
+        """
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["OwnershipTransferred"])
 
-        self.authorize_operator = AuthorizeOperatorMethod(
-            web3_or_provider, contract_address, functions.authorizeOperator, validator,
-        )
+    @staticmethod
+    def abi():
+        """Return the ABI to the underlying contract."""
+        return ABI
 
-        self.revoke_operator = RevokeOperatorMethod(
-            web3_or_provider, contract_address, functions.revokeOperator, validator,
-        )
 
-        self.create = CreateMethod(
-            web3_or_provider, contract_address, functions.create, validator
-        )
+# pylint: disable=too-many-public-methods,too-many-instance-attributes
+class AsyncImplementation:
+    """Asyncio wrapper class for Implementation Solidity contract.
 
-        self.mint_fungible = MintFungibleMethod(
-            web3_or_provider, contract_address, functions.mintFungible, validator,
-        )
+    Every method is an :class:`AsyncContractMethod` mirroring the method of
+    the same name on :class:`Implementation`.
+    """
 
-        self.mint_non_fungible = MintNonFungibleMethod(
-            web3_or_provider, contract_address, functions.mintNonFungible, validator,
-        )
+    domain_separator = LazyMethod(AsyncContractMethod, "domain_separator")
+    """Asyncio flavour of :class:`DomainSeparatorMethod`."""
 
-        self.send = SendMethod(
-            web3_or_provider, contract_address, functions.send, validator
-        )
+    eip712_domain_typehash = LazyMethod(AsyncContractMethod, "eip712_domain_typehash")
+    """Asyncio flavour of :class:`Eip712DomainTypehashMethod`."""
 
-        self.operator_send = OperatorSendMethod(
-            web3_or_provider, contract_address, functions.operatorSend, validator,
-        )
+    swap_typehash = LazyMethod(AsyncContractMethod, "swap_typehash")
+    """Asyncio flavour of :class:`SwapTypehashMethod`."""
 
-        self.burn = BurnMethod(
-            web3_or_provider, contract_address, functions.burn, validator
-        )
+    name = LazyMethod(AsyncContractMethod, "name")
+    """Asyncio flavour of :class:`NameMethod`."""
 
-        self.operator_burn = OperatorBurnMethod(
-            web3_or_provider, contract_address, functions.operatorBurn, validator,
-        )
+    owner = LazyMethod(AsyncContractMethod, "owner")
+    """Asyncio flavour of :class:`OwnerMethod`."""
 
-        self.swap = SwapMethod(
-            web3_or_provider, contract_address, functions.swap, validator
-        )
+    renounce_ownership = LazyMethod(AsyncContractMethod, "renounce_ownership")
+    """Asyncio flavour of :class:`RenounceOwnershipMethod`."""
 
-    def get_ownership_transferred_event(
+    signer_nonces = LazyMethod(AsyncContractMethod, "signer_nonces")
+    """Asyncio flavour of :class:`SignerNoncesMethod`."""
+
+    transfer_ownership = LazyMethod(AsyncContractMethod, "transfer_ownership")
+    """Asyncio flavour of :class:`TransferOwnershipMethod`."""
+
+    register = LazyMethod(AsyncContractMethod, "register")
+    """Asyncio flavour of :class:`RegisterMethod`."""
+
+    add_sub_account = LazyMethod(AsyncContractMethod, "add_sub_account")
+    """Asyncio flavour of :class:`AddSubAccountMethod`."""
+
+    suspend_account = LazyMethod(AsyncContractMethod, "suspend_account")
+    """Asyncio flavour of :class:`SuspendAccountMethod`."""
+
+    reactivate_account = LazyMethod(AsyncContractMethod, "reactivate_account")
+    """Asyncio flavour of :class:`ReactivateAccountMethod`."""
+
+    blacklist_account = LazyMethod(AsyncContractMethod, "blacklist_account")
+    """Asyncio flavour of :class:`BlacklistAccountMethod`."""
+
+    recover_account = LazyMethod(AsyncContractMethod, "recover_account")
+    """Asyncio flavour of :class:`RecoverAccountMethod`."""
+
+    authorize_operator = LazyMethod(AsyncContractMethod, "authorize_operator")
+    """Asyncio flavour of :class:`AuthorizeOperatorMethod`."""
+
+    revoke_operator = LazyMethod(AsyncContractMethod, "revoke_operator")
+    """Asyncio flavour of :class:`RevokeOperatorMethod`."""
+
+    create = LazyMethod(AsyncContractMethod, "create")
+    """Asyncio flavour of :class:`CreateMethod`."""
+
+    mint_fungible = LazyMethod(AsyncContractMethod, "mint_fungible")
+    """Asyncio flavour of :class:`MintFungibleMethod`."""
+
+    mint_non_fungible = LazyMethod(AsyncContractMethod, "mint_non_fungible")
+    """Asyncio flavour of :class:`MintNonFungibleMethod`."""
+
+    send = LazyMethod(AsyncContractMethod, "send")
+    """Asyncio flavour of :class:`SendMethod`."""
+
+    operator_send = LazyMethod(AsyncContractMethod, "operator_send")
+    """Asyncio flavour of :class:`OperatorSendMethod`."""
+
+    burn = LazyMethod(AsyncContractMethod, "burn")
+    """Asyncio flavour of :class:`BurnMethod`."""
+
+    operator_burn = LazyMethod(AsyncContractMethod, "operator_burn")
+    """Asyncio flavour of :class:`OperatorBurnMethod`."""
+
+    swap = LazyMethod(AsyncContractMethod, "swap")
+    """Asyncio flavour of :class:`SwapMethod`."""
+
+    def __init__(
+        self,
+        web3_or_provider: Union[Web3, BaseProvider],
+        contract_address: str,
+        validator: ImplementationValidator = None,
+        async_provider: AsyncHTTPProvider = None,
+    ):
+        """Get an instance of asyncio wrapper for smart contract.
+
+        :param web3_or_provider: Either an instance of `web3.Web3`:code: or
+            `web3.providers.base.BaseProvider`:code:, used to encode calls
+        :param contract_address: where the contract has been deployed
+        :param validator: for validation of method inputs.
+        :param async_provider: sends every request; defaults to the shared
+            provider for the node behind `web3_or_provider`:code:
+        """
+        self._wrapper = Implementation(web3_or_provider, contract_address, validator)
+        self.contract_address = contract_address
+        self._provider = get_async_provider(async_provider or web3_or_provider)
+
+    def _build_method(self, method_class: Any, name: str) -> Any:
+        """Return the `method_class`:code: instance mirroring `name`:code:."""
+        return method_class(self._provider, getattr(self._wrapper, name))
+
+    async def get_ownership_transferred_event(
         self, tx_hash: Union[HexBytes, bytes]
     ) -> Tuple[AttributeDict]:
         """Get log entry for OwnershipTransferred event.
 
         :param tx_hash: hash of transaction emitting OwnershipTransferred event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address),
-                abi=Implementation.abi(),
-            )
-            .events.OwnershipTransferred()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["OwnershipTransferred"])
+
+
+def _freeze(value):
+    """Recursively turn parsed JSON into read-only containers."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _decode_receipt_logs(tx_receipt, topic: bytes) -> Tuple[AttributeDict]:
+    """Decode the logs of `tx_receipt`:code: emitted for the event `topic`:code:."""
+    decode = EVENT_DECODERS[topic]
+    return tuple(
+        decode(log)
+        for log in tx_receipt["logs"]
+        if log["topics"] and log["topics"][0] == topic
+    )
 
-    @staticmethod
-    def abi():
-        """Return the ABI to the underlying contract."""
-        return json.loads(
-            '[{"inputs":[{"internalType":"address","name":"_account","type":"address"},{"internalType":"address","name":"_token","type":"address"}],"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"previousOwner","type":"address"},{"indexed":true,"internalType":"address","name":"newOwner","type":"address"}],"name":"OwnershipTransferred","type":"event"},{"inputs":[],"name":"DOMAIN_SEPARATOR","outputs":[{"internalType":"bytes32","name":"","type":"bytes32"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"EIP712_DOMAIN_TYPEHASH","outputs":[{"internalType":"bytes32","name":"","type":"bytes32"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"SWAP_TYPEHASH","outputs":[{"internalType":"bytes32","name":"","type":"bytes32"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"name","outputs":[{"internalType":"string","name":"","type":"string"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"owner","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"renounceOwnership","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"index_0","type":"address"}],"name":"signerNonces","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"newOwner","type":"address"}],"name":"transferOwnership","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"string","name":"_name","type":"string"}],"name":"register","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"},{"internalType":"string","name":"_name","type":"string"}],"name":"addSubAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"suspendAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"reactivateAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"blacklistAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"recoverAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_operator","type":"address"}],"name":"authorizeOperator","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_operator","type":"address"}],"name":"revokeOperator","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"string","name":"_uri","type":"string"},{"internalType":"bool","name":"_isNF","type":"bool"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"create","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address[]","name":"_to","type":"address[]"},{"internalType":"uint256","name":"_id","type":"uint256"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"mintFungible","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address[]","name":"_to","type":"address[]"},{"internalType":"uint256","name":"_type","type":"uint256"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"mintNonFungible","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_to","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"send","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_from","type":"address"},{"internalType":"address","name":"_to","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"},{"internalType":"bytes","name":"_operatorData","type":"bytes"}],"name":"operatorSend","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"burn","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_from","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"},{"internalType":"bytes","name":"_operatorData","type":"bytes"}],"name":"operatorBurn","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"components":[{"internalType":"address","name":"sender","type":"address"},{"internalType":"uint256[]","name":"senderTokenIds","type":"uint256[]"},{"internalType":"uint256[]","name":"senderTokenAmounts","type":"uint256[]"},{"internalType":"uint256[]","name":"signerTokenIds","type":"uint256[]"},{"internalType":"uint256[]","name":"signerTokenAmounts","type":"uint256[]"}],"internalType":"struct SwapLib.Swap","name":"_swap","type":"tuple"},{"internalType":"uint256","name":"_nonce","type":"uint256"},{"internalType":"uint256","name":"_expiry","type":"uint256"},{"internalType":"uint8","name":"_v","type":"uint8"},{"internalType":"bytes32","name":"_r","type":"bytes32"},{"internalType":"bytes32","name":"_s","type":"bytes32"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"swap","outputs":[],"stateMutability":"nonpayable","type":"function"}]'  # noqa: E501 (line-too-long)
-        )
+
+# Parsed once at import time.  web3 gets its own plain copy because it expects
+# mutable dicts, everybody else gets the read-only ABI.
+_WEB3_ABI = json.loads(
+    '[{"inputs":[{"internalType":"address","name":"_account","type":"address"},{"internalType":"address","name":"_token","type":"address"}],"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"previousOwner","type":"address"},{"indexed":true,"internalType":"address","name":"newOwner","type":"address"}],"name":"OwnershipTransferred","type":"event"},{"inputs":[],"name":"DOMAIN_SEPARATOR","outputs":[{"internalType":"bytes32","name":"","type":"bytes32"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"EIP712_DOMAIN_TYPEHASH","outputs":[{"internalType":"bytes32","name":"","type":"bytes32"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"SWAP_TYPEHASH","outputs":[{"internalType":"bytes32","name":"","type":"bytes32"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"name","outputs":[{"internalType":"string","name":"","type":"string"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"owner","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"renounceOwnership","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"index_0","type":"address"}],"name":"signerNonces","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"newOwner","type":"address"}],"name":"transferOwnership","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"string","name":"_name","type":"string"}],"name":"register","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"},{"internalType":"string","name":"_name","type":"string"}],"name":"addSubAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"suspendAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"reactivateAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"blacklistAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_acc","type":"address"}],"name":"recoverAccount","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_operator","type":"address"}],"name":"authorizeOperator","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_operator","type":"address"}],"name":"revokeOperator","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"string","name":"_uri","type":"string"},{"internalType":"bool","name":"_isNF","type":"bool"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"create","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address[]","name":"_to","type":"address[]"},{"internalType":"uint256","name":"_id","type":"uint256"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"mintFungible","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address[]","name":"_to","type":"address[]"},{"internalType":"uint256","name":"_type","type":"uint256"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"mintNonFungible","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_to","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"send","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_from","type":"address"},{"internalType":"address","name":"_to","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"},{"internalType":"bytes","name":"_operatorData","type":"bytes"}],"name":"operatorSend","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"burn","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_from","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"},{"internalType":"bytes","name":"_operatorData","type":"bytes"}],"name":"operatorBurn","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"components":[{"internalType":"address","name":"sender","type":"address"},{"internalType":"uint256[]","name":"senderTokenIds","type":"uint256[]"},{"internalType":"uint256[]","name":"senderTokenAmounts","type":"uint256[]"},{"internalType":"uint256[]","name":"signerTokenIds","type":"uint256[]"},{"internalType":"uint256[]","name":"signerTokenAmounts","type":"uint256[]"}],"internalType":"struct SwapLib.Swap","name":"_swap","type":"tuple"},{"internalType":"uint256","name":"_nonce","type":"uint256"},{"internalType":"uint256","name":"_expiry","type":"uint256"},{"internalType":"uint8","name":"_v","type":"uint8"},{"internalType":"bytes32","name":"_r","type":"bytes32"},{"internalType":"bytes32","name":"_s","type":"bytes32"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"swap","outputs":[],"stateMutability":"nonpayable","type":"function"}]'  # noqa: E501 (line-too-long)
+)
+_CODEC = ABICodec(build_default_registry())
+
+ABI = _freeze(_WEB3_ABI)
+"""Immutable ABI of the underlying contract."""
+
+FUNCTION_SELECTORS = MappingProxyType(
+    {
+        entry["name"]: function_abi_to_4byte_selector(entry)
+        for entry in _WEB3_ABI
+        if entry["type"] == "function"
+    }
+)
+"""4-byte selector of every function, keyed by function name."""
+
+FUNCTION_ABIS = MappingProxyType(
+    {
+        FUNCTION_SELECTORS[entry["name"]]: entry
+        for entry in ABI
+        if entry["type"] == "function"
+    }
+)
+"""ABI entry of every function, keyed by its 4-byte selector."""
+
+EVENT_TOPICS = MappingProxyType(
+    {
+        entry["name"]: event_abi_to_log_topic(entry)
+        for entry in _WEB3_ABI
+        if entry["type"] == "event"
+    }
+)
+"""Topic 0 of every event, keyed by event name."""
+
+EVENT_DECODERS = MappingProxyType(
+    {
+        EVENT_TOPICS[entry["name"]]: partial(get_event_data, _CODEC, entry)
+        for entry in _WEB3_ABI
+        if entry["type"] == "event"
+    }
+)
+"""Log decoder of every event, keyed by its topic 0."""
 
 
 # pylint: disable=too-many-lines
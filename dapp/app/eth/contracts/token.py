@@ -3,6 +3,8 @@
 # pylint: disable=too-many-arguments
 
 import json
+from functools import partial
+from types import MappingProxyType
 from typing import (  # noqa
     Any,
     List,
@@ -11,17 +13,40 @@ from typing import (  # noqa
     Union,
 )
 
-from eth_utils import to_checksum_address
+from eth_abi.codec import ABICodec
+from eth_account.signers.local import LocalAccount
+from eth_utils import (
+    event_abi_to_log_topic,
+    function_abi_to_4byte_selector,
+    to_checksum_address,
+)
 from mypy_extensions import TypedDict
 from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
+from web3.types import BlockIdentifier
+from web3._utils.abi import build_default_registry
+from web3._utils.events import get_event_data
 
 from zero_ex.contract_wrappers.bases import ContractMethod, Validator
 from zero_ex.contract_wrappers.tx_params import TxParams
 
+from app.eth.aio import (
+    AsyncContractMethod,
+    AsyncHTTPProvider,
+    get_async_provider,
+    get_transaction_receipt,
+)
+from app.eth.batch import Batch
+from app.eth.cache import CachedContract, get_read_cache
+from app.eth.methods import LazyMethod, local_method_class
+from app.eth.multicall import Aggregate
+from app.eth.pipeline import TransactionPipeline
+from app.eth.preflight import sent_from
+from app.eth.receipts import get_receipt_tracker
+
 
 # Try to import a custom validator class definition; if there isn't one,
 # declare one that we can instantiate for the default argument to the
@@ -96,20 +121,26 @@ class CreatorsMethod(ContractMethod):
         index_0 = int(index_0)
         return index_0
 
+    def convert_output(self, returned: Any) -> str:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return str(returned)
+
     def call(self, index_0: int, tx_params: Optional[TxParams] = None) -> str:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (index_0) = self.validate_and_normalize_inputs(index_0)
+        with sent_from(tx_params):
+            (index_0) = self.validate_and_normalize_inputs(index_0)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(index_0).call(tx_params.as_dict())
-        return str(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, index_0: int, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (index_0) = self.validate_and_normalize_inputs(index_0)
+        with sent_from(tx_params):
+            (index_0) = self.validate_and_normalize_inputs(index_0)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(index_0).estimateGas(tx_params.as_dict())
 
@@ -139,20 +170,26 @@ class GetNonFungibleBaseTypeMethod(ContractMethod):
         _id = int(_id)
         return _id
 
+    def convert_output(self, returned: Any) -> int:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return int(returned)
+
     def call(self, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(_id).call(tx_params.as_dict())
-        return int(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(_id).estimateGas(tx_params.as_dict())
 
@@ -180,20 +217,26 @@ class GetNonFungibleIndexMethod(ContractMethod):
         _id = int(_id)
         return _id
 
+    def convert_output(self, returned: Any) -> int:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return int(returned)
+
     def call(self, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(_id).call(tx_params.as_dict())
-        return int(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(_id).estimateGas(tx_params.as_dict())
 
@@ -228,7 +271,8 @@ class InitializeMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (implementation) = self.validate_and_normalize_inputs(implementation)
+        with sent_from(tx_params):
+            (implementation) = self.validate_and_normalize_inputs(implementation)
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(implementation).call(tx_params.as_dict())
 
@@ -239,7 +283,8 @@ class InitializeMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (implementation) = self.validate_and_normalize_inputs(implementation)
+        with sent_from(tx_params):
+            (implementation) = self.validate_and_normalize_inputs(implementation)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(implementation).transact(tx_params.as_dict())
 
@@ -247,7 +292,8 @@ class InitializeMethod(ContractMethod):
         self, implementation: str, tx_params: Optional[TxParams] = None
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (implementation) = self.validate_and_normalize_inputs(implementation)
+        with sent_from(tx_params):
+            (implementation) = self.validate_and_normalize_inputs(implementation)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(implementation).buildTransaction(
             tx_params.as_dict()
@@ -257,7 +303,8 @@ class InitializeMethod(ContractMethod):
         self, implementation: str, tx_params: Optional[TxParams] = None
     ) -> int:
         """Estimate gas consumption of method call."""
-        (implementation) = self.validate_and_normalize_inputs(implementation)
+        with sent_from(tx_params):
+            (implementation) = self.validate_and_normalize_inputs(implementation)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(implementation).estimateGas(tx_params.as_dict())
 
@@ -285,20 +332,26 @@ class IsFungibleMethod(ContractMethod):
         _id = int(_id)
         return _id
 
+    def convert_output(self, returned: Any) -> bool:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return bool(returned)
+
     def call(self, _id: int, tx_params: Optional[TxParams] = None) -> bool:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(_id).call(tx_params.as_dict())
-        return bool(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(_id).estimateGas(tx_params.as_dict())
 
@@ -326,20 +379,26 @@ class IsNonFungibleMethod(ContractMethod):
         _id = int(_id)
         return _id
 
+    def convert_output(self, returned: Any) -> bool:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return bool(returned)
+
     def call(self, _id: int, tx_params: Optional[TxParams] = None) -> bool:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(_id).call(tx_params.as_dict())
-        return bool(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(_id).estimateGas(tx_params.as_dict())
 
@@ -369,20 +428,26 @@ class IsNonFungibleBaseTypeMethod(ContractMethod):
         _id = int(_id)
         return _id
 
+    def convert_output(self, returned: Any) -> bool:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return bool(returned)
+
     def call(self, _id: int, tx_params: Optional[TxParams] = None) -> bool:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(_id).call(tx_params.as_dict())
-        return bool(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(_id).estimateGas(tx_params.as_dict())
 
@@ -410,20 +475,26 @@ class IsNonFungibleItemMethod(ContractMethod):
         _id = int(_id)
         return _id
 
+    def convert_output(self, returned: Any) -> bool:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return bool(returned)
+
     def call(self, _id: int, tx_params: Optional[TxParams] = None) -> bool:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(_id).call(tx_params.as_dict())
-        return bool(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(_id).estimateGas(tx_params.as_dict())
 
@@ -451,20 +522,26 @@ class MaxIndexMethod(ContractMethod):
         index_0 = int(index_0)
         return index_0
 
+    def convert_output(self, returned: Any) -> int:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return int(returned)
+
     def call(self, index_0: int, tx_params: Optional[TxParams] = None) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (index_0) = self.validate_and_normalize_inputs(index_0)
+        with sent_from(tx_params):
+            (index_0) = self.validate_and_normalize_inputs(index_0)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(index_0).call(tx_params.as_dict())
-        return int(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, index_0: int, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (index_0) = self.validate_and_normalize_inputs(index_0)
+        with sent_from(tx_params):
+            (index_0) = self.validate_and_normalize_inputs(index_0)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(index_0).estimateGas(tx_params.as_dict())
 
@@ -492,20 +569,26 @@ class OwnerOfMethod(ContractMethod):
         _id = int(_id)
         return _id
 
+    def convert_output(self, returned: Any) -> str:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return str(returned)
+
     def call(self, _id: int, tx_params: Optional[TxParams] = None) -> str:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(_id).call(tx_params.as_dict())
-        return str(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        (_id) = self.validate_and_normalize_inputs(_id)
+        with sent_from(tx_params):
+            (_id) = self.validate_and_normalize_inputs(_id)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(_id).estimateGas(tx_params.as_dict())
 
@@ -543,6 +626,10 @@ class CreateMethod(ContractMethod):
         )
         return (sender, uri, is_nf, data)
 
+    def convert_output(self, returned: Any) -> int:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return int(returned)
+
     def call(
         self,
         sender: str,
@@ -556,14 +643,15 @@ class CreateMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (sender, uri, is_nf, data) = self.validate_and_normalize_inputs(
-            sender, uri, is_nf, data
-        )
+        with sent_from(tx_params):
+            (sender, uri, is_nf, data) = self.validate_and_normalize_inputs(
+                sender, uri, is_nf, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(sender, uri, is_nf, data).call(
             tx_params.as_dict()
         )
-        return int(returned)
+        return self.convert_output(returned)
 
     def send_transaction(
         self,
@@ -577,9 +665,10 @@ class CreateMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (sender, uri, is_nf, data) = self.validate_and_normalize_inputs(
-            sender, uri, is_nf, data
-        )
+        with sent_from(tx_params):
+            (sender, uri, is_nf, data) = self.validate_and_normalize_inputs(
+                sender, uri, is_nf, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, uri, is_nf, data).transact(
             tx_params.as_dict()
@@ -594,9 +683,10 @@ class CreateMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (sender, uri, is_nf, data) = self.validate_and_normalize_inputs(
-            sender, uri, is_nf, data
-        )
+        with sent_from(tx_params):
+            (sender, uri, is_nf, data) = self.validate_and_normalize_inputs(
+                sender, uri, is_nf, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, uri, is_nf, data).buildTransaction(
             tx_params.as_dict()
@@ -611,9 +701,10 @@ class CreateMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (sender, uri, is_nf, data) = self.validate_and_normalize_inputs(
-            sender, uri, is_nf, data
-        )
+        with sent_from(tx_params):
+            (sender, uri, is_nf, data) = self.validate_and_normalize_inputs(
+                sender, uri, is_nf, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, uri, is_nf, data).estimateGas(
             tx_params.as_dict()
@@ -679,9 +770,10 @@ class MintFungibleMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (sender, to, _id, amounts, data) = self.validate_and_normalize_inputs(
-            sender, to, _id, amounts, data
-        )
+        with sent_from(tx_params):
+            (sender, to, _id, amounts, data) = self.validate_and_normalize_inputs(
+                sender, to, _id, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(sender, to, _id, amounts, data).call(
             tx_params.as_dict()
@@ -700,9 +792,10 @@ class MintFungibleMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (sender, to, _id, amounts, data) = self.validate_and_normalize_inputs(
-            sender, to, _id, amounts, data
-        )
+        with sent_from(tx_params):
+            (sender, to, _id, amounts, data) = self.validate_and_normalize_inputs(
+                sender, to, _id, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, to, _id, amounts, data).transact(
             tx_params.as_dict()
@@ -718,9 +811,10 @@ class MintFungibleMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (sender, to, _id, amounts, data) = self.validate_and_normalize_inputs(
-            sender, to, _id, amounts, data
-        )
+        with sent_from(tx_params):
+            (sender, to, _id, amounts, data) = self.validate_and_normalize_inputs(
+                sender, to, _id, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, to, _id, amounts, data).buildTransaction(
             tx_params.as_dict()
@@ -736,9 +830,10 @@ class MintFungibleMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (sender, to, _id, amounts, data) = self.validate_and_normalize_inputs(
-            sender, to, _id, amounts, data
-        )
+        with sent_from(tx_params):
+            (sender, to, _id, amounts, data) = self.validate_and_normalize_inputs(
+                sender, to, _id, amounts, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, to, _id, amounts, data).estimateGas(
             tx_params.as_dict()
@@ -795,9 +890,10 @@ class MintNonFungibleMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (sender, to, _type, data) = self.validate_and_normalize_inputs(
-            sender, to, _type, data
-        )
+        with sent_from(tx_params):
+            (sender, to, _type, data) = self.validate_and_normalize_inputs(
+                sender, to, _type, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(sender, to, _type, data).call(tx_params.as_dict())
 
@@ -813,9 +909,10 @@ class MintNonFungibleMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (sender, to, _type, data) = self.validate_and_normalize_inputs(
-            sender, to, _type, data
-        )
+        with sent_from(tx_params):
+            (sender, to, _type, data) = self.validate_and_normalize_inputs(
+                sender, to, _type, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, to, _type, data).transact(
             tx_params.as_dict()
@@ -830,9 +927,10 @@ class MintNonFungibleMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (sender, to, _type, data) = self.validate_and_normalize_inputs(
-            sender, to, _type, data
-        )
+        with sent_from(tx_params):
+            (sender, to, _type, data) = self.validate_and_normalize_inputs(
+                sender, to, _type, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, to, _type, data).buildTransaction(
             tx_params.as_dict()
@@ -847,9 +945,10 @@ class MintNonFungibleMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (sender, to, _type, data) = self.validate_and_normalize_inputs(
-            sender, to, _type, data
-        )
+        with sent_from(tx_params):
+            (sender, to, _type, data) = self.validate_and_normalize_inputs(
+                sender, to, _type, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, to, _type, data).estimateGas(
             tx_params.as_dict()
@@ -883,22 +982,28 @@ class BalanceOfMethod(ContractMethod):
         _id = int(_id)
         return (owner, _id)
 
+    def convert_output(self, returned: Any) -> int:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return int(returned)
+
     def call(self, owner: str, _id: int, tx_params: Optional[TxParams] = None) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
 
         """
-        (owner, _id) = self.validate_and_normalize_inputs(owner, _id)
+        with sent_from(tx_params):
+            (owner, _id) = self.validate_and_normalize_inputs(owner, _id)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(owner, _id).call(tx_params.as_dict())
-        return int(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(
         self, owner: str, _id: int, tx_params: Optional[TxParams] = None
     ) -> int:
         """Estimate gas consumption of method call."""
-        (owner, _id) = self.validate_and_normalize_inputs(owner, _id)
+        with sent_from(tx_params):
+            (owner, _id) = self.validate_and_normalize_inputs(owner, _id)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(owner, _id).estimateGas(tx_params.as_dict())
 
@@ -929,6 +1034,10 @@ class BalanceOfBatchMethod(ContractMethod):
         )
         return (owners, ids)
 
+    def convert_output(self, returned: Any) -> List[int]:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return [int(element) for element in returned]
+
     def call(
         self, owners: List[str], ids: List[int], tx_params: Optional[TxParams] = None,
     ) -> List[int]:
@@ -937,16 +1046,18 @@ class BalanceOfBatchMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        (owners, ids) = self.validate_and_normalize_inputs(owners, ids)
+        with sent_from(tx_params):
+            (owners, ids) = self.validate_and_normalize_inputs(owners, ids)
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method(owners, ids).call(tx_params.as_dict())
-        return [int(element) for element in returned]
+        return self.convert_output(returned)
 
     def estimate_gas(
         self, owners: List[str], ids: List[int], tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (owners, ids) = self.validate_and_normalize_inputs(owners, ids)
+        with sent_from(tx_params):
+            (owners, ids) = self.validate_and_normalize_inputs(owners, ids)
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(owners, ids).estimateGas(tx_params.as_dict())
 
@@ -964,6 +1075,10 @@ class GranularityMethod(ContractMethod):
         super().__init__(web3_or_provider, contract_address)
         self._underlying_method = contract_function
 
+    def convert_output(self, returned: Any) -> int:
+        """Return the value of ``call`` for its decoded ``returned`` output."""
+        return int(returned)
+
     def call(self, tx_params: Optional[TxParams] = None) -> int:
         """Execute underlying contract method via eth_call.
 
@@ -972,7 +1087,7 @@ class GranularityMethod(ContractMethod):
         """
         tx_params = super().normalize_tx_params(tx_params)
         returned = self._underlying_method().call(tx_params.as_dict())
-        return int(returned)
+        return self.convert_output(returned)
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
@@ -1027,9 +1142,10 @@ class SwapMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (sender, signer, swap, data) = self.validate_and_normalize_inputs(
-            sender, signer, swap, data
-        )
+        with sent_from(tx_params):
+            (sender, signer, swap, data) = self.validate_and_normalize_inputs(
+                sender, signer, swap, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(sender, signer, swap, data).call(tx_params.as_dict())
 
@@ -1045,9 +1161,10 @@ class SwapMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (sender, signer, swap, data) = self.validate_and_normalize_inputs(
-            sender, signer, swap, data
-        )
+        with sent_from(tx_params):
+            (sender, signer, swap, data) = self.validate_and_normalize_inputs(
+                sender, signer, swap, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, signer, swap, data).transact(
             tx_params.as_dict()
@@ -1062,9 +1179,10 @@ class SwapMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (sender, signer, swap, data) = self.validate_and_normalize_inputs(
-            sender, signer, swap, data
-        )
+        with sent_from(tx_params):
+            (sender, signer, swap, data) = self.validate_and_normalize_inputs(
+                sender, signer, swap, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, signer, swap, data).buildTransaction(
             tx_params.as_dict()
@@ -1079,9 +1197,10 @@ class SwapMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (sender, signer, swap, data) = self.validate_and_normalize_inputs(
-            sender, signer, swap, data
-        )
+        with sent_from(tx_params):
+            (sender, signer, swap, data) = self.validate_and_normalize_inputs(
+                sender, signer, swap, data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(sender, signer, swap, data).estimateGas(
             tx_params.as_dict()
@@ -1157,17 +1276,18 @@ class SendMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (
-            operator,
-            _from,
-            to,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            operator, _from, to, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                operator,
+                _from,
+                to,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                operator, _from, to, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(
             operator, _from, to, ids, amounts, data, operator_data
@@ -1188,17 +1308,18 @@ class SendMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (
-            operator,
-            _from,
-            to,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            operator, _from, to, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                operator,
+                _from,
+                to,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                operator, _from, to, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             operator, _from, to, ids, amounts, data, operator_data
@@ -1216,17 +1337,18 @@ class SendMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (
-            operator,
-            _from,
-            to,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            operator, _from, to, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                operator,
+                _from,
+                to,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                operator, _from, to, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             operator, _from, to, ids, amounts, data, operator_data
@@ -1244,17 +1366,18 @@ class SendMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (
-            operator,
-            _from,
-            to,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            operator, _from, to, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                operator,
+                _from,
+                to,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                operator, _from, to, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             operator, _from, to, ids, amounts, data, operator_data
@@ -1324,16 +1447,17 @@ class BurnMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: the return value of the underlying method.
         """
-        (
-            operator,
-            _from,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            operator, _from, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                operator,
+                _from,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                operator, _from, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(
             operator, _from, ids, amounts, data, operator_data
@@ -1353,16 +1477,17 @@ class BurnMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        (
-            operator,
-            _from,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            operator, _from, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                operator,
+                _from,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                operator, _from, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             operator, _from, ids, amounts, data, operator_data
@@ -1379,16 +1504,17 @@ class BurnMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> dict:
         """Construct calldata to be used as input to the method."""
-        (
-            operator,
-            _from,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            operator, _from, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                operator,
+                _from,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                operator, _from, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             operator, _from, ids, amounts, data, operator_data
@@ -1405,16 +1531,17 @@ class BurnMethod(ContractMethod):
         tx_params: Optional[TxParams] = None,
     ) -> int:
         """Estimate gas consumption of method call."""
-        (
-            operator,
-            _from,
-            ids,
-            amounts,
-            data,
-            operator_data,
-        ) = self.validate_and_normalize_inputs(
-            operator, _from, ids, amounts, data, operator_data
-        )
+        with sent_from(tx_params):
+            (
+                operator,
+                _from,
+                ids,
+                amounts,
+                data,
+                operator_data,
+            ) = self.validate_and_normalize_inputs(
+                operator, _from, ids, amounts, data, operator_data
+            )
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(
             operator, _from, ids, amounts, data, operator_data
@@ -1429,98 +1556,110 @@ class Token:
     which can be accomplished via `str.encode("utf_8")`:code:.
     """
 
-    creators: CreatorsMethod
-    """Constructor-initialized instance of
+    creators = LazyMethod(CreatorsMethod, "creators", validated=True)
+    """Lazily-initialized instance of
     :class:`CreatorsMethod`.
     """
 
-    get_non_fungible_base_type: GetNonFungibleBaseTypeMethod
-    """Constructor-initialized instance of
+    get_non_fungible_base_type = LazyMethod(
+        GetNonFungibleBaseTypeMethod, "getNonFungibleBaseType", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`GetNonFungibleBaseTypeMethod`.
     """
 
-    get_non_fungible_index: GetNonFungibleIndexMethod
-    """Constructor-initialized instance of
+    get_non_fungible_index = LazyMethod(
+        GetNonFungibleIndexMethod, "getNonFungibleIndex", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`GetNonFungibleIndexMethod`.
     """
 
-    initialize: InitializeMethod
-    """Constructor-initialized instance of
+    initialize = LazyMethod(InitializeMethod, "initialize", validated=True)
+    """Lazily-initialized instance of
     :class:`InitializeMethod`.
     """
 
-    is_fungible: IsFungibleMethod
-    """Constructor-initialized instance of
+    is_fungible = LazyMethod(IsFungibleMethod, "isFungible", validated=True)
+    """Lazily-initialized instance of
     :class:`IsFungibleMethod`.
     """
 
-    is_non_fungible: IsNonFungibleMethod
-    """Constructor-initialized instance of
+    is_non_fungible = LazyMethod(IsNonFungibleMethod, "isNonFungible", validated=True)
+    """Lazily-initialized instance of
     :class:`IsNonFungibleMethod`.
     """
 
-    is_non_fungible_base_type: IsNonFungibleBaseTypeMethod
-    """Constructor-initialized instance of
+    is_non_fungible_base_type = LazyMethod(
+        IsNonFungibleBaseTypeMethod, "isNonFungibleBaseType", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`IsNonFungibleBaseTypeMethod`.
     """
 
-    is_non_fungible_item: IsNonFungibleItemMethod
-    """Constructor-initialized instance of
+    is_non_fungible_item = LazyMethod(
+        IsNonFungibleItemMethod, "isNonFungibleItem", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`IsNonFungibleItemMethod`.
     """
 
-    max_index: MaxIndexMethod
-    """Constructor-initialized instance of
+    max_index = LazyMethod(MaxIndexMethod, "maxIndex", validated=True)
+    """Lazily-initialized instance of
     :class:`MaxIndexMethod`.
     """
 
-    owner_of: OwnerOfMethod
-    """Constructor-initialized instance of
+    owner_of = LazyMethod(OwnerOfMethod, "ownerOf", validated=True)
+    """Lazily-initialized instance of
     :class:`OwnerOfMethod`.
     """
 
-    create: CreateMethod
-    """Constructor-initialized instance of
+    create = LazyMethod(CreateMethod, "create", validated=True)
+    """Lazily-initialized instance of
     :class:`CreateMethod`.
     """
 
-    mint_fungible: MintFungibleMethod
-    """Constructor-initialized instance of
+    mint_fungible = LazyMethod(MintFungibleMethod, "mintFungible", validated=True)
+    """Lazily-initialized instance of
     :class:`MintFungibleMethod`.
     """
 
-    mint_non_fungible: MintNonFungibleMethod
-    """Constructor-initialized instance of
+    mint_non_fungible = LazyMethod(
+        MintNonFungibleMethod, "mintNonFungible", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`MintNonFungibleMethod`.
     """
 
-    balance_of: BalanceOfMethod
-    """Constructor-initialized instance of
+    balance_of = LazyMethod(BalanceOfMethod, "balanceOf", validated=True)
+    """Lazily-initialized instance of
     :class:`BalanceOfMethod`.
     """
 
-    balance_of_batch: BalanceOfBatchMethod
-    """Constructor-initialized instance of
+    balance_of_batch = LazyMethod(
+        BalanceOfBatchMethod, "balanceOfBatch", validated=True
+    )
+    """Lazily-initialized instance of
     :class:`BalanceOfBatchMethod`.
     """
 
-    granularity: GranularityMethod
-    """Constructor-initialized instance of
+    granularity = LazyMethod(GranularityMethod, "granularity")
+    """Lazily-initialized instance of
     :class:`GranularityMethod`.
     """
 
-    swap: SwapMethod
-    """Constructor-initialized instance of
+    swap = LazyMethod(SwapMethod, "swap", validated=True)
+    """Lazily-initialized instance of
     :class:`SwapMethod`.
     """
 
-    send: SendMethod
-    """Constructor-initialized instance of
+    send = LazyMethod(SendMethod, "send", validated=True)
+    """Lazily-initialized instance of
     :class:`SendMethod`.
     """
 
-    burn: BurnMethod
-    """Constructor-initialized instance of
+    burn = LazyMethod(BurnMethod, "burn", validated=True)
+    """Lazily-initialized instance of
     :class:`BurnMethod`.
     """
 
@@ -1574,93 +1713,78 @@ class Token:
 
         self._web3_eth = web3.eth
 
-        functions = self._web3_eth.contract(
-            address=to_checksum_address(contract_address), abi=Token.abi()
-        ).functions
-
-        self.creators = CreatorsMethod(
-            web3_or_provider, contract_address, functions.creators, validator
-        )
-
-        self.get_non_fungible_base_type = GetNonFungibleBaseTypeMethod(
-            web3_or_provider,
-            contract_address,
-            functions.getNonFungibleBaseType,
-            validator,
-        )
-
-        self.get_non_fungible_index = GetNonFungibleIndexMethod(
-            web3_or_provider,
-            contract_address,
-            functions.getNonFungibleIndex,
-            validator,
-        )
-
-        self.initialize = InitializeMethod(
-            web3_or_provider, contract_address, functions.initialize, validator
-        )
+        self._web3_or_provider = web3_or_provider
+        self._validator = validator
+        self._address = to_checksum_address(contract_address)
 
-        self.is_fungible = IsFungibleMethod(
-            web3_or_provider, contract_address, functions.isFungible, validator
-        )
+    def _build_method(
+        self, method_class: Any, function_name: str, validated: bool = False
+    ) -> Any:
+        """Return the `method_class`:code: instance calling `function_name`:code:.
 
-        self.is_non_fungible = IsNonFungibleMethod(
-            web3_or_provider, contract_address, functions.isNonFungible, validator,
-        )
-
-        self.is_non_fungible_base_type = IsNonFungibleBaseTypeMethod(
-            web3_or_provider,
-            contract_address,
-            functions.isNonFungibleBaseType,
-            validator,
-        )
-
-        self.is_non_fungible_item = IsNonFungibleItemMethod(
-            web3_or_provider, contract_address, functions.isNonFungibleItem, validator,
-        )
-
-        self.max_index = MaxIndexMethod(
-            web3_or_provider, contract_address, functions.maxIndex, validator
-        )
+        Only the ABI entry of `function_name`:code: is resolved, so a method
+        costs nothing until it is first used.  Pure functions with an
+        in-process implementation are evaluated locally, see
+        `app.eth.methods.local_method_class`:code:.
+        """
+        function = ContractFunction.factory(
+            function_name,
+            web3=self._web3_eth.web3,
+            contract_abi=_WEB3_ABI,
+            address=self._address,
+            function_identifier=function_name,
+        )
+        method_class = local_method_class(
+            method_class, FUNCTION_ABIS[FUNCTION_SELECTORS[function_name]]
+        )
+        if validated:
+            return method_class(
+                self._web3_or_provider, self.contract_address, function, self._validator
+            )
+        return method_class(self._web3_or_provider, self.contract_address, function)
 
-        self.owner_of = OwnerOfMethod(
-            web3_or_provider, contract_address, functions.ownerOf, validator
-        )
+    def batch(self) -> Batch:
+        """Return a batch queueing view calls into a single JSON-RPC request.
 
-        self.create = CreateMethod(
-            web3_or_provider, contract_address, functions.create, validator
-        )
+        Methods of this wrapper are reachable as attributes of the batch, e.g.
+        `batch.balance_of(owner, token_id)`:code:, and calls to other
+        wrappers on the same node can be queued with `Batch.add`:code:.
+        """
+        return Batch(self._web3_eth, self)
 
-        self.mint_fungible = MintFungibleMethod(
-            web3_or_provider, contract_address, functions.mintFungible, validator,
-        )
+    def aggregate(self, block_identifier: BlockIdentifier = "latest") -> Aggregate:
+        """Return an aggregate packing view calls into one Multicall eth_call.
 
-        self.mint_non_fungible = MintNonFungibleMethod(
-            web3_or_provider, contract_address, functions.mintNonFungible, validator,
-        )
+        Every queued call is read at the same block; without a configured
+        aggregator the calls are sent as a plain batch instead.
 
-        self.balance_of = BalanceOfMethod(
-            web3_or_provider, contract_address, functions.balanceOf, validator
-        )
+        :param block_identifier: block at which the calls are evaluated
+        """
+        return Aggregate(self._web3_eth, self, block_identifier=block_identifier)
 
-        self.balance_of_batch = BalanceOfBatchMethod(
-            web3_or_provider, contract_address, functions.balanceOfBatch, validator,
-        )
+    def cached(self) -> CachedContract:
+        """Return a view of this wrapper whose view calls are cached.
 
-        self.granularity = GranularityMethod(
-            web3_or_provider, contract_address, functions.granularity
-        )
+        Immutable reads are cached indefinitely and state reads until the next
+        block, in-process and in the shared Django cache.
+        """
+        return CachedContract(self, get_read_cache(self._web3_eth.web3))
 
-        self.swap = SwapMethod(
-            web3_or_provider, contract_address, functions.swap, validator
-        )
+    def pipeline(
+        self, account: LocalAccount, max_workers: int = 8
+    ) -> TransactionPipeline:
+        """Return a pipeline sending transactions signed by `account`:code:.
 
-        self.send = SendMethod(
-            web3_or_provider, contract_address, functions.send, validator
-        )
+        Methods of this wrapper are reachable as attributes of the pipeline,
+        e.g. `pipeline.send(to, ids, amounts, data)`:code:, which returns the
+        future of the transaction hash; nonces come from the shared nonce
+        manager of the node.
 
-        self.burn = BurnMethod(
-            web3_or_provider, contract_address, functions.burn, validator
+        :param account: local account signing the transactions
+        :param max_workers: how many transactions are in flight at once
+        """
+        return TransactionPipeline(
+            self._web3_eth.web3, account, wrapper=self, max_workers=max_workers
         )
 
     def get_token_burned_event(
@@ -1670,14 +1794,8 @@ class Token:
 
         :param tx_hash: hash of transaction emitting TokenBurned event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address), abi=Token.abi(),
-            )
-            .events.TokenBurned()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenBurned"])
 
     def get_token_created_event(
         self, tx_hash: Union[HexBytes, bytes]
@@ -1686,14 +1804,8 @@ class Token:
 
         :param tx_hash: hash of transaction emitting TokenCreated event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address), abi=Token.abi(),
-            )
-            .events.TokenCreated()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenCreated"])
 
     def get_token_minted_event(
         self, tx_hash: Union[HexBytes, bytes]
@@ -1702,14 +1814,8 @@ class Token:
 
         :param tx_hash: hash of transaction emitting TokenMinted event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address), abi=Token.abi(),
-            )
-            .events.TokenMinted()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenMinted"])
 
     def get_token_sent_event(
         self, tx_hash: Union[HexBytes, bytes]
@@ -1718,14 +1824,8 @@ class Token:
 
         :param tx_hash: hash of transaction emitting TokenSent event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address), abi=Token.abi(),
-            )
-            .events.TokenSent()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenSent"])
 
     def get_token_uri_event(
         self, tx_hash: Union[HexBytes, bytes]
@@ -1734,21 +1834,223 @@ class Token:
 
         :param tx_hash: hash of transaction emitting TokenURI event
         """
-        tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address), abi=Token.abi(),
-            )
-            .events.TokenURI()
-            .processReceipt(tx_receipt)
-        )
+        tx_receipt = get_receipt_tracker(self._web3_eth.web3).receipt(tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenURI"])
 
     @staticmethod
     def abi():
         """Return the ABI to the underlying contract."""
-        return json.loads(
-            '[{"inputs":[{"internalType":"uint256","name":"_granularity","type":"uint256"},{"internalType":"address","name":"_1820Registry","type":"address"}],"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"from","type":"address"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"amount","type":"uint256"},{"indexed":false,"internalType":"bytes","name":"data","type":"bytes"},{"indexed":false,"internalType":"bytes","name":"operatorData","type":"bytes"}],"name":"TokenBurned","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"creator","type":"address"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"},{"indexed":false,"internalType":"bytes","name":"data","type":"bytes"}],"name":"TokenCreated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"to","type":"address"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"amount","type":"uint256"},{"indexed":false,"internalType":"bytes","name":"data","type":"bytes"}],"name":"TokenMinted","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"from","type":"address"},{"indexed":true,"internalType":"address","name":"to","type":"address"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"amount","type":"uint256"},{"indexed":false,"internalType":"bytes","name":"data","type":"bytes"},{"indexed":false,"internalType":"bytes","name":"operatorData","type":"bytes"}],"name":"TokenSent","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"string","name":"value","type":"string"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"}],"name":"TokenURI","type":"event"},{"inputs":[{"internalType":"uint256","name":"index_0","type":"uint256"}],"name":"creators","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"getNonFungibleBaseType","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"getNonFungibleIndex","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_implementation","type":"address"}],"name":"initialize","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"isFungible","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"isNonFungible","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"isNonFungibleBaseType","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"isNonFungibleItem","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"index_0","type":"uint256"}],"name":"maxIndex","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"ownerOf","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"string","name":"_uri","type":"string"},{"internalType":"bool","name":"_isNF","type":"bool"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"create","outputs":[{"internalType":"uint256","name":"type_","type":"uint256"}],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address[]","name":"_to","type":"address[]"},{"internalType":"uint256","name":"_id","type":"uint256"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"mintFungible","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address[]","name":"_to","type":"address[]"},{"internalType":"uint256","name":"_type","type":"uint256"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"mintNonFungible","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_owner","type":"address"},{"internalType":"uint256","name":"_id","type":"uint256"}],"name":"balanceOf","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address[]","name":"_owners","type":"address[]"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"}],"name":"balanceOfBatch","outputs":[{"internalType":"uint256[]","name":"balances_","type":"uint256[]"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"granularity","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address","name":"_signer","type":"address"},{"components":[{"internalType":"address","name":"sender","type":"address"},{"internalType":"uint256[]","name":"senderTokenIds","type":"uint256[]"},{"internalType":"uint256[]","name":"senderTokenAmounts","type":"uint256[]"},{"internalType":"uint256[]","name":"signerTokenIds","type":"uint256[]"},{"internalType":"uint256[]","name":"signerTokenAmounts","type":"uint256[]"}],"internalType":"struct SwapLib.Swap","name":"_swap","type":"tuple"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"swap","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_operator","type":"address"},{"internalType":"address","name":"_from","type":"address"},{"internalType":"address","name":"_to","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"},{"internalType":"bytes","name":"_operatorData","type":"bytes"}],"name":"send","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_operator","type":"address"},{"internalType":"address","name":"_from","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"},{"internalType":"bytes","name":"_operatorData","type":"bytes"}],"name":"burn","outputs":[],"stateMutability":"nonpayable","type":"function"}]'  # noqa: E501 (line-too-long)
-        )
+        return ABI
+
+
+# pylint: disable=too-many-public-methods,too-many-instance-attributes
+class AsyncToken:
+    """Asyncio wrapper class for Token Solidity contract.
+
+    Every method is an :class:`AsyncContractMethod` mirroring the method of
+    the same name on :class:`Token`.
+    """
+
+    creators = LazyMethod(AsyncContractMethod, "creators")
+    """Asyncio flavour of :class:`CreatorsMethod`."""
+
+    get_non_fungible_base_type = LazyMethod(
+        AsyncContractMethod, "get_non_fungible_base_type"
+    )
+    """Asyncio flavour of :class:`GetNonFungibleBaseTypeMethod`."""
+
+    get_non_fungible_index = LazyMethod(AsyncContractMethod, "get_non_fungible_index")
+    """Asyncio flavour of :class:`GetNonFungibleIndexMethod`."""
+
+    initialize = LazyMethod(AsyncContractMethod, "initialize")
+    """Asyncio flavour of :class:`InitializeMethod`."""
+
+    is_fungible = LazyMethod(AsyncContractMethod, "is_fungible")
+    """Asyncio flavour of :class:`IsFungibleMethod`."""
+
+    is_non_fungible = LazyMethod(AsyncContractMethod, "is_non_fungible")
+    """Asyncio flavour of :class:`IsNonFungibleMethod`."""
+
+    is_non_fungible_base_type = LazyMethod(
+        AsyncContractMethod, "is_non_fungible_base_type"
+    )
+    """Asyncio flavour of :class:`IsNonFungibleBaseTypeMethod`."""
+
+    is_non_fungible_item = LazyMethod(AsyncContractMethod, "is_non_fungible_item")
+    """Asyncio flavour of :class:`IsNonFungibleItemMethod`."""
+
+    max_index = LazyMethod(AsyncContractMethod, "max_index")
+    """Asyncio flavour of :class:`MaxIndexMethod`."""
+
+    owner_of = LazyMethod(AsyncContractMethod, "owner_of")
+    """Asyncio flavour of :class:`OwnerOfMethod`."""
+
+    create = LazyMethod(AsyncContractMethod, "create")
+    """Asyncio flavour of :class:`CreateMethod`."""
+
+    mint_fungible = LazyMethod(AsyncContractMethod, "mint_fungible")
+    """Asyncio flavour of :class:`MintFungibleMethod`."""
+
+    mint_non_fungible = LazyMethod(AsyncContractMethod, "mint_non_fungible")
+    """Asyncio flavour of :class:`MintNonFungibleMethod`."""
+
+    balance_of = LazyMethod(AsyncContractMethod, "balance_of")
+    """Asyncio flavour of :class:`BalanceOfMethod`."""
+
+    balance_of_batch = LazyMethod(AsyncContractMethod, "balance_of_batch")
+    """Asyncio flavour of :class:`BalanceOfBatchMethod`."""
+
+    granularity = LazyMethod(AsyncContractMethod, "granularity")
+    """Asyncio flavour of :class:`GranularityMethod`."""
+
+    swap = LazyMethod(AsyncContractMethod, "swap")
+    """Asyncio flavour of :class:`SwapMethod`."""
+
+    send = LazyMethod(AsyncContractMethod, "send")
+    """Asyncio flavour of :class:`SendMethod`."""
+
+    burn = LazyMethod(AsyncContractMethod, "burn")
+    """Asyncio flavour of :class:`BurnMethod`."""
+
+    def __init__(
+        self,
+        web3_or_provider: Union[Web3, BaseProvider],
+        contract_address: str,
+        validator: TokenValidator = None,
+        async_provider: AsyncHTTPProvider = None,
+    ):
+        """Get an instance of asyncio wrapper for smart contract.
+
+        :param web3_or_provider: Either an instance of `web3.Web3`:code: or
+            `web3.providers.base.BaseProvider`:code:, used to encode calls
+        :param contract_address: where the contract has been deployed
+        :param validator: for validation of method inputs.
+        :param async_provider: sends every request; defaults to the shared
+            provider for the node behind `web3_or_provider`:code:
+        """
+        self._wrapper = Token(web3_or_provider, contract_address, validator)
+        self.contract_address = contract_address
+        self._provider = get_async_provider(async_provider or web3_or_provider)
+
+    def _build_method(self, method_class: Any, name: str) -> Any:
+        """Return the `method_class`:code: instance mirroring `name`:code:."""
+        return method_class(self._provider, getattr(self._wrapper, name))
+
+    async def get_token_burned_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for TokenBurned event.
+
+        :param tx_hash: hash of transaction emitting TokenBurned event
+        """
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenBurned"])
+
+    async def get_token_created_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for TokenCreated event.
+
+        :param tx_hash: hash of transaction emitting TokenCreated event
+        """
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenCreated"])
+
+    async def get_token_minted_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for TokenMinted event.
+
+        :param tx_hash: hash of transaction emitting TokenMinted event
+        """
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenMinted"])
+
+    async def get_token_sent_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for TokenSent event.
+
+        :param tx_hash: hash of transaction emitting TokenSent event
+        """
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenSent"])
+
+    async def get_token_uri_event(
+        self, tx_hash: Union[HexBytes, bytes]
+    ) -> Tuple[AttributeDict]:
+        """Get log entry for TokenURI event.
+
+        :param tx_hash: hash of transaction emitting TokenURI event
+        """
+        tx_receipt = await get_transaction_receipt(self._provider, tx_hash)
+        return _decode_receipt_logs(tx_receipt, EVENT_TOPICS["TokenURI"])
+
+
+def _freeze(value):
+    """Recursively turn parsed JSON into read-only containers."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _decode_receipt_logs(tx_receipt, topic: bytes) -> Tuple[AttributeDict]:
+    """Decode the logs of `tx_receipt`:code: emitted for the event `topic`:code:."""
+    decode = EVENT_DECODERS[topic]
+    return tuple(
+        decode(log)
+        for log in tx_receipt["logs"]
+        if log["topics"] and log["topics"][0] == topic
+    )
+
+
+# Parsed once at import time.  web3 gets its own plain copy because it expects
+# mutable dicts, everybody else gets the read-only ABI.
+_WEB3_ABI = json.loads(
+    '[{"inputs":[{"internalType":"uint256","name":"_granularity","type":"uint256"},{"internalType":"address","name":"_1820Registry","type":"address"}],"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"from","type":"address"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"amount","type":"uint256"},{"indexed":false,"internalType":"bytes","name":"data","type":"bytes"},{"indexed":false,"internalType":"bytes","name":"operatorData","type":"bytes"}],"name":"TokenBurned","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"creator","type":"address"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"},{"indexed":false,"internalType":"bytes","name":"data","type":"bytes"}],"name":"TokenCreated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"to","type":"address"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"amount","type":"uint256"},{"indexed":false,"internalType":"bytes","name":"data","type":"bytes"}],"name":"TokenMinted","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"operator","type":"address"},{"indexed":true,"internalType":"address","name":"from","type":"address"},{"indexed":true,"internalType":"address","name":"to","type":"address"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"amount","type":"uint256"},{"indexed":false,"internalType":"bytes","name":"data","type":"bytes"},{"indexed":false,"internalType":"bytes","name":"operatorData","type":"bytes"}],"name":"TokenSent","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"string","name":"value","type":"string"},{"indexed":true,"internalType":"uint256","name":"id","type":"uint256"}],"name":"TokenURI","type":"event"},{"inputs":[{"internalType":"uint256","name":"index_0","type":"uint256"}],"name":"creators","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"getNonFungibleBaseType","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"getNonFungibleIndex","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_implementation","type":"address"}],"name":"initialize","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"isFungible","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"isNonFungible","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"isNonFungibleBaseType","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"isNonFungibleItem","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"pure","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"index_0","type":"uint256"}],"name":"maxIndex","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"uint256","name":"id","type":"uint256"}],"name":"ownerOf","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"string","name":"_uri","type":"string"},{"internalType":"bool","name":"_isNF","type":"bool"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"create","outputs":[{"internalType":"uint256","name":"type_","type":"uint256"}],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address[]","name":"_to","type":"address[]"},{"internalType":"uint256","name":"_id","type":"uint256"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"mintFungible","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address[]","name":"_to","type":"address[]"},{"internalType":"uint256","name":"_type","type":"uint256"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"mintNonFungible","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_owner","type":"address"},{"internalType":"uint256","name":"_id","type":"uint256"}],"name":"balanceOf","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address[]","name":"_owners","type":"address[]"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"}],"name":"balanceOfBatch","outputs":[{"internalType":"uint256[]","name":"balances_","type":"uint256[]"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[],"name":"granularity","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function","constant":true},{"inputs":[{"internalType":"address","name":"_sender","type":"address"},{"internalType":"address","name":"_signer","type":"address"},{"components":[{"internalType":"address","name":"sender","type":"address"},{"internalType":"uint256[]","name":"senderTokenIds","type":"uint256[]"},{"internalType":"uint256[]","name":"senderTokenAmounts","type":"uint256[]"},{"internalType":"uint256[]","name":"signerTokenIds","type":"uint256[]"},{"internalType":"uint256[]","name":"signerTokenAmounts","type":"uint256[]"}],"internalType":"struct SwapLib.Swap","name":"_swap","type":"tuple"},{"internalType":"bytes","name":"_data","type":"bytes"}],"name":"swap","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_operator","type":"address"},{"internalType":"address","name":"_from","type":"address"},{"internalType":"address","name":"_to","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"},{"internalType":"bytes","name":"_operatorData","type":"bytes"}],"name":"send","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"_operator","type":"address"},{"internalType":"address","name":"_from","type":"address"},{"internalType":"uint256[]","name":"_ids","type":"uint256[]"},{"internalType":"uint256[]","name":"_amounts","type":"uint256[]"},{"internalType":"bytes","name":"_data","type":"bytes"},{"internalType":"bytes","name":"_operatorData","type":"bytes"}],"name":"burn","outputs":[],"stateMutability":"nonpayable","type":"function"}]'  # noqa: E501 (line-too-long)
+)
+_CODEC = ABICodec(build_default_registry())
+
+ABI = _freeze(_WEB3_ABI)
+"""Immutable ABI of the underlying contract."""
+
+FUNCTION_SELECTORS = MappingProxyType(
+    {
+        entry["name"]: function_abi_to_4byte_selector(entry)
+        for entry in _WEB3_ABI
+        if entry["type"] == "function"
+    }
+)
+"""4-byte selector of every function, keyed by function name."""
+
+FUNCTION_ABIS = MappingProxyType(
+    {
+        FUNCTION_SELECTORS[entry["name"]]: entry
+        for entry in ABI
+        if entry["type"] == "function"
+    }
+)
+"""ABI entry of every function, keyed by its 4-byte selector."""
+
+EVENT_TOPICS = MappingProxyType(
+    {
+        entry["name"]: event_abi_to_log_topic(entry)
+        for entry in _WEB3_ABI
+        if entry["type"] == "event"
+    }
+)
+"""Topic 0 of every event, keyed by event name."""
+
+EVENT_DECODERS = MappingProxyType(
+    {
+        EVENT_TOPICS[entry["name"]]: partial(get_event_data, _CODEC, entry)
+        for entry in _WEB3_ABI
+        if entry["type"] == "event"
+    }
+)
+"""Log decoder of every event, keyed by its topic 0."""
 
 
 # pylint: disable=too-many-lines
@@ -0,0 +1,296 @@
+"""Bulk, columnar decoding of event logs.
+
+``get_event_data`` decodes one log at a time through the generic ``eth_abi``
+machinery and wraps each of them in nested ``AttributeDict``\\ s, which
+dominates the CPU time of a large backfill.  A :class:`BulkDecoder` instead
+precomputes, for every event ABI, where each field lives in the log: which
+topic, or which 32-byte word of the data.  It then decodes a whole batch of
+logs in a single pass into one :class:`EventBatch` of columns per event::
+
+    decoder = BulkDecoder.for_wrappers(Token, Account)
+    batches = decoder.decode(logs)
+    sent = batches["TokenSent"]
+    sent["id"], sent["amount"]  # lists of ints, one per log
+
+Fixed-width fields (addresses, integers, booleans, ``bytesN``, indexed
+values) are decoded eagerly.  Dynamic fields (``bytes``, ``string``,
+arrays) are only decoded when their column is first read.
+
+Address columns hold lower-case hex strings: checksumming costs a keccak per
+value and is left to :meth:`EventBatch.rows`.
+
+Columns are Python lists, not NumPy arrays: token ids and amounts are
+``uint256`` values, which overflow every NumPy integer type, and object
+arrays would only add a copy.  Code vectorizing over ids converts their
+column with :func:`app.eth.tokenid.to_limbs`, into ``uint64`` limbs.
+"""
+import re
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+from eth_abi import decode_abi
+from eth_utils import event_abi_to_log_topic, to_checksum_address
+from eth_utils.abi import collapse_if_tuple
+from web3.datastructures import AttributeDict
+from web3.types import LogReceipt
+
+_WORD = 32
+_INT_TYPE = re.compile(r"^(u?)int(\d*)$")
+_BYTES_TYPE = re.compile(r"^bytes(\d+)$")
+
+
+def _to_bytes(value: Any) -> bytes:
+    """Return ``value``, a hex string or bytes, as bytes."""
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value[:2] in ("0x", "0X") else value)
+    return bytes(value)
+
+
+def _word_decoder(abi_type: str) -> Callable[[bytes], Any]:
+    """Return the decoder of a ``abi_type`` value held in one 32-byte word.
+
+    Raise ``ValueError`` when ``abi_type`` is not a single-word type.
+    """
+    if abi_type == "address":
+        return lambda word: "0x" + word[12:].hex()
+    if abi_type == "bool":
+        return lambda word: word[-1] != 0
+    match = _INT_TYPE.match(abi_type)
+    if match:
+        signed = not match.group(1)
+        return lambda word: int.from_bytes(word, "big", signed=signed)
+    match = _BYTES_TYPE.match(abi_type)
+    if match and int(match.group(1)) <= _WORD:
+        size = int(match.group(1))
+        return lambda word: word[:size]
+    raise ValueError(f"{abi_type} does not fit in one word")
+
+
+def _is_word_type(abi_type: str) -> bool:
+    try:
+        _word_decoder(abi_type)
+    except ValueError:
+        return False
+    return True
+
+
+class LazyColumn:
+    """Column of dynamic values decoded from the log data on first access."""
+
+    def __init__(self, datas: List[bytes], layout: "EventLayout", position: int):
+        """
+        :param datas: data of every log of the batch
+        :param layout: layout of the event
+        :param position: position of this column's field among the
+            non-indexed fields of the event
+        """
+        self._datas = datas
+        self._layout = layout
+        self._position = position
+        self._values: List[Any] = []
+
+    def values(self) -> List[Any]:
+        """Return every value of the column, decoding them on the first call."""
+        if len(self._values) != len(self._datas):
+            types = self._layout.data_types
+            abi_type = types[self._position]
+            if self._layout.word_heads and abi_type in ("bytes", "string"):
+                head = self._position * _WORD
+                text = abi_type == "string"
+                self._values = [
+                    self._decode_bytes(data, head, text) for data in self._datas
+                ]
+            else:
+                position = self._position
+                self._values = [
+                    decode_abi(types, data)[position] for data in self._datas
+                ]
+        return self._values
+
+    @staticmethod
+    def _decode_bytes(data: bytes, head: int, text: bool) -> Any:
+        start = int.from_bytes(data[head : head + _WORD], "big")
+        length = int.from_bytes(data[start : start + _WORD], "big")
+        value = data[start + _WORD : start + _WORD + length]
+        return value.decode("utf-8") if text else value
+
+    def __len__(self) -> int:
+        return len(self._datas)
+
+    def __getitem__(self, index):
+        return self.values()[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values())
+
+
+class EventBatch:
+    """Decoded logs of one event, as columns.
+
+    Every log has a ``block_number``, ``transaction_hash``, ``log_index`` and
+    ``address`` and one column per event field, e.g. ``batch["amount"]``.
+    """
+
+    def __init__(self, layout: "EventLayout"):
+        self.event = layout.name
+        self._layout = layout
+        self.block_number: List[int] = []
+        self.transaction_hash: List[bytes] = []
+        self.transaction_index: List[int] = []
+        self.log_index: List[int] = []
+        self.block_hash: List[bytes] = []
+        self.address: List[str] = []
+        self._columns: Dict[str, List[Any]] = {name: [] for name in layout.eager}
+        self._datas: List[bytes] = []
+
+    def __len__(self) -> int:
+        return len(self.block_number)
+
+    def __getitem__(self, name: str):
+        if name in self._columns:
+            return self._columns[name]
+        position = self._layout.dynamic.get(name)
+        if position is None:
+            raise KeyError(name)
+        column = LazyColumn(self._datas, self._layout, position)
+        self._columns[name] = column  # type: ignore
+        return column
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Names of the event fields, in ABI order."""
+        return self._layout.fields
+
+    def rows(self) -> Iterator[AttributeDict]:
+        """Yield every log the way ``get_event_data`` decodes it."""
+        columns = {name: self[name] for name in self.fields}
+        for index in range(len(self)):
+            args = {}
+            for name in self.fields:
+                value = columns[name][index]
+                if name in self._layout.addresses:
+                    value = to_checksum_address(value)
+                args[name] = value
+            yield AttributeDict(
+                {
+                    "args": AttributeDict(args),
+                    "event": self.event,
+                    "logIndex": self.log_index[index],
+                    "transactionIndex": self.transaction_index[index],
+                    "transactionHash": self.transaction_hash[index],
+                    "address": to_checksum_address(self.address[index]),
+                    "blockHash": self.block_hash[index],
+                    "blockNumber": self.block_number[index],
+                }
+            )
+
+
+class EventLayout:
+    """Where every field of an event ABI lives in its logs."""
+
+    def __init__(self, event_abi: Mapping):
+        self.name: str = event_abi["name"]
+        self.topic = event_abi_to_log_topic(dict(event_abi))
+        inputs = event_abi["inputs"]
+        self.fields = tuple(field["name"] for field in inputs)
+        self.addresses = frozenset(
+            field["name"] for field in inputs if field["type"] == "address"
+        )
+        self.data_types = [
+            collapse_if_tuple(dict(field)) for field in inputs if not field["indexed"]
+        ]
+        # Whether every data field has a one-word head, which is what lets
+        # fields be located without decoding the others.
+        self.word_heads = all(
+            _is_word_type(abi_type) or abi_type in ("bytes", "string")
+            for abi_type in self.data_types
+        )
+
+        # (name, topic position, decoder) of the indexed fields.
+        self.topics: List[Tuple[str, int, Callable]] = []
+        # (name, word position, decoder) of the fixed-width data fields.
+        self.words: List[Tuple[str, int, Callable]] = []
+        # name -> position among the data fields, for the lazily decoded ones.
+        self.dynamic: Dict[str, int] = {}
+        topic_position = 1
+        data_position = 0
+        for field in inputs:
+            name, abi_type = field["name"], field["type"]
+            if field["indexed"]:
+                # Indexed dynamic values are only present as their hash.
+                if not _is_word_type(abi_type):
+                    abi_type = "bytes32"
+                self.topics.append((name, topic_position, _word_decoder(abi_type)))
+                topic_position += 1
+                continue
+            if self.word_heads and _is_word_type(abi_type):
+                self.words.append((name, data_position, _word_decoder(abi_type)))
+            else:
+                self.dynamic[name] = data_position
+            data_position += 1
+        self.eager = [name for name, _position, _decoder in self.topics + self.words]
+
+
+class BulkDecoder:
+    """Decoder of batches of logs of known events."""
+
+    def __init__(self, event_abis: Iterable[Mapping]):
+        """
+        :param event_abis: ABI entries of the events to decode
+        """
+        self.layouts: Dict[bytes, EventLayout] = {}
+        for event_abi in event_abis:
+            if event_abi.get("type") == "event" and not event_abi.get("anonymous"):
+                layout = EventLayout(event_abi)
+                self.layouts[layout.topic] = layout
+
+    @classmethod
+    def for_wrappers(cls, *wrapper_classes: type) -> "BulkDecoder":
+        """Return a decoder of every event of the generated ``wrapper_classes``."""
+        return cls(
+            entry
+            for wrapper_class in wrapper_classes
+            for entry in sys.modules[wrapper_class.__module__].ABI  # type: ignore
+        )
+
+    def decode(self, logs: Iterable[LogReceipt]) -> Dict[str, EventBatch]:
+        """Decode ``logs`` into one batch per event name.
+
+        Logs of unknown events, and logs removed by a reorg, are skipped.
+        ``logs`` may be formatted by web3 or raw JSON-RPC objects.
+        """
+        batches: Dict[bytes, EventBatch] = {}
+        layouts = self.layouts
+        for log in logs:
+            topics = log["topics"]
+            if not topics or log.get("removed"):
+                continue
+            topic0 = _to_bytes(topics[0])
+            layout = layouts.get(topic0)
+            if layout is None:
+                continue
+            batch = batches.get(topic0)
+            if batch is None:
+                batch = batches[topic0] = EventBatch(layout)
+
+            batch.block_number.append(_to_int(log["blockNumber"]))
+            batch.transaction_hash.append(_to_bytes(log["transactionHash"]))
+            batch.transaction_index.append(_to_int(log["transactionIndex"]))
+            batch.log_index.append(_to_int(log["logIndex"]))
+            batch.block_hash.append(_to_bytes(log["blockHash"]))
+            batch.address.append(log["address"].lower())
+
+            columns = batch._columns
+            for name, position, decode in layout.topics:
+                columns[name].append(decode(_to_bytes(topics[position])))
+            data = _to_bytes(log["data"])
+            for name, position, decode in layout.words:
+                offset = position * _WORD
+                columns[name].append(decode(data[offset : offset + _WORD]))
+            if layout.dynamic:
+                batch._datas.append(data)
+        return {batch.event: batch for batch in batches.values()}
+
+
+def _to_int(value: Any) -> int:
+    return int(value, 16) if isinstance(value, str) else value
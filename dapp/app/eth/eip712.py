@@ -0,0 +1,198 @@
+"""EIP-712 hashing of swaps and recovery of their signers, off chain.
+
+Reproduces ``hashSwap`` and ``DOMAIN_SEPARATOR`` of ``SwapVerifier.sol``, so
+that swap offers are checked without calling the contract::
+
+    domain = domain_separator(chain_id, implementation_address)
+    digest = swap_digest(swap, domain)
+    recover_signer(digest, v, r, s)  # what ecrecover returns, or None
+
+The ``abi.encode`` of a swap is written word by word instead of going through
+``eth_abi``: the layout of ``(bytes32, address, uint256[4][])`` never changes
+and this is several times faster.  Domain separators are computed once per
+(chain id, verifying contract).
+
+Recovery runs through ``eth_keys``, on ``coincurve`` (libsecp256k1) when it is
+installed.  :func:`recover_signers` and :func:`recover_swap_signers` split
+large batches over a pool of processes.
+"""
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+from django.conf import settings
+from eth_keys import keys
+from eth_keys.exceptions import BadSignature
+from eth_utils import keccak, to_canonical_address
+from web3 import Web3
+
+# ``name`` of SwapVerifier.sol.
+DOMAIN_NAME = "VAHATRA"
+EIP712_DOMAIN_TYPE = (
+    "EIP712Domain(string name,uint256 chainId,address verifyingContract)"
+)
+EIP712_DOMAIN_TYPEHASH = keccak(text=EIP712_DOMAIN_TYPE)
+SWAP_TYPE = (
+    "Swap(address sender,uint256[] senderTokenIds,uint256[] senderTokenAmounts,"
+    "uint256[] signerTokenIds,uint256[] signerTokenAmounts)"
+)
+SWAP_TYPEHASH = keccak(text=SWAP_TYPE)
+# ``hashSwap`` packs the escaped string literal "\\x19\\x01", eight bytes, not
+# the two bytes of EIP-712.
+SWAP_PREFIX = b"\\x19\\x01"
+SWAP_ARRAYS = (
+    "senderTokenIds",
+    "senderTokenAmounts",
+    "signerTokenIds",
+    "signerTokenAmounts",
+)
+
+# Below this many signatures a batch is recovered in-process.
+MIN_POOL_BATCH = 256
+
+Signature = Tuple[int, bytes, bytes]
+
+_chain_ids: "weakref.WeakKeyDictionary[Web3, int]" = weakref.WeakKeyDictionary()
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _domain_separator(name: str, chain_id: int, verifying_contract: bytes) -> bytes:
+    return keccak(
+        EIP712_DOMAIN_TYPEHASH
+        + keccak(text=name)
+        + chain_id.to_bytes(32, "big")
+        + verifying_contract.rjust(32, b"\0")
+    )
+
+
+def domain_separator(
+    chain_id: int, verifying_contract: str, name: str = DOMAIN_NAME
+) -> bytes:
+    """Return the ``DOMAIN_SEPARATOR`` of the contract at ``verifying_contract``."""
+    return _domain_separator(name, chain_id, to_canonical_address(verifying_contract))
+
+
+def chain_id(web3: Web3) -> int:
+    """Return the chain id of the node behind ``web3``, asked once."""
+    try:
+        return _chain_ids[web3]
+    except KeyError:
+        value = _chain_ids[web3] = web3.eth.chainId
+        return value
+
+
+def _word(value: int) -> bytes:
+    try:
+        return value.to_bytes(32, "big")
+    except OverflowError:
+        raise ValueError(f"{value} is not a uint256")
+
+
+def encode_swap(swap: Mapping) -> bytes:
+    """Return ``abi.encode(SWAP_TYPEHASH, sender, <the four arrays>)``."""
+    head = [SWAP_TYPEHASH, to_canonical_address(swap["sender"]).rjust(32, b"\0")]
+    tail = []
+    offset = 32 * (2 + len(SWAP_ARRAYS))
+    for name in SWAP_ARRAYS:
+        values = swap[name]
+        head.append(offset.to_bytes(32, "big"))
+        tail.append(len(values).to_bytes(32, "big"))
+        tail.extend(_word(int(value)) for value in values)
+        offset += 32 * (1 + len(values))
+    return b"".join(head + tail)
+
+
+def swap_struct_hash(swap: Mapping) -> bytes:
+    """Return the struct hash of ``swap``, a ``SwapLib.Swap`` argument."""
+    return keccak(encode_swap(swap))
+
+
+def swap_digest(swap: Mapping, domain: bytes) -> bytes:
+    """Return the digest ``hashSwap`` computes for ``swap`` under ``domain``."""
+    return keccak(SWAP_PREFIX + domain + swap_struct_hash(swap))
+
+
+def recover_signer(digest: bytes, v: int, r: bytes, s: bytes) -> Optional[str]:
+    """Return the lower-case address ``ecrecover`` returns, None where it fails."""
+    if v not in (27, 28):
+        return None
+    try:
+        signature = keys.Signature(
+            vrs=(v - 27, int.from_bytes(r, "big"), int.from_bytes(s, "big"))
+        )
+        public_key = signature.recover_public_key_from_msg_hash(digest)
+    except (BadSignature, ValueError):
+        return None
+    return public_key.to_address().lower()
+
+
+def _recover_chunk(items: Sequence[Tuple[bytes, int, bytes, bytes]]) -> List:
+    return [recover_signer(*item) for item in items]
+
+
+def _recover_swap_chunk(
+    domain: bytes, items: Sequence[Tuple[Mapping, Signature]]
+) -> List:
+    return [
+        recover_signer(swap_digest(swap, domain), *signature)
+        for swap, signature in items
+    ]
+
+
+def get_recovery_pool() -> ProcessPoolExecutor:
+    """Return the pool of processes batches of signatures are recovered in."""
+    global _pool  # pylint: disable=global-statement
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    settings.WEB3_RECOVERY_WORKERS or os.cpu_count()
+                )
+    return _pool
+
+
+def _chunks(items: Sequence, size: int):
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _in_pool(function, items: Sequence, chunk_size: int, *args) -> List:
+    chunks = _chunks(items, chunk_size)
+    pool = get_recovery_pool()
+    futures = [pool.submit(function, *args, chunk) for chunk in chunks]
+    return [signer for future in futures for signer in future.result()]
+
+
+def recover_signers(
+    items: Sequence[Tuple[bytes, int, bytes, bytes]], chunk_size: int = 1024
+) -> List[Optional[str]]:
+    """Return the signer of every ``(digest, v, r, s)`` of ``items``, in order.
+
+    :param chunk_size: signatures per task of the pool
+    """
+    items = list(items)
+    if len(items) < MIN_POOL_BATCH:
+        return _recover_chunk(items)
+    return _in_pool(_recover_chunk, items, chunk_size)
+
+
+def recover_swap_signers(
+    swaps: Sequence[Mapping],
+    signatures: Sequence[Signature],
+    domain: bytes,
+    chunk_size: int = 1024,
+) -> List[Optional[str]]:
+    """Return the signer of every swap of ``swaps``, hashed in the pool too.
+
+    :param signatures: ``(v, r, s)`` of every swap
+    :param domain: domain separator the swaps are signed under
+    :param chunk_size: swaps per task of the pool
+    """
+    items = list(zip(swaps, signatures))
+    if len(items) < MIN_POOL_BATCH:
+        return _recover_swap_chunk(domain, items)
+    return _in_pool(_recover_swap_chunk, items, chunk_size, domain)
@@ -0,0 +1,221 @@
+"""Range-based event log scanner.
+
+A :class:`LogScanner` reads the events of one or more deployed contracts over
+a range of blocks with ``eth_getLogs``, one request per chunk of blocks for
+every contract and event at once, and yields them decoded, in chain order::
+
+    scanner = LogScanner(web3, [(Token, token_address), (Account, account_address)])
+    for event in scanner.scan(from_block, to_block):
+        ...
+
+Providers cap the number of logs a single ``eth_getLogs`` may return.  When a
+chunk is refused for holding too many results it is split in halves and
+retried; chunks then grow back after every successful request, so sparse
+stretches of history are read in few large requests and busy ones in many
+small ones.
+
+:meth:`LogScanner.scan_batches` decodes every chunk in bulk, into the columns
+of :class:`~app.eth.decoder.EventBatch`, which is what backfills should use.
+"""
+import logging
+import sys
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3.types import BlockIdentifier, LogReceipt
+
+from app.eth.decoder import BulkDecoder, EventBatch
+
+logger = logging.getLogger(__name__)
+
+# Fragments of the errors providers answer with when a range holds too many logs.
+TOO_MANY_RESULTS = (
+    "query returned more than",
+    "too many results",
+    "response size exceeded",
+    "limit exceeded",
+    "block range is too wide",
+    "range too large",
+    "query timeout exceeded",
+)
+
+Decoder = Callable[[LogReceipt], AttributeDict]
+
+
+class Chunk(NamedTuple):
+    """Decoded events of the blocks ``start`` to ``end``, inclusive."""
+
+    start: int
+    end: int
+    events: List[AttributeDict]
+
+
+def is_too_many_results(exc: Exception) -> bool:
+    """Whether ``exc`` is a provider refusing a range for holding too many logs."""
+    error = exc.args[0] if exc.args else exc
+    if isinstance(error, dict):
+        if error.get("code") == -32005:
+            return True
+        error = error.get("message", "")
+    message = str(error).lower()
+    return any(fragment in message for fragment in TOO_MANY_RESULTS)
+
+
+def wrapper_events(wrapper_class: type) -> Mapping[str, bytes]:
+    """Return the topic 0 of every event of a generated ``wrapper_class``."""
+    return sys.modules[wrapper_class.__module__].EVENT_TOPICS  # type: ignore
+
+
+def wrapper_decoders(wrapper_class: type) -> Mapping[bytes, Decoder]:
+    """Return the log decoder of every event of a generated ``wrapper_class``."""
+    return sys.modules[wrapper_class.__module__].EVENT_DECODERS  # type: ignore
+
+
+class Batches(NamedTuple):
+    """Events of the blocks ``start`` to ``end``, inclusive, by event name."""
+
+    start: int
+    end: int
+    batches: Dict[str, EventBatch]
+
+
+class LogScanner:
+    """Reader of the events of deployed contracts over block ranges."""
+
+    def __init__(
+        self,
+        web3: Web3,
+        contracts: Iterable[Tuple[type, str]],
+        events: Optional[Iterable[str]] = None,
+        chunk_size: int = 2000,
+        max_chunk_size: int = 100000,
+    ):
+        """
+        :param web3: client used to send ``eth_getLogs``
+        :param contracts: ``(wrapper_class, address)`` pairs, e.g.
+            ``(Token, settings.CONTRACT_TOKEN_ADR)``
+        :param events: names of the events to read; defaults to every event
+            of every contract
+        :param chunk_size: number of blocks of the first request
+        :param max_chunk_size: chunks never grow beyond this many blocks
+        """
+        self.web3 = web3
+        self.chunk_size = chunk_size
+        self.max_chunk_size = max_chunk_size
+        if events is not None:
+            events = set(events)
+        self._decoders: Dict[Tuple[str, bytes], Decoder] = {}
+        topics = set()
+        event_abis = {}
+        for wrapper_class, address in contracts:
+            address = to_checksum_address(address)
+            decoders = wrapper_decoders(wrapper_class)
+            abis = {
+                entry["name"]: entry
+                for entry in sys.modules[wrapper_class.__module__].ABI  # type: ignore
+                if entry["type"] == "event"
+            }
+            for name, topic in wrapper_events(wrapper_class).items():
+                if events is None or name in events:
+                    self._decoders[(address, bytes(topic))] = decoders[topic]
+                    topics.add(bytes(topic))
+                    event_abis[bytes(topic)] = abis[name]
+        self._bulk_decoder = BulkDecoder(event_abis.values())
+        self.addresses = sorted({address for address, _topic in self._decoders})
+        self.topics = sorted(HexBytes(topic).hex() for topic in topics)
+
+    def scan(
+        self, from_block: int, to_block: BlockIdentifier = "latest"
+    ) -> Iterator[AttributeDict]:
+        """Yield every event emitted from ``from_block`` to ``to_block``, in order."""
+        for chunk in self.scan_chunks(from_block, to_block):
+            yield from chunk.events
+
+    def scan_chunks(
+        self, from_block: int, to_block: BlockIdentifier = "latest"
+    ) -> Iterator[Chunk]:
+        """Yield the events of consecutive chunks of ``from_block`` to ``to_block``.
+
+        Every chunk is complete when it is yielded, which makes its ``end`` a
+        safe checkpoint to resume from.
+        """
+        for start, end, logs in self._ranges(from_block, to_block):
+            yield Chunk(start, end, self.decode(logs))
+
+    def scan_batches(
+        self, from_block: int, to_block: BlockIdentifier = "latest"
+    ) -> Iterator[Batches]:
+        """Yield the events of consecutive chunks, decoded in bulk.
+
+        Like :meth:`scan_chunks`, but every chunk is decoded into one
+        :class:`~app.eth.decoder.EventBatch` of columns per event.
+        """
+        for start, end, logs in self._ranges(from_block, to_block):
+            yield Batches(start, end, self._bulk_decoder.decode(logs))
+
+    def _ranges(
+        self, from_block: int, to_block: BlockIdentifier
+    ) -> Iterator[Tuple[int, int, List[LogReceipt]]]:
+        """Yield the raw logs of chunks of blocks sized to the provider's limit."""
+        if not isinstance(to_block, int):
+            to_block = self.web3.eth.getBlock(to_block)["number"]
+        chunk_size = self.chunk_size
+        start = from_block
+        while start <= to_block:
+            end = min(start + chunk_size - 1, to_block)
+            try:
+                logs = self.get_logs(start, end)
+            except ValueError as exc:
+                if not is_too_many_results(exc) or start == end:
+                    raise
+                chunk_size = max(1, (end - start + 1) // 2)
+                logger.debug(
+                    "Too many logs in blocks %s-%s, retrying %s blocks at a time",
+                    start,
+                    end,
+                    chunk_size,
+                )
+                continue
+            yield start, end, logs
+            start = end + 1
+            chunk_size = min(chunk_size * 2, self.max_chunk_size)
+
+    def get_logs(self, start: int, end: int) -> List[LogReceipt]:
+        """Return the raw logs of the scanned events from ``start`` to ``end``."""
+        if not self._decoders:
+            return []
+        return self.web3.eth.getLogs(
+            {
+                "fromBlock": start,
+                "toBlock": end,
+                "address": self.addresses,
+                "topics": [self.topics],
+            }
+        )
+
+    def decode(self, logs: Sequence[LogReceipt]) -> List[AttributeDict]:
+        """Decode ``logs``, skipping the ones removed by a reorg."""
+        events = []
+        for log in logs:
+            if log.get("removed") or not log["topics"]:
+                continue
+            # web3 has already checksummed the address of every log.
+            decoder = self._decoders.get((log["address"], bytes(log["topics"][0])))
+            if decoder is not None:
+                events.append(decoder(log))
+        return events
+
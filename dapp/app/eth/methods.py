@@ -0,0 +1,87 @@
+"""Lazy construction of the method objects of generated wrappers.
+
+A wrapper exposes one ``*Method`` object per ABI function, each resolving its
+``ContractFunction`` and holding a validator.  Building all of them up front
+makes every wrapper cost as much as its whole ABI even when a request touches
+a single method, so generated classes declare their methods as
+:class:`LazyMethod` descriptors instead: a method object is built on first
+access and memoized on the instance, where later lookups find it directly.
+
+Methods of ``pure`` functions known to :data:`app.eth.tokenid.LOCAL_CALLS`
+are built from a subclass, see :func:`local_method_class`, whose ``call``
+runs in-process instead of sending an ``eth_call``.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Generic, Mapping, Optional, Type, TypeVar
+
+from eth_utils import abi_to_signature
+
+from app.eth.batch import normalize_inputs
+from app.eth.tokenid import LOCAL_CALLS
+
+Method = TypeVar("Method")
+
+
+class LazyMethod(Generic[Method]):
+    """Class attribute building a method object on first instance access.
+
+    The object is built by ``instance._build_method(method_class, *args,
+    **kwargs)``, which every generated wrapper defines.
+    """
+
+    def __init__(self, method_class: Type[Method], *args: Any, **kwargs: Any):
+        """
+        :param method_class: class of the method object, e.g. ``NameMethod``
+        :param args: forwarded to the ``_build_method`` of the wrapper
+        :param kwargs: forwarded to the ``_build_method`` of the wrapper
+        """
+        self.method_class = method_class
+        self.args = args
+        self.kwargs = kwargs
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Method:
+        if instance is None:
+            return self  # type: ignore
+        method = instance._build_method(self.method_class, *self.args, **self.kwargs)
+        # Shadows this non-data descriptor for every later lookup.
+        instance.__dict__[self.name] = method
+        return method
+
+
+def local_method_class(method_class: type, function_abi: Mapping) -> type:
+    """Return the class of the method object of the function ``function_abi``.
+
+    That is ``method_class`` itself, unless the function is ``pure`` and has
+    an in-process implementation, in which case it is a subclass whose
+    ``call`` evaluates it locally.  Batches, aggregates and cached contracts
+    resolve such calls without a request too; ``estimate_gas`` still asks
+    the node.
+    """
+    if function_abi.get("stateMutability") != "pure":
+        return method_class
+    function = LOCAL_CALLS.get(abi_to_signature(function_abi))
+    if function is None:
+        return method_class
+    return _local_subclass(method_class, function)
+
+
+@lru_cache(maxsize=None)
+def _local_subclass(method_class: type, function: Callable) -> type:
+    def call(self, *args, tx_params=None):
+        """Evaluate the pure function in-process, without ``eth_call``."""
+        return function(*normalize_inputs(self, args))
+
+    return type(
+        method_class.__name__,
+        (method_class,),
+        {
+            "__doc__": method_class.__doc__,
+            "__module__": method_class.__module__,
+            "call": call,
+            "local_function": staticmethod(function),
+        },
+    )
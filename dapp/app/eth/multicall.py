@@ -0,0 +1,148 @@
+"""Aggregation of contract view calls through the on-chain ``Multicall`` contract.
+
+Some providers cap the size of JSON-RPC batches.  An :class:`Aggregate` queues
+calls exactly like a :class:`~app.eth.batch.Batch` but packs them into the
+``aggregate`` function of the ``Multicall`` contract
+(``contracts/token/contracts/Multicall.sol``), so the node sees a single
+``eth_call`` and every result is read at the same block.
+
+Without an aggregator address (``settings.CONTRACT_MULTICALL_ADR``) the queued
+calls are sent as a plain batch instead.
+"""
+from typing import Any, List, Optional, Union
+
+from django.conf import settings
+from eth_abi import decode_abi
+from eth_abi.exceptions import DecodingError
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.eth import Eth
+from web3.types import BlockIdentifier, RPCEndpoint
+
+from app.eth.batch import Batch, BatchItem, format_block
+
+AGGREGATE_SELECTOR = function_signature_to_4byte_selector(
+    "aggregate((address,bytes)[])"
+)
+AGGREGATE_INPUT_TYPES = ["(address,bytes)[]"]
+AGGREGATE_OUTPUT_TYPES = ["uint256", "(bool,bytes)[]"]
+
+# Error(string) selector prefixing revert reasons.
+REVERT_SELECTOR = function_signature_to_4byte_selector("Error(string)")
+
+
+class Aggregate(Batch):
+    """Queue of contract view calls executed in one ``Multicall.aggregate`` call.
+
+    Calls are split in chunks of ``max_calls`` to stay under the node's
+    ``eth_call`` gas cap; every chunk after the first one is pinned to the
+    block the first one was read at.
+    """
+
+    def __init__(
+        self,
+        web3_or_eth: Union[Web3, Eth],
+        wrapper: Any = None,
+        aggregator_address: Optional[str] = None,
+        block_identifier: BlockIdentifier = "latest",
+        max_calls: int = 500,
+    ):
+        """
+        :param web3_or_eth: client, or its ``eth`` module, used to send calls
+        :param wrapper: generated wrapper whose methods are reachable as
+            attributes of the aggregate
+        :param aggregator_address: where ``Multicall`` has been deployed;
+            defaults to ``settings.CONTRACT_MULTICALL_ADR``
+        :param block_identifier: block at which the calls are evaluated
+        :param max_calls: maximum number of calls per ``eth_call``
+        """
+        super().__init__(web3_or_eth, wrapper)
+        if aggregator_address is None:
+            aggregator_address = getattr(settings, "CONTRACT_MULTICALL_ADR", "")
+        self.aggregator_address = (
+            to_checksum_address(aggregator_address) if aggregator_address else None
+        )
+        self.block_identifier = block_identifier
+        self.max_calls = max_calls
+        self.block_number: Optional[int] = None
+
+    def add(self, method, *args, tx_params=None, block_identifier=None) -> BatchItem:
+        """Queue ``method.call(*args)`` and return the item holding its result.
+
+        Every call of an aggregate is read at the block of the aggregate,
+        ``block_identifier`` is only honoured by the plain-call fallback.
+        """
+        return super().add(
+            method,
+            *args,
+            tx_params=tx_params,
+            block_identifier=(
+                self.block_identifier if block_identifier is None else block_identifier
+            ),
+        )
+
+    def execute(self) -> List[BatchItem]:
+        """Send every queued call and resolve its item."""
+        if self.aggregator_address is None:
+            return super().execute()
+
+        items, self._items = self._items, []
+        block_identifier = self.block_identifier
+        for start in range(0, len(items), self.max_calls):
+            chunk = items[start : start + self.max_calls]
+            try:
+                self.block_number, results = self._aggregate(chunk, block_identifier)
+            except Exception as exc:  # pylint: disable=broad-except
+                for item in chunk:
+                    item.set_error(exc)
+                continue
+            block_identifier = self.block_number
+            for item, (success, return_data) in zip(chunk, results):
+                if success:
+                    item.set_response(self._web3, {"result": HexBytes(return_data)})
+                else:
+                    error = revert_error(return_data)
+                    item.set_response(self._web3, {"error": error})
+        return items
+
+    def _aggregate(self, items: List[BatchItem], block_identifier: BlockIdentifier):
+        """Execute ``items`` in one ``aggregate`` call at ``block_identifier``."""
+        calls = [
+            (call["to"], HexBytes(call["data"]))
+            for call, _block in (item.params for item in items)
+        ]
+        data = AGGREGATE_SELECTOR + self._web3.codec.encode_abi(
+            AGGREGATE_INPUT_TYPES, [calls]
+        )
+        # Through the middlewares, which eth-tester needs to read the block.
+        response = self._web3.manager._make_request(
+            RPCEndpoint("eth_call"),
+            [
+                {"to": self.aggregator_address, "data": HexBytes(data).hex()},
+                format_block(block_identifier),
+            ],
+        )
+        if "error" in response:
+            raise ValueError(response["error"])
+        try:
+            return self._web3.codec.decode_abi(
+                AGGREGATE_OUTPUT_TYPES, HexBytes(response["result"])
+            )
+        except DecodingError as exc:
+            raise ValueError(
+                f"Unexpected output from aggregator {self.aggregator_address}: {exc}"
+            )
+
+
+def revert_error(return_data: bytes) -> dict:
+    """Return a JSON-RPC error object for a call reverting with ``return_data``."""
+    message = "execution reverted"
+    if return_data[:4] == REVERT_SELECTOR:
+        try:
+            (reason,) = decode_abi(["string"], return_data[4:])
+        except DecodingError:
+            pass
+        else:
+            message = f"{message}: {reason}"
+    return {"code": 3, "message": message, "data": HexBytes(return_data).hex()}
@@ -0,0 +1,171 @@
+"""Nonces of the signing accounts, handed out without asking the node.
+
+Letting web3 fill in the nonce of every transaction means one
+``eth_getTransactionCount`` per transaction and, as soon as two workers send
+from the same account, two transactions with the same nonce.  A
+:class:`NonceManager` keeps one counter per signer in Redis instead: taking a
+nonce is a single atomic ``INCRBY`` shared by every worker, and the node is
+only asked for the transaction count to initialize a counter or to re-sync it
+after a failure::
+
+    nonces = get_nonce_manager(web3)
+    nonce = nonces.allocate(address)
+    first = nonces.allocate(address, count=100)  # first..first + 99
+
+Counters live under ``settings.WEB3_NONCE_REDIS_URL``, one per chain and
+signer; without it they are kept in-process, which is only safe with a
+single worker per signer.
+"""
+import threading
+from typing import Dict, Optional
+
+import redis
+from django.conf import settings
+from eth_utils import to_checksum_address
+from web3 import Web3
+
+# INCRBY the counter of KEYS[1] by ARGV[1] and return its previous value, or
+# -1 if the counter has not been initialized.
+_ALLOCATE = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return -1
+end
+return redis.call("INCRBY", KEYS[1], ARGV[1]) - tonumber(ARGV[1])
+"""
+
+# Raise the counter of KEYS[1] to ARGV[1] if it is lower; return its value.
+_RAISE_TO = """
+local current = tonumber(redis.call("GET", KEYS[1]) or "-1")
+local nonce = tonumber(ARGV[1])
+if nonce > current then
+    redis.call("SET", KEYS[1], nonce)
+    return nonce
+end
+return current
+"""
+
+_lock = threading.Lock()
+_managers: Dict[str, "NonceManager"] = {}
+
+
+class RedisNonceStore:
+    """Next nonce of every signer, shared through Redis."""
+
+    def __init__(self, client: redis.Redis, prefix: str = "eth:nonce"):
+        """
+        :param client: Redis connection
+        :param prefix: prefix of the keys of the counters
+        """
+        self.client = client
+        self.prefix = prefix
+        self._allocate = client.register_script(_ALLOCATE)
+        self._raise_to = client.register_script(_RAISE_TO)
+
+    def _key(self, address: str) -> str:
+        return f"{self.prefix}:{address}"
+
+    def allocate(self, address: str, count: int = 1) -> Optional[int]:
+        """Reserve ``count`` nonces; return the first, or None if uninitialized."""
+        nonce = int(self._allocate(keys=[self._key(address)], args=[count]))
+        return None if nonce < 0 else nonce
+
+    def raise_to(self, address: str, nonce: int) -> int:
+        """Move the next nonce up to ``nonce``, never down; return it."""
+        return int(self._raise_to(keys=[self._key(address)], args=[nonce]))
+
+    def reset(self, address: str, nonce: int):
+        """Set the next nonce to ``nonce``, even if lower."""
+        self.client.set(self._key(address), nonce)
+
+
+class LocalNonceStore:
+    """Next nonce of every signer, kept in-process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._nonces: Dict[str, int] = {}
+
+    def allocate(self, address: str, count: int = 1) -> Optional[int]:
+        """Reserve ``count`` nonces; return the first, or None if uninitialized."""
+        with self._lock:
+            nonce = self._nonces.get(address)
+            if nonce is not None:
+                self._nonces[address] = nonce + count
+            return nonce
+
+    def raise_to(self, address: str, nonce: int) -> int:
+        """Move the next nonce up to ``nonce``, never down; return it."""
+        with self._lock:
+            nonce = max(nonce, self._nonces.get(address, -1))
+            self._nonces[address] = nonce
+            return nonce
+
+    def reset(self, address: str, nonce: int):
+        """Set the next nonce to ``nonce``, even if lower."""
+        with self._lock:
+            self._nonces[address] = nonce
+
+
+class NonceManager:
+    """Hands out the nonces of the accounts signing for a node."""
+
+    def __init__(self, web3: Web3, store=None):
+        """
+        :param web3: client of the node the transactions are sent to
+        :param store: :class:`RedisNonceStore` or :class:`LocalNonceStore`;
+            defaults to a new :class:`LocalNonceStore`
+        """
+        self.web3 = web3
+        self.store = store if store is not None else LocalNonceStore()
+
+    def allocate(self, address: str, count: int = 1) -> int:
+        """Reserve ``count`` consecutive nonces of ``address``; return the first."""
+        address = to_checksum_address(address)
+        nonce = self.store.allocate(address, count)
+        if nonce is None:
+            self.sync(address)
+            nonce = self.store.allocate(address, count)
+        return nonce
+
+    def chain_nonce(self, address: str) -> int:
+        """Return the next nonce of ``address`` known to the node, pending included."""
+        return self.web3.eth.getTransactionCount(
+            to_checksum_address(address), "pending"
+        )
+
+    def sync(self, address: str) -> int:
+        """Catch up with the transactions the node has seen; return the next nonce.
+
+        Nonces already handed out are never handed out again.
+        """
+        address = to_checksum_address(address)
+        return self.store.raise_to(address, self.chain_nonce(address))
+
+    def reset(self, address: str) -> int:
+        """Restart from the next nonce known to the node; return it.
+
+        Only safe once every transaction sent with a higher nonce is known to
+        have been dropped.
+        """
+        address = to_checksum_address(address)
+        nonce = self.chain_nonce(address)
+        self.store.reset(address, nonce)
+        return nonce
+
+
+def get_nonce_manager(web3: Web3) -> NonceManager:
+    """Return the shared :class:`NonceManager` of the node behind ``web3``."""
+    key = str(getattr(web3.provider, "endpoint_uri", None) or id(web3.provider))
+    manager = _managers.get(key)
+    if manager is None:
+        with _lock:
+            manager = _managers.get(key)
+            if manager is None:
+                url = settings.WEB3_NONCE_REDIS_URL
+                if url:
+                    prefix = f"eth:nonce:{web3.eth.chainId}"
+                    store = RedisNonceStore(redis.Redis.from_url(url), prefix)
+                else:
+                    store = LocalNonceStore()
+                manager = _managers[key] = NonceManager(web3, store)
+    return manager
@@ -0,0 +1,286 @@
+"""Concurrent submission of locally signed transactions.
+
+``send_transaction`` on a generated method asks the node for a nonce, lets
+it sign and waits for the answer, one transaction at a time.  A
+:class:`TransactionPipeline` builds, signs and sends the transactions of one
+account from a thread pool instead, taking nonces from the shared
+:class:`~app.eth.nonces.NonceManager`::
+
+    with implementation.pipeline(Account.from_key(key)) as pipeline:
+        futures = [
+            pipeline.mint_fungible(recipients, token_id, amounts, b"")
+            for recipients, amounts in chunks
+        ]
+    tx_hashes = [future.result() for future in futures]
+
+Transactions are validated and their gas estimated before a nonce is taken,
+so only transactions the node refuses can leave a gap.  A nonce the node
+reports as already used makes the pipeline re-sync and retry with a new
+one; a nonce left unused by a refused transaction goes to the next
+transaction, or to a zero-value transfer to self when the pipeline is
+closed, so the transactions queued after it are not stuck.
+"""
+import copy
+import heapq
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TransactionNotFound
+from zero_ex.contract_wrappers.bases import ContractMethod
+from zero_ex.contract_wrappers.tx_params import TxParams
+
+from app.eth.nonces import NonceManager, get_nonce_manager
+from app.eth.preflight import acting_as
+
+logger = logging.getLogger(__name__)
+
+# Hook receiving the nonce, hash and raw bytes of a signed transaction.
+BeforeSend = Callable[[int, HexBytes, bytes], None]
+
+# Errors of nodes that already have the very same transaction.
+KNOWN_TRANSACTION = ("already known", "known transaction", "already imported")
+# Errors of nodes that have another transaction with the same nonce.
+NONCE_USED = (
+    "nonce too low",
+    "replacement transaction underpriced",
+    "correct nonce",
+)
+
+
+def _error_message(exc: Exception) -> str:
+    error = exc.args[0] if exc.args else exc
+    if isinstance(error, dict):
+        error = error.get("message", error)
+    return str(error).lower()
+
+
+def _nonce_used(exc: Exception) -> bool:
+    message = _error_message(exc)
+    return any(reason in message for reason in NONCE_USED)
+
+
+class TransactionPipeline:
+    """Signs the transactions of ``account`` and sends them concurrently.
+
+    Used as a context manager, the pipeline is closed when the block exits.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        account: LocalAccount,
+        wrapper: Any = None,
+        nonces: Optional[NonceManager] = None,
+        max_workers: int = 8,
+        retries: int = 3,
+    ):
+        """
+        :param web3: client of the node the transactions are sent to
+        :param account: account signing the transactions
+        :param wrapper: generated wrapper whose methods are reachable as
+            attributes of the pipeline
+        :param nonces: defaults to the shared manager of the node
+        :param max_workers: how many transactions are in flight at once
+        :param retries: how many times a transaction whose nonce turned out
+            to be used is retried with a new one
+        """
+        self.web3 = web3
+        self.account = account
+        self.address = account.address
+        self.nonces = nonces or get_nonce_manager(web3)
+        self.retries = retries
+        self._wrapper = wrapper
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="eth-tx")
+        self._lock = threading.Lock()
+        # Nonces taken by transactions the node refused, lowest first.
+        self._free: List[int] = []
+        self._futures: List[Future] = []
+        # Nonce -> hash of the transactions sent and not yet seen mined.
+        self.pending: Dict[int, HexBytes] = {}
+
+    def __enter__(self) -> "TransactionPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getattr__(self, name: str) -> Callable[..., Future]:
+        wrapper = self.__dict__.get("_wrapper")
+        method = getattr(wrapper, name, None)
+        if not isinstance(method, ContractMethod):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.submit(method, *args, **kwargs)
+
+    def submit(
+        self,
+        method: ContractMethod,
+        *args,
+        tx_params: Optional[TxParams] = None,
+        before_send: Optional[BeforeSend] = None,
+    ) -> Future:
+        """Queue ``method.send_transaction(*args)``; return the future of its hash.
+
+        :param method: method of a generated wrapper, e.g.
+            ``implementation.mint_fungible``
+        :param tx_params: transaction parameters; ``from_`` and ``nonce`` are
+            the pipeline's
+        :param before_send: called with the nonce, hash and raw bytes of the
+            signed transaction before it is sent, e.g. to record it; the
+            transaction is not sent if it raises
+        """
+        future = self._executor.submit(
+            self._send, method, args, tx_params, before_send
+        )
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    def wait(self, timeout: Optional[float] = None) -> List[Future]:
+        """Wait for every queued transaction to be sent and fill the nonce gaps.
+
+        :returns: the futures of the transactions queued so far, in order
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        wait(futures, timeout)
+        self.fill_gaps()
+        return futures
+
+    def close(self):
+        """Wait for every queued transaction, fill the gaps and stop the workers."""
+        self.wait()
+        self._executor.shutdown()
+
+    def _send(
+        self,
+        method: ContractMethod,
+        args: tuple,
+        tx_params: Optional[TxParams],
+        before_send: Optional[BeforeSend],
+    ) -> HexBytes:
+        tx_params = copy.copy(tx_params) if tx_params is not None else TxParams()
+        tx_params.from_ = self.address
+        tx_params.nonce = None
+        with acting_as(self.address):
+            transaction = method.build_transaction(*args, tx_params=tx_params)
+        attempt = 0
+        while True:
+            transaction["nonce"] = self._take_nonce()
+            try:
+                return self._send_signed(transaction, before_send)
+            except ValueError as exc:
+                if attempt >= self.retries or not _nonce_used(exc):
+                    raise
+            logger.info(
+                "Nonce %s of %s already used, re-syncing",
+                transaction["nonce"],
+                self.address,
+            )
+            self.nonces.sync(self.address)
+            attempt += 1
+
+    def _send_signed(
+        self, transaction: dict, before_send: Optional[BeforeSend] = None
+    ) -> HexBytes:
+        """Sign and send ``transaction``, giving its nonce back if refused.
+
+        :raises ValueError: with the error of the node when the nonce is used
+        """
+        nonce = transaction["nonce"]
+        signed = self.account.sign_transaction(transaction)
+        if before_send is not None:
+            try:
+                before_send(nonce, HexBytes(signed.hash), bytes(signed.rawTransaction))
+            except Exception:
+                self.give_back(nonce)
+                raise
+        try:
+            tx_hash = self.web3.eth.sendRawTransaction(signed.rawTransaction)
+        except Exception as exc:  # pylint: disable=broad-except
+            message = _error_message(exc)
+            if any(reason in message for reason in KNOWN_TRANSACTION):
+                tx_hash = HexBytes(signed.hash)
+            elif self._is_known(signed.hash):
+                # Sent, but the answer was lost (e.g. a timeout), or sent
+                # twice and already mined ("nonce too low").
+                tx_hash = HexBytes(signed.hash)
+            elif _nonce_used(exc):
+                raise
+            else:
+                self.give_back(nonce)
+                raise
+        with self._lock:
+            self.pending[nonce] = tx_hash
+        return tx_hash
+
+    def _is_known(self, tx_hash: bytes) -> bool:
+        try:
+            self.web3.eth.getTransaction(tx_hash)
+        except TransactionNotFound:
+            return False
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not look %s up", HexBytes(tx_hash).hex())
+            return False
+        return True
+
+    def _take_nonce(self) -> int:
+        with self._lock:
+            if self._free:
+                return heapq.heappop(self._free)
+        return self.nonces.allocate(self.address)
+
+    def give_back(self, nonce: int):
+        """Hand ``nonce`` out again, to the next transaction or to fill the gap.
+
+        For nonces taken but never used, e.g. by a transaction the node
+        refused.
+        """
+        with self._lock:
+            heapq.heappush(self._free, nonce)
+
+    def fill_gaps(self) -> List[HexBytes]:
+        """Send a zero-value transfer to self with every nonce given back.
+
+        :returns: the hashes of the transfers sent
+        """
+        with self._lock:
+            free, self._free = self._free, []
+        if not free:
+            return []
+        gas_price = self.web3.eth.gasPrice
+        chain_id = self.web3.eth.chainId
+        tx_hashes = []
+        for nonce in sorted(free):
+            transaction = {
+                "to": self.address,
+                "value": 0,
+                "gas": 21000,
+                "gasPrice": gas_price,
+                "nonce": nonce,
+                "chainId": chain_id,
+            }
+            try:
+                tx_hashes.append(self._send_signed(transaction))
+            except Exception as exc:  # pylint: disable=broad-except
+                # A refused transfer gives its nonce back for the next call.
+                if not _nonce_used(exc):
+                    logger.exception(
+                        "Could not fill nonce %s of %s", nonce, self.address
+                    )
+        return tx_hashes
+
+    def prune(self) -> Dict[int, HexBytes]:
+        """Forget the transactions mined since; return those still pending."""
+        mined = self.web3.eth.getTransactionCount(self.address, "latest")
+        with self._lock:
+            self.pending = {
+                nonce: tx_hash
+                for nonce, tx_hash in self.pending.items()
+                if nonce >= mined
+            }
+            return dict(self.pending)
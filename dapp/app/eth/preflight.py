@@ -0,0 +1,342 @@
+"""Pre-flight validation of the write methods of ``Implementation``.
+
+Most failed ``send``, ``burn``, ``mintFungible`` or ``swap`` transactions
+revert on a handful of ``require``\\ s: an inactive account, an amount that is
+not a multiple of the granularity, a caller that did not create the token,
+an insufficient balance...  :class:`ImplementationValidator` checks those
+rules against local state before anything reaches the node.  The generated
+``Implementation`` wrapper picks it up as its validator, so every
+``call``, ``send_transaction``, ``build_transaction`` and ``estimate_gas``
+raises a :class:`PreflightError` carrying the revert reason the contract
+would have answered with::
+
+    implementation.send.build_transaction(to, [token_id], [amount], b"")
+    # PreflightError: send would revert: INVALID_GRANULARITY
+
+The state is read through the :class:`PreflightState` named by
+``settings.WEB3_PREFLIGHT_STATE``, e.g. the tables of the indexer; validation
+is off unless one is set.  A state may lag behind the chain, so a rule only
+fails on facts the state knows: creators that are not known yet are not
+checked, and account statuses, operators and balances are only checked while
+the state is :meth:`~PreflightState.synced`, i.e. close enough to the head.
+The sender of a transaction is the ``from`` of its ``tx_params``, else the
+account set by :func:`acting_as`, else ``eth.defaultAccount``; rules about
+the sender are skipped when it is unknown.
+"""
+import abc
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from web3 import Web3
+from web3.providers.base import BaseProvider
+from zero_ex.contract_wrappers.bases import Validator
+
+from app.eth.tokenid import is_fungible, is_non_fungible, is_non_fungible_item
+
+ZERO_ADDRESS = "0x" + "00" * 20
+
+
+class PreflightError(ValueError):
+    """A transaction would revert with ``reason``."""
+
+    def __init__(self, method_name: str, reason: str):
+        super().__init__(f"{method_name} would revert: {reason}")
+        self.method_name = method_name
+        self.reason = reason
+
+
+class PreflightState(abc.ABC):
+    """State the pre-flight rules are checked against."""
+
+    @abc.abstractmethod
+    def synced(self) -> bool:
+        """Whether account statuses, operators and balances are recent enough."""
+
+    @abc.abstractmethod
+    def granularity(self) -> int:
+        """Return the granularity of the fungible tokens."""
+
+    @abc.abstractmethod
+    def creator(self, token_id: int) -> Optional[str]:
+        """Return the lower-case address that created ``token_id``, if known."""
+
+    @abc.abstractmethod
+    def is_active(self, account: str) -> bool:
+        """Whether ``account`` is an active account."""
+
+    @abc.abstractmethod
+    def is_operator_for(self, operator: str, holder: str) -> bool:
+        """Whether ``operator`` may send and burn the tokens of ``holder``."""
+
+    @abc.abstractmethod
+    def balances(self, owner: str, token_ids: Sequence[int]) -> Mapping[int, int]:
+        """Return the balance of ``owner`` of every id of ``token_ids``."""
+
+
+_local = threading.local()
+
+
+@contextmanager
+def acting_as(sender: str) -> Iterator[None]:
+    """Validate the transactions built in the block as sent by ``sender``."""
+    previous = getattr(_local, "sender", None)
+    _local.sender = sender.lower()
+    try:
+        yield
+    finally:
+        _local.sender = previous
+
+
+@contextmanager
+def sent_from(tx_params) -> Iterator[None]:
+    """Validate the transactions built in the block as sent by ``tx_params.from_``.
+
+    Does nothing when ``tx_params`` or its ``from_`` is not set.
+    """
+    sender = getattr(tx_params, "from_", None)
+    if not sender:
+        yield
+        return
+    with acting_as(sender):
+        yield
+
+
+class Rules:
+    """Checks mirroring the ``require``\\ s of a method, raising on failure."""
+
+    def __init__(self, method_name: str, state: PreflightState, sender: Optional[str]):
+        self.method_name = method_name
+        self.state = state
+        self.sender = sender
+        self._synced: Optional[bool] = None
+
+    def fail(self, reason: str):
+        raise PreflightError(self.method_name, reason)
+
+    def synced(self) -> bool:
+        """Whether the state of accounts and balances can be relied upon."""
+        if self._synced is None:
+            self._synced = self.state.synced()
+        return self._synced
+
+    def active(self, account: Optional[str]):
+        if account is not None and self.synced() and not self.state.is_active(account):
+            self.fail("NOT_LISTED_OR_INACTIVE_ACCOUNT")
+
+    def operator(self, holder: str):
+        if (
+            self.sender is not None
+            and self.synced()
+            and not self.state.is_operator_for(self.sender, holder)
+        ):
+            self.fail("INSUFFICIENT_ALLOWANCE")
+
+    def creator(self, token_id: int):
+        if self.sender is None:
+            return
+        creator = self.state.creator(token_id)
+        # Tokens created after the last indexed block have no creator yet.
+        if creator is not None and creator != self.sender:
+            self.fail("NOT_CREATOR")
+
+    def recipients(self, recipients: Sequence[str], reason: str):
+        if any(recipient.lower() == ZERO_ADDRESS for recipient in recipients):
+            self.fail(reason)
+
+    def lengths(self, first: Sequence, second: Sequence):
+        if len(first) != len(second):
+            self.fail("LENGTH_MISMATCH")
+
+    def granularity(self, amounts: Sequence[int]):
+        granularity = self.state.granularity()
+        if any(amount % granularity for amount in amounts):
+            self.fail("INVALID_GRANULARITY")
+
+    def spend(self, holder: Optional[str], token_ids: Sequence[int], amounts: Sequence):
+        """Check that ``holder`` may send or burn ``amounts`` of ``token_ids``."""
+        self.lengths(token_ids, amounts)
+        fungible = []
+        needed: Dict[int, int] = defaultdict(int)
+        for token_id, amount in zip(token_ids, amounts):
+            token_id, amount = int(token_id), int(amount)
+            if is_non_fungible(token_id):
+                if amount != 1:
+                    self.fail("INVALID_AMOUNT")
+            else:
+                fungible.append(amount)
+            needed[token_id] += amount
+        if fungible:
+            self.granularity(fungible)
+        if holder is None or not self.synced():
+            return
+        held = self.state.balances(holder, list(needed))
+        for token_id, amount in needed.items():
+            if held.get(token_id, 0) < amount:
+                if is_non_fungible_item(token_id):
+                    self.fail("NOT_OWNER")
+                self.fail("SafeMath: subtraction overflow")
+
+
+def _send(rules: Rules, args: Mapping[str, Any]):
+    rules.active(rules.sender)
+    rules.recipients([args["_to"]], "INVALID_RECIPIENT_ADDRESS")
+    rules.spend(rules.sender, args["_ids"], args["_amounts"])
+
+
+def _operator_send(rules: Rules, args: Mapping[str, Any]):
+    holder = args["_from"].lower()
+    rules.active(holder)
+    rules.operator(holder)
+    rules.recipients([args["_to"]], "INVALID_RECIPIENT_ADDRESS")
+    rules.spend(holder, args["_ids"], args["_amounts"])
+
+
+def _burn(rules: Rules, args: Mapping[str, Any]):
+    rules.active(rules.sender)
+    rules.spend(rules.sender, args["_ids"], args["_amounts"])
+
+
+def _operator_burn(rules: Rules, args: Mapping[str, Any]):
+    holder = args["_from"].lower()
+    rules.active(holder)
+    rules.operator(holder)
+    rules.spend(holder, args["_ids"], args["_amounts"])
+
+
+def _mint_fungible(rules: Rules, args: Mapping[str, Any]):
+    token_id = int(args["_id"])
+    rules.creator(token_id)
+    if not is_fungible(token_id):
+        rules.fail("NON_FUNGIBLE_TOKEN")
+    rules.lengths(args["_to"], args["_amounts"])
+    rules.recipients(args["_to"], "INVALID_ADDRESS")
+    rules.granularity([int(amount) for amount in args["_amounts"]])
+
+
+def _mint_non_fungible(rules: Rules, args: Mapping[str, Any]):
+    base_type = int(args["_type"])
+    rules.creator(base_type)
+    if not is_non_fungible(base_type):
+        rules.fail("FUNGIBLE_TOKEN")
+    rules.recipients(args["_to"], "INVALID_RECIPIENT_ADDRESS")
+
+
+def _swap(rules: Rules, args: Mapping[str, Any]):
+    swap = args["_swap"]
+    if not isinstance(swap, Mapping):
+        swap = dict(zip(("sender", "senderTokenIds", "senderTokenAmounts"), swap))
+    rules.active(rules.sender)
+    if int(args["_expiry"]) < time.time():
+        rules.fail("SIGNATURE_EXPIRED")
+    # The signer is only known once the signature is recovered on chain.
+    rules.spend(rules.sender, swap["senderTokenIds"], swap["senderTokenAmounts"])
+
+
+# ABI name -> (parameter names, in order, and check) of the validated methods.
+IMPLEMENTATION_RULES: Dict[str, Tuple[Tuple[str, ...], Callable]] = {
+    "send": (("_to", "_ids", "_amounts", "_data"), _send),
+    "operatorSend": (
+        ("_from", "_to", "_ids", "_amounts", "_data", "_operatorData"),
+        _operator_send,
+    ),
+    "burn": (("_ids", "_amounts", "_data"), _burn),
+    "operatorBurn": (
+        ("_from", "_ids", "_amounts", "_data", "_operatorData"),
+        _operator_burn,
+    ),
+    "mintFungible": (("_to", "_id", "_amounts", "_data"), _mint_fungible),
+    "mintNonFungible": (("_to", "_type", "_data"), _mint_non_fungible),
+    "swap": (
+        ("_swap", "_nonce", "_expiry", "_v", "_r", "_s", "_data"),
+        _swap,
+    ),
+}
+
+
+_states: Dict[str, PreflightState] = {}
+_states_lock = threading.Lock()
+
+
+def get_preflight_state() -> Optional[PreflightState]:
+    """Return the shared :class:`PreflightState` of the settings, if enabled."""
+    path = settings.WEB3_PREFLIGHT_STATE
+    if not path:
+        return None
+    state = _states.get(path)
+    if state is None:
+        with _states_lock:
+            state = _states.get(path)
+            if state is None:
+                state = _states[path] = import_string(path)()
+    return state
+
+
+class ImplementationValidator(Validator):
+    """Validator rejecting the ``Implementation`` transactions bound to revert.
+
+    The generated methods hand their arguments over one at a time; they are
+    gathered per thread and the rules of a method run with the last one.
+    """
+
+    rules = IMPLEMENTATION_RULES
+
+    def __init__(
+        self,
+        web3_or_provider: Union[Web3, BaseProvider],
+        contract_address: str,
+        state: Optional[PreflightState] = None,
+    ):
+        """
+        :param web3_or_provider: client the wrapper sends transactions with
+        :param contract_address: where ``Implementation`` has been deployed
+        :param state: defaults to :func:`get_preflight_state`
+        """
+        super().__init__(web3_or_provider, contract_address)
+        if isinstance(web3_or_provider, BaseProvider):
+            web3_or_provider = Web3(web3_or_provider)
+        self._web3 = web3_or_provider
+        self._state = state
+        self._pending = threading.local()
+
+    def assert_valid(self, method_name: str, parameter_name: str, argument_value: Any):
+        """Gather ``argument_value``; check the rules of the method once complete.
+
+        :raises PreflightError: when the transaction would revert
+        """
+        rule = self.rules.get(method_name)
+        if rule is None:
+            return
+        parameters, check = rule
+        if parameter_name == parameters[0]:
+            # A new call, even if a previous one failed half-way.
+            self._pending.args = {}
+        args = getattr(self._pending, "args", {})
+        args[parameter_name] = argument_value
+        if parameter_name != parameters[-1]:
+            return
+        self._pending.args = {}
+        state = self._state or get_preflight_state()
+        if state is not None:
+            check(Rules(method_name, state, self.sender()), args)
+
+    def sender(self) -> Optional[str]:
+        """Return the lower-case address transactions are sent from, if known."""
+        sender = getattr(_local, "sender", None)
+        if sender is None:
+            sender = self._web3.eth.defaultAccount
+        return sender.lower() if sender else None
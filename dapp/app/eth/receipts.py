@@ -0,0 +1,277 @@
+"""One receipt poller per worker for every pending transaction.
+
+Waiting for a transaction usually means calling ``getTransactionReceipt``
+in a loop, once per hash, and ``get_*_event(tx_hash)`` fetches the receipt
+once more.  A :class:`ReceiptTracker` watches every pending hash of a worker
+from a single background thread instead::
+
+    tracker = get_receipt_tracker(web3)
+    outcome = tracker.watch(tx_hash).result()
+    outcome.receipt.status, outcome.events["TokenSent"]
+
+    outcome = await tracker.watch_async(tx_hash)
+
+Once per new block it reads the hashes the block includes and only fetches
+the receipts of the watched ones, each in one JSON-RPC batch, so the load
+on the node depends on the blocks, not on the number of transactions in
+flight.  Hashes are looked up once when first watched, in case they were
+mined already.  Resolved receipts are kept, so ``get_*_event(tx_hash)`` no
+longer needs a request of its own.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from django.conf import settings
+from hexbytes import HexBytes
+from web3 import Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+from web3.types import RPCEndpoint, RPCResponse, TxReceipt
+
+from app.eth.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_trackers: Dict[str, "ReceiptTracker"] = {}
+
+
+class TransactionOutcome(NamedTuple):
+    """Receipt of a mined transaction and the events it emitted, by name."""
+
+    receipt: TxReceipt
+    events: Mapping[str, Tuple[AttributeDict, ...]]
+
+
+class _Watch(NamedTuple):
+    future: Future
+    deadline: Optional[float]
+
+
+class ReceiptTracker:
+    """Background poller resolving the receipts of the watched transactions."""
+
+    def __init__(
+        self,
+        web3: Web3,
+        decoders: Optional[Mapping[bytes, Callable]] = None,
+        interval: float = 1.0,
+        timeout: Optional[float] = None,
+        maxsize: int = 4096,
+    ):
+        """
+        :param web3: client of the node the transactions were sent to
+        :param decoders: log decoder of every known event, by topic 0
+        :param interval: how often the head block is polled, in seconds
+        :param timeout: default time a hash is watched for, in seconds
+        :param maxsize: how many resolved receipts are kept
+        """
+        self.web3 = web3
+        self.decoders = decoders or {}
+        self.interval = interval
+        self.timeout = timeout
+        self._receipts = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self._watches: Dict[HexBytes, List[_Watch]] = {}
+        # Hashes watched since the last poll, looked up directly once.
+        self._fresh: List[HexBytes] = []
+        self._thread: Optional[threading.Thread] = None
+        # Last block whose transactions were matched.
+        self._block_number: Optional[int] = None
+
+    def watch(
+        self, tx_hash: Union[HexBytes, bytes, str], timeout: Optional[float] = None
+    ) -> Future:
+        """Return the future :class:`TransactionOutcome` of ``tx_hash``.
+
+        :param timeout: fail with ``TimeExhausted`` if the transaction is not
+            mined within this many seconds; defaults to the tracker's
+        """
+        tx_hash = HexBytes(tx_hash)
+        future: Future = Future()
+        receipt = self._receipts.get(tx_hash)
+        if receipt is not None:
+            future.set_result(self.outcome(receipt))
+            return future
+        timeout = timeout if timeout is not None else self.timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            self._watches.setdefault(tx_hash, []).append(_Watch(future, deadline))
+            self._fresh.append(tx_hash)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="eth-receipts", daemon=True
+                )
+                self._thread.start()
+        return future
+
+    def watch_async(
+        self, tx_hash: Union[HexBytes, bytes, str], timeout: Optional[float] = None
+    ) -> "asyncio.Future":
+        """Return :meth:`watch` as an awaitable of the running event loop."""
+        return asyncio.wrap_future(self.watch(tx_hash, timeout))
+
+    def receipt(self, tx_hash: Union[HexBytes, bytes, str]) -> TxReceipt:
+        """Return the receipt of ``tx_hash``, without a request if already resolved.
+
+        :raises TransactionNotFound: if the transaction is not mined yet
+        """
+        tx_hash = HexBytes(tx_hash)
+        receipt = self._receipts.get(tx_hash)
+        if receipt is None:
+            receipt = self.web3.eth.getTransactionReceipt(tx_hash)
+            if receipt["blockHash"] is not None:
+                self._receipts.set(tx_hash, receipt)
+        return receipt
+
+    def outcome(self, receipt: TxReceipt) -> TransactionOutcome:
+        """Return ``receipt`` with its logs decoded."""
+        events: Dict[str, List[AttributeDict]] = {}
+        for log in receipt["logs"]:
+            decode = self.decoders.get(log["topics"][0]) if log["topics"] else None
+            if decode is not None:
+                event = decode(log)
+                events.setdefault(event["event"], []).append(event)
+        return TransactionOutcome(
+            receipt, {name: tuple(logs) for name, logs in events.items()}
+        )
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._watches:
+                    # Restarted by the next watch, from the head at that time.
+                    self._thread = None
+                    self._block_number = None
+                    return
+            try:
+                self.poll()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Receipt poll failed")
+            time.sleep(self.interval)
+
+    def poll(self):
+        """Resolve the watched hashes mined since the last poll."""
+        head = self.web3.eth.blockNumber
+        with self._lock:
+            fresh, self._fresh = self._fresh, []
+            watched = set(self._watches)
+        candidates = set(fresh)
+        first = head + 1 if self._block_number is None else self._block_number + 1
+        try:
+            if first <= head:
+                blocks = self._request_many(
+                    [
+                        (RPCEndpoint("eth_getBlockByNumber"), [hex(number), False])
+                        for number in range(first, head + 1)
+                    ]
+                )
+                for block in blocks:
+                    if block.get("result"):
+                        transactions = block["result"]["transactions"]
+                        candidates.update(HexBytes(tx_hash) for tx_hash in transactions)
+            self._resolve(candidates & watched)
+        except Exception:
+            # Looked up again by the next poll.
+            with self._lock:
+                self._fresh.extend(fresh)
+            raise
+        self._block_number = head
+        self._expire()
+
+    def _resolve(self, tx_hashes: Sequence[HexBytes]):
+        tx_hashes = list(tx_hashes)
+        if not tx_hashes:
+            return
+        responses = self._request_many(
+            [
+                (RPCEndpoint("eth_getTransactionReceipt"), [tx_hash.hex()])
+                for tx_hash in tx_hashes
+            ]
+        )
+        for tx_hash, response in zip(tx_hashes, responses):
+            if response.get("error") is not None or response.get("result") is None:
+                continue
+            if response["result"].get("blockHash") is None:
+                # Receipt of a pending transaction, as some nodes return them.
+                continue
+            receipt = receipt_formatter(response["result"])
+            self._receipts.set(tx_hash, receipt)
+            outcome = self.outcome(receipt)
+            with self._lock:
+                watches = self._watches.pop(tx_hash, [])
+            for watch in watches:
+                if not watch.future.done():
+                    watch.future.set_result(outcome)
+
+    def _expire(self):
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for tx_hash, watches in list(self._watches.items()):
+                alive = [
+                    watch
+                    for watch in watches
+                    if not watch.future.done()
+                    and (watch.deadline is None or watch.deadline > now)
+                ]
+                expired.extend(
+                    (tx_hash, watch) for watch in watches if watch not in alive
+                )
+                if alive:
+                    self._watches[tx_hash] = alive
+                else:
+                    del self._watches[tx_hash]
+        for tx_hash, watch in expired:
+            if not watch.future.done():
+                watch.future.set_exception(
+                    TimeExhausted(f"Transaction {tx_hash.hex()} is not in the chain")
+                )
+
+    def _request_many(
+        self, calls: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        provider = self.web3.provider
+        if hasattr(provider, "make_batch_request"):
+            return provider.make_batch_request(calls)
+        # Providers without batch support (IPC, eth-tester) go one by one,
+        # through the middlewares eth-tester needs to read JSON-RPC params.
+        return [self.web3.manager._make_request(*call) for call in calls]
+
+
+def get_receipt_tracker(web3: Web3) -> ReceiptTracker:
+    """Return the shared :class:`ReceiptTracker` of the node behind ``web3``."""
+    key = str(getattr(web3.provider, "endpoint_uri", None) or id(web3.provider))
+    tracker = _trackers.get(key)
+    if tracker is None:
+        with _lock:
+            tracker = _trackers.get(key)
+            if tracker is None:
+                # Imported here: the generated modules import this one.
+                from app.eth.contracts import event_decoders
+
+                tracker = ReceiptTracker(
+                    web3,
+                    decoders=event_decoders(),
+                    interval=settings.WEB3_HEAD_POLL_INTERVAL,
+                    timeout=settings.WEB3_RECEIPT_TIMEOUT or None,
+                    maxsize=settings.WEB3_CACHE_SIZE,
+                )
+                _trackers[key] = tracker
+    return tracker
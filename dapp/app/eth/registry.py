@@ -0,0 +1,98 @@
+"""Process-wide registry of web3 clients and contract wrappers.
+
+Generated wrappers build their ``ContractMethod`` objects lazily, but every
+method still resolves its ``ContractFunction`` on first use, which is wasted
+work if the wrapper is thrown away after each request.  Wrappers hold no
+per-call state once constructed, which makes it safe to build each of them
+once per worker and share it between threads.
+"""
+import threading
+from typing import Dict, Hashable, Optional, Tuple, Type, TypeVar, Union
+
+from django.conf import settings
+from eth_utils import to_checksum_address
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from app.eth.session import PooledHTTPProvider
+
+Wrapper = TypeVar("Wrapper")
+
+_lock = threading.Lock()
+_clients: Dict[Hashable, Web3] = {}
+_wrappers: Dict[Tuple[Hashable, str, type], object] = {}
+
+
+def _provider_key(provider: Union[str, Web3, BaseProvider]) -> Hashable:
+    """Return the key identifying the node behind ``provider``."""
+    if isinstance(provider, Web3):
+        provider = provider.provider
+    # Providers talking to the same node are interchangeable.
+    for attr in ("endpoint_uri", "ipc_path"):
+        uri = getattr(provider, attr, None)
+        if uri:
+            return str(uri)
+    return provider
+
+
+def get_web3(provider: Optional[Union[str, Web3, BaseProvider]] = None) -> Web3:
+    """Return the shared ``Web3`` client for ``provider``.
+
+    :param provider: endpoint URI, provider or client; defaults to
+        ``settings.WEB3_PROVIDER``.
+    """
+    if provider is None:
+        provider = settings.WEB3_PROVIDER
+    key = _provider_key(provider)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            if isinstance(provider, Web3):
+                client = provider
+            elif isinstance(provider, BaseProvider):
+                client = Web3(provider)
+            else:
+                client = Web3(PooledHTTPProvider(provider))
+            _clients[key] = client
+    return client
+
+
+def get_contract(
+    wrapper_class: Type[Wrapper],
+    contract_address: str,
+    provider: Optional[Union[str, Web3, BaseProvider]] = None,
+) -> Wrapper:
+    """Return the shared ``wrapper_class`` instance deployed at ``contract_address``.
+
+    The wrapper is built on first use and handed out to every later caller
+    asking for the same (provider, address, wrapper class).
+
+    :param wrapper_class: generated wrapper, e.g. ``Implementation``
+    :param contract_address: where the contract has been deployed
+    :param provider: see :func:`get_web3`
+    """
+    web3 = get_web3(provider)
+    key = (_provider_key(web3), to_checksum_address(contract_address), wrapper_class)
+    wrapper = _wrappers.get(key)
+    if wrapper is not None:
+        return wrapper  # type: ignore
+
+    with _lock:
+        wrapper = _wrappers.get(key)
+        if wrapper is None:
+            # Passing the client rather than the provider lets every method
+            # object share it instead of building its own ``Web3``.
+            wrapper = wrapper_class(web3, key[1])  # type: ignore
+            _wrappers[key] = wrapper
+    return wrapper  # type: ignore
+
+
+def clear():
+    """Forget every client and wrapper built so far."""
+    with _lock:
+        _clients.clear()
+        _wrappers.clear()
@@ -0,0 +1,237 @@
+"""Pooled keep-alive HTTP sessions shared by the RPC clients of a worker.
+
+Every client talking to a given node goes through one :class:`RPCSession`,
+which keeps a bounded pool of persistent connections (so TLS handshakes are
+paid once per connection, not once per request), applies a per-request
+timeout and retries transport errors with jittered exponential backoff.
+
+Each session records :class:`RPCMetrics`: requests in flight, requests that
+had to wait for a free connection, retries, errors and latency percentiles.
+The pool is sized by ``settings.WEB3_POOL_SIZE``, the timeout and retries by
+``settings.WEB3_REQUEST_TIMEOUT`` and ``settings.WEB3_REQUEST_RETRIES``.
+Requests that send a transaction are never retried: the node may have
+received the first one, and the sender knows best how to find out.
+"""
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from web3.types import RPCEndpoint, RPCResponse
+
+from app.eth.batch import BatchHTTPProvider
+
+logger = logging.getLogger(__name__)
+
+TRANSPORT_ERRORS = (requests.ConnectionError, requests.Timeout)
+# Methods whose request must not be sent twice.
+UNSAFE_METHODS = frozenset(["eth_sendRawTransaction", "eth_sendTransaction"])
+
+_lock = threading.Lock()
+_sessions: Dict[str, "RPCSession"] = {}
+_metrics: Dict[str, "RPCMetrics"] = {}
+
+
+def backoff_delay(attempt: int, base: float = 0.1, cap: float = 5.0) -> float:
+    """Return a "full jitter" exponential backoff delay for retry ``attempt``."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class RPCMetrics:
+    """Thread-safe counters of the requests sent through a session.
+
+    Latency percentiles are computed over the last ``window`` requests.
+    """
+
+    def __init__(self, window: int = 2048):
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=window)
+        self.requests = 0
+        self.in_flight = 0
+        self.pool_waits = 0
+        self.retries = 0
+        self.errors = 0
+
+    @contextmanager
+    def track(self):
+        """Count the request executed in the block and time it."""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.in_flight -= 1
+                self._latencies.append(elapsed)
+
+    def record_pool_wait(self):
+        """Count a request that waited for a free connection."""
+        with self._lock:
+            self.pool_waits += 1
+
+    def record_retry(self):
+        """Count a request retried after a transport error."""
+        with self._lock:
+            self.retries += 1
+
+    def percentiles(self, quantiles: Iterable[int] = (50, 90, 99)) -> Dict[int, float]:
+        """Return the latency, in seconds, at each of ``quantiles``."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if not samples:
+            return {quantile: 0.0 for quantile in quantiles}
+        return {
+            quantile: samples[min(len(samples) - 1, len(samples) * quantile // 100)]
+            for quantile in quantiles
+        }
+
+    def snapshot(self) -> dict:
+        """Return every counter and the latency percentiles."""
+        latency = self.percentiles()
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "in_flight": self.in_flight,
+                "pool_waits": self.pool_waits,
+                "retries": self.retries,
+                "errors": self.errors,
+                "latency_p50": latency[50],
+                "latency_p90": latency[90],
+                "latency_p99": latency[99],
+            }
+
+
+class RPCSession:
+    """Pool of keep-alive connections to the nodes of a worker."""
+
+    def __init__(self, pool_size: int = 10, timeout: float = 10, retries: int = 3):
+        """
+        :param pool_size: maximum number of concurrent connections
+        :param timeout: per-request timeout, in seconds
+        :param retries: how many times a request failing with a transport
+            error is retried
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.metrics = RPCMetrics()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @contextmanager
+    def _slot(self):
+        """Hold one of the connections of the pool for the block."""
+        if not self._slots.acquire(blocking=False):
+            self.metrics.record_pool_wait()
+            self._slots.acquire()
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def post(
+        self, endpoint_uri: str, data: bytes, retries: Optional[int] = None, **kwargs
+    ) -> bytes:
+        """Post ``data`` to ``endpoint_uri`` and return the raw answer.
+
+        :param retries: defaults to the retries of the session
+        """
+        if retries is None:
+            retries = self.retries
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            try:
+                with self._slot(), self.metrics.track():
+                    response = self.session.post(endpoint_uri, data=data, **kwargs)
+                    response.raise_for_status()
+                    return response.content
+            except TRANSPORT_ERRORS as exc:
+                if attempt >= retries:
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning(
+                    "RPC transport error on %s (%s), retrying in %.2fs",
+                    endpoint_uri,
+                    exc,
+                    delay,
+                )
+                self.metrics.record_retry()
+                attempt += 1
+                time.sleep(delay)
+
+
+def get_session(endpoint_uri: str) -> RPCSession:
+    """Return the shared :class:`RPCSession` used to reach ``endpoint_uri``."""
+    session = _sessions.get(endpoint_uri)
+    if session is None:
+        with _lock:
+            session = _sessions.get(endpoint_uri)
+            if session is None:
+                session = RPCSession(
+                    pool_size=settings.WEB3_POOL_SIZE,
+                    timeout=settings.WEB3_REQUEST_TIMEOUT,
+                    retries=settings.WEB3_REQUEST_RETRIES,
+                )
+                _sessions[endpoint_uri] = session
+                register_metrics(endpoint_uri, session.metrics)
+    return session
+
+
+def register_metrics(name: str, metrics: RPCMetrics):
+    """Publish ``metrics`` in :func:`get_metrics` under ``name``."""
+    _metrics[name] = metrics
+
+
+def get_metrics() -> Dict[str, dict]:
+    """Return the snapshot of every published :class:`RPCMetrics`."""
+    return {name: metrics.snapshot() for name, metrics in list(_metrics.items())}
+
+
+class PooledHTTPProvider(BatchHTTPProvider):
+    """Batching HTTP provider sending every request through an :class:`RPCSession`."""
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        request_kwargs: Optional[dict] = None,
+        rpc_session: Optional[RPCSession] = None,
+    ):
+        """
+        :param endpoint_uri: URI of the node
+        :param request_kwargs: extra keyword arguments of every ``post``
+        :param rpc_session: defaults to the shared session of ``endpoint_uri``
+        """
+        super().__init__(endpoint_uri, request_kwargs)
+        self.rpc_session = rpc_session or get_session(str(self.endpoint_uri))
+
+    def post(self, request_data: bytes, retries: Optional[int] = None) -> bytes:
+        return self.rpc_session.post(
+            self.endpoint_uri, request_data, retries, **self.get_request_kwargs()
+        )
+
+    def make_request(self, method: RPCEndpoint, params) -> RPCResponse:
+        logger.debug(
+            "Making request HTTP. URI: %s, Method: %s", self.endpoint_uri, method
+        )
+        retries = 0 if method in UNSAFE_METHODS else None
+        return self.decode_rpc_response(
+            self.post(self.encode_rpc_request(method, params), retries)
+        )
@@ -0,0 +1,45 @@
+import pytest
+
+from app.eth.cache import CachedContract, ReadCache
+from app.eth.contracts import Implementation
+
+
+class SharedCache(dict):
+    """Django-like cache recording the keys it is given."""
+
+    def get(self, key, default=None):
+        return super().get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self[key] = value
+
+
+@pytest.fixture
+def implementation(w3, contracts) -> Implementation:
+    return Implementation(w3, contracts.implementation.address)
+
+
+def test_shared_keys_are_per_chain(w3, implementation):
+    shared = SharedCache()
+    cached = CachedContract(implementation, ReadCache(w3, shared=shared))
+
+    assert cached.owner.call() == w3.eth.accounts[0]
+    assert cached.name.call() == "VAHATRA"
+
+    assert len(shared) == 2
+    assert all(key.startswith(f"eth:call:{w3.eth.chainId}:") for key in shared)
+
+
+def test_a_second_chain_misses(w3, implementation, monkeypatch):
+    shared = SharedCache()
+    ReadCache(w3, shared=shared).call(implementation.owner)
+    (key,) = shared
+    shared[key] = "0x" + "00" * 20
+
+    # Same contract address, on a node of another chain.
+    monkeypatch.setattr("app.eth.eip712._chain_ids", {w3: w3.eth.chainId + 1})
+
+    assert ReadCache(w3, shared=shared).call(implementation.owner) == (
+        w3.eth.accounts[0]
+    )
+    assert len(shared) == 2
@@ -0,0 +1,100 @@
+import pytest
+from eth_account import Account
+from eth_utils import keccak
+
+from app.conftest import FLATTENED_DIR
+from app.eth.eip712 import (
+    SWAP_PREFIX,
+    domain_separator,
+    recover_signer,
+    recover_signers,
+    swap_digest,
+    swap_struct_hash,
+)
+
+# Exposes the internal swapVerify, for a signer whose nonce is still 0.
+HARNESS = """
+contract SwapVerifierHarness is SwapVerifier {
+    function verify(
+        SwapLib.Swap memory _swap,
+        uint8 _v,
+        bytes32 _r,
+        bytes32 _s
+    ) external returns (address) {
+        return swapVerify(_swap, 0, uint256(-1), _v, _r, _s);
+    }
+}
+"""
+
+SWAPS = [
+    {
+        "sender": "0x" + "00" * 20,
+        "senderTokenIds": [],
+        "senderTokenAmounts": [],
+        "signerTokenIds": [],
+        "signerTokenAmounts": [],
+    },
+    {
+        "sender": "0x" + "12" * 20,
+        "senderTokenIds": [1, 1 << 128 | 7],
+        "senderTokenAmounts": [10, 1],
+        "signerTokenIds": [2 ** 256 - 1],
+        "signerTokenAmounts": [3],
+    },
+]
+
+
+@pytest.fixture
+def harness(deploy):
+    source = (FLATTENED_DIR / "ImplementationFlattened.sol").read_text() + HARNESS
+    return deploy("SwapVerifierHarness", source)
+
+
+def sign(account, digest: bytes):
+    signed = account.signHash(digest)
+    return signed.v, signed.r.to_bytes(32, "big"), signed.s.to_bytes(32, "big")
+
+
+def test_domain_separator(w3, harness):
+    assert harness.functions.DOMAIN_SEPARATOR().call() == domain_separator(
+        w3.eth.chainId, harness.address
+    )
+
+
+@pytest.mark.parametrize("swap", SWAPS)
+def test_swap_digest_is_hash_swap(w3, harness, swap):
+    account = Account.create()
+    digest = swap_digest(swap, domain_separator(w3.eth.chainId, harness.address))
+    v, r, s = sign(account, digest)
+
+    # ecrecover only returns the account over the very digest of hashSwap.
+    assert harness.functions.verify(swap, v, r, s).call() == account.address
+    assert recover_signer(digest, v, r, s) == account.address.lower()
+
+
+def test_escaped_prefix(w3, harness):
+    assert SWAP_PREFIX == b"\\x19\\x01" and len(SWAP_PREFIX) == 8
+    account = Account.create()
+    domain = domain_separator(w3.eth.chainId, harness.address)
+    # The two bytes of EIP-712 are not what the contract hashes.
+    digest = keccak(b"\x19\x01" + domain + swap_struct_hash(SWAPS[1]))
+
+    signer = harness.functions.verify(SWAPS[1], *sign(account, digest)).call()
+
+    assert signer != account.address
+
+
+def test_recover_signers():
+    accounts = [Account.create() for _ in range(3)]
+    digests = [keccak(text=str(index)) for index in range(3)]
+    items = [
+        (digest, *sign(account, digest)) for account, digest in zip(accounts, digests)
+    ]
+    # ecrecover fails on any v but 27 and 28.
+    items[1] = (items[1][0], 29, items[1][2], items[1][3])
+
+    assert recover_signers(items) == [
+        accounts[0].address.lower(),
+        None,
+        accounts[2].address.lower(),
+    ]
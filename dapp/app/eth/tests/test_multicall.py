@@ -0,0 +1,115 @@
+import pytest
+from zero_ex.contract_wrappers.bases import ContractMethod
+
+from app.eth.multicall import Aggregate
+
+COUNTER = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.6.10;
+
+contract Counter {
+    uint256 public count;
+
+    function increment() external {
+        count += 1;
+    }
+
+    function blockNumber() external view returns (uint256) {
+        return block.number;
+    }
+
+    function fail() external pure returns (uint256) {
+        revert("NOPE");
+    }
+}
+"""
+
+
+class Method(ContractMethod):
+    """Argument-less view function, as the generated wrappers expose them."""
+
+    def __init__(self, contract, name: str):
+        super().__init__(contract.web3, contract.address)
+        self._underlying_method = getattr(contract.functions, name)
+
+
+@pytest.fixture
+def counter(deploy):
+    return deploy("Counter", COUNTER)
+
+
+@pytest.fixture
+def multicall(deploy):
+    return deploy("Multicall")
+
+
+def increment(w3, counter, times: int = 1):
+    for _ in range(times):
+        w3.eth.waitForTransactionReceipt(counter.functions.increment().transact())
+
+
+def test_results(w3, counter, multicall):
+    increment(w3, counter, 2)
+    with Aggregate(w3, aggregator_address=multicall.address) as aggregate:
+        count = aggregate.add(Method(counter, "count"))
+        block_number = aggregate.add(Method(counter, "blockNumber"))
+
+    assert count.result() == 2
+    assert block_number.result() == aggregate.block_number
+
+
+def test_falls_back_to_batch_without_address(w3, counter, settings):
+    settings.CONTRACT_MULTICALL_ADR = ""
+    increment(w3, counter)
+    aggregate = Aggregate(w3)
+    count = aggregate.add(Method(counter, "count"))
+    aggregate.execute()
+
+    assert aggregate.aggregator_address is None
+    assert count.result() == 1
+    # Plain calls are not read through the aggregator.
+    assert aggregate.block_number is None
+
+
+def test_revert_reason(w3, counter, multicall):
+    aggregate = Aggregate(w3, aggregator_address=multicall.address)
+    failed = aggregate.add(Method(counter, "fail"))
+    count = aggregate.add(Method(counter, "count"))
+    aggregate.execute()
+
+    assert isinstance(failed.error, ValueError)
+    assert "execution reverted: NOPE" in str(failed.error)
+    with pytest.raises(ValueError):
+        failed.result()
+    assert count.result() == 0
+
+
+def test_block_pinning(w3, counter, multicall):
+    increment(w3, counter)
+    pinned = w3.eth.blockNumber
+    increment(w3, counter, 2)
+
+    aggregate = Aggregate(
+        w3, aggregator_address=multicall.address, block_identifier=pinned, max_calls=2
+    )
+    count = aggregate.add(Method(counter, "count"))
+    block_numbers = [aggregate.add(Method(counter, "blockNumber")) for _ in range(5)]
+    aggregate.execute()
+
+    # The state of the pinned block, which every call is evaluated against.
+    assert count.result() == 1
+    assert {item.result() for item in block_numbers} == {aggregate.block_number}
+
+
+
+def test_genesis_block_is_not_latest(w3, counter, settings):
+    settings.CONTRACT_MULTICALL_ADR = ""
+    increment(w3, counter)
+    aggregate = Aggregate(w3)
+    latest = aggregate.add(Method(counter, "count"))
+    genesis = aggregate.add(Method(counter, "count"), block_identifier=0)
+    aggregate.execute()
+
+    assert latest.result() == 1
+    # Deployed after the genesis block, the counter has no code there.
+    assert genesis.error is not None
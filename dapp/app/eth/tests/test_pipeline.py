@@ -0,0 +1,84 @@
+import pytest
+
+from app.eth.contracts import Implementation
+from app.eth.nonces import NonceManager
+from app.eth.pipeline import TransactionPipeline
+
+
+@pytest.fixture
+def implementation(w3, contracts) -> Implementation:
+    return Implementation(w3, contracts.implementation.address)
+
+
+@pytest.fixture
+def pipeline(w3, signer, implementation):
+    """Pipeline of ``signer`` sending one transaction at a time.
+
+    eth-tester mines every transaction as it comes, so it refuses any that
+    would leave a gap.
+    """
+    with TransactionPipeline(
+        w3, signer, wrapper=implementation, nonces=NonceManager(w3), max_workers=1
+    ) as pipeline:
+        yield pipeline
+
+
+def refuse(nonce, tx_hash, raw):
+    raise RuntimeError("refused")
+
+
+def test_transactions_take_consecutive_nonces(w3, pipeline):
+    futures = [pipeline.register("signer")] + [
+        pipeline.authorize_operator(operator) for operator in w3.eth.accounts[1:4]
+    ]
+    pipeline.wait()
+
+    tx_hashes = [future.result() for future in futures]
+    nonces = [w3.eth.getTransaction(tx_hash)["nonce"] for tx_hash in tx_hashes]
+    assert nonces == [0, 1, 2, 3]
+    assert all(w3.eth.getTransactionReceipt(tx_hash)["status"] for tx_hash in tx_hashes)
+    assert pipeline.pending == dict(enumerate(tx_hashes))
+    assert pipeline.prune() == {}
+
+
+def test_refused_nonce_goes_to_the_next_transaction(w3, implementation, pipeline):
+    refused = pipeline.submit(implementation.register, "signer", before_send=refuse)
+    with pytest.raises(RuntimeError):
+        refused.result()
+    sent = pipeline.register("signer")
+    pipeline.wait()
+
+    assert w3.eth.getTransaction(sent.result())["nonce"] == 0
+    assert pipeline.fill_gaps() == []
+
+
+def test_gaps_are_filled_on_close(w3, signer, implementation, pipeline):
+    pipeline.register("signer").result()
+    refused = pipeline.submit(
+        implementation.authorize_operator, w3.eth.accounts[1], before_send=refuse
+    )
+    with pytest.raises(RuntimeError):
+        refused.result()
+
+    pipeline.close()
+
+    assert w3.eth.getTransactionCount(signer.address) == 2
+    filler = w3.eth.getTransaction(pipeline.pending[1])
+    assert (filler["to"], filler["value"]) == (signer.address, 0)
+
+
+def test_a_transaction_is_never_sent_twice(w3, signer, pipeline):
+    transaction = {
+        "to": signer.address,
+        "value": 0,
+        "gas": 21000,
+        "gasPrice": w3.eth.gasPrice,
+        "nonce": 0,
+        "chainId": w3.eth.chainId,
+    }
+    first = pipeline._send_signed(dict(transaction))
+    # Refused by the node, which already mined it.
+    second = pipeline._send_signed(dict(transaction))
+
+    assert first == second
+    assert w3.eth.getTransactionCount(signer.address) == 1
@@ -0,0 +1,77 @@
+import pytest
+from web3.exceptions import TimeExhausted
+
+from app.eth.contracts import event_decoders
+from app.eth.receipts import ReceiptTracker
+
+
+@pytest.fixture
+def tracker(w3):
+    return ReceiptTracker(w3, decoders=event_decoders(), interval=0.05, timeout=10)
+
+
+@pytest.fixture
+def requests(monkeypatch, tracker):
+    """Record the calls of every request the tracker makes."""
+    requests = []
+    request_many = tracker._request_many
+
+    def record(calls):
+        requests.append(list(calls))
+        return request_many(calls)
+
+    monkeypatch.setattr(tracker, "_request_many", record)
+    return requests
+
+
+def requested_receipts(requests):
+    return [
+        [params[0] for method, params in calls]
+        for calls in requests
+        if calls[0][0] == "eth_getTransactionReceipt"
+    ]
+
+
+def test_receipts_of_a_block_in_one_batch(w3, contracts, tracker, requests):
+    register = contracts.implementation.functions.register
+    tester = w3.provider.ethereum_tester
+    tester.disable_auto_mine_transactions()
+    alice, bob, carol = w3.eth.accounts[1:4]
+    tx_hashes = [
+        register(name).transact({"from": sender})
+        for name, sender in (("alice", alice), ("bob", bob), ("carol", carol))
+    ]
+    futures = [tracker.watch(tx_hash) for tx_hash in tx_hashes[:2]]
+
+    tester.mine_blocks(1)
+    outcomes = [future.result(timeout=5) for future in futures]
+
+    for sender, outcome in zip((alice, bob), outcomes):
+        assert outcome.receipt.status == 1
+        (created,) = outcome.events["AccountCreated"]
+        assert created.args._acc == sender
+    batches = requested_receipts(requests)
+    # Looked up while pending, then fetched together once mined.
+    assert sorted(tx_hash.hex() for tx_hash in tx_hashes[:2]) in map(sorted, batches)
+    assert tx_hashes[2].hex() not in {tx_hash for batch in batches for tx_hash in batch}
+
+
+def test_already_mined(w3, contracts, transact, tracker, requests):
+    receipt = transact(contracts.implementation.functions.register("alice"))
+
+    outcome = tracker.watch(receipt.transactionHash).result(timeout=5)
+
+    assert outcome.receipt.blockNumber == receipt.blockNumber
+    assert requested_receipts(requests) == [[receipt.transactionHash.hex()]]
+    # Resolved receipts are read from the tracker.
+    assert tracker.receipt(receipt.transactionHash) == outcome.receipt
+    assert tracker.watch(receipt.transactionHash).done()
+    assert len(requests) == 1
+
+
+def test_timeout(w3, contracts, tracker):
+    w3.provider.ethereum_tester.disable_auto_mine_transactions()
+    tx_hash = contracts.implementation.functions.register("alice").transact()
+
+    with pytest.raises(TimeExhausted):
+        tracker.watch(tx_hash, timeout=0.2).result(timeout=5)
@@ -0,0 +1,128 @@
+import random
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from app.eth import tokenid
+
+uint256 = st.integers(min_value=0, max_value=tokenid.UINT256_MAX)
+
+EDGES = [
+    0,
+    1,
+    tokenid.NF_INDEX_MASK,
+    1 << 128,
+    (1 << 255) - 1,
+    1 << 255,
+    (1 << 255) + 1,
+    (1 << 255) | tokenid.NF_INDEX_MASK,
+    tokenid.TYPE_MASK,
+    tokenid.UINT256_MAX,
+]
+
+
+@given(uint256)
+def test_base_type_and_index_round_trip(token_id):
+    base_type = tokenid.get_non_fungible_base_type(token_id)
+    index = tokenid.get_non_fungible_index(token_id)
+
+    assert base_type & tokenid.NF_INDEX_MASK == 0
+    assert 0 <= index <= tokenid.NF_INDEX_MASK
+    assert base_type | index == token_id
+    assert tokenid.make_id(base_type, index) == token_id
+
+
+@given(st.lists(uint256, max_size=20))
+def test_split_matches_the_scalar_functions(token_ids):
+    types, indexes = tokenid.split(token_ids)
+
+    assert types == [tokenid.get_non_fungible_base_type(i) for i in token_ids]
+    assert indexes == [tokenid.get_non_fungible_index(i) for i in token_ids]
+
+
+@given(st.lists(uint256, max_size=20))
+def test_split_array_round_trip(token_ids):
+    columns = tokenid.split_array(token_ids)
+
+    assert all(column.dtype == np.uint64 for column in columns)
+    assert tokenid.from_columns(columns) == token_ids
+    limbs = tokenid.to_limbs(token_ids)
+    assert limbs.shape == (len(token_ids), 4)
+    assert tokenid.from_columns(tokenid.split_array(limbs)) == token_ids
+
+
+@given(uint256)
+def test_nf_bit(token_id):
+    non_fungible = token_id >= 1 << 255
+
+    assert tokenid.is_non_fungible(token_id) is non_fungible
+    assert tokenid.is_fungible(token_id) is not non_fungible
+    assert tokenid.is_non_fungible_base_type(token_id) is (
+        non_fungible and tokenid.get_non_fungible_index(token_id) == 0
+    )
+    assert tokenid.is_non_fungible_item(token_id) is (
+        non_fungible and tokenid.get_non_fungible_index(token_id) != 0
+    )
+
+
+@given(st.lists(uint256, max_size=20))
+def test_classify_matches_the_scalar_functions(token_ids):
+    expected = (
+        [tokenid.is_fungible(i) for i in token_ids],
+        [tokenid.is_non_fungible_base_type(i) for i in token_ids],
+        [tokenid.is_non_fungible_item(i) for i in token_ids],
+    )
+
+    assert tuple(tokenid.classify(token_ids)) == expected
+    kinds = tokenid.classify_array(token_ids)
+    assert tuple(kind.tolist() for kind in kinds) == expected
+
+
+def test_edges_of_the_nf_bit():
+    below, bit, above = (1 << 255) - 1, 1 << 255, (1 << 255) + 1
+
+    assert tokenid.is_fungible(below)
+    assert tokenid.get_non_fungible_index(below) == tokenid.NF_INDEX_MASK
+    assert tokenid.is_non_fungible_base_type(bit)
+    assert not tokenid.is_non_fungible_item(bit)
+    assert tokenid.is_non_fungible_item(above)
+    assert tokenid.get_non_fungible_base_type(above) == bit
+    assert tokenid.is_non_fungible_item(tokenid.UINT256_MAX)
+
+
+@pytest.mark.parametrize("token_id", [-1, tokenid.UINT256_MAX + 1])
+def test_out_of_range(token_id):
+    for function in tokenid.LOCAL_CALLS.values():
+        with pytest.raises(ValueError):
+            function(token_id)
+    with pytest.raises(ValueError):
+        tokenid.split([token_id])
+    with pytest.raises(ValueError):
+        tokenid.to_limbs([token_id])
+
+
+def test_make_id_rejects_indexed_types_and_large_indexes():
+    with pytest.raises(ValueError):
+        tokenid.make_id((1 << 255) + 1, 1)
+    with pytest.raises(ValueError):
+        tokenid.make_id(1 << 255, tokenid.NF_INDEX_MASK + 1)
+
+
+@pytest.fixture
+def mixin_nf(deploy):
+    return deploy("MixinNF")
+
+
+def test_matches_mixin_nf(mixin_nf):
+    rand = random.Random(255)
+    token_ids = EDGES + [rand.getrandbits(256) for _ in range(20)]
+    for signature, function in tokenid.LOCAL_CALLS.items():
+        name = signature.split("(")[0]
+        contract_function = getattr(mixin_nf.functions, name)
+        for token_id in token_ids:
+            assert function(token_id) == contract_function(token_id).call(), (
+                signature,
+                hex(token_id),
+            )
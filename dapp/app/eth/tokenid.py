@@ -0,0 +1,169 @@
+"""Split-bit token ids of ``MixinNF.sol``, decoded in-process.
+
+A token id is 256 bits: the upper 128 bits are its type, the lower 128 bits
+the index of a non-fungible item, and the top bit flags non-fungible types::
+
+    | NF | type (127 bits)          | index (128 bits)               |
+
+The functions below mirror the ``pure`` functions of ``MixinNF`` bit for bit,
+so the generated wrappers evaluate them without an ``eth_call`` (see
+:data:`LOCAL_CALLS`).  Lists of ids are classified with plain Python; NumPy
+arrays of ids are split into 64-bit limbs by :func:`split_array` and
+:func:`classify_array`.
+"""
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+
+UINT256_MAX = (1 << 256) - 1
+# Type in the upper 128 bits...
+TYPE_MASK = ((1 << 128) - 1) << 128
+# ...and non-fungible index in the lower 128.
+NF_INDEX_MASK = (1 << 128) - 1
+# The top bit flags the non-fungible types.
+TYPE_NF_BIT = 1 << 255
+
+
+def _check(token_id: int) -> int:
+    if not 0 <= token_id <= UINT256_MAX:
+        raise ValueError(f"{token_id} is not a uint256")
+    return token_id
+
+
+def is_non_fungible(token_id: int) -> bool:
+    """Whether ``token_id`` is of a non-fungible type (``isNonFungible``)."""
+    return _check(token_id) & TYPE_NF_BIT == TYPE_NF_BIT
+
+
+def is_fungible(token_id: int) -> bool:
+    """Whether ``token_id`` is of a fungible type (``isFungible``)."""
+    return _check(token_id) & TYPE_NF_BIT == 0
+
+
+def get_non_fungible_index(token_id: int) -> int:
+    """Return the item index of ``token_id`` (``getNonFungibleIndex``)."""
+    return _check(token_id) & NF_INDEX_MASK
+
+
+def get_non_fungible_base_type(token_id: int) -> int:
+    """Return the type of ``token_id`` (``getNonFungibleBaseType``)."""
+    return _check(token_id) & TYPE_MASK
+
+
+def is_non_fungible_base_type(token_id: int) -> bool:
+    """Whether ``token_id`` is a non-fungible type (``isNonFungibleBaseType``)."""
+    _check(token_id)
+    return token_id & TYPE_NF_BIT == TYPE_NF_BIT and token_id & NF_INDEX_MASK == 0
+
+
+def is_non_fungible_item(token_id: int) -> bool:
+    """Whether ``token_id`` is a non-fungible item (``isNonFungibleItem``)."""
+    _check(token_id)
+    return token_id & TYPE_NF_BIT == TYPE_NF_BIT and token_id & NF_INDEX_MASK != 0
+
+
+def make_id(base_type: int, index: int = 0) -> int:
+    """Return the id of item ``index`` of ``base_type``, as ``mintNonFungible`` does."""
+    if _check(base_type) & NF_INDEX_MASK or not 0 <= index <= NF_INDEX_MASK:
+        raise ValueError(f"Invalid type {base_type} or index {index}")
+    return base_type | index
+
+
+# In-process implementations of the pure functions of MixinNF, by signature.
+LOCAL_CALLS = {
+    "isNonFungible(uint256)": is_non_fungible,
+    "isFungible(uint256)": is_fungible,
+    "getNonFungibleIndex(uint256)": get_non_fungible_index,
+    "getNonFungibleBaseType(uint256)": get_non_fungible_base_type,
+    "isNonFungibleBaseType(uint256)": is_non_fungible_base_type,
+    "isNonFungibleItem(uint256)": is_non_fungible_item,
+}
+
+
+def split(token_ids: Iterable[int]) -> Tuple[List[int], List[int]]:
+    """Return the types and the item indexes of ``token_ids``."""
+    token_ids = [_check(token_id) for token_id in token_ids]
+    return (
+        [token_id & TYPE_MASK for token_id in token_ids],
+        [token_id & NF_INDEX_MASK for token_id in token_ids],
+    )
+
+
+class IdKinds(NamedTuple):
+    """Which of a batch of ids are fungible, non-fungible types or items."""
+
+    fungible: Sequence[bool]
+    base_type: Sequence[bool]
+    item: Sequence[bool]
+
+
+def classify(token_ids: Iterable[int]) -> IdKinds:
+    """Return the kind of every id of ``token_ids``."""
+    fungible, base_type, item = [], [], []
+    for token_id in token_ids:
+        non_fungible = _check(token_id) & TYPE_NF_BIT == TYPE_NF_BIT
+        indexed = token_id & NF_INDEX_MASK != 0
+        fungible.append(not non_fungible)
+        base_type.append(non_fungible and not indexed)
+        item.append(non_fungible and indexed)
+    return IdKinds(fungible, base_type, item)
+
+
+class IdColumns(NamedTuple):
+    """Ids split into their type and index, each as two ``uint64`` columns.
+
+    NumPy has no 128-bit integers: the type of id ``i`` is
+    ``type_high[i] << 64 | type_low[i]`` and its index
+    ``index_high[i] << 64 | index_low[i]``.
+    """
+
+    type_high: "numpy.ndarray"
+    type_low: "numpy.ndarray"
+    index_high: "numpy.ndarray"
+    index_low: "numpy.ndarray"
+
+
+def to_limbs(token_ids: Iterable[int]) -> "numpy.ndarray":
+    """Return ``token_ids`` as an ``(n, 4)`` array of big-endian ``uint64`` limbs."""
+    import numpy as np
+
+    data = b"".join(_check(token_id).to_bytes(32, "big") for token_id in token_ids)
+    return np.frombuffer(data, dtype=">u8").reshape(-1, 4).astype(np.uint64)
+
+
+def split_array(token_ids) -> IdColumns:
+    """Split ``token_ids``, ints or an array from :func:`to_limbs`, into columns."""
+    limbs = _limbs(token_ids)
+    return IdColumns(limbs[:, 0], limbs[:, 1], limbs[:, 2], limbs[:, 3])
+
+
+def classify_array(token_ids) -> IdKinds:
+    """Return the kind of every id as boolean arrays, like :func:`classify`."""
+    import numpy as np
+
+    limbs = _limbs(token_ids)
+    non_fungible = (limbs[:, 0] >> np.uint64(63)) == 1
+    indexed = (limbs[:, 2] | limbs[:, 3]) != 0
+    return IdKinds(~non_fungible, non_fungible & ~indexed, non_fungible & indexed)
+
+
+def from_columns(columns: IdColumns) -> List[int]:
+    """Return the ids split into ``columns`` by :func:`split_array`."""
+    return [
+        int(type_high) << 192
+        | int(type_low) << 128
+        | int(index_high) << 64
+        | int(index_low)
+        for type_high, type_low, index_high, index_low in zip(*columns)
+    ]
+
+
+def _limbs(token_ids) -> "numpy.ndarray":
+    import numpy as np
+
+    if isinstance(token_ids, np.ndarray) and token_ids.dtype == np.uint64:
+        if token_ids.ndim != 2 or token_ids.shape[1] != 4:
+            raise ValueError("Limb arrays must have shape (n, 4)")
+        return token_ids
+    return to_limbs(token_ids)
@@ -3,13 +3,12 @@ from rest_framework.response import Response
 from rest_framework import permissions
 
 from django.conf import settings
-from web3 import Web3
 
 # from web3.middleware import geth_poa_middleware
 
-from app.implementation.instance import Implementation
+from app.eth.contracts import Implementation
+from app.eth.registry import get_contract
 
-provider = Web3.HTTPProvider(settings.WEB3_PROVIDER)
 contract = settings.CONTRACT_IMPL_ADR
 
 
@@ -25,7 +24,7 @@ class Name(APIView):
         """
         Build.
         """
-        instance = Implementation(provider, contract)
+        instance = get_contract(Implementation, contract).cached()
         res = instance.name.call()
 
         return Response(res)
@@ -0,0 +1,18 @@
+from django.contrib import admin
+
+from app.ethimplementation.models import Airdrop, AirdropChunk
+
+
+class AirdropChunkInline(admin.TabularInline):
+    model = AirdropChunk
+    fields = ("first", "size", "gas", "status", "nonce", "tx_hash", "block_number")
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+@admin.register(Airdrop)
+class AirdropAdmin(admin.ModelAdmin):
+    list_display = ("name", "kind", "token_id", "sender", "created")
+    readonly_fields = ("base_gas", "gas_per_recipient", "created")
+    inlines = (AirdropChunkInline,)
@@ -0,0 +1,294 @@
+"""Bulk mints of a token to a long list of recipients.
+
+``mintFungible`` and ``mintNonFungible`` take arrays of recipients, but a
+single transaction can only hold as many as fit in a block.  An
+:class:`AirdropPlanner` estimates the gas of a mint once, as a fixed cost
+plus a cost per recipient, and cuts the recipients of an
+:class:`~app.ethimplementation.models.Airdrop` into
+:class:`~app.ethimplementation.models.AirdropChunk`\\ s of equal size, each
+fitting in ``max_gas``.  The chunks are then signed and sent through a
+:class:`~app.eth.pipeline.TransactionPipeline` and their receipts awaited::
+
+    planner = AirdropPlanner(implementation, Account.from_key(key))
+    planner.run(airdrop)  # {"planned": 0, "sent": 0, "mined": 412, "failed": 0}
+
+Every signed transaction is recorded on its chunk before it is sent.  After
+a crash, :meth:`AirdropPlanner.recover` settles the chunks left ``SENT``
+from the chain: mined, re-broadcast with the very same nonce, or planned
+again only once that nonce has been used by another transaction, so a chunk
+can never be minted twice.  Only one planner may run a given airdrop at a
+time.
+"""
+import logging
+import math
+from concurrent.futures import Future
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from eth_account.signers.local import LocalAccount
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from zero_ex.contract_wrappers.bases import ContractMethod
+from zero_ex.contract_wrappers.tx_params import TxParams
+
+from app.eth.pipeline import KNOWN_TRANSACTION, NONCE_USED, TransactionPipeline
+from app.eth.preflight import acting_as
+from app.eth.receipts import get_receipt_tracker
+from app.ethimplementation.models import (
+    Airdrop,
+    AirdropChunk,
+    AirdropKind,
+    AirdropRecipient,
+    ChunkStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# Recipients of the second gas estimate; the first one has a single recipient.
+SAMPLE_SIZE = 10
+
+
+def _still_pending(exc: ValueError) -> bool:
+    """Whether a re-broadcast was refused because the node has the transaction."""
+    message = str(exc).lower()
+    return any(reason in message for reason in KNOWN_TRANSACTION + NONCE_USED)
+
+
+class AirdropPlanner:
+    """Plans, sends and settles the chunks of airdrops minted by ``account``."""
+
+    def __init__(
+        self,
+        implementation,
+        account: LocalAccount,
+        max_gas: Optional[int] = None,
+        margin: float = 1.2,
+        max_workers: int = 8,
+    ):
+        """
+        :param implementation: ``Implementation`` wrapper minting the tokens
+        :param account: creator of the airdropped tokens, signing the mints
+        :param max_gas: gas limit of a chunk; defaults to
+            ``settings.AIRDROP_BLOCK_GAS_SHARE`` of the block gas limit
+        :param margin: factor applied to the estimated gas of every chunk
+        :param max_workers: how many mints are in flight at once
+        """
+        self.implementation = implementation
+        self.web3 = implementation._web3_eth.web3
+        self.account = account
+        self.sender = account.address.lower()
+        self.max_gas = max_gas
+        self.margin = margin
+        self.max_workers = max_workers
+
+    def _mint(
+        self, airdrop: Airdrop, recipients: Sequence[AirdropRecipient]
+    ) -> Tuple[ContractMethod, tuple]:
+        """Return the mint method and arguments giving ``recipients`` their tokens."""
+        to = [to_checksum_address(recipient.address) for recipient in recipients]
+        data = bytes(airdrop.data)
+        if airdrop.kind == AirdropKind.FUNGIBLE:
+            amounts = [int(recipient.amount) for recipient in recipients]
+            return (
+                self.implementation.mint_fungible,
+                (to, int(airdrop.token_id), amounts, data),
+            )
+        return self.implementation.mint_non_fungible, (to, int(airdrop.token_id), data)
+
+    def _estimate_gas(
+        self, airdrop: Airdrop, recipients: Sequence[AirdropRecipient]
+    ) -> int:
+        method, args = self._mint(airdrop, recipients)
+        with acting_as(self.sender):
+            return method.estimate_gas(
+                *args, tx_params=TxParams(from_=self.account.address)
+            )
+
+    def estimate(self, airdrop: Airdrop) -> Tuple[int, int]:
+        """Estimate the fixed and per-recipient gas of the mints of ``airdrop``.
+
+        Estimated once, from its first recipients, and stored on the airdrop.
+        """
+        if airdrop.gas_per_recipient is not None:
+            return airdrop.base_gas, airdrop.gas_per_recipient
+        sample = list(airdrop.recipients.all()[:SAMPLE_SIZE])
+        if not sample:
+            raise ValueError(f"Airdrop {airdrop} has no recipient")
+        single = self._estimate_gas(airdrop, sample[:1])
+        if len(sample) == 1:
+            base, per_recipient = 0, single
+        else:
+            several = self._estimate_gas(airdrop, sample)
+            per_recipient = math.ceil((several - single) / (len(sample) - 1))
+            base = max(0, single - per_recipient)
+        airdrop.base_gas, airdrop.gas_per_recipient = base, per_recipient
+        airdrop.save(update_fields=["base_gas", "gas_per_recipient"])
+        return base, per_recipient
+
+    def chunk_gas(self, airdrop: Airdrop, size: int) -> int:
+        """Return the gas limit of a chunk of ``size`` recipients."""
+        base, per_recipient = self.estimate(airdrop)
+        return math.ceil((base + per_recipient * size) * self.margin)
+
+    def plan(self, airdrop: Airdrop) -> List[AirdropChunk]:
+        """Cut the recipients of ``airdrop`` into chunks, unless already done."""
+        chunks = list(airdrop.chunks.all())
+        if chunks:
+            return chunks
+        count = airdrop.recipients.count()
+        if not count:
+            return []
+        base, per_recipient = self.estimate(airdrop)
+        if per_recipient <= 0:
+            raise ValueError(
+                f"Airdrop {airdrop} has an estimated gas per recipient of "
+                f"{per_recipient}"
+            )
+        max_gas = self.max_gas or int(
+            self.web3.eth.getBlock("latest")["gasLimit"]
+            * settings.AIRDROP_BLOCK_GAS_SHARE
+        )
+        capacity = int((max_gas / self.margin - base) // per_recipient)
+        if capacity < 1:
+            raise ValueError(f"A single mint needs more than {max_gas} gas")
+        # As many chunks as needed, all of the same size.
+        size = math.ceil(count / math.ceil(count / capacity))
+        chunks = [
+            AirdropChunk(
+                airdrop=airdrop,
+                first=first,
+                size=min(size, count - first),
+                gas=self.chunk_gas(airdrop, min(size, count - first)),
+            )
+            for first in range(0, count, size)
+        ]
+        with transaction.atomic():
+            AirdropChunk.objects.bulk_create(chunks)
+        logger.info(
+            "Planned %s chunks of %s recipients for %s", len(chunks), size, airdrop
+        )
+        return list(airdrop.chunks.all())
+
+    def recover(
+        self, airdrop: Airdrop, pipeline: Optional[TransactionPipeline] = None
+    ):
+        """Settle the chunks left ``SENT`` by a previous run.
+
+        :param pipeline: takes the nonces of the transactions the node no
+            longer accepts, so that later transactions are not stuck behind
+            them; their chunks are planned again once the nonce is used
+        """
+        chunks = list(airdrop.chunks.filter(status=ChunkStatus.SENT))
+        if not chunks:
+            return
+        # Read before the receipts: a nonce below it was mined before them.
+        mined_nonce = self.web3.eth.getTransactionCount(self.account.address, "latest")
+        for chunk in chunks:
+            try:
+                receipt = self.web3.eth.getTransactionReceipt(chunk.tx_hash)
+            except TransactionNotFound:
+                receipt = None
+            if receipt is not None:
+                self._settle(chunk, receipt)
+            elif chunk.nonce < mined_nonce:
+                # Its nonce went to another transaction: nothing was minted.
+                self._replan(chunk)
+            else:
+                try:
+                    self.web3.eth.sendRawTransaction(bytes(chunk.raw_transaction))
+                except ValueError as exc:
+                    logger.info("Re-broadcast of %s refused: %s", chunk.tx_hash, exc)
+                    if pipeline is not None and not _still_pending(exc):
+                        pipeline.give_back(chunk.nonce)
+
+    def run(self, airdrop: Airdrop, retry_failed: bool = False) -> Dict[str, int]:
+        """Mint every chunk of ``airdrop`` not minted yet; return the chunks by status.
+
+        :param retry_failed: also send again the chunks whose mint reverted
+        """
+        if airdrop.sender.lower() != self.sender:
+            raise ValueError(f"Airdrop {airdrop} is minted by {airdrop.sender}")
+        tracker = get_receipt_tracker(self.web3)
+        watched: List[Tuple[AirdropChunk, Future]] = []
+        submitted: List[Tuple[AirdropChunk, Future]] = []
+        with TransactionPipeline(
+            self.web3, self.account, max_workers=self.max_workers
+        ) as pipeline:
+            self.recover(airdrop, pipeline)
+            if retry_failed:
+                for chunk in airdrop.chunks.filter(status=ChunkStatus.FAILED):
+                    self._replan(chunk)
+            chunks = self.plan(airdrop)
+            watched.extend(
+                (chunk, tracker.watch(chunk.tx_hash))
+                for chunk in chunks
+                if chunk.status == ChunkStatus.SENT
+            )
+            for chunk in chunks:
+                if chunk.status != ChunkStatus.PLANNED:
+                    continue
+                recipients = airdrop.recipients.filter(
+                    position__gte=chunk.first, position__lt=chunk.first + chunk.size
+                )
+                method, args = self._mint(airdrop, list(recipients))
+                future = pipeline.submit(
+                    method,
+                    *args,
+                    tx_params=TxParams(gas=chunk.gas),
+                    before_send=partial(self._record, chunk),
+                )
+                submitted.append((chunk, future))
+
+        for chunk, future in submitted:
+            try:
+                watched.append((chunk, tracker.watch(future.result())))
+            except Exception:  # pylint: disable=broad-except
+                # Recorded or not, recover() settles it on the next run.
+                logger.exception("Could not send %s", chunk)
+        for chunk, watch in watched:
+            try:
+                self._settle(chunk, watch.result().receipt)
+            except TimeExhausted:
+                logger.warning("%s is not mined yet", chunk)
+
+        counts = {status.name.lower(): 0 for status in ChunkStatus}
+        for status in airdrop.chunks.values_list("status", flat=True):
+            counts[ChunkStatus(status).name.lower()] += 1
+        return counts
+
+    @staticmethod
+    def _record(chunk: AirdropChunk, nonce: int, tx_hash: HexBytes, raw: bytes):
+        chunk.status = ChunkStatus.SENT
+        chunk.nonce = nonce
+        chunk.tx_hash = tx_hash.hex()
+        chunk.raw_transaction = raw
+        chunk.save(
+            update_fields=["status", "nonce", "tx_hash", "raw_transaction", "updated"]
+        )
+
+    @staticmethod
+    def _settle(chunk: AirdropChunk, receipt):
+        chunk.status = ChunkStatus.MINED if receipt["status"] else ChunkStatus.FAILED
+        chunk.block_number = receipt["blockNumber"]
+        chunk.save(update_fields=["status", "block_number", "updated"])
+
+    @staticmethod
+    def _replan(chunk: AirdropChunk):
+        chunk.status = ChunkStatus.PLANNED
+        chunk.nonce = None
+        chunk.tx_hash = ""
+        chunk.raw_transaction = None
+        chunk.block_number = None
+        chunk.save(
+            update_fields=[
+                "status",
+                "nonce",
+                "tx_hash",
+                "raw_transaction",
+                "block_number",
+                "updated",
+            ]
+        )
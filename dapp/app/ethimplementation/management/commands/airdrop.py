@@ -0,0 +1,110 @@
+import csv
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from eth_account import Account
+from eth_utils import is_address
+from hexbytes import HexBytes
+
+from app.eth.contracts import Implementation
+from app.eth.registry import get_contract
+from app.ethimplementation.airdrop import AirdropPlanner
+from app.ethimplementation.models import Airdrop, AirdropKind, AirdropRecipient
+
+
+class Command(BaseCommand):
+    help = (
+        "Mint a token to the recipients of an airdrop, creating it from a CSV "
+        "of address[,amount] rows on first run; later runs resume it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", help="Name of the airdrop.")
+        parser.add_argument("--csv", help="Recipients of a new airdrop.")
+        parser.add_argument(
+            "--token-id",
+            type=lambda value: int(value, 0),
+            help="Fungible token id, or non-fungible type, of a new airdrop.",
+        )
+        parser.add_argument(
+            "--non-fungible",
+            action="store_true",
+            help="Mint one new item of the type to every recipient.",
+        )
+        parser.add_argument("--data", default="0x", help="Data of the mints, in hex.")
+        parser.add_argument(
+            "--key-env",
+            default="AIRDROP_PRIVATE_KEY",
+            help="Environment variable holding the private key of the minter.",
+        )
+        parser.add_argument("--max-gas", type=int, help="Gas limit of a mint.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="How many mint transactions are in flight at once.",
+        )
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Send again the mints that reverted.",
+        )
+
+    def handle(self, *args, **options):
+        key = os.environ.get(options["key_env"])
+        if not key:
+            raise CommandError(f"{options['key_env']} is not set")
+        account = Account.from_key(key)
+
+        airdrop = Airdrop.objects.filter(name=options["name"]).first()
+        if airdrop is None:
+            airdrop = self.create(account.address, options)
+        implementation = get_contract(Implementation, airdrop.contract)
+        planner = AirdropPlanner(
+            implementation,
+            account,
+            max_gas=options["max_gas"],
+            max_workers=options["workers"],
+        )
+        counts = planner.run(airdrop, retry_failed=options["retry_failed"])
+        summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Chunks of {airdrop}: {summary}."))
+
+    def create(self, sender: str, options: dict) -> Airdrop:
+        if not options["csv"] or options["token_id"] is None:
+            raise CommandError("New airdrops need --csv and --token-id")
+        non_fungible = options["non_fungible"]
+        with open(options["csv"], newline="") as recipients_file:
+            rows = [row for row in csv.reader(recipients_file) if row]
+        recipients = []
+        for line, row in enumerate(rows, 1):
+            if not is_address(row[0]):
+                raise CommandError(f"Line {line}: {row[0]} is not an address")
+            amount = 1 if non_fungible else int(row[1])
+            recipients.append((row[0], amount))
+
+        with transaction.atomic():
+            airdrop = Airdrop.objects.create(
+                name=options["name"],
+                contract=settings.CONTRACT_IMPL_ADR,
+                kind=AirdropKind.NON_FUNGIBLE if non_fungible else AirdropKind.FUNGIBLE,
+                token_id=options["token_id"],
+                data=bytes(HexBytes(options["data"])),
+                sender=sender.lower(),
+            )
+            AirdropRecipient.objects.bulk_create(
+                [
+                    AirdropRecipient(
+                        airdrop=airdrop,
+                        position=position,
+                        address=address,
+                        amount=amount,
+                    )
+                    for position, (address, amount) in enumerate(recipients)
+                ],
+                batch_size=5000,
+            )
+        self.stdout.write(f"Created {airdrop} with {len(recipients)} recipients.")
+        return airdrop
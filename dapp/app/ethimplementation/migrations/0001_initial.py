@@ -0,0 +1,71 @@
+# Generated by Django 3.0.8 on 2026-10-18 12:00
+
+import app.ethindexer.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Airdrop',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.SlugField(unique=True)),
+                ('contract', app.ethindexer.fields.AddressField()),
+                ('kind', models.CharField(choices=[('fungible', 'fungible'), ('non_fungible', 'non-fungible')], max_length=16)),
+                ('token_id', app.ethindexer.fields.Uint256Field()),
+                ('data', models.BinaryField(default=b'')),
+                ('sender', app.ethindexer.fields.AddressField()),
+                ('base_gas', models.BigIntegerField(null=True)),
+                ('gas_per_recipient', models.BigIntegerField(null=True)),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='created')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AirdropRecipient',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('address', app.ethindexer.fields.AddressField()),
+                ('amount', app.ethindexer.fields.Uint256Field(default=1)),
+                ('airdrop', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recipients', to='ethimplementation.Airdrop')),
+            ],
+            options={
+                'ordering': ('airdrop', 'position'),
+            },
+        ),
+        migrations.CreateModel(
+            name='AirdropChunk',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first', models.PositiveIntegerField()),
+                ('size', models.PositiveIntegerField()),
+                ('gas', models.BigIntegerField()),
+                ('status', models.PositiveSmallIntegerField(choices=[(0, 'planned'), (1, 'sent'), (2, 'mined'), (3, 'failed')], db_index=True, default=0)),
+                ('nonce', models.BigIntegerField(null=True)),
+                ('tx_hash', models.CharField(blank=True, max_length=66)),
+                ('raw_transaction', models.BinaryField(null=True)),
+                ('block_number', models.BigIntegerField(null=True)),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='updated')),
+                ('airdrop', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='ethimplementation.Airdrop')),
+            ],
+            options={
+                'ordering': ('airdrop', 'first'),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='airdroprecipient',
+            constraint=models.UniqueConstraint(fields=('airdrop', 'position'), name='ethimplementation_airdroprecipient_unique_position'),
+        ),
+        migrations.AddConstraint(
+            model_name='airdropchunk',
+            constraint=models.UniqueConstraint(fields=('airdrop', 'first'), name='ethimplementation_airdropchunk_unique_first'),
+        ),
+    ]
@@ -0,0 +1,97 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from app.ethindexer.fields import AddressField, Uint256Field
+
+
+class AirdropKind(models.TextChoices):
+    FUNGIBLE = "fungible", _("fungible")
+    NON_FUNGIBLE = "non_fungible", _("non-fungible")
+
+
+class ChunkStatus(models.IntegerChoices):
+    PLANNED = 0, _("planned")
+    SENT = 1, _("sent")
+    MINED = 2, _("mined")
+    FAILED = 3, _("failed")
+
+
+class Airdrop(models.Model):
+    """Distribution of a token to a list of recipients, minted by ``sender``.
+
+    Fungible airdrops mint ``amount`` of ``token_id`` to every recipient
+    (``mintFungible``); non-fungible ones mint one new item of the type
+    ``token_id`` to each of them (``mintNonFungible``).
+    """
+
+    name = models.SlugField(unique=True)
+    contract = AddressField()
+    kind = models.CharField(max_length=16, choices=AirdropKind.choices)
+    token_id = Uint256Field()
+    data = models.BinaryField(default=b"")
+    sender = AddressField()
+    # Gas of a mint is base_gas + gas_per_recipient * recipients, once estimated.
+    base_gas = models.BigIntegerField(null=True)
+    gas_per_recipient = models.BigIntegerField(null=True)
+    created = models.DateTimeField(auto_now_add=True, verbose_name=_("created"))
+
+    def __str__(self):
+        return self.name
+
+
+class AirdropRecipient(models.Model):
+    """Recipient of an airdrop, at ``position`` in its list."""
+
+    airdrop = models.ForeignKey(
+        Airdrop, on_delete=models.CASCADE, related_name="recipients"
+    )
+    position = models.PositiveIntegerField()
+    address = AddressField()
+    amount = Uint256Field(default=1)
+
+    class Meta:
+        ordering = ("airdrop", "position")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["airdrop", "position"],
+                name="%(app_label)s_%(class)s_unique_position",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.airdrop}#{self.position}: {self.address}"
+
+
+class AirdropChunk(models.Model):
+    """Recipients ``first`` to ``first + size - 1`` of an airdrop, minted at once.
+
+    The signed transaction is recorded before it is sent, so a chunk is only
+    ever minted by that transaction or, once its nonce has been used by
+    another one, by a new transaction.
+    """
+
+    airdrop = models.ForeignKey(
+        Airdrop, on_delete=models.CASCADE, related_name="chunks"
+    )
+    first = models.PositiveIntegerField()
+    size = models.PositiveIntegerField()
+    gas = models.BigIntegerField()
+    status = models.PositiveSmallIntegerField(
+        choices=ChunkStatus.choices, default=ChunkStatus.PLANNED, db_index=True
+    )
+    nonce = models.BigIntegerField(null=True)
+    tx_hash = models.CharField(max_length=66, blank=True)
+    raw_transaction = models.BinaryField(null=True)
+    block_number = models.BigIntegerField(null=True)
+    updated = models.DateTimeField(auto_now=True, verbose_name=_("updated"))
+
+    class Meta:
+        ordering = ("airdrop", "first")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["airdrop", "first"], name="%(app_label)s_%(class)s_unique_first"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.airdrop}[{self.first}:{self.first + self.size}]"
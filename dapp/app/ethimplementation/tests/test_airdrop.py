@@ -0,0 +1,123 @@
+import pytest
+from hexbytes import HexBytes
+from zero_ex.contract_wrappers.tx_params import TxParams
+
+from app.eth.contracts import Implementation
+from app.ethimplementation.airdrop import AirdropPlanner
+from app.ethimplementation.models import (
+    Airdrop,
+    AirdropChunk,
+    AirdropKind,
+    AirdropRecipient,
+    ChunkStatus,
+)
+
+pytestmark = pytest.mark.django_db
+
+AMOUNT = 5
+
+
+@pytest.fixture(autouse=True)
+def web3_settings(settings):
+    settings.WEB3_NONCE_REDIS_URL = ""
+    settings.WEB3_HEAD_POLL_INTERVAL = 0.05
+    settings.WEB3_RECEIPT_TIMEOUT = 30
+
+
+@pytest.fixture
+def planner(w3, contracts, signer) -> AirdropPlanner:
+    implementation = Implementation(w3, contracts.implementation.address)
+    return AirdropPlanner(implementation, signer, max_workers=1)
+
+
+@pytest.fixture
+def airdrop(w3, contracts, transact, signer) -> Airdrop:
+    """Fungible airdrop of ``signer``, in three chunks of two recipients."""
+    implementation = contracts.implementation.functions
+    transact(implementation.transferOwnership(signer.address))
+    receipt = transact(implementation.create("", False, b""), signer.address)
+    (created,) = contracts.token.events.TokenCreated().processReceipt(receipt)
+    airdrop = Airdrop.objects.create(
+        name="airdrop",
+        contract=contracts.implementation.address,
+        kind=AirdropKind.FUNGIBLE,
+        token_id=created.args.id,
+        sender=signer.address,
+    )
+    AirdropRecipient.objects.bulk_create(
+        AirdropRecipient(
+            airdrop=airdrop, position=position, address=address, amount=AMOUNT
+        )
+        for position, address in enumerate(w3.eth.accounts[1:7])
+    )
+    AirdropChunk.objects.bulk_create(
+        AirdropChunk(airdrop=airdrop, first=first, size=2, gas=500000)
+        for first in range(0, 6, 2)
+    )
+    return airdrop
+
+
+def record(w3, planner, airdrop, signer) -> AirdropChunk:
+    """Sign the mint of the first chunk and record it, as a crashed run would."""
+    chunk = airdrop.chunks.first()
+    recipients = airdrop.recipients.filter(position__lt=chunk.size)
+    method, args = planner._mint(airdrop, list(recipients))
+    nonce = w3.eth.getTransactionCount(signer.address)
+    signed = signer.sign_transaction(
+        method.build_transaction(
+            *args, tx_params=TxParams(from_=signer.address, gas=chunk.gas, nonce=nonce)
+        )
+    )
+    planner._record(chunk, nonce, HexBytes(signed.hash), bytes(signed.rawTransaction))
+    return chunk
+
+
+def assert_minted_once(w3, contracts, airdrop):
+    assert set(airdrop.chunks.values_list("status", flat=True)) == {ChunkStatus.MINED}
+    for address in w3.eth.accounts[1:7]:
+        balance = contracts.token.functions.balanceOf(address, airdrop.token_id)
+        assert balance.call() == AMOUNT
+
+
+def test_sent_and_mined(w3, contracts, signer, planner, airdrop):
+    chunk = record(w3, planner, airdrop, signer)
+    w3.eth.sendRawTransaction(chunk.raw_transaction)
+
+    planner.recover(airdrop)
+
+    chunk.refresh_from_db()
+    assert chunk.status == ChunkStatus.MINED
+    assert chunk.block_number == w3.eth.blockNumber
+
+    planner.run(airdrop)
+    assert_minted_once(w3, contracts, airdrop)
+
+
+def test_recorded_but_never_sent(w3, contracts, signer, planner, airdrop):
+    chunk = record(w3, planner, airdrop, signer)
+
+    planner.recover(airdrop)
+
+    # Re-broadcast, with the same hash and nonce.
+    transaction = w3.eth.getTransaction(chunk.tx_hash)
+    assert transaction["nonce"] == chunk.nonce
+
+    assert planner.run(airdrop) == {"planned": 0, "sent": 0, "mined": 3, "failed": 0}
+    assert_minted_once(w3, contracts, airdrop)
+
+
+def test_nonce_used_by_another_transaction(w3, contracts, signer, planner, airdrop):
+    chunk = record(w3, planner, airdrop, signer)
+    tx_hash = chunk.tx_hash
+    transfer = {"from": signer.address, "to": signer.address, "value": 0}
+    w3.eth.waitForTransactionReceipt(w3.eth.sendTransaction(transfer))
+
+    planner.recover(airdrop)
+
+    chunk.refresh_from_db()
+    assert (chunk.status, chunk.nonce, chunk.tx_hash) == (ChunkStatus.PLANNED, None, "")
+
+    planner.run(airdrop)
+    chunk.refresh_from_db()
+    assert chunk.tx_hash != tx_hash
+    assert_minted_once(w3, contracts, airdrop)
@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from app.ethindexer.models import Checkpoint
+
+
+@admin.register(Checkpoint)
+class CheckpointAdmin(admin.ModelAdmin):
+    list_display = ("contract", "block_number", "updated")
+    readonly_fields = ("updated",)
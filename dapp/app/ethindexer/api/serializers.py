@@ -0,0 +1,151 @@
+from rest_framework import serializers
+
+from app.ethindexer.models import (
+    AccountCreation,
+    AccountNode,
+    AccountStatusUpdate,
+    Balance,
+    OperatorChange,
+    TokenBurn,
+    TokenCreation,
+    TokenMint,
+    TokenTransfer,
+    TokenURI,
+)
+
+EVENT_FIELDS = ("contract", "block_number", "transaction_hash", "log_index")
+
+
+class Uint256Field(serializers.Field):
+    """uint256 values exceed the range of JSON numbers, so they are strings."""
+
+    def to_representation(self, value):
+        return str(value)
+
+
+class HexBytesField(serializers.Field):
+    def to_representation(self, value):
+        return "0x" + bytes(value).hex()
+
+
+class TokenTransferSerializer(serializers.ModelSerializer):
+    token_id = Uint256Field()
+    amount = Uint256Field()
+    data = HexBytesField()
+    operator_data = HexBytesField()
+
+    class Meta:
+        model = TokenTransfer
+        fields = EVENT_FIELDS + (
+            "operator",
+            "sender",
+            "recipient",
+            "token_id",
+            "amount",
+            "data",
+            "operator_data",
+        )
+
+
+class TokenMintSerializer(serializers.ModelSerializer):
+    token_id = Uint256Field()
+    amount = Uint256Field()
+    data = HexBytesField()
+
+    class Meta:
+        model = TokenMint
+        fields = EVENT_FIELDS + ("operator", "recipient", "token_id", "amount", "data")
+
+
+class TokenBurnSerializer(serializers.ModelSerializer):
+    token_id = Uint256Field()
+    amount = Uint256Field()
+    data = HexBytesField()
+    operator_data = HexBytesField()
+
+    class Meta:
+        model = TokenBurn
+        fields = EVENT_FIELDS + (
+            "operator",
+            "holder",
+            "token_id",
+            "amount",
+            "data",
+            "operator_data",
+        )
+
+
+class TokenCreationSerializer(serializers.ModelSerializer):
+    token_id = Uint256Field()
+    data = HexBytesField()
+
+    class Meta:
+        model = TokenCreation
+        fields = EVENT_FIELDS + ("creator", "token_id", "data")
+
+
+class TokenURISerializer(serializers.ModelSerializer):
+    token_id = Uint256Field()
+
+    class Meta:
+        model = TokenURI
+        fields = EVENT_FIELDS + ("token_id", "value")
+
+
+class AccountCreationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AccountCreation
+        fields = EVENT_FIELDS + ("account", "parent", "root", "name", "level", "status")
+
+
+class AccountStatusUpdateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AccountStatusUpdate
+        fields = EVENT_FIELDS + ("account", "status")
+
+
+class OperatorChangeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = OperatorChange
+        fields = EVENT_FIELDS + ("operator", "holder", "authorized")
+
+
+class BalanceSerializer(serializers.ModelSerializer):
+    token_id = Uint256Field()
+    amount = Uint256Field()
+
+    class Meta:
+        model = Balance
+        fields = ("contract", "owner", "token_id", "amount", "block_number")
+
+
+class AccountNodeSerializer(serializers.ModelSerializer):
+    depth = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = AccountNode
+        fields = (
+            "contract",
+            "address",
+            "parent",
+            "root",
+            "name",
+            "level",
+            "status",
+            "depth",
+            "block_number",
+        )
+
+
+class SubtreeBalanceSerializer(serializers.Serializer):
+    token_id = Uint256Field()
+    total = Uint256Field()
+
+
+class OperatorCheckSerializer(serializers.Serializer):
+    pairs = serializers.ListField(
+        child=serializers.ListField(
+            child=serializers.CharField(max_length=42), min_length=2, max_length=2
+        ),
+        max_length=10000,
+    )
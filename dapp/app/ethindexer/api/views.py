@@ -0,0 +1,226 @@
+from rest_framework import generics, permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from app.ethindexer.api import serializers
+from app.ethindexer.models import (
+    AccountCreation,
+    AccountStatusUpdate,
+    Balance,
+    OperatorChange,
+    TokenBurn,
+    TokenCreation,
+    TokenMint,
+    TokenTransfer,
+    TokenURI,
+)
+from app.ethindexer.hierarchy import ancestors, descendants, subtree_balances
+from app.ethindexer.operators import get_operator_index
+from app.ethindexer.snapshots import balances_at
+
+
+class EventPagination(LimitOffsetPagination):
+    default_limit = 100
+    max_limit = 1000
+
+
+class EventList(generics.ListAPIView):
+    """
+    Indexed events, oldest first, read from the database.
+
+    Every name of `filter_fields` is an optional query parameter, e.g.
+    `?token_id=1&sender=0x...`; `from_block` and `to_block` bound the blocks.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    pagination_class = EventPagination
+    filter_fields: tuple = ()
+    address_fields = frozenset(
+        {
+            "contract",
+            "operator",
+            "sender",
+            "recipient",
+            "holder",
+            "creator",
+            "account",
+            "owner",
+        }
+    )
+
+    def get_queryset(self):
+        queryset = self.serializer_class.Meta.model.objects.all()
+        params = self.request.query_params
+        try:
+            for field in self.filter_fields:
+                value = params.get(field)
+                if value:
+                    if field in self.address_fields:
+                        value = value.lower()
+                    elif field == "token_id":
+                        value = int(value, 0)
+                    queryset = queryset.filter(**{field: value})
+            if params.get("from_block"):
+                queryset = queryset.filter(block_number__gte=int(params["from_block"]))
+            if params.get("to_block"):
+                queryset = queryset.filter(block_number__lte=int(params["to_block"]))
+        except ValueError as exc:
+            raise ValidationError(str(exc))
+        return queryset
+
+
+class TokenTransferList(EventList):
+    serializer_class = serializers.TokenTransferSerializer
+    filter_fields = ("contract", "operator", "sender", "recipient", "token_id")
+
+
+class TokenMintList(EventList):
+    serializer_class = serializers.TokenMintSerializer
+    filter_fields = ("contract", "operator", "recipient", "token_id")
+
+
+class TokenBurnList(EventList):
+    serializer_class = serializers.TokenBurnSerializer
+    filter_fields = ("contract", "operator", "holder", "token_id")
+
+
+class TokenCreationList(EventList):
+    serializer_class = serializers.TokenCreationSerializer
+    filter_fields = ("contract", "creator", "token_id")
+
+
+class TokenURIList(EventList):
+    serializer_class = serializers.TokenURISerializer
+    filter_fields = ("contract", "token_id")
+
+
+class AccountCreationList(EventList):
+    serializer_class = serializers.AccountCreationSerializer
+    filter_fields = ("contract", "account", "parent")
+
+
+class AccountStatusUpdateList(EventList):
+    serializer_class = serializers.AccountStatusUpdateSerializer
+    filter_fields = ("contract", "account")
+
+
+class OperatorChangeList(EventList):
+    serializer_class = serializers.OperatorChangeSerializer
+    filter_fields = ("contract", "operator", "holder")
+
+
+class BalanceList(EventList):
+    """
+    Non-zero balances, e.g. every balance of `?owner=0x...` or every holder
+    of `?token_id=...`; `from_block` and `to_block` bound the last block
+    that changed them.
+    """
+
+    serializer_class = serializers.BalanceSerializer
+    filter_fields = ("contract", "owner", "token_id")
+
+    def get_queryset(self):
+        return super().get_queryset().filter(amount__gt=0)
+
+
+class BalancesAt(APIView):
+    """
+    Non-zero balances of `?owner=0x...` at the end of `?block=...`, from the
+    last snapshot before the block and the events since.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, format=None):
+        params = request.query_params
+        if not params.get("owner") or not params.get("block"):
+            raise ValidationError("owner and block are required.")
+        try:
+            block = int(params["block"])
+            balances = balances_at(params["owner"], block, params.get("contract"))
+        except ValueError as exc:
+            raise ValidationError(str(exc))
+        return Response(
+            {
+                "owner": params["owner"].lower(),
+                "block_number": block,
+                "balances": [
+                    {"token_id": str(token_id), "amount": str(amount)}
+                    for token_id, amount in sorted(balances.items())
+                ],
+            }
+        )
+
+
+class AccountDescendants(generics.ListAPIView):
+    """
+    Every account below an account, nearest first.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    pagination_class = EventPagination
+    serializer_class = serializers.AccountNodeSerializer
+
+    def get_queryset(self):
+        return descendants(self.kwargs["address"]).order_by("depth", "address")
+
+
+class AccountAncestors(generics.ListAPIView):
+    """
+    Every account above an account, its parent first.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    serializer_class = serializers.AccountNodeSerializer
+
+    def get_queryset(self):
+        return ancestors(self.kwargs["address"])
+
+
+class SubtreeBalances(generics.ListAPIView):
+    """
+    Total balance of every token id held by an account and its descendants.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    pagination_class = EventPagination
+    serializer_class = serializers.SubtreeBalanceSerializer
+
+    def get_queryset(self):
+        return subtree_balances(self.kwargs["address"])
+
+
+class OperatorHolders(APIView):
+    """
+    Every holder an operator may send and burn the tokens of.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, operator, format=None):
+        index = get_operator_index()
+        holders = index.holders_of(operator)
+        return Response(
+            {
+                "operator": operator.lower(),
+                "block_number": index.block_number,
+                "holders": sorted(holders),
+            }
+        )
+
+
+class OperatorCheck(APIView):
+    """
+    `isOperatorFor` of up to 10000 `[operator, holder]` pairs at once.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request, format=None):
+        serializer = serializers.OperatorCheckSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        index = get_operator_index()
+        results = index.check_many(serializer.validated_data["pairs"])
+        return Response({"block_number": index.block_number, "results": results})
@@ -0,0 +1,93 @@
+"""Incremental maintenance of the :class:`~app.ethindexer.models.Balance` table.
+
+Every ``TokenMinted``, ``TokenSent`` and ``TokenBurned`` event is turned into
+balance deltas, which are summed per holding and block and then applied to
+the table with one ``SELECT ... FOR UPDATE``, one ``bulk_create`` and one
+``bulk_update`` per chunk of blocks.
+
+A row only takes the deltas of the blocks after its ``block_number``.  Chunks
+always hold whole blocks, so ingesting a range a second time leaves the
+balances unchanged.
+"""
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterable, Tuple
+
+from app.eth.decoder import EventBatch
+from app.eth.tokenid import get_non_fungible_base_type, is_non_fungible_item
+from app.ethindexer.models import Balance
+
+# event name -> (owner argument, sign) of every balance the event moves.
+LEDGER_EVENTS = {
+    "TokenMinted": (("to", 1),),
+    "TokenSent": (("from", -1), ("to", 1)),
+    "TokenBurned": (("from", -1),),
+}
+
+Holding = Tuple[str, str, int]  # (contract, owner, token_id)
+
+
+def collect_deltas(
+    batches: Iterable[EventBatch],
+) -> Dict[Holding, Dict[int, int]]:
+    """Return the balance delta of every holding moved by ``batches``, by block."""
+    deltas: DefaultDict[Holding, DefaultDict[int, int]] = defaultdict(
+        lambda: defaultdict(int)
+    )
+    for batch in batches:
+        sides = LEDGER_EVENTS.get(batch.event)
+        if sides is None:
+            continue
+        ids = batch["id"]
+        amounts = batch["amount"]
+        for owner_argument, sign in sides:
+            owners = batch[owner_argument]
+            for index in range(len(batch)):
+                token_id = ids[index]
+                delta = sign * amounts[index]
+                key = (batch.address[index], owners[index], token_id)
+                block = batch.block_number[index]
+                deltas[key][block] += delta
+                if is_non_fungible_item(token_id):
+                    # The base type of a non-fungible item counts its items.
+                    base = (key[0], key[1], get_non_fungible_base_type(token_id))
+                    deltas[base][block] += delta
+    return deltas
+
+
+def update_balances(batches: Iterable[EventBatch], batch_size: int = 5000) -> int:
+    """Apply the ledger events of ``batches``; return the number of rows touched.
+
+    Must run in the transaction storing the events.
+    """
+    deltas = collect_deltas(batches)
+    if not deltas:
+        return 0
+    owners = {owner for _contract, owner, _token_id in deltas}
+    token_ids = {token_id for _contract, _owner, token_id in deltas}
+    existing = {
+        (balance.contract, balance.owner, balance.token_id): balance
+        for balance in Balance.objects.select_for_update().filter(
+            owner__in=owners, token_id__in=token_ids
+        )
+    }
+    created, updated = [], []
+    for (contract, owner, token_id), blocks in deltas.items():
+        balance = existing.get((contract, owner, token_id))
+        if balance is None:
+            balance = Balance(
+                contract=contract, owner=owner, token_id=token_id, block_number=-1
+            )
+            created.append(balance)
+        last_block = balance.block_number
+        fresh = [block for block in blocks if block > last_block]
+        if not fresh:
+            continue
+        balance.amount += sum(blocks[block] for block in fresh)
+        balance.block_number = max(fresh)
+        if balance.pk is not None:
+            updated.append(balance)
+    Balance.objects.bulk_create(created, batch_size=batch_size)
+    Balance.objects.bulk_update(
+        updated, ["amount", "block_number"], batch_size=batch_size
+    )
+    return len(created) + len(updated)
@@ -0,0 +1,38 @@
+from django.db import models
+
+
+class Uint256Field(models.DecimalField):
+    """Unsigned 256-bit integer, stored as ``numeric(78, 0)`` and read as ``int``."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs["max_digits"] = 78
+        kwargs["decimal_places"] = 0
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        del kwargs["max_digits"]
+        del kwargs["decimal_places"]
+        return name, path, args, kwargs
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return int(value)
+
+
+class AddressField(models.CharField):
+    """Ethereum address, stored lower-case as emitted by the bulk decoder."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs["max_length"] = 42
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        del kwargs["max_length"]
+        return name, path, args, kwargs
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        return value.lower() if value else value
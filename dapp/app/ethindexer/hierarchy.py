@@ -0,0 +1,138 @@
+"""Mirror of the account tree of the ``Account`` contract.
+
+``AccountCreated`` events add an :class:`~app.ethindexer.models.AccountNode`
+and its rows of the :class:`~app.ethindexer.models.AccountPath` closure table;
+``AccountStatusUpdated`` events update its status.  The descendants of an
+account, its ancestors or the balances of its whole subtree are then each one
+indexed query, where the contract can only be walked one ``getAccount`` call
+at a time.
+
+The ``_uAcc`` emitted for sub-accounts is the zero address, so the root of
+an account is taken from the closure instead.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+from django.db.models import F, QuerySet, Sum
+
+from app.eth.decoder import EventBatch
+from app.ethindexer.fields import Uint256Field
+from app.ethindexer.models import AccountNode, AccountPath, Balance
+
+ZERO_ADDRESS = "0x" + "00" * 20
+
+
+def update_hierarchy(batches: Iterable[EventBatch], batch_size: int = 5000) -> int:
+    """Apply the account events of ``batches``; return the number of events applied.
+
+    Must run in the transaction storing the events.
+    """
+    by_event = {batch.event: batch for batch in batches}
+    count = 0
+    created = by_event.get("AccountCreated")
+    if created is not None and len(created):
+        count += _add_accounts(created, batch_size)
+    updated = by_event.get("AccountStatusUpdated")
+    if updated is not None and len(updated):
+        count += _update_statuses(updated, batch_size)
+    return count
+
+
+def _add_accounts(batch: EventBatch, batch_size: int) -> int:
+    accounts = batch["_acc"]
+    parents = batch["_pAcc"]
+    names = batch["_name"]
+    levels = batch["level"]
+    statuses = batch["_status"]
+
+    # account -> (ancestor, depth) of all its ancestors, itself included.
+    lineage: Dict[str, List[Tuple[str, int]]] = {}
+    known_parents = set(parents) - set(accounts) - {ZERO_ADDRESS}
+    for descendant, ancestor, depth in AccountPath.objects.filter(
+        descendant_id__in=known_parents
+    ).values_list("descendant_id", "ancestor_id", "depth"):
+        lineage.setdefault(descendant, []).append((ancestor, depth))
+
+    nodes, paths = [], []
+    for index in range(len(batch)):
+        account, parent = accounts[index], parents[index]
+        line = [(account, 0)]
+        if parent != ZERO_ADDRESS:
+            # Parents created before the first indexed block are unknown.
+            line += [
+                (ancestor, depth + 1) for ancestor, depth in lineage.get(parent, ())
+            ]
+        lineage[account] = line
+        root, _depth = max(line, key=lambda path: path[1])
+        nodes.append(
+            AccountNode(
+                contract=batch.address[index],
+                address=account,
+                parent=parent,
+                root=root,
+                name=names[index],
+                level=levels[index],
+                status=statuses[index],
+                block_number=batch.block_number[index],
+            )
+        )
+        paths.extend(
+            AccountPath(ancestor_id=ancestor, descendant_id=account, depth=depth)
+            for ancestor, depth in line
+        )
+    # Accounts already mirrored by an interrupted run are skipped.
+    AccountNode.objects.bulk_create(nodes, batch_size=batch_size, ignore_conflicts=True)
+    AccountPath.objects.bulk_create(paths, batch_size=batch_size, ignore_conflicts=True)
+    return len(nodes)
+
+
+def _update_statuses(batch: EventBatch, batch_size: int) -> int:
+    accounts = batch["_acc"]
+    statuses = batch["_status"]
+    # Logs are in chain order, so the last one of an account wins.
+    latest = {
+        accounts[index]: (batch.block_number[index], statuses[index])
+        for index in range(len(batch))
+    }
+    changed = []
+    for node in AccountNode.objects.select_for_update().filter(address__in=latest):
+        block_number, status = latest[node.address]
+        if block_number >= node.block_number:
+            node.status = status
+            node.block_number = block_number
+            changed.append(node)
+    AccountNode.objects.bulk_update(
+        changed, ["status", "block_number"], batch_size=batch_size
+    )
+    return len(changed)
+
+
+def descendants(address: str) -> QuerySet:
+    """Return every account below ``address``, with its ``depth`` below it."""
+    return AccountNode.objects.filter(
+        ancestor_paths__ancestor_id=address.lower(), ancestor_paths__depth__gt=0
+    ).annotate(depth=F("ancestor_paths__depth"))
+
+
+def ancestors(address: str) -> QuerySet:
+    """Return every account above ``address``, its parent first."""
+    return (
+        AccountNode.objects.filter(
+            descendant_paths__descendant_id=address.lower(),
+            descendant_paths__depth__gt=0,
+        )
+        .annotate(depth=F("descendant_paths__depth"))
+        .order_by("depth")
+    )
+
+
+def subtree_balances(address: str) -> QuerySet:
+    """Return the ``token_id`` and ``total`` held by ``address`` and its descendants."""
+    subtree = AccountPath.objects.filter(ancestor_id=address.lower()).values(
+        "descendant_id"
+    )
+    return (
+        Balance.objects.filter(owner__in=subtree, amount__gt=0)
+        .values("token_id")
+        .annotate(total=Sum("amount", output_field=Uint256Field()))
+        .order_by("token_id")
+    )
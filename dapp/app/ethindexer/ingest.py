@@ -0,0 +1,260 @@
+"""Ingestion of decoded contract events into the indexer tables.
+
+A :class:`ChainFollower` scans the logs of every indexed contract from its
+:class:`~app.ethindexer.models.Checkpoint` up to the last confirmed block,
+decodes them in bulk and writes each chunk of blocks with one ``bulk_create``
+per table.  The rows of a chunk, the balances, account tree and operators
+they change and the checkpoint moving past it are saved in the same
+transaction, so a follower can be stopped at any time and resumes exactly
+where it stopped.
+
+The balances of token contracts are also snapshotted at the end of the first
+chunk at least ``INDEXER_SNAPSHOT_INTERVAL`` blocks after the previous
+snapshot.  Their chunks are capped to that many blocks, which bounds the
+window of events :func:`~app.ethindexer.snapshots.balances_at` replays.
+"""
+import logging
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Type
+
+from django.conf import settings
+from django.db import models, transaction
+from eth_utils import to_checksum_address
+from web3 import Web3
+
+from app.eth.contracts import Account, Token
+from app.eth.decoder import EventBatch
+from app.eth.logs import LogScanner, wrapper_events
+from app.eth.registry import get_web3
+from app.ethindexer.balances import LEDGER_EVENTS, update_balances
+from app.ethindexer.hierarchy import update_hierarchy
+from app.ethindexer.operators import update_operators
+from app.ethindexer.models import (
+    AccountCreation,
+    AccountStatusUpdate,
+    Checkpoint,
+    OperatorChange,
+    TokenBurn,
+    TokenCreation,
+    TokenMint,
+    TokenTransfer,
+    TokenURI,
+)
+from app.ethindexer.snapshots import last_snapshot_block, take_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class EventTable(NamedTuple):
+    """Model an event is stored in, with the event argument of every field."""
+
+    model: Type[models.Model]
+    fields: Dict[str, str]
+    constants: Dict[str, object] = {}
+
+
+EVENT_TABLES: Dict[str, EventTable] = {
+    "TokenSent": EventTable(
+        TokenTransfer,
+        {
+            "operator": "operator",
+            "sender": "from",
+            "recipient": "to",
+            "token_id": "id",
+            "amount": "amount",
+            "data": "data",
+            "operator_data": "operatorData",
+        },
+    ),
+    "TokenMinted": EventTable(
+        TokenMint,
+        {
+            "operator": "operator",
+            "recipient": "to",
+            "token_id": "id",
+            "amount": "amount",
+            "data": "data",
+        },
+    ),
+    "TokenBurned": EventTable(
+        TokenBurn,
+        {
+            "operator": "operator",
+            "holder": "from",
+            "token_id": "id",
+            "amount": "amount",
+            "data": "data",
+            "operator_data": "operatorData",
+        },
+    ),
+    "TokenCreated": EventTable(
+        TokenCreation, {"creator": "creator", "token_id": "id", "data": "data"}
+    ),
+    "TokenURI": EventTable(TokenURI, {"token_id": "id", "value": "value"}),
+    "AccountCreated": EventTable(
+        AccountCreation,
+        {
+            "account": "_acc",
+            "parent": "_pAcc",
+            "root": "_uAcc",
+            "name": "_name",
+            "level": "level",
+            "status": "_status",
+        },
+    ),
+    "AccountStatusUpdated": EventTable(
+        AccountStatusUpdate, {"account": "_acc", "status": "_status"}
+    ),
+    "AuthorizedOperator": EventTable(
+        OperatorChange,
+        {"operator": "operator", "holder": "holder"},
+        {"authorized": True},
+    ),
+    "RevokedOperator": EventTable(
+        OperatorChange,
+        {"operator": "operator", "holder": "holder"},
+        {"authorized": False},
+    ),
+}
+
+
+def build_rows(batch: EventBatch) -> List[models.Model]:
+    """Return the unsaved rows storing the events of ``batch``."""
+    table = EVENT_TABLES[batch.event]
+    columns = [(field, batch[argument]) for field, argument in table.fields.items()]
+    return [
+        table.model(
+            contract=batch.address[index],
+            block_number=batch.block_number[index],
+            transaction_hash="0x" + batch.transaction_hash[index].hex(),
+            log_index=batch.log_index[index],
+            **{field: column[index] for field, column in columns},
+            **table.constants,
+        )
+        for index in range(len(batch))
+    ]
+
+
+def store(batches: Iterable[EventBatch], batch_size: int = 5000) -> int:
+    """Insert the events of ``batches`` and return how many were decoded."""
+    count = 0
+    for batch in batches:
+        if batch.event not in EVENT_TABLES or not len(batch):
+            continue
+        rows = build_rows(batch)
+        # Logs already stored by an interrupted run are skipped.
+        type(rows[0]).objects.bulk_create(
+            rows, batch_size=batch_size, ignore_conflicts=True
+        )
+        count += len(rows)
+    return count
+
+
+class ChainFollower:
+    """Follower of the events of the indexed contracts."""
+
+    def __init__(
+        self,
+        contracts: Optional[Iterable[Tuple[type, str]]] = None,
+        web3: Optional[Web3] = None,
+        start_block: Optional[int] = None,
+        confirmations: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        snapshot_interval: Optional[int] = None,
+    ):
+        """
+        :param contracts: ``(wrapper_class, address)`` pairs; defaults to the
+            ``Token`` and ``Account`` contracts of the settings
+        :param web3: defaults to the shared client of ``settings.WEB3_PROVIDER``
+        :param start_block: first block of a contract without checkpoint
+        :param confirmations: how many blocks the head is trailed by, so
+            that reorganized blocks are not ingested
+        :param batch_size: rows per ``INSERT``
+        :param snapshot_interval: blocks between two balance snapshots; 0
+            disables them
+        """
+        if contracts is None:
+            contracts = [
+                (Token, settings.CONTRACT_TOKEN_ADR),
+                (Account, settings.CONTRACT_ACCOUNT_ADR),
+            ]
+        self.web3 = web3 or get_web3()
+        self.start_block = (
+            settings.INDEXER_START_BLOCK if start_block is None else start_block
+        )
+        self.confirmations = (
+            settings.INDEXER_CONFIRMATIONS if confirmations is None else confirmations
+        )
+        self.batch_size = batch_size or settings.INDEXER_BATCH_SIZE
+        self.snapshot_interval = (
+            settings.INDEXER_SNAPSHOT_INTERVAL
+            if snapshot_interval is None
+            else snapshot_interval
+        )
+        self.scanners = {}
+        # Contracts whose balances are snapshotted.
+        self.ledgers = set()
+        for wrapper_class, address in contracts:
+            if not address:
+                continue
+            contract = to_checksum_address(address).lower()
+            options = {}
+            if self.snapshot_interval and LEDGER_EVENTS.keys() <= set(
+                wrapper_events(wrapper_class)
+            ):
+                self.ledgers.add(contract)
+                options["chunk_size"] = min(2000, self.snapshot_interval)
+                options["max_chunk_size"] = self.snapshot_interval
+            self.scanners[contract] = LogScanner(
+                self.web3, [(wrapper_class, address)], **options
+            )
+
+    def confirmed_block(self) -> int:
+        """Return the last block considered final."""
+        return self.web3.eth.blockNumber - self.confirmations
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """Ingest every contract up to ``to_block`` and return the events stored."""
+        if to_block is None:
+            to_block = self.confirmed_block()
+        count = 0
+        for contract, scanner in self.scanners.items():
+            checkpoint = Checkpoint.objects.filter(contract=contract).first()
+            from_block = checkpoint.block_number + 1 if checkpoint else self.start_block
+            snapshot_block = last_snapshot_block(contract)
+            if snapshot_block is None:
+                snapshot_block = from_block - 1
+                if contract in self.ledgers:
+                    # Seeds the snapshots, so no lookup replays the history.
+                    with transaction.atomic():
+                        take_snapshot(contract, snapshot_block, self.batch_size)
+            for chunk in scanner.scan_batches(from_block, to_block):
+                with transaction.atomic():
+                    stored = store(chunk.batches.values(), self.batch_size)
+                    update_balances(chunk.batches.values(), self.batch_size)
+                    update_hierarchy(chunk.batches.values(), self.batch_size)
+                    update_operators(chunk.batches.values(), self.batch_size)
+                    Checkpoint.objects.update_or_create(
+                        contract=contract, defaults={"block_number": chunk.end}
+                    )
+                    if (
+                        contract in self.ledgers
+                        and chunk.end - snapshot_block >= self.snapshot_interval
+                    ):
+                        take_snapshot(contract, chunk.end, self.batch_size)
+                        snapshot_block = chunk.end
+                count += stored
+                logger.info(
+                    "Indexed %s events of %s in blocks %s-%s",
+                    stored,
+                    contract,
+                    chunk.start,
+                    chunk.end,
+                )
+        return count
+
+    def follow(self, poll_interval: float = 5.0):
+        """Keep ingesting new blocks, forever."""
+        while True:
+            self.sync()
+            time.sleep(poll_interval)
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from app.ethindexer.ingest import ChainFollower
+
+
+class Command(BaseCommand):
+    help = "Ingest the events of the indexed contracts, then follow new blocks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once every confirmed block has been ingested.",
+        )
+        parser.add_argument(
+            "--from-block",
+            type=int,
+            help="First block of the contracts without checkpoint.",
+        )
+        parser.add_argument(
+            "--to-block", type=int, help="Last block to ingest (implies --once)."
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.INDEXER_POLL_INTERVAL,
+            help="Seconds between two looks at the head of the chain.",
+        )
+
+    def handle(self, *args, **options):
+        follower = ChainFollower(start_block=options["from_block"])
+        if options["once"] or options["to_block"] is not None:
+            count = follower.sync(options["to_block"])
+            self.stdout.write(self.style.SUCCESS(f"Indexed {count} events."))
+            return
+        follower.follow(options["poll_interval"])
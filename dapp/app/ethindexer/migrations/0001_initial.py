@@ -0,0 +1,202 @@
+# Generated by Django 3.0.8 on 2026-10-18 12:00
+
+import app.ethindexer.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Checkpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contract', app.ethindexer.fields.AddressField(unique=True)),
+                ('block_number', models.BigIntegerField()),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='updated')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AccountCreation',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('contract', app.ethindexer.fields.AddressField(db_index=True)),
+                ('block_number', models.BigIntegerField(db_index=True)),
+                ('transaction_hash', models.CharField(max_length=66)),
+                ('log_index', models.PositiveIntegerField()),
+                ('account', app.ethindexer.fields.AddressField(db_index=True)),
+                ('parent', app.ethindexer.fields.AddressField(db_index=True)),
+                ('root', app.ethindexer.fields.AddressField()),
+                ('name', models.TextField()),
+                ('level', models.PositiveIntegerField()),
+                ('status', models.PositiveSmallIntegerField(choices=[(0, 'not listed'), (1, 'active'), (2, 'suspended'), (3, 'blacklisted')])),
+            ],
+            options={
+                'ordering': ('block_number', 'log_index'),
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='AccountStatusUpdate',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('contract', app.ethindexer.fields.AddressField(db_index=True)),
+                ('block_number', models.BigIntegerField(db_index=True)),
+                ('transaction_hash', models.CharField(max_length=66)),
+                ('log_index', models.PositiveIntegerField()),
+                ('account', app.ethindexer.fields.AddressField(db_index=True)),
+                ('status', models.PositiveSmallIntegerField(choices=[(0, 'not listed'), (1, 'active'), (2, 'suspended'), (3, 'blacklisted')])),
+            ],
+            options={
+                'ordering': ('block_number', 'log_index'),
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='OperatorChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('contract', app.ethindexer.fields.AddressField(db_index=True)),
+                ('block_number', models.BigIntegerField(db_index=True)),
+                ('transaction_hash', models.CharField(max_length=66)),
+                ('log_index', models.PositiveIntegerField()),
+                ('operator', app.ethindexer.fields.AddressField(db_index=True)),
+                ('holder', app.ethindexer.fields.AddressField(db_index=True)),
+                ('authorized', models.BooleanField()),
+            ],
+            options={
+                'ordering': ('block_number', 'log_index'),
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TokenBurn',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('contract', app.ethindexer.fields.AddressField(db_index=True)),
+                ('block_number', models.BigIntegerField(db_index=True)),
+                ('transaction_hash', models.CharField(max_length=66)),
+                ('log_index', models.PositiveIntegerField()),
+                ('operator', app.ethindexer.fields.AddressField()),
+                ('holder', app.ethindexer.fields.AddressField(db_index=True)),
+                ('token_id', app.ethindexer.fields.Uint256Field(db_index=True)),
+                ('amount', app.ethindexer.fields.Uint256Field()),
+                ('data', models.BinaryField()),
+                ('operator_data', models.BinaryField()),
+            ],
+            options={
+                'ordering': ('block_number', 'log_index'),
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TokenCreation',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('contract', app.ethindexer.fields.AddressField(db_index=True)),
+                ('block_number', models.BigIntegerField(db_index=True)),
+                ('transaction_hash', models.CharField(max_length=66)),
+                ('log_index', models.PositiveIntegerField()),
+                ('creator', app.ethindexer.fields.AddressField(db_index=True)),
+                ('token_id', app.ethindexer.fields.Uint256Field(db_index=True)),
+                ('data', models.BinaryField()),
+            ],
+            options={
+                'ordering': ('block_number', 'log_index'),
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TokenMint',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('contract', app.ethindexer.fields.AddressField(db_index=True)),
+                ('block_number', models.BigIntegerField(db_index=True)),
+                ('transaction_hash', models.CharField(max_length=66)),
+                ('log_index', models.PositiveIntegerField()),
+                ('operator', app.ethindexer.fields.AddressField()),
+                ('recipient', app.ethindexer.fields.AddressField(db_index=True)),
+                ('token_id', app.ethindexer.fields.Uint256Field(db_index=True)),
+                ('amount', app.ethindexer.fields.Uint256Field()),
+                ('data', models.BinaryField()),
+            ],
+            options={
+                'ordering': ('block_number', 'log_index'),
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TokenTransfer',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('contract', app.ethindexer.fields.AddressField(db_index=True)),
+                ('block_number', models.BigIntegerField(db_index=True)),
+                ('transaction_hash', models.CharField(max_length=66)),
+                ('log_index', models.PositiveIntegerField()),
+                ('operator', app.ethindexer.fields.AddressField()),
+                ('sender', app.ethindexer.fields.AddressField(db_index=True)),
+                ('recipient', app.ethindexer.fields.AddressField(db_index=True)),
+                ('token_id', app.ethindexer.fields.Uint256Field(db_index=True)),
+                ('amount', app.ethindexer.fields.Uint256Field()),
+                ('data', models.BinaryField()),
+                ('operator_data', models.BinaryField()),
+            ],
+            options={
+                'ordering': ('block_number', 'log_index'),
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TokenURI',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('contract', app.ethindexer.fields.AddressField(db_index=True)),
+                ('block_number', models.BigIntegerField(db_index=True)),
+                ('transaction_hash', models.CharField(max_length=66)),
+                ('log_index', models.PositiveIntegerField()),
+                ('token_id', app.ethindexer.fields.Uint256Field(db_index=True)),
+                ('value', models.TextField()),
+            ],
+            options={
+                'ordering': ('block_number', 'log_index'),
+                'abstract': False,
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='accountcreation',
+            constraint=models.UniqueConstraint(fields=('transaction_hash', 'log_index'), name='ethindexer_accountcreation_unique_log'),
+        ),
+        migrations.AddConstraint(
+            model_name='accountstatusupdate',
+            constraint=models.UniqueConstraint(fields=('transaction_hash', 'log_index'), name='ethindexer_accountstatusupdate_unique_log'),
+        ),
+        migrations.AddConstraint(
+            model_name='operatorchange',
+            constraint=models.UniqueConstraint(fields=('transaction_hash', 'log_index'), name='ethindexer_operatorchange_unique_log'),
+        ),
+        migrations.AddConstraint(
+            model_name='tokenburn',
+            constraint=models.UniqueConstraint(fields=('transaction_hash', 'log_index'), name='ethindexer_tokenburn_unique_log'),
+        ),
+        migrations.AddConstraint(
+            model_name='tokencreation',
+            constraint=models.UniqueConstraint(fields=('transaction_hash', 'log_index'), name='ethindexer_tokencreation_unique_log'),
+        ),
+        migrations.AddConstraint(
+            model_name='tokenmint',
+            constraint=models.UniqueConstraint(fields=('transaction_hash', 'log_index'), name='ethindexer_tokenmint_unique_log'),
+        ),
+        migrations.AddConstraint(
+            model_name='tokentransfer',
+            constraint=models.UniqueConstraint(fields=('transaction_hash', 'log_index'), name='ethindexer_tokentransfer_unique_log'),
+        ),
+        migrations.AddConstraint(
+            model_name='tokenuri',
+            constraint=models.UniqueConstraint(fields=('transaction_hash', 'log_index'), name='ethindexer_tokenuri_unique_log'),
+        ),
+    ]
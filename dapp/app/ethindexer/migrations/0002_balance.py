@@ -0,0 +1,86 @@
+# Generated by Django 3.0.8 on 2026-10-18 12:00
+
+from collections import defaultdict
+
+import app.ethindexer.fields
+from django.db import migrations, models
+from django.db.models import Sum
+
+from app.eth.tokenid import get_non_fungible_base_type, is_non_fungible_item
+
+# (model, owner field, sign) of every balance change stored in the event tables.
+LEDGER_TABLES = (
+    ("TokenMint", "recipient", 1),
+    ("TokenTransfer", "sender", -1),
+    ("TokenTransfer", "recipient", 1),
+    ("TokenBurn", "holder", -1),
+)
+
+
+def backfill_balances(apps, schema_editor):
+    """Sum the ledger events indexed before the table existed into balances.
+
+    The rows hold every event up to the checkpoint of their contract, which
+    the follower resumes after.
+    """
+    Balance = apps.get_model("ethindexer", "Balance")
+    Checkpoint = apps.get_model("ethindexer", "Checkpoint")
+    totals = defaultdict(int)
+    for model_name, owner_field, sign in LEDGER_TABLES:
+        model = apps.get_model("ethindexer", model_name)
+        changes = (
+            model.objects.values("contract", owner_field, "token_id")
+            .annotate(
+                total=Sum("amount", output_field=app.ethindexer.fields.Uint256Field())
+            )
+            .values_list("contract", owner_field, "token_id", "total")
+            .order_by()
+        )
+        for contract, owner, token_id, total in changes.iterator():
+            totals[(contract, owner, token_id)] += sign * total
+            if is_non_fungible_item(token_id):
+                base_type = get_non_fungible_base_type(token_id)
+                totals[(contract, owner, base_type)] += sign * total
+    checkpoints = dict(Checkpoint.objects.values_list("contract", "block_number"))
+    Balance.objects.bulk_create(
+        [
+            Balance(
+                contract=contract,
+                owner=owner,
+                token_id=token_id,
+                amount=amount,
+                block_number=checkpoints.get(contract, -1),
+            )
+            for (contract, owner, token_id), amount in totals.items()
+        ],
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ethindexer', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Balance',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contract', app.ethindexer.fields.AddressField()),
+                ('owner', app.ethindexer.fields.AddressField()),
+                ('token_id', app.ethindexer.fields.Uint256Field(db_index=True)),
+                ('amount', app.ethindexer.fields.Uint256Field(default=0)),
+                ('block_number', models.BigIntegerField()),
+            ],
+            options={
+                'ordering': ('token_id', 'owner'),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='balance',
+            constraint=models.UniqueConstraint(fields=('owner', 'token_id', 'contract'), name='ethindexer_balance_unique_holding'),
+        ),
+        migrations.RunPython(backfill_balances, migrations.RunPython.noop),
+    ]
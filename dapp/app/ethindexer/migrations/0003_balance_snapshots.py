@@ -0,0 +1,61 @@
+# Generated by Django 3.0.8 on 2026-10-18 12:00
+
+import app.ethindexer.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ethindexer', '0002_balance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BalanceSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contract', app.ethindexer.fields.AddressField()),
+                ('block_number', models.BigIntegerField()),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='created')),
+            ],
+            options={
+                'ordering': ('contract', 'block_number'),
+            },
+        ),
+        migrations.CreateModel(
+            name='SnapshotBalance',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('owner', app.ethindexer.fields.AddressField()),
+                ('token_id', app.ethindexer.fields.Uint256Field()),
+                ('amount', app.ethindexer.fields.Uint256Field()),
+                ('snapshot', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balances', to='ethindexer.BalanceSnapshot')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='tokentransfer',
+            index=models.Index(fields=['sender', 'block_number'], name='ethindexer_transfer_sender_blk'),
+        ),
+        migrations.AddIndex(
+            model_name='tokentransfer',
+            index=models.Index(fields=['recipient', 'block_number'], name='ethindexer_transfer_recip_blk'),
+        ),
+        migrations.AddIndex(
+            model_name='tokenmint',
+            index=models.Index(fields=['recipient', 'block_number'], name='ethindexer_mint_recip_blk'),
+        ),
+        migrations.AddIndex(
+            model_name='tokenburn',
+            index=models.Index(fields=['holder', 'block_number'], name='ethindexer_burn_holder_blk'),
+        ),
+        migrations.AddIndex(
+            model_name='snapshotbalance',
+            index=models.Index(fields=['snapshot', 'owner'], name='ethindexer_snapbal_owner_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='balancesnapshot',
+            constraint=models.UniqueConstraint(fields=('contract', 'block_number'), name='ethindexer_balancesnapshot_unique_block'),
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 3.0.8 on 2026-10-18 12:00
+
+import app.ethindexer.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+ZERO_ADDRESS = "0x" + "00" * 20
+
+
+def backfill_hierarchy(apps, schema_editor):
+    """Mirror the accounts indexed before the tables existed."""
+    AccountCreation = apps.get_model("ethindexer", "AccountCreation")
+    AccountStatusUpdate = apps.get_model("ethindexer", "AccountStatusUpdate")
+    AccountNode = apps.get_model("ethindexer", "AccountNode")
+    AccountPath = apps.get_model("ethindexer", "AccountPath")
+
+    # account -> (ancestor, depth) of all its ancestors, itself included.
+    lineage = {}
+    nodes = {}
+    for creation in AccountCreation.objects.order_by(
+        "block_number", "log_index"
+    ).iterator():
+        line = [(creation.account, 0)]
+        if creation.parent != ZERO_ADDRESS:
+            line += [
+                (ancestor, depth + 1)
+                for ancestor, depth in lineage.get(creation.parent, ())
+            ]
+        lineage[creation.account] = line
+        root, _depth = max(line, key=lambda path: path[1])
+        nodes[creation.account] = AccountNode(
+            contract=creation.contract,
+            address=creation.account,
+            parent=creation.parent,
+            root=root,
+            name=creation.name,
+            level=creation.level,
+            status=creation.status,
+            block_number=creation.block_number,
+        )
+    for update in AccountStatusUpdate.objects.order_by(
+        "block_number", "log_index"
+    ).iterator():
+        node = nodes.get(update.account)
+        if node is not None:
+            node.status = update.status
+            node.block_number = update.block_number
+    AccountNode.objects.bulk_create(nodes.values(), batch_size=5000)
+    AccountPath.objects.bulk_create(
+        [
+            AccountPath(ancestor_id=ancestor, descendant_id=account, depth=depth)
+            for account, line in lineage.items()
+            for ancestor, depth in line
+        ],
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ethindexer', '0003_balance_snapshots'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountNode',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contract', app.ethindexer.fields.AddressField()),
+                ('address', app.ethindexer.fields.AddressField(unique=True)),
+                ('parent', app.ethindexer.fields.AddressField(db_index=True)),
+                ('root', app.ethindexer.fields.AddressField(db_index=True)),
+                ('name', models.TextField()),
+                ('level', models.PositiveIntegerField()),
+                ('status', models.PositiveSmallIntegerField(choices=[(0, 'not listed'), (1, 'active'), (2, 'suspended'), (3, 'blacklisted')])),
+                ('block_number', models.BigIntegerField()),
+            ],
+            options={
+                'ordering': ('root', 'level', 'address'),
+            },
+        ),
+        migrations.CreateModel(
+            name='AccountPath',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveIntegerField()),
+                ('ancestor', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='descendant_paths', to='ethindexer.AccountNode', to_field='address')),
+                ('descendant', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_paths', to='ethindexer.AccountNode', to_field='address')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='accountpath',
+            index=models.Index(fields=['descendant', 'depth'], name='ethindexer_path_ancestors_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='accountpath',
+            constraint=models.UniqueConstraint(fields=('ancestor', 'descendant'), name='ethindexer_accountpath_unique_path'),
+        ),
+        migrations.RunPython(backfill_hierarchy, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 3.0.8 on 2026-10-18 12:00
+
+import app.ethindexer.fields
+from django.db import migrations, models
+
+
+def backfill_grants(apps, schema_editor):
+    """Keep the last operator change of every pair indexed before the table existed."""
+    OperatorChange = apps.get_model("ethindexer", "OperatorChange")
+    OperatorGrant = apps.get_model("ethindexer", "OperatorGrant")
+    latest = {}
+    for change in OperatorChange.objects.order_by("block_number", "log_index").iterator():
+        latest[(change.contract, change.operator, change.holder)] = change
+    OperatorGrant.objects.bulk_create(
+        [
+            OperatorGrant(
+                contract=change.contract,
+                operator=change.operator,
+                holder=change.holder,
+                authorized=change.authorized,
+                block_number=change.block_number,
+            )
+            for change in latest.values()
+        ],
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ethindexer', '0004_account_hierarchy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OperatorGrant',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contract', app.ethindexer.fields.AddressField()),
+                ('operator', app.ethindexer.fields.AddressField()),
+                ('holder', app.ethindexer.fields.AddressField(db_index=True)),
+                ('authorized', models.BooleanField()),
+                ('block_number', models.BigIntegerField(db_index=True)),
+            ],
+            options={
+                'ordering': ('operator', 'holder'),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='operatorgrant',
+            constraint=models.UniqueConstraint(fields=('operator', 'holder', 'contract'), name='ethindexer_operatorgrant_unique_pair'),
+        ),
+        migrations.RunPython(backfill_grants, migrations.RunPython.noop),
+    ]
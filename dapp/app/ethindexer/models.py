@@ -0,0 +1,298 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from app.ethindexer.fields import AddressField, Uint256Field
+
+
+class AccountStatus(models.IntegerChoices):
+    NOT_LISTED = 0, _("not listed")
+    ACTIVE = 1, _("active")
+    SUSPENDED = 2, _("suspended")
+    BLACKLISTED = 3, _("blacklisted")
+
+
+class ChainEvent(models.Model):
+    """Log emitted by an indexed contract.
+
+    ``(transaction_hash, log_index)`` identifies a log, which makes ingesting
+    the same range twice harmless.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    contract = AddressField(db_index=True)
+    block_number = models.BigIntegerField(db_index=True)
+    transaction_hash = models.CharField(max_length=66)
+    log_index = models.PositiveIntegerField()
+
+    class Meta:
+        abstract = True
+        ordering = ("block_number", "log_index")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["transaction_hash", "log_index"],
+                name="%(app_label)s_%(class)s_unique_log",
+            )
+        ]
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.transaction_hash}:{self.log_index}>"
+
+
+class TokenTransfer(ChainEvent):
+    """``TokenSent``."""
+
+    operator = AddressField()
+    sender = AddressField(db_index=True)
+    recipient = AddressField(db_index=True)
+    token_id = Uint256Field(db_index=True)
+    amount = Uint256Field()
+    data = models.BinaryField()
+    operator_data = models.BinaryField()
+
+    class Meta(ChainEvent.Meta):
+        # Replay of the balance changes of an owner over a window of blocks.
+        indexes = [
+            models.Index(
+                fields=["sender", "block_number"], name="ethindexer_transfer_sender_blk"
+            ),
+            models.Index(
+                fields=["recipient", "block_number"],
+                name="ethindexer_transfer_recip_blk",
+            ),
+        ]
+
+
+class TokenMint(ChainEvent):
+    """``TokenMinted``."""
+
+    operator = AddressField()
+    recipient = AddressField(db_index=True)
+    token_id = Uint256Field(db_index=True)
+    amount = Uint256Field()
+    data = models.BinaryField()
+
+    class Meta(ChainEvent.Meta):
+        indexes = [
+            models.Index(
+                fields=["recipient", "block_number"], name="ethindexer_mint_recip_blk"
+            )
+        ]
+
+
+class TokenBurn(ChainEvent):
+    """``TokenBurned``."""
+
+    operator = AddressField()
+    holder = AddressField(db_index=True)
+    token_id = Uint256Field(db_index=True)
+    amount = Uint256Field()
+    data = models.BinaryField()
+    operator_data = models.BinaryField()
+
+    class Meta(ChainEvent.Meta):
+        indexes = [
+            models.Index(
+                fields=["holder", "block_number"], name="ethindexer_burn_holder_blk"
+            )
+        ]
+
+
+class TokenCreation(ChainEvent):
+    """``TokenCreated``."""
+
+    creator = AddressField(db_index=True)
+    token_id = Uint256Field(db_index=True)
+    data = models.BinaryField()
+
+
+class TokenURI(ChainEvent):
+    """``TokenURI``."""
+
+    token_id = Uint256Field(db_index=True)
+    value = models.TextField()
+
+
+class AccountCreation(ChainEvent):
+    """``AccountCreated``."""
+
+    account = AddressField(db_index=True)
+    parent = AddressField(db_index=True)
+    root = AddressField()
+    name = models.TextField()
+    level = models.PositiveIntegerField()
+    status = models.PositiveSmallIntegerField(choices=AccountStatus.choices)
+
+
+class AccountStatusUpdate(ChainEvent):
+    """``AccountStatusUpdated``."""
+
+    account = AddressField(db_index=True)
+    status = models.PositiveSmallIntegerField(choices=AccountStatus.choices)
+
+
+class OperatorChange(ChainEvent):
+    """``AuthorizedOperator`` (``authorized``) or ``RevokedOperator``."""
+
+    operator = AddressField(db_index=True)
+    holder = AddressField(db_index=True)
+    authorized = models.BooleanField()
+
+
+class Checkpoint(models.Model):
+    """Last block of a contract whose events have all been ingested."""
+
+    contract = AddressField(unique=True)
+    block_number = models.BigIntegerField()
+    updated = models.DateTimeField(auto_now=True, verbose_name=_("updated"))
+
+    def __str__(self):
+        return f"{self.contract}@{self.block_number}"
+
+
+class Balance(models.Model):
+    """Balance of a token id held by an owner, maintained from the ledger events.
+
+    Mirrors ``balances[id][owner]`` of ``Token.sol``: non-fungible items have
+    a balance of 0 or 1 and their base type counts the items held.
+    ``block_number`` is the last block whose events changed the row.
+    """
+
+    contract = AddressField()
+    owner = AddressField()
+    token_id = Uint256Field(db_index=True)
+    amount = Uint256Field(default=0)
+    block_number = models.BigIntegerField()
+
+    class Meta:
+        ordering = ("token_id", "owner")
+        constraints = [
+            # Also the index of the balances of an owner.
+            models.UniqueConstraint(
+                fields=["owner", "token_id", "contract"],
+                name="%(app_label)s_%(class)s_unique_holding",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.owner}: {self.amount} of {self.token_id}"
+
+
+class BalanceSnapshot(models.Model):
+    """Every non-zero balance of a token contract at the end of ``block_number``."""
+
+    contract = AddressField()
+    block_number = models.BigIntegerField()
+    created = models.DateTimeField(auto_now_add=True, verbose_name=_("created"))
+
+    class Meta:
+        ordering = ("contract", "block_number")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["contract", "block_number"],
+                name="%(app_label)s_%(class)s_unique_block",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.contract}@{self.block_number}"
+
+
+class SnapshotBalance(models.Model):
+    """Balance held in a :class:`BalanceSnapshot`."""
+
+    snapshot = models.ForeignKey(
+        BalanceSnapshot, on_delete=models.CASCADE, related_name="balances"
+    )
+    owner = AddressField()
+    token_id = Uint256Field()
+    amount = Uint256Field()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["snapshot", "owner"], name="ethindexer_snapbal_owner_idx"
+            )
+        ]
+
+
+class AccountNode(models.Model):
+    """Account of the ``Account`` contract tree, mirrored from its events."""
+
+    contract = AddressField()
+    address = AddressField(unique=True)
+    # Zero address for the roots.
+    parent = AddressField(db_index=True)
+    root = AddressField(db_index=True)
+    name = models.TextField()
+    level = models.PositiveIntegerField()
+    status = models.PositiveSmallIntegerField(choices=AccountStatus.choices)
+    # Last block whose events changed the row.
+    block_number = models.BigIntegerField()
+
+    class Meta:
+        ordering = ("root", "level", "address")
+
+    def __str__(self):
+        return self.name
+
+
+class AccountPath(models.Model):
+    """Closure of the account tree: one row per ancestor of every account.
+
+    Every account is its own ancestor at ``depth`` 0, so the subtree of ``U``
+    is ``AccountPath.objects.filter(ancestor=U)``.
+    """
+
+    ancestor = models.ForeignKey(
+        AccountNode,
+        to_field="address",
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name="descendant_paths",
+    )
+    descendant = models.ForeignKey(
+        AccountNode,
+        to_field="address",
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name="ancestor_paths",
+    )
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            # Also the index of the subtree of an account.
+            models.UniqueConstraint(
+                fields=["ancestor", "descendant"],
+                name="%(app_label)s_%(class)s_unique_path",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["descendant", "depth"], name="ethindexer_path_ancestors_idx"
+            )
+        ]
+
+
+class OperatorGrant(models.Model):
+    """Whether ``operator`` may act for ``holder``, as of ``block_number``."""
+
+    contract = AddressField()
+    operator = AddressField()
+    holder = AddressField(db_index=True)
+    authorized = models.BooleanField()
+    # Last block whose events changed the row.
+    block_number = models.BigIntegerField(db_index=True)
+
+    class Meta:
+        ordering = ("operator", "holder")
+        constraints = [
+            # Also the index of the holders an operator may act for.
+            models.UniqueConstraint(
+                fields=["operator", "holder", "contract"],
+                name="%(app_label)s_%(class)s_unique_pair",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.operator} for {self.holder}: {self.authorized}"
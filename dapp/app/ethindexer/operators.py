@@ -0,0 +1,177 @@
+"""Operator authorizations of the ``Account`` contract, without RPC.
+
+The chain follower keeps one :class:`~app.ethindexer.models.OperatorGrant`
+per (operator, holder) pair from the ``AuthorizedOperator`` and
+``RevokedOperator`` events.  Every worker then holds the authorized pairs in
+an :class:`OperatorIndex`, which answers ``isOperatorFor`` with a set lookup
+and only reads the grants changed by the blocks indexed since its last
+refresh::
+
+    index = get_operator_index()
+    index.is_operator_for(operator, holder)
+    index.check_many([(operator, holder), ...])
+"""
+import threading
+import time
+from collections import defaultdict
+from typing import DefaultDict, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+
+from app.eth.decoder import EventBatch
+from app.ethindexer.models import Checkpoint, OperatorGrant
+
+Pair = Tuple[str, str]  # (operator, holder)
+
+
+def update_operators(batches: Iterable[EventBatch], batch_size: int = 5000) -> int:
+    """Apply the operator events of ``batches``; return the number of pairs changed.
+
+    Must run in the transaction storing the events.
+    """
+    # (contract, operator, holder) -> (block number, log index, authorized)
+    latest: Dict[Tuple[str, str, str], Tuple[int, int, bool]] = {}
+    for batch in batches:
+        if batch.event == "AuthorizedOperator":
+            authorized = True
+        elif batch.event == "RevokedOperator":
+            authorized = False
+        else:
+            continue
+        operators = batch["operator"]
+        holders = batch["holder"]
+        for index in range(len(batch)):
+            key = (batch.address[index], operators[index], holders[index])
+            change = (batch.block_number[index], batch.log_index[index], authorized)
+            if key not in latest or latest[key] < change:
+                latest[key] = change
+    if not latest:
+        return 0
+
+    existing = {
+        (grant.contract, grant.operator, grant.holder): grant
+        for grant in OperatorGrant.objects.select_for_update().filter(
+            operator__in={operator for _contract, operator, _holder in latest},
+            holder__in={holder for _contract, _operator, holder in latest},
+        )
+    }
+    created, updated = [], []
+    for key, (block_number, _log_index, authorized) in latest.items():
+        contract, operator, holder = key
+        grant = existing.get(key)
+        if grant is None:
+            created.append(
+                OperatorGrant(
+                    contract=contract,
+                    operator=operator,
+                    holder=holder,
+                    authorized=authorized,
+                    block_number=block_number,
+                )
+            )
+        elif block_number >= grant.block_number:
+            grant.authorized = authorized
+            grant.block_number = block_number
+            updated.append(grant)
+    OperatorGrant.objects.bulk_create(created, batch_size=batch_size)
+    OperatorGrant.objects.bulk_update(
+        updated, ["authorized", "block_number"], batch_size=batch_size
+    )
+    return len(created) + len(updated)
+
+
+class OperatorIndex:
+    """In-memory set of the authorized (operator, holder) pairs of a contract."""
+
+    def __init__(self, contract: str, interval: float = 1.0):
+        """
+        :param contract: address of the ``Account`` contract
+        :param interval: how often the indexed blocks are polled, in seconds
+        """
+        self.contract = contract.lower()
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._pairs: Set[Pair] = set()
+        self._holders: DefaultDict[str, Set[str]] = defaultdict(set)
+        # Last indexed block the pairs hold at.
+        self.block_number = -1
+        self._checked_at: Optional[float] = None
+
+    def refresh(self, force: bool = False):
+        """Load the grants changed since the last refresh, if any block was indexed.
+
+        :param force: refresh even if the blocks were polled less than
+            ``interval`` seconds ago
+        """
+        if not force and not self._stale():
+            return
+        with self._lock:
+            if not force and not self._stale():
+                return
+            checkpoint = (
+                Checkpoint.objects.filter(contract=self.contract)
+                .values_list("block_number", flat=True)
+                .first()
+            )
+            if checkpoint is not None and checkpoint > self.block_number:
+                # The grants of a block are committed with its checkpoint.
+                changes = OperatorGrant.objects.filter(
+                    contract=self.contract,
+                    block_number__gt=self.block_number,
+                    block_number__lte=checkpoint,
+                ).values_list("operator", "holder", "authorized")
+                for operator, holder, authorized in changes.iterator():
+                    if authorized:
+                        self._pairs.add((operator, holder))
+                        self._holders[operator].add(holder)
+                    else:
+                        self._pairs.discard((operator, holder))
+                        self._holders[operator].discard(holder)
+                self.block_number = checkpoint
+            self._checked_at = time.monotonic()
+
+    def _stale(self) -> bool:
+        return (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at >= self.interval
+        )
+
+    def is_operator_for(self, operator: str, holder: str) -> bool:
+        """Whether ``operator`` may send and burn the tokens of ``holder``."""
+        self.refresh()
+        return (operator.lower(), holder.lower()) in self._pairs
+
+    def holders_of(self, operator: str) -> FrozenSet[str]:
+        """Return every holder ``operator`` may act for."""
+        self.refresh()
+        # A refresh may be adding to the set meanwhile.
+        with self._lock:
+            return frozenset(self._holders.get(operator.lower(), ()))
+
+    def check_many(self, pairs: Iterable[Pair]) -> List[bool]:
+        """Return :meth:`is_operator_for` of every ``(operator, holder)`` pair."""
+        self.refresh()
+        known = self._pairs
+        return [
+            (operator.lower(), holder.lower()) in known for operator, holder in pairs
+        ]
+
+
+_indexes: Dict[str, OperatorIndex] = {}
+_lock = threading.Lock()
+
+
+def get_operator_index(contract: Optional[str] = None) -> OperatorIndex:
+    """Return the :class:`OperatorIndex` of the worker for ``contract``.
+
+    :param contract: defaults to ``settings.CONTRACT_ACCOUNT_ADR``
+    """
+    contract = (contract or settings.CONTRACT_ACCOUNT_ADR).lower()
+    index = _indexes.get(contract)
+    if index is None:
+        with _lock:
+            index = _indexes.get(contract)
+            if index is None:
+                index = OperatorIndex(contract, settings.WEB3_HEAD_POLL_INTERVAL)
+                _indexes[contract] = index
+    return index
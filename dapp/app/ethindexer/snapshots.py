@@ -0,0 +1,121 @@
+"""Balances at past blocks, from periodic snapshots and the ledger events.
+
+The chain follower copies the :class:`~app.ethindexer.models.Balance` table
+of a token contract into a :class:`~app.ethindexer.models.BalanceSnapshot`
+about every ``INDEXER_SNAPSHOT_INTERVAL`` blocks.  The balances of an owner
+at block ``B`` are those of the last snapshot at or before ``B``, plus the
+deltas of the ``TokenMinted``, ``TokenSent`` and ``TokenBurned`` events
+after it, replayed in memory.  The first snapshot is taken right before the
+first block indexed, so the replay never spans more than two intervals of
+blocks and the cost of a lookup does not grow with history.
+"""
+from collections import defaultdict
+from typing import DefaultDict, Dict, Optional
+
+from django.conf import settings
+from django.db.models import Max
+
+from app.eth.tokenid import get_non_fungible_base_type, is_non_fungible_item
+from app.ethindexer.models import (
+    Balance,
+    BalanceSnapshot,
+    Checkpoint,
+    SnapshotBalance,
+    TokenBurn,
+    TokenMint,
+    TokenTransfer,
+)
+
+# (model, owner field, sign) of every balance change stored in the event tables.
+LEDGER_TABLES = (
+    (TokenMint, "recipient", 1),
+    (TokenTransfer, "sender", -1),
+    (TokenTransfer, "recipient", 1),
+    (TokenBurn, "holder", -1),
+)
+
+
+def last_snapshot_block(contract: str) -> Optional[int]:
+    """Return the block of the last snapshot of ``contract``, if any."""
+    return BalanceSnapshot.objects.filter(contract=contract).aggregate(
+        block=Max("block_number")
+    )["block"]
+
+
+def take_snapshot(
+    contract: str, block_number: int, batch_size: int = 5000
+) -> BalanceSnapshot:
+    """Copy the current balances of ``contract`` as of the end of ``block_number``.
+
+    Must run in the transaction that brought the balances to ``block_number``.
+    """
+    snapshot = BalanceSnapshot.objects.create(
+        contract=contract, block_number=block_number
+    )
+    balances = (
+        Balance.objects.filter(contract=contract, amount__gt=0)
+        .values_list("owner", "token_id", "amount")
+        .order_by()
+    )
+    rows = [
+        SnapshotBalance(
+            snapshot=snapshot, owner=owner, token_id=token_id, amount=amount
+        )
+        for owner, token_id, amount in balances.iterator(chunk_size=batch_size)
+    ]
+    SnapshotBalance.objects.bulk_create(rows, batch_size=batch_size)
+    return snapshot
+
+
+def balances_at(
+    owner: str, block_number: int, contract: Optional[str] = None
+) -> Dict[int, int]:
+    """Return the non-zero balances of ``owner`` at the end of ``block_number``.
+
+    :param owner: address of the holder
+    :param block_number: block the balances are read at
+    :param contract: token contract; defaults to ``settings.CONTRACT_TOKEN_ADR``
+    :return: token id -> balance
+    :raises ValueError: when ``block_number`` has not been indexed yet, or
+        precedes the first snapshot
+    """
+    contract = (contract or settings.CONTRACT_TOKEN_ADR).lower()
+    owner = owner.lower()
+    checkpoint = Checkpoint.objects.filter(contract=contract).first()
+    if checkpoint is None or checkpoint.block_number < block_number:
+        raise ValueError(f"Block {block_number} of {contract} is not indexed yet")
+
+    balances: DefaultDict[int, int] = defaultdict(int)
+    snapshot = (
+        BalanceSnapshot.objects.filter(
+            contract=contract, block_number__lte=block_number
+        )
+        .order_by("-block_number")
+        .first()
+    )
+    after = -1
+    if snapshot is None:
+        # Only contracts indexed without snapshots are replayed from the start.
+        if BalanceSnapshot.objects.filter(contract=contract).exists():
+            raise ValueError(
+                f"Block {block_number} of {contract} precedes its first snapshot"
+            )
+    else:
+        after = snapshot.block_number
+        for token_id, amount in snapshot.balances.filter(owner=owner).values_list(
+            "token_id", "amount"
+        ):
+            balances[token_id] = amount
+
+    for model, owner_field, sign in LEDGER_TABLES:
+        changes = model.objects.filter(
+            contract=contract,
+            block_number__gt=after,
+            block_number__lte=block_number,
+            **{owner_field: owner},
+        ).values_list("token_id", "amount")
+        for token_id, amount in changes:
+            balances[token_id] += sign * amount
+            if is_non_fungible_item(token_id):
+                balances[get_non_fungible_base_type(token_id)] += sign * amount
+    return {token_id: amount for token_id, amount in balances.items() if amount}
@@ -0,0 +1,99 @@
+"""Pre-flight state read from the indexer tables.
+
+:class:`IndexedState` answers the questions of
+:class:`~app.eth.preflight.ImplementationValidator` without RPC: facts that
+never change once on chain (creators, granularity) are kept in memory,
+operators come from the in-memory :class:`~app.ethindexer.operators.OperatorIndex`
+and account statuses and balances are one indexed lookup each.
+
+The indexer trails the head by ``settings.INDEXER_CONFIRMATIONS`` blocks, and
+the state counts as synced while the checkpoints of both contracts are that
+close to the head.  Account statuses, operators and balances are then those
+of a block up to ``INDEXER_CONFIRMATIONS`` blocks old: a transaction spending
+tokens received, or sent from an account activated, in the newer blocks is
+rejected, and one relying on tokens spent in them still reverts on chain.
+Whether the state is synced is checked once per head block.
+"""
+import threading
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+from django.conf import settings
+
+from app.eth.cache import get_read_cache
+from app.eth.contracts import Token
+from app.eth.preflight import PreflightState
+from app.eth.registry import get_contract, get_web3
+from app.ethindexer.models import (
+    AccountNode,
+    AccountStatus,
+    Balance,
+    Checkpoint,
+    TokenCreation,
+)
+from app.ethindexer.operators import get_operator_index
+
+
+class IndexedState(PreflightState):
+    """State of the token and account contracts of the settings, as indexed."""
+
+    def __init__(self):
+        self.token_address = settings.CONTRACT_TOKEN_ADR.lower()
+        self.account_address = settings.CONTRACT_ACCOUNT_ADR.lower()
+        self._granularity: Optional[int] = None
+        self._creators: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        # Head block number and whether the state was synced with it.
+        self._synced_at: Optional[Tuple[int, bool]] = None
+
+    def synced(self) -> bool:
+        head = get_read_cache(get_web3()).head.block_number()
+        synced_at = self._synced_at
+        if synced_at is None or synced_at[0] != head:
+            synced_at = self._synced_at = (head, self._indexed_to(head))
+        return synced_at[1]
+
+    def _indexed_to(self, head: int) -> bool:
+        """Whether both contracts are indexed up to the block confirmed at ``head``."""
+        contracts = [self.token_address, self.account_address]
+        indexed = Checkpoint.objects.filter(contract__in=contracts).values_list(
+            "block_number", flat=True
+        )
+        if len(indexed) < len(contracts):
+            return False
+        return min(indexed) >= head - settings.INDEXER_CONFIRMATIONS
+
+    def granularity(self) -> int:
+        if self._granularity is None:
+            token = get_contract(Token, settings.CONTRACT_TOKEN_ADR).cached()
+            self._granularity = token.granularity.call()
+        return self._granularity
+
+    def creator(self, token_id: int) -> Optional[str]:
+        creator = self._creators.get(token_id)
+        if creator is None:
+            creator = (
+                TokenCreation.objects.filter(
+                    contract=self.token_address, token_id=token_id
+                )
+                .values_list("creator", flat=True)
+                .first()
+            )
+            if creator is not None:
+                with self._lock:
+                    self._creators[token_id] = creator
+        return creator
+
+    def is_active(self, account: str) -> bool:
+        return AccountNode.objects.filter(
+            address=account, status=AccountStatus.ACTIVE
+        ).exists()
+
+    def is_operator_for(self, operator: str, holder: str) -> bool:
+        return get_operator_index().is_operator_for(operator, holder)
+
+    def balances(self, owner: str, token_ids: Sequence[int]) -> Mapping[int, int]:
+        return dict(
+            Balance.objects.filter(
+                contract=self.token_address, owner=owner, token_id__in=token_ids
+            ).values_list("token_id", "amount")
+        )
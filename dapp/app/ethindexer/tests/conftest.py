@@ -0,0 +1,24 @@
+import pytest
+
+from app.ethindexer.ingest import ChainFollower
+
+
+@pytest.fixture
+def follower(settings, w3, contracts) -> ChainFollower:
+    """Follower of ``contracts`` up to the head, without snapshots."""
+    settings.CONTRACT_TOKEN_ADR = contracts.token.address
+    settings.CONTRACT_ACCOUNT_ADR = contracts.account.address
+    return ChainFollower(web3=w3, start_block=0, confirmations=0, snapshot_interval=0)
+
+
+@pytest.fixture
+def create_token(contracts, transact):
+    """Return a function creating a token type and returning its id."""
+
+    def create(non_fungible: bool = False, uri: str = "") -> int:
+        function = contracts.implementation.functions.create(uri, non_fungible, b"")
+        receipt = transact(function)
+        (created,) = contracts.token.events.TokenCreated().processReceipt(receipt)
+        return created.args.id
+
+    return create
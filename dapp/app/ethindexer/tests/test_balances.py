@@ -0,0 +1,104 @@
+import importlib
+
+import pytest
+from django.apps import apps
+from eth_utils import to_checksum_address
+
+from app.eth.contracts import Token
+from app.eth.logs import LogScanner
+from app.ethindexer.balances import collect_deltas, update_balances
+from app.ethindexer.models import Balance
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def ledger(w3, contracts, transact, create_token):
+    """Mint, send and burn fungible and non-fungible tokens.
+
+    Return the ids and the block of every transaction.
+    """
+    implementation = contracts.implementation.functions
+    alice, bob = w3.eth.accounts[1:3]
+    transact(implementation.register("alice"), alice)
+    transact(implementation.register("bob"), bob)
+    fungible = create_token()
+    base_type = create_token(non_fungible=True)
+    blocks = {
+        "mint": transact(
+            implementation.mintFungible([alice], fungible, [10], b"")
+        ).blockNumber,
+        "mint_item": transact(
+            implementation.mintNonFungible([alice], base_type, b"")
+        ).blockNumber,
+    }
+    item = base_type | 1
+    blocks["send"] = transact(
+        implementation.send(bob, [fungible, item], [4, 1], b""), alice
+    ).blockNumber
+    blocks["burn"] = transact(
+        implementation.burn([fungible], [1], b""), bob
+    ).blockNumber
+    return fungible, base_type, item, blocks
+
+
+def scan(w3, contracts):
+    scanner = LogScanner(w3, [(Token, contracts.token.address)])
+    return [
+        batch
+        for chunk in scanner.scan_batches(0, w3.eth.blockNumber)
+        for batch in chunk.batches.values()
+    ]
+
+
+def test_collect_deltas(w3, contracts, ledger):
+    fungible, base_type, item, blocks = ledger
+    alice, bob = (address.lower() for address in w3.eth.accounts[1:3])
+    token = contracts.token.address.lower()
+
+    deltas = collect_deltas(scan(w3, contracts))
+
+    assert {key: dict(by_block) for key, by_block in deltas.items()} == {
+        (token, alice, fungible): {blocks["mint"]: 10, blocks["send"]: -4},
+        (token, bob, fungible): {blocks["send"]: 4, blocks["burn"]: -1},
+        (token, alice, item): {blocks["mint_item"]: 1, blocks["send"]: -1},
+        (token, alice, base_type): {blocks["mint_item"]: 1, blocks["send"]: -1},
+        (token, bob, item): {blocks["send"]: 1},
+        (token, bob, base_type): {blocks["send"]: 1},
+    }
+
+
+def balances():
+    return {
+        (balance.owner, balance.token_id): balance.amount
+        for balance in Balance.objects.all()
+    }
+
+
+def test_applying_a_chunk_twice(w3, contracts, ledger):
+    fungible, base_type, item, _blocks = ledger
+    batches = scan(w3, contracts)
+
+    update_balances(batches)
+    applied = balances()
+    update_balances(batches)
+
+    assert balances() == applied
+    for (owner, token_id), amount in applied.items():
+        owner = to_checksum_address(owner)
+        assert amount == contracts.token.functions.balanceOf(owner, token_id).call()
+    assert {token_id for _owner, token_id in applied} == {fungible, base_type, item}
+
+
+def test_backfill(w3, contracts, follower, ledger):
+    follower.sync()
+    indexed = balances()
+    Balance.objects.all().delete()
+
+    migration = importlib.import_module("app.ethindexer.migrations.0002_balance")
+    migration.backfill_balances(apps, None)
+
+    assert balances() == indexed
+    assert set(Balance.objects.values_list("block_number", flat=True)) == {
+        w3.eth.blockNumber
+    }
@@ -0,0 +1,140 @@
+import importlib
+
+import pytest
+from django.apps import apps
+
+from app.ethindexer.hierarchy import ancestors, descendants, subtree_balances
+from app.ethindexer.ingest import ChainFollower
+from app.ethindexer.models import AccountNode, AccountPath, AccountStatus
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def accounts(w3):
+    """Return the lower-case addresses of alice, her sub-accounts and bob."""
+    return [address.lower() for address in w3.eth.accounts[1:6]]
+
+
+@pytest.fixture
+def tree(w3, contracts, transact, accounts):
+    """Register alice, with ``sub1`` under her and ``sub2`` under ``sub1``."""
+    implementation = contracts.implementation.functions
+    alice, sub1, sub2, _sub3, _bob = w3.eth.accounts[1:6]
+    transact(implementation.register("alice"), alice)
+    transact(implementation.addSubAccount(sub1, "sub1"), alice)
+    transact(implementation.addSubAccount(sub2, "sub2"), sub1)
+
+
+def paths():
+    return set(AccountPath.objects.values_list("ancestor", "descendant", "depth"))
+
+
+def test_parents_of_the_same_batch(w3, tree, follower, accounts):
+    owner = w3.eth.accounts[0].lower()
+    alice, sub1, sub2, _sub3, _bob = accounts
+
+    follower.sync()
+
+    assert paths() == {
+        (owner, owner, 0),
+        (alice, alice, 0),
+        (alice, sub1, 1),
+        (alice, sub2, 2),
+        (sub1, sub1, 0),
+        (sub1, sub2, 1),
+        (sub2, sub2, 0),
+    }
+    node = AccountNode.objects.get(address=sub2)
+    assert (node.parent, node.root, node.name, node.level) == (
+        sub1,
+        alice,
+        "alice.sub1.sub2",
+        3,
+    )
+
+
+def test_parents_known_from_the_database(w3, contracts, transact, tree, follower):
+    follower.sync()
+    sub2, sub3 = w3.eth.accounts[3:5]
+    transact(contracts.implementation.functions.addSubAccount(sub3, "sub3"), sub2)
+
+    follower.sync()
+
+    assert [node.address for node in ancestors(sub3)] == [
+        address.lower() for address in w3.eth.accounts[1:4][::-1]
+    ]
+    assert AccountNode.objects.get(address=sub3.lower()).root == (
+        w3.eth.accounts[1].lower()
+    )
+
+
+def test_parents_created_before_the_first_block(w3, contracts, transact, follower):
+    implementation = contracts.implementation.functions
+    alice, sub1 = w3.eth.accounts[1:3]
+    transact(implementation.register("alice"), alice)
+    start_block = w3.eth.blockNumber + 1
+    transact(implementation.addSubAccount(sub1, "sub1"), alice)
+
+    ChainFollower(
+        web3=w3, start_block=start_block, confirmations=0, snapshot_interval=0
+    ).sync()
+
+    node = AccountNode.objects.get()
+    assert (node.address, node.parent, node.root) == (
+        sub1.lower(),
+        alice.lower(),
+        sub1.lower(),
+    )
+    assert paths() == {(sub1.lower(), sub1.lower(), 0)}
+
+
+def test_status_updates(w3, contracts, transact, tree, follower, accounts):
+    alice, sub1 = w3.eth.accounts[1:3]
+    transact(contracts.implementation.functions.suspendAccount(sub1), alice)
+    follower.sync()
+
+    statuses = dict(AccountNode.objects.values_list("address", "status"))
+    assert statuses[accounts[0]] == AccountStatus.ACTIVE
+    assert statuses[accounts[1]] == AccountStatus.SUSPENDED
+
+
+def test_queries(w3, contracts, transact, create_token, tree, follower, accounts):
+    alice, sub1, sub2, _sub3, bob = accounts
+    implementation = contracts.implementation.functions
+    token_id = create_token()
+    transact(
+        implementation.mintFungible(
+            [w3.eth.accounts[index] for index in (1, 2, 3, 5)],
+            token_id,
+            [10, 5, 2, 100],
+            b"",
+        )
+    )
+    follower.sync()
+
+    assert {(node.address, node.depth) for node in descendants(alice)} == {
+        (sub1, 1),
+        (sub2, 2),
+    }
+    assert [node.address for node in ancestors(sub2)] == [sub1, alice]
+    assert list(subtree_balances(alice)) == [{"token_id": token_id, "total": 17}]
+    assert list(subtree_balances(sub1)) == [{"token_id": token_id, "total": 7}]
+    assert not descendants(bob).exists()
+
+
+def test_backfill(w3, contracts, transact, tree, follower):
+    alice, sub1 = w3.eth.accounts[1:3]
+    transact(contracts.implementation.functions.suspendAccount(sub1), alice)
+    follower.sync()
+    nodes = set(AccountNode.objects.values_list("address", "root", "status"))
+    indexed = paths()
+    AccountNode.objects.all().delete()
+
+    migration = importlib.import_module(
+        "app.ethindexer.migrations.0004_account_hierarchy"
+    )
+    migration.backfill_hierarchy(apps, None)
+
+    assert set(AccountNode.objects.values_list("address", "root", "status")) == nodes
+    assert paths() == indexed
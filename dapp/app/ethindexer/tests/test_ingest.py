@@ -0,0 +1,116 @@
+import pytest
+
+from app.ethindexer import ingest
+from app.ethindexer.models import (
+    AccountCreation,
+    Checkpoint,
+    OperatorChange,
+    TokenCreation,
+    TokenMint,
+    TokenTransfer,
+    TokenURI,
+)
+
+pytestmark = pytest.mark.django_db
+
+ZERO_ADDRESS = "0x" + "00" * 20
+
+
+def checkpoints(contracts):
+    return dict(
+        Checkpoint.objects.filter(
+            contract__in=[contracts.token.address, contracts.account.address]
+        ).values_list("contract", "block_number")
+    )
+
+
+def test_sync_stores_every_event(w3, contracts, transact, follower, create_token):
+    owner, alice, bob = (address.lower() for address in w3.eth.accounts[:3])
+    implementation = contracts.implementation.functions
+    token_id = create_token(uri="ipfs://token")
+    transact(implementation.mintFungible([alice, bob], token_id, [5, 7], b"mint"))
+    transact(implementation.register("alice"), w3.eth.accounts[1])
+    transact(implementation.authorizeOperator(bob), w3.eth.accounts[1])
+
+    assert follower.sync() == 7
+
+    (creation,) = TokenCreation.objects.all()
+    assert (creation.creator, creation.token_id) == (owner, token_id)
+    assert creation.contract == contracts.token.address.lower()
+    assert TokenURI.objects.get().value == "ipfs://token"
+    mints = list(TokenMint.objects.values_list("operator", "recipient", "amount"))
+    assert mints == [(owner, alice, 5), (owner, bob, 7)]
+    assert {bytes(mint.data) for mint in TokenMint.objects.all()} == {b"mint"}
+    account = AccountCreation.objects.get(account=alice)
+    assert (account.parent, account.name, account.level) == (ZERO_ADDRESS, "alice", 1)
+    change = OperatorChange.objects.get()
+    assert (change.operator, change.holder, change.authorized) == (bob, alice, True)
+    assert set(checkpoints(contracts).values()) == {w3.eth.blockNumber}
+
+
+def test_sync_resumes_from_the_checkpoint(
+    w3, contracts, transact, follower, create_token
+):
+    alice, bob = (address.lower() for address in w3.eth.accounts[1:3])
+    implementation = contracts.implementation.functions
+    token_id = create_token()
+    transact(implementation.mintFungible([alice], token_id, [5], b""))
+    follower.sync()
+    indexed = w3.eth.blockNumber
+
+    transact(implementation.register("alice"), w3.eth.accounts[1])
+    transact(implementation.send(bob, [token_id], [2], b""), w3.eth.accounts[1])
+
+    # Only the events after the checkpoint are read.
+    assert follower.sync() == 2
+    assert TokenMint.objects.count() == 1
+    transfer = TokenTransfer.objects.get()
+    assert (transfer.sender, transfer.recipient, transfer.amount) == (alice, bob, 2)
+    assert transfer.block_number > indexed
+    assert set(checkpoints(contracts).values()) == {w3.eth.blockNumber}
+
+
+def test_reingesting_stores_nothing_twice(w3, contracts, transact, follower):
+    transact(contracts.implementation.functions.register("alice"), w3.eth.accounts[1])
+    follower.sync()
+    Checkpoint.objects.all().delete()
+
+    follower.sync()
+
+    assert AccountCreation.objects.count() == 2
+    assert set(checkpoints(contracts).values()) == {w3.eth.blockNumber}
+
+
+def test_chunks_are_atomic(w3, contracts, transact, follower, monkeypatch):
+    implementation = contracts.implementation.functions
+    transact(implementation.register("alice"), w3.eth.accounts[1])
+    failing_block = transact(
+        implementation.register("bob"), w3.eth.accounts[2]
+    ).blockNumber
+    for scanner in follower.scanners.values():
+        scanner.chunk_size = scanner.max_chunk_size = 1
+
+    update_hierarchy = ingest.update_hierarchy
+
+    def fail_on_bob(batches, batch_size):
+        if any(failing_block in batch.block_number for batch in batches):
+            raise RuntimeError("interrupted")
+        return update_hierarchy(batches, batch_size)
+
+    monkeypatch.setattr(ingest, "update_hierarchy", fail_on_bob)
+    with pytest.raises(RuntimeError):
+        follower.sync()
+
+    # The chunk of "bob" is rolled back, the ones before it are kept.
+    assert checkpoints(contracts) == {
+        contracts.account.address.lower(): failing_block - 1,
+        contracts.token.address.lower(): w3.eth.blockNumber,
+    }
+    assert set(AccountCreation.objects.values_list("name", flat=True)) == {
+        "OWNER",
+        "alice",
+    }
+
+    monkeypatch.setattr(ingest, "update_hierarchy", update_hierarchy)
+    follower.sync()
+    assert AccountCreation.objects.count() == 3
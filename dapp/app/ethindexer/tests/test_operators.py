@@ -0,0 +1,93 @@
+import importlib
+
+import pytest
+from django.apps import apps
+
+from app.ethindexer.models import Checkpoint, OperatorGrant
+from app.ethindexer.operators import OperatorIndex
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def alice(w3, contracts, transact) -> str:
+    alice = w3.eth.accounts[1]
+    transact(contracts.implementation.functions.register("alice"), alice)
+    return alice
+
+
+def grants():
+    return set(OperatorGrant.objects.values_list("operator", "holder", "authorized"))
+
+
+def test_last_change_of_a_chunk_wins(w3, contracts, transact, follower, alice):
+    implementation = contracts.implementation.functions
+    bob, carol = w3.eth.accounts[2:4]
+    transact(implementation.authorizeOperator(bob), alice)
+    transact(implementation.revokeOperator(bob), alice)
+    transact(implementation.revokeOperator(carol), alice)
+    transact(implementation.authorizeOperator(carol), alice)
+
+    follower.sync()
+
+    assert grants() == {
+        (bob.lower(), alice.lower(), False),
+        (carol.lower(), alice.lower(), True),
+    }
+
+
+def test_incremental_refresh(w3, contracts, transact, follower, alice):
+    implementation = contracts.implementation.functions
+    bob, carol = w3.eth.accounts[2:4]
+    transact(implementation.authorizeOperator(bob), alice)
+    follower.sync()
+    index = OperatorIndex(contracts.account.address, interval=0)
+
+    assert index.is_operator_for(bob, alice)
+    assert index.holders_of(bob) == {alice.lower()}
+
+    transact(implementation.revokeOperator(bob), alice)
+    transact(implementation.authorizeOperator(carol), alice)
+    follower.sync()
+
+    assert index.check_many([(bob, alice), (carol, alice)]) == [False, True]
+    assert index.holders_of(bob) == frozenset()
+    assert index.block_number == w3.eth.blockNumber
+
+
+def test_refresh_stops_at_the_checkpoint(w3, contracts, transact, follower, alice):
+    bob = w3.eth.accounts[2]
+    follower.sync()
+    checkpoint = Checkpoint.objects.get(contract=contracts.account.address)
+    index = OperatorIndex(contracts.account.address, interval=0)
+    index.refresh()
+    # Stored after the block the index is at, and not indexed yet.
+    OperatorGrant.objects.create(
+        contract=contracts.account.address,
+        operator=bob,
+        holder=alice,
+        authorized=True,
+        block_number=checkpoint.block_number + 1,
+    )
+
+    assert not index.is_operator_for(bob, alice)
+
+    checkpoint.block_number += 1
+    checkpoint.save()
+    assert index.is_operator_for(bob, alice)
+
+
+def test_backfill(w3, contracts, transact, follower, alice):
+    implementation = contracts.implementation.functions
+    bob, carol = w3.eth.accounts[2:4]
+    transact(implementation.authorizeOperator(bob), alice)
+    transact(implementation.authorizeOperator(carol), alice)
+    transact(implementation.revokeOperator(bob), alice)
+    follower.sync()
+    indexed = grants()
+    OperatorGrant.objects.all().delete()
+
+    migration = importlib.import_module("app.ethindexer.migrations.0005_operatorgrant")
+    migration.backfill_grants(apps, None)
+
+    assert grants() == indexed
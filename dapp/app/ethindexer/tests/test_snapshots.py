@@ -0,0 +1,64 @@
+import pytest
+
+from app.ethindexer.ingest import ChainFollower
+from app.ethindexer.models import BalanceSnapshot
+from app.ethindexer.snapshots import balances_at
+
+pytestmark = pytest.mark.django_db
+
+INTERVAL = 3
+
+
+@pytest.fixture
+def snapshotting(w3, follower) -> ChainFollower:
+    return ChainFollower(
+        web3=w3, start_block=0, confirmations=0, snapshot_interval=INTERVAL
+    )
+
+
+def test_balances_at_match_the_chain(
+    w3, contracts, transact, create_token, snapshotting
+):
+    implementation = contracts.implementation.functions
+    alice, bob = w3.eth.accounts[1:3]
+    transact(implementation.register("alice"), alice)
+    transact(implementation.register("bob"), bob)
+    fungible = create_token()
+    base_type = create_token(non_fungible=True)
+    first_block = transact(
+        implementation.mintFungible([alice, bob], fungible, [50, 50], b"")
+    ).blockNumber
+    transact(implementation.mintNonFungible([alice], base_type, b""))
+    transact(implementation.send(bob, [base_type | 1], [1], b""), alice)
+    for amount in range(1, 8):
+        transact(implementation.send(bob, [fungible], [amount], b""), alice)
+        transact(implementation.burn([fungible], [1], b""), bob)
+
+    snapshotting.sync(to_block=first_block + 4)
+    # Resumes from the last snapshot rather than seeding a new one.
+    snapshotting.sync()
+
+    snapshots = list(BalanceSnapshot.objects.values_list("block_number", flat=True))
+    # Seeded before the first block, then taken about every INTERVAL blocks.
+    assert snapshots[0] == -1
+    assert all(
+        INTERVAL <= after - before < 2 * INTERVAL
+        for before, after in zip(snapshots, snapshots[1:])
+    )
+    assert snapshots[-1] > w3.eth.blockNumber - 2 * INTERVAL
+    # Before, at and after every snapshot.
+    for block_number in range(first_block - 1, w3.eth.blockNumber + 1):
+        for owner in (alice, bob):
+            indexed = balances_at(owner, block_number)
+            for token_id in (fungible, base_type):
+                on_chain = contracts.token.functions.balanceOf(owner, token_id).call(
+                    block_identifier=block_number
+                )
+                assert indexed.get(token_id, 0) == on_chain, (owner, block_number)
+
+
+def test_balances_at_unindexed_block(w3, snapshotting):
+    snapshotting.sync()
+
+    with pytest.raises(ValueError):
+        balances_at(w3.eth.accounts[1], w3.eth.blockNumber + 1)
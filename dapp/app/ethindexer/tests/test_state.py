@@ -0,0 +1,116 @@
+import pytest
+
+from app.eth.preflight import (
+    IMPLEMENTATION_RULES,
+    ImplementationValidator,
+    PreflightError,
+)
+from app.eth.tokenid import TYPE_NF_BIT, make_id
+from app.ethindexer.models import AccountNode, AccountStatus, Balance, Checkpoint
+from app.ethindexer.state import IndexedState
+
+pytestmark = pytest.mark.django_db
+
+TOKEN = "0x" + "11" * 20
+ACCOUNT = "0x" + "22" * 20
+RECIPIENT = "0x" + "33" * 20
+ZERO_ADDRESS = "0x" + "00" * 20
+ITEM = make_id(TYPE_NF_BIT | 1 << 128, 1)
+CONFIRMATIONS = 2
+
+
+@pytest.fixture
+def state(settings, w3):
+    settings.WEB3_PROVIDER = w3
+    settings.WEB3_HEAD_POLL_INTERVAL = 0
+    settings.CONTRACT_TOKEN_ADR = TOKEN
+    settings.CONTRACT_ACCOUNT_ADR = ACCOUNT
+    settings.INDEXER_CONFIRMATIONS = CONFIRMATIONS
+    w3.testing.mine(5)
+    return IndexedState()
+
+
+@pytest.fixture
+def sender(w3) -> str:
+    return w3.eth.defaultAccount.lower()
+
+
+def index(w3, behind: int = 0):
+    """Checkpoint both contracts ``behind`` blocks before the confirmed block."""
+    block_number = w3.eth.blockNumber - CONFIRMATIONS - behind
+    for contract in (TOKEN, ACCOUNT):
+        Checkpoint.objects.update_or_create(
+            contract=contract, defaults={"block_number": block_number}
+        )
+
+
+def add_account(address: str, status: AccountStatus = AccountStatus.ACTIVE):
+    AccountNode.objects.create(
+        contract=ACCOUNT,
+        address=address,
+        parent=ZERO_ADDRESS,
+        root=address,
+        name="account",
+        level=0,
+        status=status,
+        block_number=1,
+    )
+
+
+def validate(w3, state, method_name: str, *args):
+    """Hand ``args`` over to the validator as a generated method does."""
+    validator = ImplementationValidator(w3, TOKEN, state)
+    parameters, _check = IMPLEMENTATION_RULES[method_name]
+    for parameter, value in zip(parameters, args):
+        validator.assert_valid(method_name, parameter, value)
+
+
+def test_send_with_insufficient_balance(w3, state, sender):
+    index(w3)
+    add_account(sender)
+
+    with pytest.raises(PreflightError) as error:
+        validate(w3, state, "send", RECIPIENT, [ITEM], [1], b"")
+    assert error.value.reason == "NOT_OWNER"
+
+
+def test_send_from_inactive_account(w3, state, sender):
+    index(w3)
+    add_account(sender, AccountStatus.SUSPENDED)
+    Balance.objects.create(
+        contract=TOKEN, owner=sender, token_id=ITEM, amount=1, block_number=1
+    )
+
+    with pytest.raises(PreflightError) as error:
+        validate(w3, state, "send", RECIPIENT, [ITEM], [1], b"")
+    assert error.value.reason == "NOT_LISTED_OR_INACTIVE_ACCOUNT"
+
+
+def test_send_within_balance(w3, state, sender):
+    index(w3)
+    add_account(sender)
+    Balance.objects.create(
+        contract=TOKEN, owner=sender, token_id=ITEM, amount=1, block_number=1
+    )
+
+    validate(w3, state, "send", RECIPIENT, [ITEM], [1], b"")
+
+
+def test_lagging_state_is_not_checked(w3, state, sender):
+    index(w3, behind=1)
+
+    assert not state.synced()
+    # Neither the account nor the balance is known.
+    validate(w3, state, "send", RECIPIENT, [ITEM], [1], b"")
+
+
+def test_synced_once_per_head(w3, state, django_assert_num_queries):
+    index(w3)
+    with django_assert_num_queries(1):
+        assert state.synced()
+        assert state.synced()
+
+    w3.testing.mine(1)
+    with django_assert_num_queries(1):
+        assert not state.synced()
+        assert not state.synced()
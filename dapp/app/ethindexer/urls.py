@@ -0,0 +1,43 @@
+from django.urls import path
+
+from app.ethindexer.api import views
+
+app_name = "ethindexer"
+
+urlpatterns = [
+    path("transfers/", views.TokenTransferList.as_view(), name="transfers"),
+    path("mints/", views.TokenMintList.as_view(), name="mints"),
+    path("burns/", views.TokenBurnList.as_view(), name="burns"),
+    path("tokens/", views.TokenCreationList.as_view(), name="tokens"),
+    path("token-uris/", views.TokenURIList.as_view(), name="token-uris"),
+    path("accounts/", views.AccountCreationList.as_view(), name="accounts"),
+    path(
+        "account-statuses/",
+        views.AccountStatusUpdateList.as_view(),
+        name="account-statuses",
+    ),
+    path("balances/", views.BalanceList.as_view(), name="balances"),
+    path("balances-at/", views.BalancesAt.as_view(), name="balances-at"),
+    path("operators/", views.OperatorChangeList.as_view(), name="operators"),
+    path("operators/check/", views.OperatorCheck.as_view(), name="operators-check"),
+    path(
+        "operators/<str:operator>/holders/",
+        views.OperatorHolders.as_view(),
+        name="operator-holders",
+    ),
+    path(
+        "hierarchy/<str:address>/descendants/",
+        views.AccountDescendants.as_view(),
+        name="account-descendants",
+    ),
+    path(
+        "hierarchy/<str:address>/ancestors/",
+        views.AccountAncestors.as_view(),
+        name="account-ancestors",
+    ),
+    path(
+        "hierarchy/<str:address>/balances/",
+        views.SubtreeBalances.as_view(),
+        name="subtree-balances",
+    ),
+]
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from app.ethswap.models import SwapOffer
+
+
+@admin.register(SwapOffer)
+class SwapOfferAdmin(admin.ModelAdmin):
+    list_display = ("signer", "sender", "nonce", "expiry", "status", "updated")
+    list_filter = ("status",)
+    search_fields = ("signer", "digest")
+    readonly_fields = ("created", "updated")
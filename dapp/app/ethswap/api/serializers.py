@@ -0,0 +1,245 @@
+import time
+from typing import Dict, Iterable
+
+from django.db import transaction
+from eth_utils import is_address, to_checksum_address
+from hexbytes import HexBytes
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from app.eth import eip712
+from app.ethswap.book import get_order_book
+from app.ethswap.models import SwapOffer
+from app.ethswap.offers import get_domain, get_implementation, swap_struct
+
+UINT256_MAX = 2 ** 256 - 1
+# Most offers posted at once.
+MAX_BATCH = 1000
+
+
+class Uint256Field(serializers.Field):
+    """uint256 values exceed the range of JSON numbers, so they are strings.
+
+    Decimal or 0x-prefixed strings are accepted, as are plain numbers.
+    """
+
+    default_error_messages = {"invalid": "A uint256 is required."}
+
+    def to_representation(self, value):
+        return str(value)
+
+    def to_internal_value(self, data):
+        try:
+            value = data if isinstance(data, int) else int(str(data), 0)
+        except (TypeError, ValueError):
+            self.fail("invalid")
+        if isinstance(value, bool) or not 0 <= value <= UINT256_MAX:
+            self.fail("invalid")
+        return value
+
+
+class AddressField(serializers.CharField):
+    default_error_messages = {"address": "An address is required."}
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("max_length", 42)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if not is_address(value):
+            self.fail("address")
+        return value.lower()
+
+
+class Bytes32Field(serializers.Field):
+    default_error_messages = {"invalid": "32 bytes, in hex, are required."}
+
+    def to_representation(self, value):
+        return "0x" + bytes(value).hex()
+
+    def to_internal_value(self, data):
+        try:
+            value = bytes(HexBytes(data))
+        except (TypeError, ValueError):
+            self.fail("invalid")
+        if len(value) != 32:
+            self.fail("invalid")
+        return value
+
+
+class SwapOfferListSerializer(serializers.ListSerializer):
+    """Offers posted at once, checked as one batch.
+
+    Signers are recovered at once, the offers already posted are looked up
+    in one query and the nonces of the signers are read in one aggregate.
+    """
+
+    def to_internal_value(self, data):
+        # Checked before any offer is.
+        if isinstance(data, list) and len(data) > MAX_BATCH:
+            raise serializers.ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        f"At most {MAX_BATCH} offers can be posted at once."
+                    ]
+                }
+            )
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        signers = eip712.recover_signers(
+            [
+                (bytes.fromhex(offer["digest"][2:]), offer["v"], offer["r"], offer["s"])
+                for offer in attrs
+            ]
+        )
+        errors = {
+            index: "The signature is not the signer's."
+            for index, (offer, signer) in enumerate(zip(attrs, signers))
+            if signer != offer["signer"]
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        keys = [(offer["digest"], offer["nonce"]) for offer in attrs]
+        rows = SwapOffer.objects.filter(
+            digest__in={digest for digest, _nonce in keys}
+        ).values_list("digest", "nonce")
+        posted = {(digest, int(nonce)) for digest, nonce in rows}
+        seen = set()
+        for index, key in enumerate(keys):
+            if key in posted:
+                errors[index] = "The offer has already been posted."
+            elif key in seen:
+                errors[index] = "The offer is posted twice."
+            seen.add(key)
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        signer_nonces = read_signer_nonces({offer["signer"] for offer in attrs})
+        errors = {
+            index: "The nonce has already been used."
+            for index, offer in enumerate(attrs)
+            if offer["nonce"] < signer_nonces[offer["signer"]]
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+        self.context["signer_nonces"] = signer_nonces
+        return attrs
+
+
+def read_signer_nonces(signers: Iterable[str]) -> Dict[str, int]:
+    """Return the ``signerNonces`` of every signer, read in one aggregate."""
+    signers = sorted(signers)
+    aggregate = get_implementation().aggregate()
+    items = [aggregate.signer_nonces(to_checksum_address(signer)) for signer in signers]
+    if items:
+        aggregate.execute()
+    return {signer: item.result() for signer, item in zip(signers, items)}
+
+
+class SwapOfferSerializer(serializers.ModelSerializer):
+    """Offer signed over the digest ``hashSwap`` computes.
+
+    The signature must recover to ``signer``, the offer must not be expired
+    and its nonce must not have been used yet.  The digest is computed
+    locally; the signers of a list of offers are recovered as one batch.
+    """
+
+    signer = AddressField()
+    sender = AddressField(default="0x" + "00" * 20)
+    sender_token_ids = serializers.ListField(child=Uint256Field(), max_length=100)
+    sender_token_amounts = serializers.ListField(child=Uint256Field(), max_length=100)
+    signer_token_ids = serializers.ListField(child=Uint256Field(), max_length=100)
+    signer_token_amounts = serializers.ListField(child=Uint256Field(), max_length=100)
+    nonce = Uint256Field()
+    expiry = Uint256Field()
+    v = serializers.IntegerField(min_value=27, max_value=28)
+    r = Bytes32Field()
+    s = Bytes32Field()
+    status = serializers.CharField(source="get_status_display", read_only=True)
+
+    class Meta:
+        model = SwapOffer
+        fields = (
+            "id",
+            "signer",
+            "sender",
+            "sender_token_ids",
+            "sender_token_amounts",
+            "signer_token_ids",
+            "signer_token_amounts",
+            "nonce",
+            "expiry",
+            "v",
+            "r",
+            "s",
+            "digest",
+            "status",
+            "created",
+        )
+        read_only_fields = ("digest", "created")
+        # The digest and nonce pair is checked by validate().
+        validators = []
+        list_serializer_class = SwapOfferListSerializer
+
+    def validate(self, attrs):
+        for side in ("sender", "signer"):
+            ids, amounts = attrs[f"{side}_token_ids"], attrs[f"{side}_token_amounts"]
+            if len(ids) != len(amounts):
+                raise serializers.ValidationError(
+                    f"{side}_token_ids and {side}_token_amounts differ in length."
+                )
+        if attrs["expiry"] < time.time():
+            raise serializers.ValidationError("The offer has expired.")
+
+        implementation = get_implementation()
+        swap = swap_struct(SwapOffer(**attrs))
+        digest = eip712.swap_digest(swap, get_domain(implementation))
+        attrs["digest"] = "0x" + digest.hex()
+        # A list of offers checks the rest as one batch.
+        if isinstance(self.parent, serializers.ListSerializer):
+            return attrs
+
+        signer = eip712.recover_signer(digest, attrs["v"], attrs["r"], attrs["s"])
+        if signer != attrs["signer"]:
+            raise serializers.ValidationError("The signature is not the signer's.")
+        if SwapOffer.objects.filter(
+            digest=attrs["digest"], nonce=attrs["nonce"]
+        ).exists():
+            raise serializers.ValidationError("The offer has already been posted.")
+
+        signer_nonce = implementation.cached().signer_nonces.call(
+            to_checksum_address(attrs["signer"])
+        )
+        if attrs["nonce"] < signer_nonce:
+            raise serializers.ValidationError("The nonce has already been used.")
+        self.context["signer_nonces"] = {attrs["signer"]: signer_nonce}
+        return attrs
+
+    def create(self, validated_data):
+        offer = super().create(validated_data)
+        signer_nonce = self.context.get("signer_nonces", {}).get(offer.signer)
+        # Offers of a request that fails later on never make it to the book.
+        transaction.on_commit(lambda: get_order_book().add(offer, signer_nonce))
+        return offer
+
+
+class OfferMatchSerializer(serializers.Serializer):
+    offered = Uint256Field(required=False)
+    wanted = Uint256Field(required=False)
+    sender = AddressField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+
+class SettlementSerializer(serializers.Serializer):
+    sender = AddressField()
+    data = serializers.CharField(default="0x")
+
+    def validate_data(self, value):
+        try:
+            return bytes(HexBytes(value))
+        except (TypeError, ValueError):
+            raise serializers.ValidationError("Hex data is required.")
+
@@ -0,0 +1,95 @@
+from django.db import IntegrityError, transaction
+from rest_framework import generics, permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from app.ethswap.api import serializers
+from app.ethswap.book import get_order_book
+from app.ethswap.models import OfferStatus, SwapOffer
+from app.ethswap.offers import build_settlement
+
+
+class OfferPagination(LimitOffsetPagination):
+    default_limit = 100
+    max_limit = 1000
+
+
+class SwapOfferList(generics.ListCreateAPIView):
+    """
+    Signed swap offers, oldest first; `?signer=0x...` and `?status=open`
+    filter them.  Posting an offer, or a list of offers, checks their
+    signatures and nonces.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    pagination_class = OfferPagination
+    serializer_class = serializers.SwapOfferSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("many", isinstance(kwargs.get("data"), list))
+        return super().get_serializer(*args, **kwargs)
+
+    def perform_create(self, serializer):
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError:
+            # Posted by another request since it was validated.
+            raise ValidationError("The offer has already been posted.")
+
+    def get_queryset(self):
+        queryset = SwapOffer.objects.all()
+        params = self.request.query_params
+        if params.get("signer"):
+            queryset = queryset.filter(signer=params["signer"].lower())
+        if params.get("status"):
+            try:
+                queryset = queryset.filter(status=OfferStatus[params["status"].upper()])
+            except KeyError:
+                raise ValidationError(f"Unknown status {params['status']}.")
+        return queryset
+
+
+class SwapOfferMatch(APIView):
+    """
+    Fillable offers giving `?offered=<token id>` for `?wanted=<token id>`,
+    that `?sender=0x...` may fill, read from the order book.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, format=None):
+        params = serializers.OfferMatchSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        book = get_order_book()
+        matches = book.match(**params.validated_data)
+        offers = SwapOffer.objects.in_bulk([offer.id for offer in matches])
+        return Response(
+            {
+                "block_number": book.block_number,
+                "offers": serializers.SwapOfferSerializer(
+                    [offers[offer.id] for offer in matches if offer.id in offers],
+                    many=True,
+                ).data,
+            }
+        )
+
+
+class SwapOfferSettlement(APIView):
+    """
+    Unsigned `swap` transaction filling an open offer, for `sender` to sign.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request, pk, format=None):
+        offer = generics.get_object_or_404(SwapOffer, pk=pk, status=OfferStatus.OPEN)
+        serializer = serializers.SettlementSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            transaction = build_settlement(offer, **serializer.validated_data)
+        except ValueError as exc:
+            raise ValidationError(str(exc))
+        return Response({"offer": offer.id, "transaction": transaction})
@@ -0,0 +1,244 @@
+"""In-memory order book of the open swap offers.
+
+Every worker holds the open :class:`~app.ethswap.models.SwapOffer`\\ s in an
+:class:`OrderBook`, indexed by the token ids they offer and want, so that
+the offers trading one token for another are a set intersection away::
+
+    book = get_order_book()
+    book.match(offered=token_id, wanted=other_token_id, sender=taker)
+
+Only the offers changed since its last refresh are read from the database.
+Once per new block, the ``signerNonces`` of every signer with an open offer
+are read in one ``Multicall`` call: offers whose nonce has been used are
+marked consumed and dropped, as are expired ones.  Only offers whose nonce
+is the signer's current one are matched, since ``swap`` rejects the others.
+"""
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import DefaultDict, Dict, FrozenSet, List, NamedTuple, Optional, Set
+
+from django.conf import settings
+from django.utils import timezone
+from eth_utils import to_checksum_address
+
+from app.eth.cache import HeadTracker
+from app.ethswap.models import OfferStatus, SwapOffer
+from app.ethswap.offers import get_implementation
+
+ZERO_ADDRESS = "0x" + "00" * 20
+
+
+class Offer(NamedTuple):
+    """Open offer, as indexed."""
+
+    id: int
+    signer: str
+    sender: str
+    # Token ids the signer gives, and wants in exchange.
+    offered: FrozenSet[int]
+    wanted: FrozenSet[int]
+    nonce: int
+    expiry: int
+
+
+class OrderBook:
+    """Open swap offers indexed by the token ids they offer and want."""
+
+    def __init__(self, interval: float = 1.0, slack: float = 5.0):
+        """
+        :param interval: how often the database and the head block are polled,
+            in seconds
+        :param slack: how far back, in seconds, changed offers are read again,
+            to catch transactions committed after a refresh started
+        """
+        self.interval = interval
+        self.slack = timedelta(seconds=slack)
+        self.implementation = get_implementation()
+        self.head = HeadTracker(self.implementation._web3_eth.web3, interval)
+        self._lock = threading.Lock()
+        self._offers: Dict[int, Offer] = {}
+        self._by_offered: DefaultDict[int, Set[int]] = defaultdict(set)
+        self._by_wanted: DefaultDict[int, Set[int]] = defaultdict(set)
+        # Signer -> signerNonces, as last read.
+        self._nonces: Dict[str, int] = {}
+        # Block the nonces were read at.
+        self.block_number = -1
+        self._loaded_at: Optional[datetime] = None
+        self._checked_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._offers)
+
+    def refresh(self, force: bool = False):
+        """Load the offers changed since the last refresh and the new nonces.
+
+        :param force: refresh even if polled less than ``interval`` seconds ago
+        """
+        if not force and not self._stale():
+            return
+        with self._lock:
+            if not force and not self._stale():
+                return
+            now = timezone.now()
+            if self._loaded_at is None:
+                changed = SwapOffer.objects.filter(status=OfferStatus.OPEN)
+            else:
+                changed = SwapOffer.objects.filter(
+                    updated__gte=self._loaded_at - self.slack
+                )
+            for offer in changed.iterator():
+                self._apply(offer)
+            self._loaded_at = now
+            block_number = self.head.block_number()
+            if block_number != self.block_number:
+                self._sync_nonces(block_number)
+            self._checked_at = time.monotonic()
+
+    def _stale(self) -> bool:
+        return (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at >= self.interval
+        )
+
+    def add(self, offer: SwapOffer, signer_nonce: Optional[int] = None):
+        """Index ``offer`` right away, e.g. once accepted by this worker.
+
+        :param signer_nonce: ``signerNonces`` of its signer, if just read
+        """
+        with self._lock:
+            self._apply(offer)
+            if signer_nonce is not None:
+                self._nonces.setdefault(offer.signer, signer_nonce)
+
+    def _apply(self, row: SwapOffer):
+        if row.status != OfferStatus.OPEN:
+            self._remove(row.id)
+            return
+        if row.id in self._offers:
+            return
+        offer = Offer(
+            id=row.id,
+            signer=row.signer,
+            sender=row.sender,
+            offered=frozenset(int(token_id) for token_id in row.signer_token_ids),
+            wanted=frozenset(int(token_id) for token_id in row.sender_token_ids),
+            nonce=int(row.nonce),
+            expiry=int(row.expiry),
+        )
+        self._offers[offer.id] = offer
+        for token_id in offer.offered:
+            self._by_offered[token_id].add(offer.id)
+        for token_id in offer.wanted:
+            self._by_wanted[token_id].add(offer.id)
+
+    def _remove(self, offer_id: int):
+        offer = self._offers.pop(offer_id, None)
+        if offer is None:
+            return
+        for index, token_ids in (
+            (self._by_offered, offer.offered),
+            (self._by_wanted, offer.wanted),
+        ):
+            for token_id in token_ids:
+                ids = index.get(token_id)
+                if ids is not None:
+                    ids.discard(offer_id)
+                    if not ids:
+                        del index[token_id]
+
+    def _sync_nonces(self, block_number: int):
+        """Read the nonces of the signers at ``block_number``; drop the dead offers."""
+        signers = sorted({offer.signer for offer in self._offers.values()})
+        aggregate = self.implementation.aggregate(block_identifier=block_number)
+        items = [
+            aggregate.signer_nonces(to_checksum_address(signer)) for signer in signers
+        ]
+        if items:
+            aggregate.execute()
+        for signer, item in zip(signers, items):
+            if item.error is None:
+                self._nonces[signer] = item.result()
+
+        now = int(time.time())
+        consumed, expired = [], []
+        for offer in self._offers.values():
+            if offer.nonce < self._nonces.get(offer.signer, 0):
+                consumed.append(offer.id)
+            elif offer.expiry < now:
+                expired.append(offer.id)
+        for status, ids in (
+            (OfferStatus.CONSUMED, consumed),
+            (OfferStatus.EXPIRED, expired),
+        ):
+            if ids:
+                SwapOffer.objects.filter(id__in=ids, status=OfferStatus.OPEN).update(
+                    status=status, updated=timezone.now()
+                )
+                for offer_id in ids:
+                    self._remove(offer_id)
+        self.block_number = block_number
+
+    def is_fillable(self, offer: Offer, now: Optional[float] = None) -> bool:
+        """Whether ``swap`` would accept the nonce and expiry of ``offer``."""
+        now = time.time() if now is None else now
+        return offer.expiry >= now and offer.nonce == self._nonces.get(offer.signer)
+
+    def match(
+        self,
+        offered: Optional[int] = None,
+        wanted: Optional[int] = None,
+        sender: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Offer]:
+        """Return the fillable offers giving ``offered`` for ``wanted``, oldest first.
+
+        :param offered: token id the signer must give
+        :param wanted: token id the signer must want
+        :param sender: only the offers this account may fill; an offer is
+            open to anybody when its sender is the zero address
+        :param limit: maximum number of offers returned
+        """
+        self.refresh()
+        with self._lock:
+            if offered is None and wanted is None:
+                ids = set(self._offers)
+            elif wanted is None:
+                ids = set(self._by_offered.get(offered, ()))
+            elif offered is None:
+                ids = set(self._by_wanted.get(wanted, ()))
+            else:
+                ids = self._by_offered.get(offered, set()) & self._by_wanted.get(
+                    wanted, set()
+                )
+            now = time.time()
+            sender = sender.lower() if sender else None
+            matches = []
+            for offer_id in sorted(ids):
+                offer = self._offers[offer_id]
+                if sender is not None and offer.sender not in (ZERO_ADDRESS, sender):
+                    continue
+                if self.is_fillable(offer, now):
+                    matches.append(offer)
+                    if len(matches) >= limit:
+                        break
+            return matches
+
+    def signer_nonce(self, signer: str) -> Optional[int]:
+        """Return the ``signerNonces`` of ``signer`` as last read, if known."""
+        return self._nonces.get(signer.lower())
+
+
+_book: Optional[OrderBook] = None
+_lock = threading.Lock()
+
+
+def get_order_book() -> OrderBook:
+    """Return the :class:`OrderBook` of the worker."""
+    global _book  # pylint: disable=global-statement
+    if _book is None:
+        with _lock:
+            if _book is None:
+                _book = OrderBook(settings.WEB3_HEAD_POLL_INTERVAL)
+    return _book
@@ -0,0 +1,48 @@
+# Generated by Django 3.0.8 on 2026-10-18 12:00
+
+import app.ethindexer.fields
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SwapOffer',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('signer', app.ethindexer.fields.AddressField(db_index=True)),
+                ('sender', app.ethindexer.fields.AddressField()),
+                ('sender_token_ids', django.contrib.postgres.fields.ArrayField(base_field=app.ethindexer.fields.Uint256Field(), size=None)),
+                ('sender_token_amounts', django.contrib.postgres.fields.ArrayField(base_field=app.ethindexer.fields.Uint256Field(), size=None)),
+                ('signer_token_ids', django.contrib.postgres.fields.ArrayField(base_field=app.ethindexer.fields.Uint256Field(), size=None)),
+                ('signer_token_amounts', django.contrib.postgres.fields.ArrayField(base_field=app.ethindexer.fields.Uint256Field(), size=None)),
+                ('nonce', app.ethindexer.fields.Uint256Field()),
+                ('expiry', app.ethindexer.fields.Uint256Field()),
+                ('v', models.PositiveSmallIntegerField()),
+                ('r', models.BinaryField(max_length=32)),
+                ('s', models.BinaryField(max_length=32)),
+                ('digest', models.CharField(max_length=66)),
+                ('status', models.PositiveSmallIntegerField(choices=[(0, 'open'), (1, 'consumed'), (2, 'expired')], default=0)),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='created')),
+                ('updated', models.DateTimeField(auto_now=True, db_index=True, verbose_name='updated')),
+            ],
+            options={
+                'ordering': ('id',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='swapoffer',
+            index=models.Index(fields=['status', 'signer'], name='ethswap_offer_signer_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='swapoffer',
+            constraint=models.UniqueConstraint(fields=('digest', 'nonce'), name='ethswap_swapoffer_unique_offer'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from app.ethindexer.fields import AddressField, Uint256Field
+
+
+class OfferStatus(models.IntegerChoices):
+    OPEN = 0, _("open")
+    CONSUMED = 1, _("consumed")
+    EXPIRED = 2, _("expired")
+
+
+class SwapOffer(models.Model):
+    """``SwapLib.Swap`` signed by ``signer``, waiting for a sender to submit it.
+
+    The signer gives ``signer_token_ids`` for ``sender_token_ids``.  The
+    offer can be filled while ``signerNonces(signer)`` equals ``nonce`` and
+    until ``expiry``; once the nonce has moved past it, it is consumed.
+    """
+
+    signer = AddressField(db_index=True)
+    # Zero address when any sender may fill the offer.
+    sender = AddressField()
+    sender_token_ids = ArrayField(Uint256Field())
+    sender_token_amounts = ArrayField(Uint256Field())
+    signer_token_ids = ArrayField(Uint256Field())
+    signer_token_amounts = ArrayField(Uint256Field())
+    nonce = Uint256Field()
+    expiry = Uint256Field()
+    v = models.PositiveSmallIntegerField()
+    r = models.BinaryField(max_length=32)
+    s = models.BinaryField(max_length=32)
+    # Typed-data digest signed by the signer.
+    digest = models.CharField(max_length=66)
+    status = models.PositiveSmallIntegerField(
+        choices=OfferStatus.choices, default=OfferStatus.OPEN
+    )
+    created = models.DateTimeField(auto_now_add=True, verbose_name=_("created"))
+    updated = models.DateTimeField(
+        auto_now=True, db_index=True, verbose_name=_("updated")
+    )
+
+    class Meta:
+        ordering = ("id",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["digest", "nonce"], name="%(app_label)s_%(class)s_unique_offer"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["status", "signer"], name="ethswap_offer_signer_idx")
+        ]
+
+    def __str__(self):
+        return f"{self.signer}#{self.nonce}"
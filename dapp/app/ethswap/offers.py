@@ -0,0 +1,93 @@
+"""Signed swap offers: their digest and their settlement.
+
+An offer is a ``SwapLib.Swap`` struct, signed by its signer over the digest
+computed by ``hashSwap`` in ``SwapVerifier.sol``, plus the nonce and expiry
+that ``swap`` checks.  Neither the nonce nor the expiry are signed.  Digests
+are computed locally by :mod:`app.eth.eip712`.
+"""
+from typing import Mapping, Optional
+
+from django.conf import settings
+from eth_utils import to_checksum_address
+from zero_ex.contract_wrappers.tx_params import TxParams
+
+from app.eth import eip712
+from app.eth.contracts import Implementation
+from app.eth.pipeline import TransactionPipeline
+from app.eth.preflight import acting_as
+from app.eth.registry import get_contract
+from app.ethswap.models import SwapOffer
+
+
+def get_implementation() -> Implementation:
+    """Return the shared ``Implementation`` wrapper the offers are settled with."""
+    return get_contract(Implementation, settings.CONTRACT_IMPL_ADR)
+
+
+def swap_struct(offer: SwapOffer) -> dict:
+    """Return the ``SwapLib.Swap`` argument of ``offer``."""
+    return {
+        "sender": to_checksum_address(offer.sender),
+        "senderTokenIds": [int(value) for value in offer.sender_token_ids],
+        "senderTokenAmounts": [int(value) for value in offer.sender_token_amounts],
+        "signerTokenIds": [int(value) for value in offer.signer_token_ids],
+        "signerTokenAmounts": [int(value) for value in offer.signer_token_amounts],
+    }
+
+
+def get_domain(implementation: Optional[Implementation] = None) -> bytes:
+    """Return the domain separator of the deployed ``Implementation``."""
+    implementation = implementation or get_implementation()
+    web3 = implementation._web3_eth.web3
+    return eip712.domain_separator(
+        eip712.chain_id(web3), implementation.contract_address
+    )
+
+
+def offer_digest(
+    swap: Mapping, implementation: Optional[Implementation] = None
+) -> bytes:
+    """Return the digest of ``swap`` for the deployed ``Implementation``."""
+    return eip712.swap_digest(swap, get_domain(implementation))
+
+
+def swap_arguments(offer: SwapOffer, data: bytes = b"") -> tuple:
+    """Return the arguments of the ``swap`` call filling ``offer``."""
+    return (
+        swap_struct(offer),
+        int(offer.nonce),
+        int(offer.expiry),
+        offer.v,
+        bytes(offer.r),
+        bytes(offer.s),
+        data,
+    )
+
+
+def build_settlement(
+    offer: SwapOffer,
+    sender: str,
+    data: bytes = b"",
+    implementation: Optional[Implementation] = None,
+) -> dict:
+    """Return the unsigned ``swap`` transaction ``sender`` fills ``offer`` with.
+
+    :raises PreflightError: when the swap would revert for the sender
+    """
+    implementation = implementation or get_implementation()
+    with acting_as(sender):
+        return implementation.swap.build_transaction(
+            *swap_arguments(offer, data),
+            tx_params=TxParams(from_=to_checksum_address(sender)),
+        )
+
+
+def settle(
+    offer: SwapOffer,
+    pipeline: TransactionPipeline,
+    data: bytes = b"",
+    implementation: Optional[Implementation] = None,
+):
+    """Fill ``offer`` from the account of ``pipeline``; return the future hash."""
+    implementation = implementation or get_implementation()
+    return pipeline.submit(implementation.swap, *swap_arguments(offer, data))
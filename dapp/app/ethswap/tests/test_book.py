@@ -0,0 +1,105 @@
+import time
+
+import pytest
+
+from app.ethswap.book import OrderBook
+from app.ethswap.models import OfferStatus, SwapOffer
+from app.ethswap.offers import get_implementation, offer_digest, swap_arguments
+
+pytestmark = pytest.mark.django_db
+
+ZERO_ADDRESS = "0x" + "00" * 20
+
+
+@pytest.fixture
+def tokens(settings, w3, contracts, deploy, transact, signer):
+    """Register ``signer`` and bob; give the first token to one, the second to bob.
+
+    Return the ids of both tokens.
+    """
+    settings.WEB3_PROVIDER = w3
+    settings.CONTRACT_IMPL_ADR = contracts.implementation.address
+    settings.CONTRACT_MULTICALL_ADR = deploy("Multicall").address
+    implementation = contracts.implementation.functions
+    bob = w3.eth.accounts[1]
+    transact(implementation.register("signer"), signer.address)
+    transact(implementation.register("bob"), bob)
+    token_ids = []
+    for owner in (signer.address, bob):
+        receipt = transact(implementation.create("", False, b""))
+        (created,) = contracts.token.events.TokenCreated().processReceipt(receipt)
+        token_ids.append(created.args.id)
+        transact(implementation.mintFungible([owner], created.args.id, [10], b""))
+    return token_ids
+
+
+def offer(signer, sender: str, gives: int, wants: int, expiry: int) -> SwapOffer:
+    """Sign and store the offer of ``signer`` giving 3 ``gives`` for 2 ``wants``."""
+    swap = {
+        "sender": sender,
+        "senderTokenIds": [wants],
+        "senderTokenAmounts": [2],
+        "signerTokenIds": [gives],
+        "signerTokenAmounts": [3],
+    }
+    digest = offer_digest(swap, get_implementation())
+    signed = signer.signHash(digest)
+    return SwapOffer.objects.create(
+        signer=signer.address,
+        sender=sender,
+        sender_token_ids=[wants],
+        sender_token_amounts=[2],
+        signer_token_ids=[gives],
+        signer_token_amounts=[3],
+        nonce=0,
+        expiry=expiry,
+        v=signed.v,
+        r=signed.r.to_bytes(32, "big"),
+        s=signed.s.to_bytes(32, "big"),
+        digest=digest.hex(),
+    )
+
+
+def test_match(w3, signer, tokens):
+    given, wanted = tokens
+    bob, carol = w3.eth.accounts[1:3]
+    expiry = int(time.time()) + 3600
+    for_bob = offer(signer, bob, given, wanted, expiry)
+    for_anybody = offer(signer, ZERO_ADDRESS, given, wanted, expiry + 1)
+
+    book = OrderBook(interval=0)
+
+    def matched(**kwargs):
+        return [match.id for match in book.match(**kwargs)]
+
+    assert matched(offered=given, wanted=wanted, sender=bob) == [
+        for_bob.id,
+        for_anybody.id,
+    ]
+    assert matched(wanted=wanted, sender=carol) == [for_anybody.id]
+    assert matched(offered=wanted) == []
+    assert book.signer_nonce(signer.address) == 0
+
+
+def test_filled_offers_are_consumed(w3, contracts, transact, signer, tokens):
+    given, wanted = tokens
+    bob = w3.eth.accounts[1]
+    filled = offer(signer, bob, given, wanted, int(time.time()) + 3600)
+    expired = offer(signer, bob, wanted, given, int(time.time()) - 1)
+    book = OrderBook(interval=0)
+    assert [match.id for match in book.match(sender=bob)] == [filled.id]
+
+    # Accepted by the contract: the digest and the signature are its own.
+    swap = contracts.implementation.functions.swap(*swap_arguments(filled))
+    transact(swap, bob)
+    book.refresh(force=True)
+
+    assert contracts.token.functions.balanceOf(bob, given).call() == 3
+    assert book.signer_nonce(signer.address) == 1
+    assert book.match() == []
+    assert len(book) == 0
+    statuses = dict(SwapOffer.objects.values_list("id", "status"))
+    assert statuses == {
+        filled.id: OfferStatus.CONSUMED,
+        expired.id: OfferStatus.EXPIRED,
+    }
@@ -0,0 +1,15 @@
+from django.urls import path
+
+from app.ethswap.api import views
+
+app_name = "ethswap"
+
+urlpatterns = [
+    path("offers/", views.SwapOfferList.as_view(), name="offers"),
+    path("offers/match/", views.SwapOfferMatch.as_view(), name="offers-match"),
+    path(
+        "offers/<int:pk>/settlement/",
+        views.SwapOfferSettlement.as_view(),
+        name="offer-settlement",
+    ),
+]
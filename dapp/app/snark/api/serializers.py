@@ -0,0 +1,41 @@
+from collections.abc import Mapping
+
+from rest_framework import serializers
+
+from app.snark.groth16 import InvalidProof, Proof, public_inputs
+
+# Most proofs verified by one request, about a second of pure Python pairings.
+MAX_BATCH = 16
+
+
+class StatementSerializer(serializers.Serializer):
+    """snarkjs ``proof.json`` and ``public.json`` of one proof."""
+
+    proof = serializers.DictField()
+    public = serializers.ListField(
+        child=serializers.CharField(max_length=80), allow_empty=True
+    )
+
+    def validate(self, attrs):
+        try:
+            return (Proof.from_json(attrs["proof"]), public_inputs(attrs["public"]))
+        except InvalidProof as exc:
+            raise serializers.ValidationError(str(exc))
+
+
+class BatchSerializer(serializers.Serializer):
+    statements = StatementSerializer(many=True)
+
+    def to_internal_value(self, data):
+        # Checked first: parsing a proof already checks its G2 subgroup.
+        statements = data.get("statements") if isinstance(data, Mapping) else None
+        if isinstance(statements, list) and len(statements) > MAX_BATCH:
+            raise serializers.ValidationError(
+                {"statements": f"At most {MAX_BATCH} proofs can be verified at once."}
+            )
+        return super().to_internal_value(data)
+
+    def validate_statements(self, value):
+        if not value:
+            raise serializers.ValidationError("At least one proof is required.")
+        return value
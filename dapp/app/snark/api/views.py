@@ -0,0 +1,49 @@
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework.views import APIView
+
+from app.snark.api import serializers
+from app.snark.groth16 import InvalidProof, get_verifying_key
+
+
+class Verify(APIView):
+    """
+    Whether a Groth16 `proof` proves its `public` inputs, in the snarkjs
+    JSON formats.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "snark"
+
+    def post(self, request, format=None):
+        serializer = serializers.StatementSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            valid = get_verifying_key().verify(*serializer.validated_data)
+        except InvalidProof as exc:
+            raise ValidationError(str(exc))
+        return Response({"valid": valid})
+
+
+class VerifyBatch(APIView):
+    """
+    Validity of every `{proof, public}` of `statements`, checked as one
+    randomized batch; only a failing batch is split to find the bad proofs.
+    """
+
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "snark_batch"
+
+    def post(self, request, format=None):
+        serializer = serializers.BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            results = get_verifying_key().verify_each(
+                serializer.validated_data["statements"]
+            )
+        except InvalidProof as exc:
+            raise ValidationError(str(exc))
+        return Response({"valid": all(results), "results": results})
@@ -0,0 +1,284 @@
+"""Memory-mapped readers of the binary files of circom and snarkjs.
+
+``.r1cs``, ``.wtns`` and ``.zkey`` files share one container: a four-byte
+magic, a version, then sections of ``(type: uint32, size: uint64, data)``,
+in any order.  The readers map the file and hand out the sections as
+read-only numpy views of the mapping, so nothing is copied or parsed until
+it is used::
+
+    with WitnessFile("witness.wtns") as witness:
+        witness.values  # (n_witness, n8 // 2) uint16 limbs, little-endian
+
+Field elements are ``n8``-byte little-endian integers, seen as ``n8 // 2``
+uint16 limbs.  Values of ``.r1cs`` and ``.wtns`` files are in normal form;
+those of ``.zkey`` files (points and coefficients) are in Montgomery form,
+as snarkjs writes them.
+"""
+import mmap
+import struct
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Section types.
+R1CS_HEADER = 1
+R1CS_CONSTRAINTS = 2
+R1CS_WIRE_TO_LABEL = 3
+WTNS_HEADER = 1
+WTNS_VALUES = 2
+ZKEY_HEADER = 1
+ZKEY_GROTH16_HEADER = 2
+ZKEY_IC = 3
+ZKEY_COEFFICIENTS = 4
+ZKEY_A = 5
+ZKEY_B1 = 6
+ZKEY_B2 = 7
+ZKEY_C = 8
+ZKEY_H = 9
+ZKEY_CONTRIBUTIONS = 10
+
+GROTH16 = 1
+
+
+class FormatError(ValueError):
+    """File that is not of the expected binary format."""
+
+
+class BinFile:
+    """Memory-mapped sectioned file of circom or snarkjs."""
+
+    magic = b""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as binary_file:
+            self._mmap = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.bytes = np.frombuffer(self._mmap, dtype=np.uint8)
+        if bytes(self.bytes[:4]) != self.magic:
+            raise FormatError(f"{path} is not a {self.magic.decode()} file")
+        self.version, n_sections = struct.unpack_from("<II", self._mmap, 4)
+        # Section type -> (offset, size) of its instances, in file order.
+        self.sections: Dict[int, List[Tuple[int, int]]] = {}
+        offset = 12
+        for _ in range(n_sections):
+            section_type, size = struct.unpack_from("<IQ", self._mmap, offset)
+            offset += 12
+            if offset + size > len(self._mmap):
+                raise FormatError(f"Section {section_type} of {path} is truncated")
+            self.sections.setdefault(section_type, []).append((offset, size))
+            offset += size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Unmap the file, unless views of it are still alive."""
+        self.bytes = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views handed out keep the mapping; it goes away with them.
+            pass
+
+    def section(self, section_type: int, index: int = 0) -> np.ndarray:
+        """Return the bytes of a section, as a view of the mapping."""
+        try:
+            offset, size = self.sections[section_type][index]
+        except (KeyError, IndexError):
+            raise FormatError(f"{self.path} has no section {section_type}")
+        return self.bytes[offset : offset + size]
+
+    def unpack(self, fmt: str, section_type: int, offset: int = 0) -> tuple:
+        """Unpack ``fmt`` at ``offset`` of a section."""
+        start = self.sections[section_type][0][0] + offset
+        return struct.unpack_from(fmt, self._mmap, start)
+
+    def integer(self, section_type: int, offset: int, n8: int) -> int:
+        """Return the ``n8``-byte integer at ``offset`` of a section."""
+        start = self.sections[section_type][0][0] + offset
+        return int.from_bytes(self._mmap[start : start + n8], "little")
+
+
+def field_elements(data: np.ndarray, n8: int) -> np.ndarray:
+    """View ``data`` as an array of ``n8``-byte field elements in uint16 limbs."""
+    return data.view("<u2").reshape(-1, n8 // 2)
+
+
+def to_int(limbs: np.ndarray) -> int:
+    """Return the integer of one field element's limbs."""
+    return int.from_bytes(limbs.astype("<u2").tobytes(), "little")
+
+
+class R1CSFile(BinFile):
+    """circom ``.r1cs`` file: the constraints ``A·w * B·w = C·w`` of a circuit.
+
+    Each constraint is three linear combinations, A, B and C, of
+    ``(wire: uint32, coefficient: n8 bytes)`` terms, each prefixed by its
+    number of terms.  As their size varies, they are indexed on first use.
+    """
+
+    magic = b"r1cs"
+
+    def __init__(self, path):
+        super().__init__(path)
+        (self.n8,) = self.unpack("<I", R1CS_HEADER)
+        self.prime = self.integer(R1CS_HEADER, 4, self.n8)
+        (
+            self.n_wires,
+            self.n_pub_out,
+            self.n_pub_in,
+            self.n_prv_in,
+            self.n_labels,
+            self.n_constraints,
+        ) = self.unpack("<IIIIQI", R1CS_HEADER, 4 + self.n8)
+        self._index: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @property
+    def wire_labels(self) -> np.ndarray:
+        """Label id of every wire, as a view."""
+        return self.section(R1CS_WIRE_TO_LABEL).view("<u8")
+
+    @property
+    def term_size(self) -> int:
+        return 4 + self.n8
+
+    def index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the offset of the first term and the number of terms of
+        every linear combination, A, B and C of constraint 0 first.
+        """
+        if self._index is None:
+            data = self.section(R1CS_CONSTRAINTS)
+            start = self.sections[R1CS_CONSTRAINTS][0][0]
+            count = 3 * self.n_constraints
+            offsets = np.empty(count, dtype=np.int64)
+            counts = np.empty(count, dtype=np.int64)
+            unpack, buffer, term_size = struct.unpack_from, self._mmap, self.term_size
+            offset = 0
+            for lc in range(count):
+                (n_terms,) = unpack("<I", buffer, start + offset)
+                offsets[lc] = offset + 4
+                counts[lc] = n_terms
+                offset += 4 + n_terms * term_size
+            if offset != len(data):
+                raise FormatError(
+                    f"Constraints of {self.path} do not match their section"
+                )
+            self._index = offsets, counts
+        return self._index
+
+    def terms(self, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the terms of the linear combinations ``start`` to ``stop - 1``.
+
+        :return: the number of terms of every combination, the wires of the
+            terms and their coefficients in uint16 limbs, gathered in order
+        """
+        offsets, counts = self.index()
+        offsets, counts = offsets[start:stop], counts[start:stop]
+        total = int(counts.sum())
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(offsets, counts) + (np.arange(total) - first) * (
+            self.term_size
+        )
+        data = self.section(R1CS_CONSTRAINTS)
+        records = data[positions[:, None] + np.arange(self.term_size)]
+        wires = records[:, :4].copy().view("<u4").ravel()
+        coefficients = field_elements(records[:, 4:].copy(), self.n8)
+        return counts, wires, coefficients
+
+
+class WitnessFile(BinFile):
+    """snarkjs ``.wtns`` file: the value of every wire of a circuit."""
+
+    magic = b"wtns"
+
+    def __init__(self, path):
+        super().__init__(path)
+        (self.n8,) = self.unpack("<I", WTNS_HEADER)
+        self.prime = self.integer(WTNS_HEADER, 4, self.n8)
+        (self.n_witness,) = self.unpack("<I", WTNS_HEADER, 4 + self.n8)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Every value, as a ``(n_witness, n8 // 2)`` view of uint16 limbs."""
+        return field_elements(self.section(WTNS_VALUES), self.n8)
+
+    def value(self, wire: int) -> int:
+        return to_int(self.values[wire])
+
+
+class ZKeyFile(BinFile):
+    """snarkjs Groth16 ``.zkey`` file: proving and verification keys.
+
+    Points are uncompressed affine coordinates in Montgomery form: G1 points
+    are ``(x, y)``, G2 points ``(x0, x1, y0, y1)``, of ``n8q`` bytes each.
+    """
+
+    magic = b"zkey"
+
+    def __init__(self, path):
+        super().__init__(path)
+        (protocol,) = self.unpack("<I", ZKEY_HEADER)
+        if protocol != GROTH16:
+            raise FormatError(f"{path} is not a Groth16 key")
+        (self.n8q,) = self.unpack("<I", ZKEY_GROTH16_HEADER)
+        self.q = self.integer(ZKEY_GROTH16_HEADER, 4, self.n8q)
+        offset = 4 + self.n8q
+        (self.n8r,) = self.unpack("<I", ZKEY_GROTH16_HEADER, offset)
+        self.r = self.integer(ZKEY_GROTH16_HEADER, offset + 4, self.n8r)
+        offset += 4 + self.n8r
+        self.n_vars, self.n_public, self.domain_size = self.unpack(
+            "<III", ZKEY_GROTH16_HEADER, offset
+        )
+        # alpha1, beta1, beta2, gamma2, delta1 and delta2 follow.
+        self._points_offset = offset + 12
+
+    def _points(self, data: np.ndarray, coordinates: int) -> np.ndarray:
+        return data.reshape(-1, coordinates, self.n8q)
+
+    def g1(self, section_type: int) -> np.ndarray:
+        """Return the G1 points of a section, as ``(n, 2, n8q)`` bytes."""
+        return self._points(self.section(section_type), 2)
+
+    def g2(self, section_type: int) -> np.ndarray:
+        """Return the G2 points of a section, as ``(n, 4, n8q)`` bytes."""
+        return self._points(self.section(section_type), 4)
+
+    @property
+    def header_points(self) -> Dict[str, np.ndarray]:
+        """alpha1, beta1, beta2, gamma2, delta1 and delta2."""
+        data = self.section(ZKEY_GROTH16_HEADER)[self._points_offset :]
+        points = {}
+        offset = 0
+        for name, coordinates in (
+            ("alpha1", 2),
+            ("beta1", 2),
+            ("beta2", 4),
+            ("gamma2", 4),
+            ("delta1", 2),
+            ("delta2", 4),
+        ):
+            size = coordinates * self.n8q
+            points[name] = data[offset : offset + size].reshape(coordinates, self.n8q)
+            offset += size
+        return points
+
+    @property
+    def ic(self) -> np.ndarray:
+        return self.g1(ZKEY_IC)
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """``(matrix, constraint, signal, value)`` records of A and B, as a view."""
+        (count,) = self.unpack("<I", ZKEY_COEFFICIENTS)
+        dtype = np.dtype(
+            [
+                ("matrix", "<u4"),
+                ("constraint", "<u4"),
+                ("signal", "<u4"),
+                ("value", "<u2", (self.n8r // 2,)),
+            ]
+        )
+        return self.section(ZKEY_COEFFICIENTS)[4:].view(dtype)[:count]
@@ -0,0 +1,90 @@
+"""Check of a witness against the constraints of a circuit.
+
+A witness ``w`` satisfies a constraint when ``(A·w) * (B·w) = C·w`` in the
+field.  :func:`check_witness` evaluates the linear combinations of a chunk
+of constraints at once, in numpy, on 16-bit limbs:
+
+* every coefficient is multiplied by its wire's value limb by limb, into
+  columns of uint64 that are summed per linear combination without carries;
+* the carries of the sums are propagated, column by column, for the whole
+  chunk at once;
+* only then is every sum turned into a Python integer, reduced modulo the
+  prime and checked, one per linear combination rather than one per term.
+
+Nothing but the chunk being checked is copied out of the mapped files.
+"""
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+from app.snark.binfiles import FormatError, R1CSFile, WitnessFile
+
+LIMB_BITS = 16
+LIMB_MASK = (1 << LIMB_BITS) - 1
+
+
+def _sums(
+    counts: np.ndarray, wires: np.ndarray, coefficients: np.ndarray, values
+) -> List[int]:
+    """Return the unreduced value of every linear combination of a chunk."""
+    n_limbs = coefficients.shape[1]
+    # Products take twice the limbs, plus two for the carries of the sums.
+    width = 2 * n_limbs + 2
+    sums = np.zeros((len(counts), width), dtype=np.uint64)
+    if len(wires):
+        factors = values[wires].astype(np.uint64)
+        coefficients = coefficients.astype(np.uint64)
+        products = np.zeros((len(wires), width), dtype=np.uint64)
+        for limb in range(n_limbs):
+            products[:, limb : limb + n_limbs] += coefficients[:, limb, None] * factors
+        filled = counts > 0
+        starts = (np.cumsum(counts) - counts)[filled]
+        sums[filled] = np.add.reduceat(products, starts, axis=0)
+    for limb in range(width - 1):
+        sums[:, limb + 1] += sums[:, limb] >> LIMB_BITS
+        sums[:, limb] &= LIMB_MASK
+    row = 2 * width
+    data = sums.astype("<u2").tobytes()
+    return [
+        int.from_bytes(data[start : start + row], "little")
+        for start in range(0, len(data), row)
+    ]
+
+
+def evaluate(
+    r1cs: R1CSFile, witness: WitnessFile, start: int, stop: int
+) -> Tuple[List[int], List[int], List[int]]:
+    """Return ``A·w``, ``B·w`` and ``C·w`` of the constraints ``start:stop``."""
+    prime = r1cs.prime
+    sums = _sums(*r1cs.terms(3 * start, 3 * stop), witness.values)
+    values = [value % prime for value in sums]
+    return values[0::3], values[1::3], values[2::3]
+
+
+def iter_failures(
+    r1cs: R1CSFile, witness: WitnessFile, chunk_size: int = 4096
+) -> Iterator[int]:
+    """Yield the index of every constraint ``witness`` does not satisfy.
+
+    :param chunk_size: constraints evaluated at once; memory grows with it
+    """
+    if r1cs.prime != witness.prime:
+        raise FormatError("The circuit and the witness are over different fields")
+    if witness.n_witness < r1cs.n_wires:
+        raise FormatError(
+            f"{witness.n_witness} values for the {r1cs.n_wires} wires of the circuit"
+        )
+    prime = r1cs.prime
+    for start in range(0, r1cs.n_constraints, chunk_size):
+        stop = min(start + chunk_size, r1cs.n_constraints)
+        a, b, c = evaluate(r1cs, witness, start, stop)
+        for index, (a_w, b_w, c_w) in enumerate(zip(a, b, c), start):
+            if (a_w * b_w - c_w) % prime:
+                yield index
+
+
+def check_witness(
+    r1cs: R1CSFile, witness: WitnessFile, chunk_size: int = 4096
+) -> List[int]:
+    """Return the indexes of the constraints ``witness`` does not satisfy."""
+    return list(iter_failures(r1cs, witness, chunk_size))
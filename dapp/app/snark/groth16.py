@@ -0,0 +1,257 @@
+"""Groth16 verification of bn128 proofs, as produced by snarkjs.
+
+A proof ``(A, B, C)`` of the public inputs ``x`` is valid when::
+
+    e(A, B) == e(alpha, beta) * e(vk_x, gamma) * e(C, delta)
+    vk_x = IC[0] + x[0] * IC[1] + ... + x[n - 1] * IC[n]
+
+:class:`VerifyingKey` loads a snarkjs ``verification_key.json`` once and
+precomputes ``e(alpha, beta)``, so that a proof costs three Miller loops and
+one final exponentiation.
+
+:meth:`VerifyingKey.verify_batch` checks many proofs at once: each one is
+weighted by a random 128-bit scalar ``r``, and the pairing equations are
+multiplied together::
+
+    prod e(r A, B) == e(alpha, beta) ^ sum(r)
+                      * e(sum(r vk_x), gamma) * e(sum(r C), delta)
+
+This costs one Miller loop per proof, plus two, and a single final
+exponentiation.  A forged proof passes with probability below 2^-128.
+:meth:`VerifyingKey.verify_each` bisects a failing batch down to its
+invalid proofs.
+
+Pairings are those of ``py_ecc.optimized_bn128``.
+"""
+import json
+import secrets
+import threading
+from pathlib import Path
+from typing import List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from django.conf import settings
+from py_ecc.optimized_bn128 import (
+    FQ,
+    FQ2,
+    FQ12,
+    Z1,
+    add,
+    b,
+    b2,
+    curve_order,
+    field_modulus,
+    final_exponentiate,
+    is_inf,
+    is_on_curve,
+    multiply,
+    neg,
+    pairing,
+)
+
+# Random scalars of a batch are this many bits long.
+BATCH_SECURITY = 128
+
+Statement = Tuple["Proof", Sequence[int]]
+
+
+class InvalidProof(ValueError):
+    """Proof, public inputs or verification key that cannot be parsed."""
+
+
+class Proof(NamedTuple):
+    a: tuple
+    b: tuple
+    c: tuple
+
+    @classmethod
+    def from_json(cls, data: Mapping) -> "Proof":
+        """Return the proof of a snarkjs ``proof.json``."""
+        try:
+            return cls(
+                a=g1_point(data["pi_a"]),
+                b=g2_point(data["pi_b"], check_subgroup=True),
+                c=g1_point(data["pi_c"]),
+            )
+        except (KeyError, TypeError) as exc:
+            raise InvalidProof(f"Malformed proof: {exc!r}")
+
+
+def _integer(value, modulus: int) -> int:
+    try:
+        if isinstance(value, str) and value.startswith("0x"):
+            value = int(value, 16)
+        else:
+            value = int(value)
+    except (TypeError, ValueError):
+        raise InvalidProof(f"{value!r} is not an integer")
+    if not 0 <= value < modulus:
+        raise InvalidProof(f"{value} is out of range")
+    return value
+
+
+def g1_point(coordinates: Sequence) -> tuple:
+    """Return the G1 point of snarkjs projective ``[x, y, z]`` coordinates."""
+    point = tuple(FQ(_integer(value, field_modulus)) for value in coordinates)
+    if len(point) != 3 or not is_on_curve(point, b):
+        raise InvalidProof("Point not on G1")
+    return point
+
+
+def g2_point(coordinates: Sequence, check_subgroup: bool = False) -> tuple:
+    """Return the G2 point of snarkjs ``[[x0, x1], [y0, y1], [z0, z1]]`` coordinates.
+
+    :param check_subgroup: also check that the point has order ``curve_order``,
+        which points chosen by a prover must
+    """
+    point = tuple(
+        FQ2([_integer(value, field_modulus) for value in pair])
+        for pair in coordinates
+        if len(pair) == 2
+    )
+    if len(point) != 3 or not is_on_curve(point, b2):
+        raise InvalidProof("Point not on G2")
+    if check_subgroup and not is_inf(multiply(point, curve_order)):
+        raise InvalidProof("Point not in the G2 subgroup")
+    return point
+
+
+def public_inputs(values: Sequence) -> List[int]:
+    """Return the public inputs of a snarkjs ``public.json``."""
+    try:
+        return [_integer(value, curve_order) for value in values]
+    except (TypeError, ValueError) as exc:
+        raise InvalidProof(f"Malformed public input: {exc}")
+
+
+class VerifyingKey:
+    """Groth16 verification key, with its fixed pairing precomputed."""
+
+    def __init__(self, alpha: tuple, beta: tuple, gamma: tuple, delta: tuple, ic):
+        """
+        :param alpha: ``vk_alpha_1``
+        :param beta: ``vk_beta_2``
+        :param gamma: ``vk_gamma_2``
+        :param delta: ``vk_delta_2``
+        :param ic: ``IC``, one G1 point more than there are public inputs
+        """
+        self.alpha = alpha
+        self.beta = beta
+        self.gamma = gamma
+        self.delta = delta
+        self.ic = list(ic)
+        # e(alpha, beta) never changes; the checks compare against its inverse.
+        self.alpha_beta = pairing(beta, alpha)
+        self._alpha_beta_inverse = self.alpha_beta.inv()
+
+    @property
+    def n_public(self) -> int:
+        return len(self.ic) - 1
+
+    @classmethod
+    def from_json(cls, data: Mapping) -> "VerifyingKey":
+        """Return the key of a snarkjs ``verification_key.json``."""
+        if data.get("protocol") != "groth16" or data.get("curve") != "bn128":
+            raise InvalidProof("Only groth16 keys over bn128 are supported")
+        key = cls(
+            alpha=g1_point(data["vk_alpha_1"]),
+            beta=g2_point(data["vk_beta_2"]),
+            gamma=g2_point(data["vk_gamma_2"]),
+            delta=g2_point(data["vk_delta_2"]),
+            ic=[g1_point(point) for point in data["IC"]],
+        )
+        if key.n_public != data["nPublic"]:
+            raise InvalidProof(f"{len(key.ic)} IC points for {data['nPublic']} inputs")
+        return key
+
+    @classmethod
+    def load(cls, path) -> "VerifyingKey":
+        with open(path) as key_file:
+            return cls.from_json(json.load(key_file))
+
+    def _combine(self, scalars: Sequence[int]) -> tuple:
+        """Return ``sum(scalars[j] * IC[j])``."""
+        point = Z1
+        for scalar, ic in zip(scalars, self.ic):
+            if scalar:
+                point = add(point, multiply(ic, scalar))
+        return point
+
+    def _check_inputs(self, inputs: Sequence[int]):
+        if len(inputs) != self.n_public:
+            raise InvalidProof(
+                f"{len(inputs)} public inputs given, {self.n_public} expected"
+            )
+
+    def verify(self, proof: Proof, inputs: Sequence[int]) -> bool:
+        """Return whether ``proof`` proves the public ``inputs``."""
+        self._check_inputs(inputs)
+        vk_x = self._combine([1, *inputs])
+        product = (
+            pairing(proof.b, neg(proof.a), final_exponentiate=False)
+            * pairing(self.gamma, vk_x, final_exponentiate=False)
+            * pairing(self.delta, proof.c, final_exponentiate=False)
+        )
+        return final_exponentiate(product) == self._alpha_beta_inverse
+
+    def verify_batch(
+        self, statements: Sequence[Statement], scalars: Optional[Sequence[int]] = None
+    ) -> bool:
+        """Return whether every proof of ``statements`` is valid, w.h.p.
+
+        :param statements: ``(proof, public inputs)`` pairs
+        :param scalars: weights of the proofs; random unless testing
+        """
+        if not statements:
+            return True
+        if len(statements) == 1:
+            return self.verify(*statements[0])
+        if scalars is None:
+            scalars = [
+                secrets.randbits(BATCH_SECURITY) | 1 for _ in range(len(statements))
+            ]
+        # sum(r vk_x) is folded into one scalar per IC point.
+        ic_scalars = [0] * len(self.ic)
+        c = Z1
+        product = FQ12.one()
+        for (proof, inputs), scalar in zip(statements, scalars):
+            self._check_inputs(inputs)
+            ic_scalars[0] += scalar
+            for index, value in enumerate(inputs, 1):
+                ic_scalars[index] += scalar * value
+            c = add(c, multiply(proof.c, scalar))
+            product *= pairing(
+                proof.b, neg(multiply(proof.a, scalar)), final_exponentiate=False
+            )
+        vk_x = self._combine([value % curve_order for value in ic_scalars])
+        product *= pairing(self.gamma, vk_x, final_exponentiate=False)
+        product *= pairing(self.delta, c, final_exponentiate=False)
+        return final_exponentiate(product) == self._alpha_beta_inverse ** (
+            ic_scalars[0] % curve_order
+        )
+
+    def verify_each(self, statements: Sequence[Statement]) -> List[bool]:
+        """Return the validity of every proof, bisecting the failing batches."""
+        results = [True] * len(statements)
+        pending = [(0, len(statements))]
+        while pending:
+            start, stop = pending.pop()
+            if stop - start == 1:
+                results[start] = self.verify(*statements[start])
+            elif stop > start and not self.verify_batch(statements[start:stop]):
+                middle = (start + stop) // 2
+                pending += [(start, middle), (middle, stop)]
+        return results
+
+
+_key: Optional[VerifyingKey] = None
+_lock = threading.Lock()
+
+
+def get_verifying_key() -> VerifyingKey:
+    """Return the key at ``settings.SNARK_VERIFICATION_KEY``, loaded once."""
+    global _key  # pylint: disable=global-statement
+    if _key is None:
+        with _lock:
+            if _key is None:
+                _key = VerifyingKey.load(Path(settings.SNARK_VERIFICATION_KEY))
+    return _key
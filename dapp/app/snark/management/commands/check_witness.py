@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.snark.binfiles import FormatError, R1CSFile, WitnessFile
+from app.snark.constraints import iter_failures
+
+
+class Command(BaseCommand):
+    help = "Check that a .wtns witness satisfies the constraints of a .r1cs circuit."
+
+    def add_arguments(self, parser):
+        parser.add_argument("r1cs", help="Constraints of the circuit.")
+        parser.add_argument("witness", help="Witness computed for the circuit.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=4096,
+            help="How many constraints are evaluated at once.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="How many unsatisfied constraints are listed.",
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            with R1CSFile(options["r1cs"]) as r1cs, WitnessFile(
+                options["witness"]
+            ) as witness:
+                failures = []
+                count = 0
+                for index in iter_failures(r1cs, witness, options["chunk_size"]):
+                    if len(failures) < options["limit"]:
+                        failures.append(index)
+                    count += 1
+                n_constraints = r1cs.n_constraints
+        except (OSError, FormatError) as exc:
+            raise CommandError(str(exc))
+        elapsed = time.perf_counter() - start
+        for index in failures:
+            self.stdout.write(f"Constraint {index} is not satisfied.")
+        summary = (
+            f"{count} of {n_constraints} constraints unsatisfied in {elapsed:.2f}s."
+        )
+        if count:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,142 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from django.conf import settings
+
+from app.snark.binfiles import WTNS_VALUES, R1CSFile, WitnessFile
+from app.snark.constraints import LIMB_BITS, _sums, check_witness, evaluate
+
+CIRCUIT_DIR = Path(settings.SNARK_VERIFICATION_KEY).parent
+LIMB = (1 << LIMB_BITS) - 1
+
+
+@pytest.fixture
+def r1cs():
+    with R1CSFile(CIRCUIT_DIR / "circuit.r1cs") as r1cs:
+        yield r1cs
+
+
+@pytest.fixture
+def witness():
+    with WitnessFile(CIRCUIT_DIR / "witness.wtns") as witness:
+        yield witness
+
+
+@pytest.fixture
+def tampered_witness(tmp_path, witness):
+    """Return the test witness with its second wire, ``out[0]``, plus one."""
+    data = bytearray((CIRCUIT_DIR / "witness.wtns").read_bytes())
+    start = witness.sections[WTNS_VALUES][0][0] + witness.n8
+    value = (witness.value(1) + 1) % witness.prime
+    data[start : start + witness.n8] = value.to_bytes(witness.n8, "little")
+    path = tmp_path / "witness.wtns"
+    path.write_bytes(bytes(data))
+    with WitnessFile(path) as tampered:
+        yield tampered
+
+
+def json_failures(values):
+    """Return the constraints of ``circuit.r1cs.json`` that ``values`` fail."""
+    circuit = json.loads((CIRCUIT_DIR / "circuit.r1cs.json").read_text())
+    prime = int(circuit["prime"])
+
+    def combine(terms):
+        return sum(int(value) * values[int(wire)] for wire, value in terms.items())
+
+    return [
+        index
+        for index, (a, b, c) in enumerate(circuit["constraints"])
+        if (combine(a) * combine(b) - combine(c)) % prime
+    ]
+
+
+def wire_values(witness):
+    return [witness.value(wire) for wire in range(witness.n_witness)]
+
+
+def test_witness_satisfies_the_circuit(r1cs, witness):
+    assert check_witness(r1cs, witness) == []
+    assert json_failures(wire_values(witness)) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4096])
+def test_tampered_witness(r1cs, tampered_witness, chunk_size):
+    failures = check_witness(r1cs, tampered_witness, chunk_size)
+
+    assert failures
+    assert failures == json_failures(wire_values(tampered_witness))
+
+
+def test_evaluate_matches_the_json_circuit(r1cs, witness):
+    circuit = json.loads((CIRCUIT_DIR / "circuit.r1cs.json").read_text())
+    values = wire_values(witness)
+    a, b, c = evaluate(r1cs, witness, 0, r1cs.n_constraints)
+
+    for index, constraint in enumerate(circuit["constraints"]):
+        expected = [
+            sum(int(value) * values[int(wire)] for wire, value in terms.items())
+            % r1cs.prime
+            for terms in constraint
+        ]
+        assert [a[index], b[index], c[index]] == expected
+
+
+def limbs(value: int, n_limbs: int) -> np.ndarray:
+    return np.frombuffer(value.to_bytes(2 * n_limbs, "little"), dtype="<u2")
+
+
+def sums_of(counts, wires, coefficients, values, n_limbs):
+    """Return what ``_sums`` computes, from Python integers."""
+    return _sums(
+        np.array(counts, dtype=np.int64),
+        np.array(wires, dtype=np.uint32),
+        np.array([limbs(value, n_limbs) for value in coefficients]).reshape(
+            -1, n_limbs
+        ),
+        np.array([limbs(value, n_limbs) for value in values]).reshape(-1, n_limbs),
+    )
+
+
+def test_sums_propagate_every_carry():
+    n_limbs = 16
+    largest = (1 << (LIMB_BITS * n_limbs)) - 1
+    # Products of the largest elements carry into every column of the sums.
+    counts = [3, 1]
+    wires = [0, 0, 1, 1]
+    coefficients = [largest, largest, 1, largest]
+    values = [largest, 12345]
+
+    assert sums_of(counts, wires, coefficients, values, n_limbs) == [
+        2 * largest * largest + 12345,
+        largest * 12345,
+    ]
+
+
+def test_sums_of_empty_linear_combinations():
+    # Empty first, middle and last combinations are 0 and shift no sum.
+    counts = [0, 2, 0, 0, 1, 0]
+    wires = [0, 1, 1]
+    coefficients = [3, 5, 7]
+    values = [11, 13]
+
+    assert sums_of(counts, wires, coefficients, values, 1) == [
+        0,
+        3 * 11 + 5 * 13,
+        0,
+        0,
+        7 * 13,
+        0,
+    ]
+    assert sums_of([0, 0], [], [], [1], 1) == [0, 0]
+
+
+def test_sums_reach_the_top_limb():
+    # One-limb elements: a sum of 2**17 products of 0xffff ** 2 needs the
+    # carries of both extra limbs, up to the top one cast to 16 bits.
+    count = 1 << 17
+    total = sums_of([count], [0] * count, [LIMB] * count, [LIMB], 1)
+
+    assert total == [count * LIMB * LIMB]
+    assert total[0] >> (3 * LIMB_BITS)
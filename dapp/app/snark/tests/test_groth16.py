@@ -0,0 +1,83 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+
+from app.snark.groth16 import Proof, VerifyingKey, public_inputs
+
+# Circuit, proving key and witness of the proofs checked by default.
+CIRCUIT_DIR = Path(settings.SNARK_VERIFICATION_KEY).parent
+
+
+@pytest.fixture(scope="session")
+def verifying_key() -> VerifyingKey:
+    return VerifyingKey.load(CIRCUIT_DIR / "verification_key.json")
+
+
+@pytest.fixture(scope="session")
+def statement(tmp_path_factory):
+    """Return the proof of the test witness and its public inputs.
+
+    Proved once by snarkjs, installed by ``npm install`` in the circuit's
+    directory.
+    """
+    snarkjs = shutil.which(
+        "snarkjs", path=str(CIRCUIT_DIR / "node_modules" / ".bin")
+    ) or shutil.which("snarkjs")
+    if snarkjs is None:
+        pytest.skip("snarkjs is not installed")
+    directory = tmp_path_factory.mktemp("proof")
+    subprocess.run(
+        [
+            snarkjs,
+            "groth16",
+            "prove",
+            CIRCUIT_DIR / "circuit.zkey",
+            CIRCUIT_DIR / "witness.wtns",
+            directory / "proof.json",
+            directory / "public.json",
+        ],
+        check=True,
+    )
+    proof = Proof.from_json(json.loads((directory / "proof.json").read_text()))
+    inputs = public_inputs(json.loads((directory / "public.json").read_text()))
+    return proof, inputs
+
+
+def tampered(inputs):
+    """Return ``inputs`` with the first one changed."""
+    return [inputs[0] ^ 1, *inputs[1:]]
+
+
+def test_valid_proof(verifying_key, statement):
+    assert verifying_key.verify(*statement)
+
+
+def test_tampered_public_input(verifying_key, statement):
+    proof, inputs = statement
+
+    assert not verifying_key.verify(proof, tampered(inputs))
+
+
+def test_swapped_proof_points(verifying_key, statement):
+    proof, inputs = statement
+
+    assert not verifying_key.verify(proof._replace(a=proof.c, c=proof.a), inputs)
+
+
+def test_batch(verifying_key, statement):
+    proof, inputs = statement
+
+    assert verifying_key.verify_batch([statement] * 3)
+    assert not verifying_key.verify_batch([statement, (proof, tampered(inputs))])
+
+
+def test_verify_each_isolates_the_bad_proof(verifying_key, statement):
+    proof, inputs = statement
+    statements = [statement] * 5
+    statements[3] = (proof, tampered(inputs))
+
+    assert verifying_key.verify_each(statements) == [True, True, True, False, True]
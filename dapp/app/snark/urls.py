@@ -0,0 +1,10 @@
+from django.urls import path
+
+from app.snark.api import views
+
+app_name = "snark"
+
+urlpatterns = [
+    path("verify/", views.Verify.as_view(), name="verify"),
+    path("verify-batch/", views.VerifyBatch.as_view(), name="verify-batch"),
+]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""Groth16 verification throughput, in proofs per second per core.
+
+No prover runs here, so the proofs are made with a verification key whose
+trapdoor is known: for random ``alpha``, ``beta``, ``gamma``, ``delta`` and
+``u[j]``, and ``IC[j] = u[j] / gamma * G1``, the proof
+``A = a G1, B = b G2, C = (a b - alpha beta - sum(x[j] u[j])) / delta * G1``
+is valid for the inputs ``x``.  The key has as many public inputs as
+``settings.SNARK_VERIFICATION_KEY``, which is loaded once to time it.
+
+Proofs are checked one by one, then in batches, in one process::
+
+    python benchmarks/groth16.py --proofs 64 --batch 8 --batch 64
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.append(str(ROOT_DIR / "app"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from py_ecc.optimized_bn128 import G1, G2, curve_order, multiply  # noqa: E402
+
+from app.snark.groth16 import Proof, VerifyingKey  # noqa: E402
+
+
+def inverse(value):
+    return pow(value, curve_order - 2, curve_order)
+
+
+def make_key(n_public, rand):
+    """Return a key of ``n_public`` inputs and the trapdoor it was made from."""
+    alpha, beta, gamma, delta = (rand.randrange(1, curve_order) for _ in range(4))
+    u = [rand.randrange(1, curve_order) for _ in range(n_public + 1)]
+    key = VerifyingKey(
+        alpha=multiply(G1, alpha),
+        beta=multiply(G2, beta),
+        gamma=multiply(G2, gamma),
+        delta=multiply(G2, delta),
+        ic=[multiply(G1, value * inverse(gamma) % curve_order) for value in u],
+    )
+    return key, (alpha, beta, delta, u)
+
+
+def make_statements(count, n_public, trapdoor, rand):
+    """Return ``count`` valid ``(proof, inputs)`` pairs."""
+    alpha, beta, delta, u = trapdoor
+    statements = []
+    for _ in range(count):
+        inputs = [rand.randrange(curve_order) for _ in range(n_public)]
+        a, b = rand.randrange(1, curve_order), rand.randrange(1, curve_order)
+        public = u[0] + sum(x * u_j for x, u_j in zip(inputs, u[1:]))
+        c = (a * b - alpha * beta - public) * inverse(delta) % curve_order
+        proof = Proof(a=multiply(G1, a), b=multiply(G2, b), c=multiply(G1, c))
+        statements.append((proof, inputs))
+    return statements
+
+
+def one_by_one(key, statements):
+    return all(key.verify(*statement) for statement in statements)
+
+
+def batched(size):
+    def verify(key, statements):
+        return all(
+            key.verify_batch(statements[start : start + size])
+            for start in range(0, len(statements), size)
+        )
+
+    verify.__name__ = f"batches of {size}"
+    return verify
+
+
+def measure(function, key, statements, runs):
+    """Return the best throughput of ``function`` over ``runs``, in proofs/s."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        valid = function(key, statements)
+        best = min(best, time.perf_counter() - start)
+        assert valid, f"{function.__name__} rejected a valid proof"
+    return len(statements) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--proofs", type=int, default=32)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--batch", type=int, action="append")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    n_public = VerifyingKey.load(settings.SNARK_VERIFICATION_KEY).n_public
+    print(f"Loaded the verification key in {time.perf_counter() - start:.2f}s")
+
+    rand = random.Random(16)
+    key, trapdoor = make_key(n_public, rand)
+    statements = make_statements(args.proofs, n_public, trapdoor, rand)
+    baseline = measure(one_by_one, key, statements, args.runs)
+    print(f"{'verification':<28}{'proofs/s/core':>14}{'speedup':>10}")
+    print(f"{'one by one':<28}{baseline:>14,.2f}{1:>9.1f}x")
+    for size in args.batch or [8, 32]:
+        throughput = measure(batched(size), key, statements, args.runs)
+        name = f"batches of {size}"
+        print(f"{name:<28}{throughput:>14,.2f}{throughput / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
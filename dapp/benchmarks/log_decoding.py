@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""Throughput of event log decoding: per-log ``get_event_data`` vs bulk columns.
+
+Decodes synthetic ``TokenSent`` logs, shaped like ``eth_getLogs`` answers
+formatted by web3, through:
+
+* the per-receipt path of the generated wrappers (``get_token_sent_event``
+  runs ``get_event_data`` on every log);
+* :class:`app.eth.decoder.BulkDecoder`, with and without reading the lazily
+  decoded ``data``/``operatorData`` columns::
+
+    python benchmarks/log_decoding.py --logs 200000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.append(str(ROOT_DIR / "app"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
+
+import django  # noqa: E402
+
+django.setup()
+
+from eth_abi import encode_abi  # noqa: E402
+from hexbytes import HexBytes  # noqa: E402
+from web3.datastructures import AttributeDict  # noqa: E402
+
+from app.eth.contracts import Token  # noqa: E402
+from app.eth.contracts.token import EVENT_DECODERS, EVENT_TOPICS  # noqa: E402
+from app.eth.decoder import BulkDecoder  # noqa: E402
+
+ADDRESS = "0x" + "11" * 20
+
+
+def make_logs(count):
+    """Return ``count`` formatted ``TokenSent`` logs with random values."""
+    topic = HexBytes(EVENT_TOPICS["TokenSent"])
+    rand = random.Random(1155)
+
+    def word(bits):
+        return HexBytes(rand.getrandbits(bits).to_bytes(32, "big"))
+
+    logs = []
+    for index in range(count):
+        data = encode_abi(
+            ["address", "uint256", "bytes", "bytes"],
+            [
+                "0x%040x" % rand.getrandbits(160),
+                rand.getrandbits(64),
+                bytes(rand.getrandbits(8) for _ in range(rand.randrange(64))),
+                b"",
+            ],
+        )
+        logs.append(
+            AttributeDict(
+                {
+                    "address": ADDRESS,
+                    "topics": [topic, word(160), word(160), word(256)],
+                    "data": HexBytes(data).hex(),
+                    "blockNumber": 1000000 + index // 10,
+                    "blockHash": word(256),
+                    "transactionHash": word(256),
+                    "transactionIndex": index % 10,
+                    "logIndex": index % 10,
+                    "removed": False,
+                }
+            )
+        )
+    return logs
+
+
+def per_log(logs):
+    decode = EVENT_DECODERS[EVENT_TOPICS["TokenSent"]]
+    return [decode(log) for log in logs]
+
+
+def bulk(logs):
+    return BulkDecoder.for_wrappers(Token).decode(logs)
+
+
+def bulk_with_dynamic(logs):
+    batch = BulkDecoder.for_wrappers(Token).decode(logs)["TokenSent"]
+    batch["data"].values()
+    batch["operatorData"].values()
+    return batch
+
+
+def measure(function, logs, runs):
+    """Return the best throughput of ``function`` over ``runs``, in logs/s."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        function(logs)
+        best = min(best, time.perf_counter() - start)
+    return len(logs) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logs", type=int, default=50000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    logs = make_logs(args.logs)
+    baseline = measure(per_log, logs, args.runs)
+    print(f"{'decoder':<28}{'logs/s':>14}{'speedup':>10}")
+    for name, function in (
+        ("get_event_data per log", per_log),
+        ("bulk, fixed-width only", bulk),
+        ("bulk, with dynamic bytes", bulk_with_dynamic),
+    ):
+        if function is per_log:
+            throughput = baseline
+        else:
+            throughput = measure(function, logs, args.runs)
+        print(f"{name:<28}{throughput:>14,.0f}{throughput / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Import time and resident memory of the generated contract wrappers.
+
+Every scenario runs in a fresh interpreter, after ``django.setup()``, so it
+measures what a cold uvicorn worker or ``manage.py`` command pays::
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 --import app.ethtoken.token
+
+``--import`` times arbitrary modules, which is how the figures of an older
+tree (e.g. one generated module per Django app) are reproduced for comparison.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve(strict=True).parent.parent
+
+SCENARIOS = {
+    "django only": [],
+    "contracts package": ["import app.eth.contracts"],
+    "one wrapper (lazy)": ["from app.eth.contracts import Implementation"],
+    "every wrapper (eager)": [
+        "import app.eth.contracts.account",
+        "import app.eth.contracts.implementation",
+        "import app.eth.contracts.token",
+    ],
+}
+
+PROBE = """
+import json, os, resource, sys, time
+sys.path.append(os.path.join(os.getcwd(), "app"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
+import django
+django.setup()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+modules = len(sys.modules)
+start = time.perf_counter()
+{statements}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss,
+    "modules": len(sys.modules) - modules,
+}}))
+"""
+
+
+def probe(statements):
+    """Return the measures of one fresh interpreter running ``statements``."""
+    code = PROBE.format(statements="\n".join(statements) or "pass")
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--import",
+        dest="modules",
+        action="append",
+        default=[],
+        help="time importing this module instead of the built-in scenarios",
+    )
+    args = parser.parse_args()
+
+    scenarios = SCENARIOS
+    if args.modules:
+        scenarios = {"custom": [f"import {module}" for module in args.modules]}
+
+    print(f"{'scenario':<24}{'import ms':>12}{'RSS KiB':>12}{'modules':>10}")
+    for name, statements in scenarios.items():
+        probe(statements)  # Warm the bytecode cache.
+        runs = [probe(statements) for _ in range(args.runs)]
+        seconds = statistics.median(run["seconds"] for run in runs)
+        rss = statistics.median(run["rss_kib"] for run in runs)
+        print(f"{name:<24}{seconds * 1000:>12.1f}{rss:>12.0f}{runs[0]['modules']:>10}")
+
+
+if __name__ == "__main__":
+    main()
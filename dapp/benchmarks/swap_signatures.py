@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""Throughput of swap offer verification: eth_abi and eth_account vs app.eth.eip712.
+
+Signs synthetic swaps with random keys, then hashes them and recovers their
+signers through:
+
+* ``eth_abi.encode_abi`` and ``Account.recoverHash``, one offer at a time;
+* :func:`app.eth.eip712.swap_digest` and :func:`~app.eth.eip712.recover_signer`
+  in-process;
+* :func:`app.eth.eip712.recover_swap_signers`, over the process pool::
+
+    python benchmarks/swap_signatures.py --offers 20000 --workers 8
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.append(str(ROOT_DIR / "app"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from eth_abi import encode_abi  # noqa: E402
+from eth_account import Account  # noqa: E402
+from eth_keys import keys  # noqa: E402
+from eth_utils import keccak  # noqa: E402
+
+from app.eth import eip712  # noqa: E402
+
+CONTRACT = "0x" + "11" * 20
+STRUCT_TYPES = ["bytes32", "address"] + ["uint256[]"] * 4
+
+
+def make_offers(count, domain):
+    """Return ``count`` (swap, signature, signer) triples, signed by 64 keys."""
+    rand = random.Random(712)
+    private_keys = [
+        keys.PrivateKey(rand.getrandbits(255).to_bytes(32, "big")) for _ in range(64)
+    ]
+    offers = []
+    for index in range(count):
+        size = rand.randrange(1, 4)
+        swap = {"sender": "0x" + "00" * 20}
+        for name in eip712.SWAP_ARRAYS:
+            swap[name] = [rand.getrandbits(128) for _ in range(size)]
+        key = private_keys[index % len(private_keys)]
+        signature = key.sign_msg_hash(eip712.swap_digest(swap, domain))
+        v, r, s = signature.vrs
+        offers.append(
+            (
+                swap,
+                (v + 27, r.to_bytes(32, "big"), s.to_bytes(32, "big")),
+                key.public_key.to_address().lower(),
+            )
+        )
+    return offers
+
+
+def eth_abi_digest(swap, domain):
+    struct_hash = keccak(
+        encode_abi(
+            STRUCT_TYPES,
+            [eip712.SWAP_TYPEHASH, swap["sender"]]
+            + [swap[name] for name in eip712.SWAP_ARRAYS],
+        )
+    )
+    return keccak(eip712.SWAP_PREFIX + domain + struct_hash)
+
+
+def per_offer(offers, domain):
+    signers = []
+    for swap, (v, r, s), _signer in offers:
+        vrs = (v, int.from_bytes(r, "big"), int.from_bytes(s, "big"))
+        digest = eth_abi_digest(swap, domain)
+        signers.append(Account.recoverHash(digest, vrs=vrs).lower())
+    return signers
+
+
+def in_process(offers, domain):
+    return [
+        eip712.recover_signer(eip712.swap_digest(swap, domain), *signature)
+        for swap, signature, _signer in offers
+    ]
+
+
+def pooled(offers, domain):
+    return eip712.recover_swap_signers(
+        [offer[0] for offer in offers], [offer[1] for offer in offers], domain
+    )
+
+
+def measure(function, offers, domain, runs):
+    """Return the best throughput of ``function`` over ``runs``, in offers/s."""
+    expected = [offer[2] for offer in offers]
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        signers = function(offers, domain)
+        best = min(best, time.perf_counter() - start)
+        assert signers == expected, f"{function.__name__} recovered other signers"
+    return len(offers) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--offers", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+    settings.WEB3_RECOVERY_WORKERS = args.workers
+
+    domain = eip712.domain_separator(1, CONTRACT)
+    offers = make_offers(args.offers, domain)
+    # Start the pool outside of the measures.
+    pooled(offers[: eip712.MIN_POOL_BATCH], domain)
+    baseline = measure(per_offer, offers, domain, args.runs)
+    print(f"{'verification':<28}{'offers/s':>14}{'speedup':>10}")
+    for name, function in (
+        ("eth_abi + recoverHash", per_offer),
+        ("eip712, in-process", in_process),
+        ("eip712, process pool", pooled),
+    ):
+        if function is per_offer:
+            throughput = baseline
+        else:
+            throughput = measure(function, offers, domain, args.runs)
+        print(f"{name:<28}{throughput:>14,.0f}{throughput / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
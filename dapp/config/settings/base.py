@@ -75,6 +75,9 @@ LOCAL_APPS = [
     "app.ethimplementation.apps.EthImplementationConfig",
     "app.ethaccount.apps.EthAccountConfig",
     "app.ethtoken.apps.EthTokenConfig",
+    "app.ethindexer.apps.EthIndexerConfig",
+    "app.ethswap.apps.EthSwapConfig",
+    "app.snark.apps.SnarkConfig",
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -280,6 +283,11 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    # Rates of the views of a throttle_scope, per user or per anonymous IP.
+    "DEFAULT_THROTTLE_RATES": {
+        "snark": env("SNARK_THROTTLE_RATE", default="60/minute"),
+        "snark_batch": env("SNARK_BATCH_THROTTLE_RATE", default="10/minute"),
+    },
 }
 
 # django-cors-headers - https://github.com/adamchainz/django-cors-headers#setup
@@ -288,3 +296,38 @@ CORS_URLS_REGEX = r"^/api/.*$"
 # ETH
 WEB3_PROVIDER = ""
 CONTRACT_IMPL_ADR = ""
+CONTRACT_MULTICALL_ADR = ""
+CONTRACT_TOKEN_ADR = env("CONTRACT_TOKEN_ADR", default="")
+CONTRACT_ACCOUNT_ADR = env("CONTRACT_ACCOUNT_ADR", default="")
+# Connection pool shared by the RPC clients of a worker.
+WEB3_POOL_SIZE = env.int("WEB3_POOL_SIZE", default=10)
+WEB3_REQUEST_TIMEOUT = env.float("WEB3_REQUEST_TIMEOUT", default=10)
+WEB3_REQUEST_RETRIES = env.int("WEB3_REQUEST_RETRIES", default=3)
+# View call cache: per-worker LRU backed by a shared Django cache ("" for none).
+WEB3_CACHE_ALIAS = env("WEB3_CACHE_ALIAS", default="default")
+WEB3_CACHE_SIZE = env.int("WEB3_CACHE_SIZE", default=4096)
+WEB3_CACHE_STATE_TIMEOUT = env.int("WEB3_CACHE_STATE_TIMEOUT", default=60)
+WEB3_HEAD_POLL_INTERVAL = env.float("WEB3_HEAD_POLL_INTERVAL", default=1.0)
+# Indexer: contracts are followed from INDEXER_START_BLOCK, trailing the head.
+INDEXER_START_BLOCK = env.int("INDEXER_START_BLOCK", default=0)
+INDEXER_CONFIRMATIONS = env.int("INDEXER_CONFIRMATIONS", default=12)
+INDEXER_POLL_INTERVAL = env.float("INDEXER_POLL_INTERVAL", default=5)
+INDEXER_BATCH_SIZE = env.int("INDEXER_BATCH_SIZE", default=5000)
+# Blocks between two balance snapshots of a token contract (0 for none).
+INDEXER_SNAPSHOT_INTERVAL = env.int("INDEXER_SNAPSHOT_INTERVAL", default=10000)
+# State the pre-flight validation of Implementation transactions reads, e.g.
+# "app.ethindexer.state.IndexedState" ("" for none).
+WEB3_PREFLIGHT_STATE = env("WEB3_PREFLIGHT_STATE", default="")
+# Redis holding the nonce counters of the signing accounts ("" for in-process).
+WEB3_NONCE_REDIS_URL = env("WEB3_NONCE_REDIS_URL", default=env("REDIS_URL", default=""))
+# Seconds a pending transaction is watched for before giving up (0 for no limit).
+WEB3_RECEIPT_TIMEOUT = env.float("WEB3_RECEIPT_TIMEOUT", default=600)
+# Share of the block gas limit an airdrop mint transaction may use.
+AIRDROP_BLOCK_GAS_SHARE = env.float("AIRDROP_BLOCK_GAS_SHARE", default=0.5)
+# Processes recovering batches of swap signatures (0 for one per CPU).
+WEB3_RECOVERY_WORKERS = env.int("WEB3_RECOVERY_WORKERS", default=0)
+# Groth16 verification key of the proofs checked by the snark API (snarkjs JSON).
+SNARK_VERIFICATION_KEY = env(
+    "SNARK_VERIFICATION_KEY",
+    default=str(ROOT_DIR.parent / "zk-snark" / "test" / "verification_key.json"),
+)
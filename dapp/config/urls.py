@@ -15,6 +15,12 @@ api_urlpatterns = [
     path(f"{API_PREFIX}/", include("djoser.urls.jwt")),
     # User management
     path(f"{API_PREFIX}/", include("djoser.urls")),
+    # Indexed contract events
+    path(f"{API_PREFIX}/indexer/", include("app.ethindexer.urls")),
+    # Signed swap offers
+    path(f"{API_PREFIX}/swap/", include("app.ethswap.urls")),
+    # Groth16 proof verification
+    path(f"{API_PREFIX}/snark/", include("app.snark.urls")),
 ]
 
 urlpatterns += api_urlpatterns